@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
-from .init_command import init_command, parse_agent_string, run_init
-from .memory_command import memory_app
-from .verify_command import verify_command
-from .workflow_mixin import (
-    WorkflowMixin,
-    create_non_interactive_workflow,
-    non_interactive_option,
-    validate_required_defaults,
-    workflow_command_options,
-)
+from importlib import import_module
+from typing import Any
+
+# Exports resolve on first attribute access so that importing one submodule
+# (e.g. from a single CLI command) does not pull in the whole package.
+# `init_command` and `verify_command` share their submodule's name; import
+# them from the submodule when the module may already have been loaded.
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "init_command": (".init_command", "init_command"),
+    "parse_agent_string": (".init_command", "parse_agent_string"),
+    "run_init": (".init_command", "run_init"),
+    "memory_app": (".memory_command", "memory_app"),
+    "verify_command": (".verify_command", "verify_command"),
+    "WorkflowMixin": (".workflow_mixin", "WorkflowMixin"),
+    "create_non_interactive_workflow": (".workflow_mixin", "create_non_interactive_workflow"),
+    "non_interactive_option": (".workflow_mixin", "non_interactive_option"),
+    "validate_required_defaults": (".workflow_mixin", "validate_required_defaults"),
+    "workflow_command_options": (".workflow_mixin", "workflow_command_options"),
+}
 
 __all__ = [
     # Workflow support
@@ -26,3 +35,17 @@ __all__ = [
     "verify_command",
     "workflow_command_options",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -13,6 +13,7 @@ from __future__ import annotations
 import json
 from datetime import date, datetime
 from pathlib import Path
+from typing import Annotated
 
 import typer
 from rich.console import Console
@@ -21,12 +22,18 @@ from rich.table import Table
 from ..exit_codes import ExitCode
 from ..models.status_models import SpecState
 from ..services.analytics_service import AnalyticsService
+from ..services.spec_cache import SpecCache
 from ..services.spec_scanner import NotADoitProjectError, SpecNotFoundError
 from .output import OutputFormat, format_option, resolve_format
 
 app = typer.Typer(help="Spec analytics and metrics dashboard")
 console = Console()
 
+NoCacheFlag = Annotated[
+    bool,
+    typer.Option("--no-cache", help="Re-parse every spec instead of using .doit/cache/"),
+]
+
 _TABULAR_FORMATS = (OutputFormat.TABLE, OutputFormat.JSON, OutputFormat.CSV)
 _EXPORT_FORMATS = (OutputFormat.MARKDOWN, OutputFormat.JSON)
 
@@ -43,6 +50,12 @@ def _get_status_emoji(status: SpecState) -> str:
     return emojis.get(status, "❓")
 
 
+def _analytics_service(no_cache: bool) -> AnalyticsService:
+    """Build the service, sharing the parsed-spec cache unless disabled."""
+    project_root = Path.cwd()
+    return AnalyticsService(project_root, cache=SpecCache(project_root, enabled=not no_cache))
+
+
 @app.callback(invoke_without_command=True)
 def main(ctx: typer.Context):
     """Spec analytics and metrics dashboard.
@@ -51,12 +64,13 @@ def main(ctx: typer.Context):
     """
     if ctx.invoked_subcommand is None:
         # Default to show command
-        show(json_output=False)
+        show(json_output=False, no_cache=False)
 
 
 @app.command()
 def show(
     json_output: bool = typer.Option(False, "--json", help="Output as JSON instead of table"),
+    no_cache: NoCacheFlag = False,
 ) -> None:
     """Display completion metrics summary for all specs.
 
@@ -68,7 +82,7 @@ def show(
       2 - Not a doit project
     """
     try:
-        service = AnalyticsService()
+        service = _analytics_service(no_cache)
         summary = service.get_completion_summary()
 
         if summary["total_specs"] == 0:
@@ -145,6 +159,7 @@ def cycles(
     days: int = typer.Option(30, "--days", "-d", help="Filter to last N days"),
     since: str | None = typer.Option(None, "--since", "-s", help="Filter since date (YYYY-MM-DD)"),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+    no_cache: NoCacheFlag = False,
 ) -> None:
     """Display cycle time statistics for completed specs.
 
@@ -156,7 +171,7 @@ def cycles(
       2 - Not a doit project
     """
     try:
-        service = AnalyticsService()
+        service = _analytics_service(no_cache)
 
         # Parse since date if provided
         since_date: date | None = None
@@ -272,6 +287,7 @@ def velocity(
         default=OutputFormat.TABLE,
         allowed=_TABULAR_FORMATS,
     ),
+    no_cache: NoCacheFlag = False,
 ) -> None:
     """Display velocity trends over time.
 
@@ -285,7 +301,7 @@ def velocity(
     fmt = resolve_format(format_type, _TABULAR_FORMATS)
 
     try:
-        service = AnalyticsService()
+        service = _analytics_service(no_cache)
         velocity_data = service.get_velocity_data(weeks=weeks)
 
         if len(velocity_data) < 2:
@@ -379,6 +395,7 @@ def _print_velocity_table(velocity_data, weeks: int) -> None:
 def spec(
     spec_name: str = typer.Argument(..., help="Spec directory name"),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+    no_cache: NoCacheFlag = False,
 ) -> None:
     """Display detailed metrics for a specific spec.
 
@@ -390,7 +407,7 @@ def spec(
       2 - Not a doit project
     """
     try:
-        service = AnalyticsService()
+        service = _analytics_service(no_cache)
 
         try:
             metadata = service.get_spec_details(spec_name)
@@ -519,6 +536,7 @@ def export(
         allowed=_EXPORT_FORMATS,
     ),
     output_path: Path | None = typer.Option(None, "--output", "-o", help="Output file path"),
+    no_cache: NoCacheFlag = False,
 ) -> None:
     """Export analytics report to file.
 
@@ -532,7 +550,7 @@ def export(
     fmt = resolve_format(format_type, _EXPORT_FORMATS)
 
     try:
-        service = AnalyticsService()
+        service = _analytics_service(no_cache)
         report = service.generate_report()
 
         # Determine output path
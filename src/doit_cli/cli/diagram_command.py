@@ -100,18 +100,49 @@ def generate_command(
         "-o",
         help="Write diagrams to separate file",
     ),
+    all_specs: bool = typer.Option(
+        False,
+        "--all",
+        "-a",
+        help="Generate diagrams for every spec in specs/",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Regenerate diagrams even if their source sections are unchanged",
+    ),
+    jobs: int = typer.Option(
+        0,
+        "--jobs",
+        min=0,
+        help="Specs processed in parallel with --all (0 = one per CPU)",
+    ),
 ) -> None:
     """Generate Mermaid diagrams for a specification file.
 
     If FILE is not provided, auto-detects spec.md in current directory
     or finds the most recently modified spec in specs/.
 
+    Diagrams whose source sections (user stories, key entities) are
+    unchanged since they were last inserted are skipped; use --force to
+    regenerate them anyway.
+
     Examples:
         doit diagram generate
         doit diagram generate specs/035-feature/spec.md
         doit diagram generate --type er-diagram --strict
         doit diagram generate --no-insert --output diagrams.md
+        doit diagram generate --all
     """
+    if all_specs:
+        if file or no_insert or output:
+            console.print(
+                "[red]Error:[/red] --all cannot be combined with FILE, --no-insert or --output."
+            )
+            raise typer.Exit(code=ExitCode.FAILURE)
+        _generate_all(diagram_type, strict, force, jobs)
+        return
+
     # Resolve file path
     resolved_path = _resolve_file_path(file)
     if not resolved_path:
@@ -140,6 +171,7 @@ def generate_command(
         file_path=resolved_path,
         diagram_types=types if types else None,
         insert=not no_insert,
+        force=force,
     )
 
     # Handle errors
@@ -147,6 +179,13 @@ def generate_command(
         console.print(f"[red]Error:[/red] {result.error}")
         raise typer.Exit(code=ExitCode.VALIDATION_ERROR if strict else ExitCode.FAILURE)
 
+    if result.sections_unchanged:
+        console.print(
+            f"[dim]Up to date (source unchanged): {', '.join(result.sections_unchanged)}[/dim]"
+        )
+        if not result.diagrams:
+            raise typer.Exit(code=ExitCode.SUCCESS)
+
     # Display results table
     if result.diagrams:
         table = Table(show_header=True, header_style="bold")
@@ -202,6 +241,68 @@ def generate_command(
         raise typer.Exit(code=ExitCode.PROVIDER_ERROR)
 
 
+def _generate_all(diagram_type: str, strict: bool, force: bool, jobs: int) -> None:
+    """Generate and insert diagrams for every ``specs/*/spec.md``.
+
+    Args:
+        diagram_type: Type string (user-journey, er-diagram, architecture, all)
+        strict: Fail on validation errors
+        force: Regenerate sections whose source is unchanged
+        jobs: Specs processed in parallel (0 = one per CPU)
+    """
+    from ..services.validation_service import resolve_jobs
+
+    types = _parse_diagram_types(diagram_type)
+    if not types and diagram_type != "all":
+        console.print(f"[red]Error:[/red] Unknown diagram type: {diagram_type}")
+        console.print("Valid types: user-journey, er-diagram, architecture, all")
+        raise typer.Exit(code=ExitCode.FAILURE)
+
+    spec_files = sorted((Path.cwd() / "specs").glob("*/spec.md"))
+    if not spec_files:
+        console.print("[yellow]No specs found in specs/.[/yellow]")
+        raise typer.Exit(code=ExitCode.SUCCESS)
+
+    service = DiagramService(strict=strict, backup=True)
+    results = service.generate_all(
+        spec_files,
+        diagram_types=None if diagram_type == "all" else types,
+        force=force,
+        jobs=resolve_jobs(jobs),
+    )
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Spec")
+    table.add_column("Status")
+    table.add_column("Sections")
+
+    updated = unchanged = failed = 0
+    for result in results:
+        spec_name = result.file_path.parent.name
+        if not result.success:
+            failed += 1
+            table.add_row(spec_name, "[red]❌ Error[/red]", result.error or "")
+        elif result.sections_updated:
+            updated += 1
+            table.add_row(
+                spec_name, "[green]✅ Updated[/green]", ", ".join(result.sections_updated)
+            )
+        elif result.sections_unchanged:
+            unchanged += 1
+            table.add_row(spec_name, "[dim]Up to date[/dim]", ", ".join(result.sections_unchanged))
+
+    if updated or failed:
+        console.print(table)
+        console.print()
+    console.print(
+        f"{len(results)} specs: {updated} updated, {unchanged} up to date, "
+        f"{len(results) - updated - unchanged - failed} without diagram sections, {failed} failed"
+    )
+
+    if failed:
+        raise typer.Exit(code=ExitCode.VALIDATION_ERROR if strict else ExitCode.FAILURE)
+
+
 @app.command(name="validate")
 def validate_command(
     file: Path | None = typer.Argument(
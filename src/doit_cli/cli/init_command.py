@@ -204,6 +204,9 @@ def display_init_result(result: InitResult, agents: list[Agent]) -> None:
     # Display summary
     console.print()
     console.print(f"[bold]Summary:[/bold] {result.summary}")
+    if result.backup_path:
+        rel_backup = result.backup_path.relative_to(result.project.path)
+        console.print(f"[dim]Previous files backed up to {rel_backup}/[/dim]")
 
     # Display next steps
     display_next_steps(agents)
@@ -406,6 +409,7 @@ def run_init(
     """
     # Defer imports to avoid circular dependencies
     from ..services.agent_detector import AgentDetector
+    from ..services.backup_service import BackupService
     from ..services.template_manager import TemplateManager
 
     # Create project model
@@ -460,6 +464,13 @@ def run_init(
     if not result.success:
         return result
 
+    # Back up doit-managed command files before --update overwrites them
+    # (--force overwrites without a backup)
+    if update and not force:
+        backup_service = BackupService(project.path)
+        result.backup_path = backup_service.create_doit_backup()
+        backup_service.cleanup_old_backups()
+
     # Create agent directories and copy templates
     template_manager = TemplateManager(template_source)
 
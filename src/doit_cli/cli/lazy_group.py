@@ -0,0 +1,100 @@
+"""Lazy command registry for the top-level `doit` Typer app.
+
+Importing every command module up front pulls in the whole service layer
+(httpx, watchdog, yaml, rich tables, ...) before Typer has even parsed
+argv. Git hooks run `doit hooks validate` on every commit, so that cost
+lands on every commit.
+
+`LazyTyperGroup` keeps a registry of `LazyCommand` entries that name the
+module and attribute implementing each command. A command's module tree
+is imported only when that command is resolved. The top-level `--help`
+listing is rendered from the short help stored in the registry, so it
+imports nothing at all.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Any, ClassVar
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+
+@dataclass(frozen=True)
+class LazyCommand:
+    """A registered top-level command whose module is imported on demand.
+
+    Attributes:
+        name: Command name as typed on the command line.
+        import_path: ``"module:attribute"`` of the Typer sub-app or the
+            command function.
+        help: One-line summary shown in the top-level ``--help`` listing.
+            Must match the first paragraph of the real command's help.
+    """
+
+    name: str
+    import_path: str
+    help: str
+
+    def load(self) -> Any:
+        """Import and return the Typer sub-app or command function."""
+        module_name, _, attr = self.import_path.partition(":")
+        return getattr(import_module(module_name), attr)
+
+
+def build_click_command(entry: LazyCommand) -> Any:
+    """Build the click command for a registry entry.
+
+    The target is mounted on a throwaway parent app exactly as
+    ``app.add_typer`` / ``app.command`` would, so the resulting command is
+    indistinguishable from an eagerly registered one.
+    """
+    target = entry.load()
+    parent = typer.Typer()
+    if isinstance(target, typer.Typer):
+        parent.add_typer(target, name=entry.name)
+    else:
+        parent.command(name=entry.name)(target)
+    return typer.main.get_group(parent).commands[entry.name]
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that resolves registered commands on first use.
+
+    Subclasses set `lazy_commands` to an ordered mapping of command name
+    to `LazyCommand`. Commands registered directly on the Typer app still
+    work and are listed after the lazy ones.
+    """
+
+    lazy_commands: ClassVar[Mapping[str, LazyCommand]] = {}
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Placeholders keep listing order and Typer's "did you mean"
+        # suggestions working without importing anything.
+        placeholders = {
+            name: TyperCommand(name=entry.name, help=entry.help)
+            for name, entry in self.lazy_commands.items()
+        }
+        self.commands = {**placeholders, **self.commands}
+        self._loaded: set[str] = set()
+        self._listing = False
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        entry = self.lazy_commands.get(cmd_name)
+        if entry is None or cmd_name in self._loaded or self._listing:
+            return super().get_command(ctx, cmd_name)
+        command = build_click_command(entry)
+        self.commands[cmd_name] = command
+        self._loaded.add(cmd_name)
+        return command
+
+    def format_help(self, ctx: Any, formatter: Any) -> None:
+        self._listing = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
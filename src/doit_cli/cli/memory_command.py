@@ -95,6 +95,11 @@ def search_command(
         "-j",
         help="Output results as JSON",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Scan every file instead of using the search index in .doit/cache/",
+    ),
 ):
     """Search across project memory files.
 
@@ -138,7 +143,7 @@ def search_command(
         raise typer.Exit(code=ExitCode.FAILURE)
 
     # Create service and search
-    service = MemorySearchService(project_root, console)
+    service = MemorySearchService(project_root, console, use_index=not no_cache)
 
     start_time = time.time()
     try:
@@ -6,6 +6,8 @@ allowing users to view GitHub epics alongside local roadmap items.
 
 from __future__ import annotations
 
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import typer
@@ -27,6 +29,10 @@ from ..utils.github_auth import get_github_config_status, get_repository_name
 app = typer.Typer(help="Manage project roadmap with GitHub epic integration")
 console = Console()
 
+# Incremental refreshes miss epics that lost their label or were deleted,
+# so the cache is rebuilt from a full fetch at least this often.
+FULL_SYNC_INTERVAL = timedelta(hours=24)
+
 
 @app.command()
 def show(
@@ -94,6 +100,10 @@ def show(
 def _fetch_github_epics(refresh: bool):
     """Fetch GitHub epics from API or cache.
 
+    An expired cache is brought up to date by fetching only the epics and
+    features that changed since the last sync; ``--refresh``, a missing
+    cache, or a full sync older than FULL_SYNC_INTERVAL refetch everything.
+
     Args:
         refresh: If True, bypass cache and fetch from API
 
@@ -111,32 +121,39 @@ def _fetch_github_epics(refresh: bool):
             console.print(f"[dim]Using cached GitHub data ({cache_age:.1f} minutes old)[/dim]\n")
             return epics, True
 
-    # Fetch from GitHub API
+    # Fetch from GitHub API (features of all epics are fetched concurrently)
     try:
-        console.print("[dim]Fetching GitHub epics...[/dim]")
-        epics = github_service.fetch_epics(state="open")
-
-        # Fetch features for each epic
-        for epic in epics:
-            try:
-                features = github_service.fetch_features_for_epic(epic.number)
-                epic.features = features
-            except Exception as e:
-                # Log warning but continue with other epics
-                console.print(
-                    f"[dim yellow]Warning: Failed to fetch features for epic #{epic.number}: {e}[/dim yellow]"
-                )
-                epic.features = []
+        synced_at = datetime.now().astimezone()
+        since = None if refresh else _incremental_since(cache_service, synced_at)
+        cached = cache_service.get_epics(allow_stale=True) if since else None
+        if since and cached is not None:
+            console.print("[dim]Fetching GitHub epic changes...[/dim]")
+            fetched = github_service.fetch_epic_changes(cached, since, state="open")
+        else:
+            console.print("[dim]Fetching GitHub epics...[/dim]")
+            fetched = github_service.fetch_epics_with_features(state="open")
+        epics = fetched.epics
+
+        for epic_number, error in fetched.failures.items():
+            # Features of the other epics were still fetched
+            console.print(
+                f"[dim yellow]Warning: Failed to fetch features for epic #{epic_number}: {error}[/dim yellow]"
+            )
 
         # Save to cache
+        started = time.perf_counter()
         repo_url = f"https://github.com/{get_repository_name()}"
         metadata = SyncMetadata.create_new(repo_url)
-        cache_service.save_cache(epics, metadata)
+        cache_service.save_cache(
+            epics, metadata, synced_at=synced_at, full_sync=since is None or cached is None
+        )
+        timings = {**fetched.timings, "cache": time.perf_counter() - started}
 
         feature_count = sum(len(epic.features) for epic in epics)
         console.print(
-            f"[dim]Found {len(epics)} open epic(s) with {feature_count} linked feature(s) on GitHub[/dim]\n"
+            f"[dim]Found {len(epics)} open epic(s) with {feature_count} linked feature(s) on GitHub[/dim]"
         )
+        console.print(f"[dim]{_format_timings(timings)}[/dim]\n")
         return epics, False
 
     except GitHubAuthError as e:
@@ -144,7 +161,7 @@ def _fetch_github_epics(refresh: bool):
         console.print("[yellow]  Checking cache for offline mode...[/yellow]\n")
 
         # Try to use stale cache
-        epics = cache_service.get_epics()
+        epics = cache_service.get_epics(allow_stale=True)
         if epics:
             console.print("[yellow]  Using stale cached data (offline mode)[/yellow]\n")
             return epics, True
@@ -156,7 +173,7 @@ def _fetch_github_epics(refresh: bool):
         console.print(f"[yellow]⚠ GitHub API error: {e}[/yellow]")
 
         # Try to use cache as fallback
-        epics = cache_service.get_epics()
+        epics = cache_service.get_epics(allow_stale=True)
         if epics:
             console.print("[yellow]  Using cached data as fallback[/yellow]\n")
             return epics, True
@@ -169,6 +186,20 @@ def _fetch_github_epics(refresh: bool):
         return [], False
 
 
+def _incremental_since(cache_service: GitHubCacheService, now: datetime) -> datetime | None:
+    """Return the last sync time to fetch changes from, or None for a full fetch."""
+    last_full = cache_service.get_synced_at("full")
+    if last_full is None or now - last_full.astimezone() > FULL_SYNC_INTERVAL:
+        return None
+    return cache_service.get_synced_at("features")
+
+
+def _format_timings(timings: dict[str, float]) -> str:
+    """Format per-stage durations, e.g. ``Fetched in 1.2s (epics 0.4s, ...)``."""
+    stages = ", ".join(f"{stage} {seconds:.1f}s" for stage, seconds in timings.items())
+    return f"Fetched in {sum(timings.values()):.1f}s ({stages})"
+
+
 def _load_local_roadmap() -> list[RoadmapItem]:
     """Load roadmap items from local .doit/memory/roadmap.md file.
 
@@ -12,6 +12,7 @@ from ..formatters.json_formatter import JsonFormatter
 from ..formatters.markdown_formatter import MarkdownFormatter
 from ..formatters.rich_formatter import RichFormatter
 from ..models.status_models import SpecState
+from ..services.spec_cache import SpecCache
 from ..services.spec_scanner import NotADoitProjectError
 from ..services.status_reporter import StatusReporter
 from .output import OutputFormat, format_option, resolve_format
@@ -41,6 +42,17 @@ def status_command(
         allowed=_STATUS_FORMATS,
     ),
     output_file: Path | None = typer.Option(None, "--output", "-o", help="Write report to file"),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Re-parse and re-validate every spec instead of using .doit/cache/",
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        min=0,
+        help="Validate specs in N worker processes (0 = one per CPU, 1 = serial)",
+    ),
 ) -> None:
     """Display status of all specifications in the project.
 
@@ -68,13 +80,16 @@ def status_command(
         fmt = resolve_format(output_format, _STATUS_FORMATS)
 
         # Initialize reporter
-        reporter = StatusReporter()
+        project_root = Path.cwd()
+        cache = SpecCache(project_root, enabled=not no_cache)
+        reporter = StatusReporter(project_root, cache=cache)
 
         # Generate report with filters
         report = reporter.generate_report(
             status_filter=spec_state_filter,
             blocking_only=blocking,
             recent_days=recent,
+            jobs=jobs,
         )
 
         # Select formatter based on format option.
@@ -99,6 +114,8 @@ def status_command(
         elif fmt is OutputFormat.RICH:
             # Rich formatter should print directly for better terminal rendering
             RichFormatter(console).format_to_console(report, verbose=verbose)
+            if verbose:
+                console.print(f"[dim]Spec cache: {cache.stats}[/dim]")
         else:
             # JSON and Markdown output to stdout - use print() for raw output
             print(output_str)
@@ -12,11 +12,12 @@ from rich.table import Table
 
 from ..exit_codes import ExitCode
 from ..models.agent import Agent
-from ..models.sync_models import FileOperation, OperationType, SyncResult
+from ..models.sync_models import FileOperation, OperationType, SyncResult, SyncStatusEnum
 from ..services.command_writer import CommandWriter
 from ..services.prompt_writer import PromptWriter
 from ..services.skill_reader import SkillReader
 from ..services.skill_writer import SkillWriter
+from ..services.sync_manifest import SyncManifest
 from ..services.template_reader import TemplateReader
 
 console = Console()
@@ -208,15 +209,15 @@ def _merge_results(results: list[SyncResult]) -> SyncResult:
 
 def _check_agent_status(
     templates,
-    writer,
     get_path_fn,
+    check_fn,
 ) -> SyncResult:
     """Check sync status for a specific agent without making changes.
 
     Args:
         templates: List of command templates.
-        writer: Writer instance (PromptWriter or CommandWriter).
         get_path_fn: Function to get target path from template.
+        check_fn: Function returning the SyncStatusEnum of a template's target.
 
     Returns:
         SyncResult with status information.
@@ -224,8 +225,9 @@ def _check_agent_status(
     result = SyncResult(total_commands=len(templates))
     for template in templates:
         target_path = get_path_fn(template)
+        status = check_fn(template)
 
-        if not target_path.exists():
+        if status == SyncStatusEnum.MISSING:
             result.add_operation(
                 FileOperation(
                     file_path=str(target_path),
@@ -234,28 +236,24 @@ def _check_agent_status(
                     message="Missing - needs sync",
                 )
             )
-        else:
-            target_mtime = target_path.stat().st_mtime
-            template_mtime = template.modified_at.timestamp()
-
-            if target_mtime < template_mtime:
-                result.add_operation(
-                    FileOperation(
-                        file_path=str(target_path),
-                        operation_type=OperationType.UPDATED,
-                        success=True,
-                        message="Out-of-sync - needs update",
-                    )
+        elif status == SyncStatusEnum.OUT_OF_SYNC:
+            result.add_operation(
+                FileOperation(
+                    file_path=str(target_path),
+                    operation_type=OperationType.UPDATED,
+                    success=True,
+                    message="Out-of-sync - needs update",
                 )
-            else:
-                result.add_operation(
-                    FileOperation(
-                        file_path=str(target_path),
-                        operation_type=OperationType.SKIPPED,
-                        success=True,
-                        message="Up-to-date",
-                    )
+            )
+        else:
+            result.add_operation(
+                FileOperation(
+                    file_path=str(target_path),
+                    operation_type=OperationType.SKIPPED,
+                    success=True,
+                    message="Up-to-date",
                 )
+            )
     return result
 
 
@@ -363,8 +361,10 @@ def sync_prompts_command(
 
     # Initialize services
     reader = TemplateReader(project_root=project_root)
-    prompt_writer = PromptWriter(project_root=project_root)
-    command_writer = CommandWriter(project_root=project_root)
+    # Both writers share one manifest so neither save drops the other's entries
+    manifest = SyncManifest(project_root)
+    prompt_writer = PromptWriter(project_root=project_root, manifest=manifest)
+    command_writer = CommandWriter(project_root=project_root, manifest=manifest)
 
     # Read templates
     templates = reader.scan_templates(filter_name=command_name)
@@ -388,12 +388,13 @@ def sync_prompts_command(
             # Check mode - report status without making changes
             if target_agent == Agent.COPILOT:
                 result = _check_agent_status(
-                    templates, prompt_writer, prompt_writer.get_prompt_path
+                    templates, prompt_writer.get_prompt_path, prompt_writer.check_prompt
                 )
             else:
                 result = _check_agent_status(
-                    templates, command_writer, command_writer.get_command_path
+                    templates, command_writer.get_command_path, command_writer.check_command
                 )
+            manifest.save()
         else:
             # Perform actual sync
             if target_agent == Agent.COPILOT:
@@ -581,6 +581,13 @@ def list_notifications(
         "-l",
         help="Maximum number to show",
     ),
+    page: int = typer.Option(
+        1,
+        "--page",
+        "-p",
+        min=1,
+        help="Page of results to show (pages hold --limit notifications)",
+    ),
     format: str = typer.Option(
         "table",
         "--format",
@@ -595,6 +602,7 @@ def list_notifications(
     Examples:
         doit team notify list
         doit team notify list --all
+        doit team notify list --all --page 2
         doit team notify list --type conflict_detected
     """
     service = _get_service()
@@ -614,11 +622,15 @@ def list_notifications(
             )
             raise typer.Exit(code=ExitCode.FAILURE) from None
 
+    # Fetch one extra to know whether another page follows
     notifications = notif_service.get_notifications(
         unread_only=not all_notifications,
-        limit=limit,
+        limit=limit + 1,
         notification_type=type_filter,
+        offset=(page - 1) * limit,
     )
+    has_more = len(notifications) > limit
+    notifications = notifications[:limit]
 
     if format.lower() == "json":
         import json
@@ -667,6 +679,8 @@ def list_notifications(
     console.print(table)
     console.print()
 
+    if has_more:
+        console.print(f"[dim]More notifications: use --page {page + 1} to see them.[/dim]")
     if unread_count > 0:
         console.print("[dim]Run 'doit team notify read' to mark all as read.[/dim]")
 
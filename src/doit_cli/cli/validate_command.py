@@ -11,6 +11,7 @@ from rich.console import Console
 from ..exit_codes import ExitCode
 from ..models.validation_models import ValidationConfig
 from ..services.report_generator import ReportGenerator
+from ..services.spec_cache import SpecCache
 from ..services.validation_service import ValidationService
 
 console = Console()
@@ -26,6 +27,20 @@ VerboseFlag = Annotated[
     bool, typer.Option("--verbose", "-v", help="Show detailed output including all issues")
 ]
 
+JobsOption = Annotated[
+    int,
+    typer.Option(
+        "--jobs",
+        min=0,
+        help="Validate specs in N worker processes (0 = one per CPU, 1 = serial)",
+    ),
+]
+
+NoCacheFlag = Annotated[
+    bool,
+    typer.Option("--no-cache", help="Re-validate every spec instead of using .doit/cache/"),
+]
+
 
 def validate_command(
     path: Annotated[
@@ -35,6 +50,8 @@ def validate_command(
     all_specs: AllFlag = False,
     json_output: JsonFlag = False,
     verbose: VerboseFlag = False,
+    no_cache: NoCacheFlag = False,
+    jobs: JobsOption = 1,
 ) -> None:
     """Validate spec files for quality and standards compliance.
 
@@ -55,6 +72,8 @@ def validate_command(
         doit validate spec.md                # Validate specific file
         doit validate --all                  # Validate all specs
         doit validate --all --json           # Output as JSON
+        doit validate --all --no-cache       # Ignore cached results
+        doit validate --all --jobs 0         # Validate on every CPU
     """
     # Resolve path
     project_root = Path.cwd()
@@ -66,13 +85,32 @@ def validate_command(
 
     # Create services
     config = ValidationConfig.default()
-    service = ValidationService(project_root=project_root, config=config)
+    cache = SpecCache(project_root, enabled=not no_cache)
+    service = ValidationService(project_root=project_root, config=config, cache=cache)
     reporter = ReportGenerator(console=console)
 
+    try:
+        _run_validation(service, reporter, target_path, all_specs, json_output, verbose, jobs)
+    finally:
+        cache.save()
+        if verbose and not json_output:
+            console.print(f"[dim]Spec cache: {cache.stats}[/dim]")
+
+
+def _run_validation(
+    service: ValidationService,
+    reporter: ReportGenerator,
+    target_path: Path,
+    all_specs: bool,
+    json_output: bool,
+    verbose: bool,
+    jobs: int,
+) -> None:
+    """Validate the requested target and report results."""
     try:
         if all_specs:
             # Validate all specs in specs/ directory
-            results = service.validate_all()
+            results = service.validate_all(jobs=jobs)
 
             if not results:
                 if json_output:
@@ -136,7 +174,7 @@ def validate_command(
                     raise typer.Exit(code=ExitCode.FAILURE)
             else:
                 # Validate all specs in the directory
-                results = service.validate_directory(target_path)
+                results = service.validate_directory(target_path, jobs=jobs)
 
                 if not results:
                     if json_output:
@@ -10,9 +10,10 @@ from rich.console import Console
 from rich.table import Table
 
 from ..exit_codes import ExitCode
-from ..models.crossref_models import CoverageReport, CoverageStatus
+from ..models.crossref_models import CoverageReport, CoverageStatus, TraceabilityMatrix
 from ..services.crossref_service import CrossReferenceService
 from ..services.spec_scanner import NotADoitProjectError
+from ..services.traceability_service import TraceabilityService
 from .output import OutputFormat, format_option, resolve_format
 
 # Standard (rich, json, markdown) format set used by most xref reports.
@@ -21,6 +22,9 @@ _REPORT_FORMATS = (OutputFormat.RICH, OutputFormat.JSON, OutputFormat.MARKDOWN)
 # Terse (rich, json) set for commands that don't carry a markdown variant.
 _TERSE_FORMATS = (OutputFormat.RICH, OutputFormat.JSON)
 
+# Coverage reports can also be exported as flat CSV for dashboards.
+_COVERAGE_FORMATS = (*_REPORT_FORMATS, OutputFormat.CSV)
+
 console = Console()
 
 # Create the xref subcommand group
@@ -37,21 +41,13 @@ def _detect_spec_from_branch() -> str | None:
     Returns:
         Spec name if branch matches pattern XXX-feature-name, None otherwise.
     """
-    import subprocess
+    from ..services.git_context import get_git_context
 
-    try:
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            branch = result.stdout.strip()
-            # Check if branch matches spec pattern (e.g., 033-feature-name)
-            if branch and branch[0].isdigit():
-                return branch
-    except (FileNotFoundError, subprocess.SubprocessError):
-        pass
+    context = get_git_context()
+    branch = context.branch if context is not None else None
+    # Check if branch matches spec pattern (e.g., 033-feature-name)
+    if branch and branch[0].isdigit():
+        return branch
     return None
 
 
@@ -159,6 +155,74 @@ def _format_coverage_markdown(report: CoverageReport) -> str:
     return "\n".join(lines)
 
 
+def _format_matrix_rich(matrix: TraceabilityMatrix, console: Console) -> None:
+    """Format a project-wide coverage matrix as Rich table."""
+    console.print()
+    console.print("[bold]Requirement Coverage: all specs[/bold]")
+    console.print("=" * 50)
+    console.print()
+
+    if not matrix.reports:
+        console.print("[yellow]No specs found.[/yellow]")
+        return
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Spec", style="cyan")
+    table.add_column("Requirements", justify="right")
+    table.add_column("Covered", justify="right")
+    table.add_column("Coverage", justify="right")
+    table.add_column("Orphaned", justify="right")
+
+    for feature, report in matrix.reports.items():
+        orphaned = len(report.orphaned_references)
+        table.add_row(
+            feature,
+            str(report.total_count),
+            str(report.covered_count),
+            f"{report.coverage_percent:.0f}%",
+            f"[red]{orphaned}[/red]" if orphaned else "0",
+        )
+
+    console.print(table)
+    console.print()
+
+    coverage_color = "green" if matrix.coverage_percent >= 100 else "yellow"
+    if matrix.coverage_percent < 50:
+        coverage_color = "red"
+
+    console.print(
+        f"[{coverage_color}]Coverage: {matrix.coverage_percent:.0f}% "
+        f"({matrix.covered_count}/{matrix.total_count})[/{coverage_color}]"
+    )
+    if matrix.orphaned_count:
+        console.print(f"[red]Orphaned references: {matrix.orphaned_count}[/red]")
+
+
+def _format_matrix_markdown(matrix: TraceabilityMatrix) -> str:
+    """Format a project-wide coverage matrix as Markdown."""
+    lines = [
+        "# Requirement Coverage: all specs",
+        "",
+        "| Spec | Requirements | Covered | Coverage | Orphaned |",
+        "|------|--------------|---------|----------|----------|",
+    ]
+
+    for feature, report in matrix.reports.items():
+        lines.append(
+            f"| {feature} | {report.total_count} | {report.covered_count} "
+            f"| {report.coverage_percent:.0f}% | {len(report.orphaned_references)} |"
+        )
+
+    lines.extend(
+        [
+            "",
+            f"**Coverage**: {matrix.coverage_percent:.0f}% "
+            f"({matrix.covered_count}/{matrix.total_count})",
+        ]
+    )
+    return "\n".join(lines)
+
+
 @xref_app.command(name="coverage")
 def coverage_command(
     spec_name: str | None = typer.Argument(
@@ -166,26 +230,63 @@ def coverage_command(
     ),
     output_format: str = format_option(
         default=OutputFormat.RICH,
-        allowed=_REPORT_FORMATS,
+        allowed=_COVERAGE_FORMATS,
     ),
     strict: bool = typer.Option(
         False, "--strict", "-s", help="Treat uncovered requirements as errors"
     ),
+    all_specs: bool = typer.Option(
+        False, "--all", "-a", help="Report coverage for every spec in the project"
+    ),
     output_file: Path | None = typer.Option(None, "--output", "-o", help="Write output to file"),
 ) -> None:
     """Generate a coverage report showing requirement-to-task mapping.
 
     Shows which requirements have implementing tasks and identifies
-    any uncovered requirements or orphaned task references.
+    any uncovered requirements or orphaned task references. With --all,
+    every spec is parsed once and summarised in one report; the json and
+    csv formats then list every requirement-task link.
 
     Exit codes (see doit_cli.exit_codes.ExitCode):
       0 (SUCCESS)          — all requirements covered
       1 (FAILURE)          — uncovered requirements (with --strict) or orphans
       2 (VALIDATION_ERROR) — spec not found or invalid
     """
-    fmt = resolve_format(output_format, _REPORT_FORMATS)
+    fmt = resolve_format(output_format, _COVERAGE_FORMATS)
 
     try:
+        if all_specs:
+            if spec_name:
+                console.print("[red]Error:[/red] Provide a spec name or --all, not both.")
+                raise typer.Exit(code=ExitCode.VALIDATION_ERROR)
+
+            matrix = TraceabilityService().build()
+
+            if fmt is OutputFormat.JSON:
+                output_str: str | None = json.dumps(matrix.to_dict(), indent=2)
+            elif fmt is OutputFormat.CSV:
+                output_str = matrix.to_csv()
+            elif fmt is OutputFormat.MARKDOWN or output_file:
+                # For rich format to file, use markdown instead
+                output_str = _format_matrix_markdown(matrix)
+            else:
+                output_str = None  # Rich output handled separately
+
+            if output_file:
+                output_file.write_text(output_str or "")
+                console.print(f"[green]Report written to {output_file}[/green]")
+            elif output_str is None:
+                _format_matrix_rich(matrix, console)
+            else:
+                print(output_str, end="" if fmt is OutputFormat.CSV else "\n")
+
+            if matrix.orphaned_count:
+                raise typer.Exit(code=ExitCode.FAILURE)
+            if strict and matrix.uncovered_count:
+                raise typer.Exit(code=ExitCode.FAILURE)
+
+            raise typer.Exit(code=ExitCode.SUCCESS)
+
         # Auto-detect spec from branch if not provided
         if not spec_name:
             spec_name = _detect_spec_from_branch()
@@ -206,9 +307,11 @@ def coverage_command(
 
         # Format output
         if fmt is OutputFormat.JSON:
-            output_str: str | None = _format_coverage_json(report)
+            output_str = _format_coverage_json(report)
         elif fmt is OutputFormat.MARKDOWN:
             output_str = _format_coverage_markdown(report)
+        elif fmt is OutputFormat.CSV:
+            output_str = TraceabilityMatrix(reports={spec_name: report}).to_csv()
         else:
             output_str = None  # Rich output handled separately
 
@@ -222,7 +325,7 @@ def coverage_command(
         elif fmt is OutputFormat.RICH:
             _format_coverage_rich(report, console)
         else:
-            print(output_str)
+            print(output_str, end="" if fmt is OutputFormat.CSV else "\n")
 
         # Determine exit code
         has_orphaned = len(report.orphaned_references) > 0
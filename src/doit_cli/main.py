@@ -4,57 +4,134 @@ from __future__ import annotations
 
 import typer
 
-from .cli.analytics_command import app as analytics_app
-from .cli.constitution_command import app as constitution_app
-from .cli.context_command import context_app
-from .cli.diagram_command import diagram_app
-from .cli.fixit_command import app as fixit_app
-from .cli.hooks_command import hooks_app
-from .cli.init_command import init_command
-from .cli.memory_command import memory_app
-from .cli.provider_command import app as provider_app
-from .cli.roadmapit_command import app as roadmapit_app
-from .cli.status_command import status_command
-from .cli.sync_prompts_command import sync_prompts_command
-from .cli.team_command import app as team_app
-from .cli.update_command import update_command
-from .cli.validate_command import validate_command
-from .cli.verify_command import verify_command, verify_memory_command
-from .cli.xref_command import xref_app
+from .cli.lazy_group import LazyCommand, LazyTyperGroup
+
+# Top-level commands, in `--help` order. Each module is imported only when
+# its command runs, so `doit hooks validate` (run from git hooks on every
+# commit) does not pay for analytics, MCP, GitHub providers, etc.
+COMMANDS: dict[str, LazyCommand] = {
+    entry.name: entry
+    for entry in (
+        LazyCommand(
+            "init",
+            "doit_cli.cli.init_command:init_command",
+            "Initialize a new doit project with bundled templates.",
+        ),
+        LazyCommand(
+            "status",
+            "doit_cli.cli.status_command:status_command",
+            "Display status of all specifications in the project.",
+        ),
+        LazyCommand(
+            "sync-prompts",
+            "doit_cli.cli.sync_prompts_command:sync_prompts_command",
+            "Synchronize agent commands with doit command templates.",
+        ),
+        LazyCommand(
+            "update",
+            "doit_cli.cli.update_command:update_command",
+            "Update doit templates and commands to the latest version.",
+        ),
+        LazyCommand(
+            "validate",
+            "doit_cli.cli.validate_command:validate_command",
+            "Validate spec files for quality and standards compliance.",
+        ),
+        LazyCommand(
+            "verify",
+            "doit_cli.cli.verify_command:verify_command",
+            "Verify doit project setup and report status.",
+        ),
+        LazyCommand(
+            "verify-memory",
+            "doit_cli.cli.verify_command:verify_memory_command",
+            "Validate .doit/memory/* against the memory-file contract.",
+        ),
+        # Subcommand groups
+        LazyCommand(
+            "analytics",
+            "doit_cli.cli.analytics_command:app",
+            "Spec analytics and metrics dashboard",
+        ),
+        LazyCommand(
+            "constitution",
+            "doit_cli.cli.constitution_command:app",
+            "Constitution management commands",
+        ),
+        LazyCommand(
+            "context",
+            "doit_cli.cli.context_command:context_app",
+            "Manage AI context injection for doit commands.",
+        ),
+        LazyCommand(
+            "diagram",
+            "doit_cli.cli.diagram_command:diagram_app",
+            "Generate and validate Mermaid diagrams from specifications",
+        ),
+        LazyCommand(
+            "fixit",
+            "doit_cli.cli.fixit_command:app",
+            "Bug-fix workflow commands",
+        ),
+        LazyCommand(
+            "hooks",
+            "doit_cli.cli.hooks_command:hooks_app",
+            "Manage Git hooks for workflow enforcement.",
+        ),
+        LazyCommand(
+            "memory",
+            "doit_cli.cli.memory_command:memory_app",
+            "Project memory commands: search the memory files, enrich placeholder "
+            "stubs, and run shape migrations. Subcommands: `search`, `history`, "
+            "`schema`, `enrich <file>`, `migrate`.",
+        ),
+        LazyCommand(
+            "provider",
+            "doit_cli.cli.provider_command:app",
+            "Git provider management commands",
+        ),
+        LazyCommand(
+            "roadmapit",
+            "doit_cli.cli.roadmapit_command:app",
+            "Manage project roadmap with GitHub epic integration",
+        ),
+        LazyCommand(
+            "team",
+            "doit_cli.cli.team_command:app",
+            "Team collaboration commands",
+        ),
+        LazyCommand(
+            "xref",
+            "doit_cli.cli.xref_command:xref_app",
+            "Cross-reference commands for spec-task traceability",
+        ),
+        # MCP subcommand - availability checked at runtime in serve_command()
+        LazyCommand(
+            "mcp",
+            "doit_cli.cli.mcp_command:app",
+            "MCP server for AI assistant integration",
+        ),
+    )
+}
+
+
+class DoitGroup(LazyTyperGroup):
+    """Top-level `doit` group backed by the lazy `COMMANDS` registry."""
+
+    lazy_commands = COMMANDS
+
 
-# Create a new typer app for the refactored commands
 app = typer.Typer(
     name="doit",
     help="Doit CLI - Setup tool for Doit spec-driven development projects",
     add_completion=False,
+    cls=DoitGroup,
 )
 
-# Register commands
-app.command(name="init")(init_command)
-app.command(name="status")(status_command)
-app.command(name="sync-prompts")(sync_prompts_command)
-app.command(name="update")(update_command)
-app.command(name="validate")(validate_command)
-app.command(name="verify")(verify_command)
-app.command(name="verify-memory")(verify_memory_command)
-
-# Register subcommand groups
-app.add_typer(analytics_app, name="analytics")
-app.add_typer(constitution_app, name="constitution")
-app.add_typer(context_app, name="context")
-app.add_typer(diagram_app, name="diagram")
-app.add_typer(fixit_app, name="fixit")
-app.add_typer(hooks_app, name="hooks")
-app.add_typer(memory_app, name="memory")
-app.add_typer(provider_app, name="provider")
-app.add_typer(roadmapit_app, name="roadmapit")
-app.add_typer(team_app, name="team")
-app.add_typer(xref_app, name="xref")
-
-# MCP subcommand - availability checked at runtime in serve_command()
-from .cli.mcp_command import app as mcp_app
 
-app.add_typer(mcp_app, name="mcp")
+@app.callback()
+def _root() -> None:
+    """Doit CLI - Setup tool for Doit spec-driven development projects."""
 
 
 def main():
@@ -0,0 +1,450 @@
+"""Warm, watcher-invalidated project state for the MCP server.
+
+`doit mcp serve` is a long-lived process, but each tool call used to build
+fresh services from `Path.cwd()` and rescan the whole project. The
+`ProjectState` here keeps the derived data in memory instead:
+
+- per spec directory: its `SpecStatus`, `ValidationResult` and requirement
+  coverage
+- per file: parsed tasks and raw text (memory resources)
+- per project: the loaded context and the current branch
+
+Entries are dropped when watchdog reports a change to a file they depend
+on, so unchanged files are served without touching the disk. Changes to
+configuration (``.doit/config/`` or files directly in ``.doit/``) drop
+everything. The git directory is watched non-recursively: writing
+``index`` drops spec statuses (blocking depends on staged files) and
+moving ``HEAD`` drops the branch and the loaded context.
+
+If the watcher cannot start, every lookup is computed fresh, exactly as
+before.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from watchdog.events import (
+    EVENT_TYPE_CLOSED,
+    EVENT_TYPE_CLOSED_NO_WRITE,
+    EVENT_TYPE_OPENED,
+    FileSystemEvent,
+    FileSystemEventHandler,
+)
+from watchdog.observers import Observer
+
+from ..services.git_utils import GitError, run_git_command
+from ..services.spec_cache import CacheStats, SpecCache
+
+if TYPE_CHECKING:
+    from ..models.context_config import ContextSource, LoadedContext
+    from ..models.crossref_models import CoverageReport, Task
+    from ..models.status_models import SpecStatus
+    from ..models.validation_models import ValidationResult
+    from ..services.context_loader import ContextLoader
+    from ..services.spec_scanner import SpecScanner
+    from ..services.validation_service import ValidationService
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Events that do not change file content.
+_IGNORED_EVENT_TYPES = frozenset({EVENT_TYPE_OPENED, EVENT_TYPE_CLOSED, EVENT_TYPE_CLOSED_NO_WRITE})
+
+
+@dataclass
+class StateStats(CacheStats):
+    """Hit/miss counters for the MCP project state.
+
+    Attributes:
+        invalidations: Entries dropped because a watched file changed
+    """
+
+    invalidations: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert to a JSON-serializable dict."""
+        return {**super().to_dict(), "invalidations": self.invalidations}
+
+
+class _InvalidatingHandler(FileSystemEventHandler):
+    """Forwards every changed path (source and destination) to the state."""
+
+    def __init__(self, state: ProjectState) -> None:
+        self.state = state
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        if event.event_type in _IGNORED_EVENT_TYPES:
+            return
+        for raw in (event.src_path, getattr(event, "dest_path", "")):
+            if raw:
+                self.state.invalidate(Path(os.fsdecode(raw)))
+
+
+class ProjectState:
+    """In-memory model of a doit project shared by all MCP tool calls.
+
+    Attributes:
+        project_root: Root of the doit project
+        spec_cache: Parsed-spec cache shared by the services (never saved)
+        stats: Hit/miss/invalidation counters for this server
+    """
+
+    SPECS_DIR = "specs"
+    DOIT_DIR = ".doit"
+
+    # Subdirectories of .doit/ whose changes only affect entries that
+    # depend on the changed file. Other subdirectories (cache, logs,
+    # backups, ...) are written by doit itself and ignored.
+    _TRACKED_DOIT_DIRS = frozenset({"memory"})
+    # Subdirectories of .doit/ holding configuration read by every service.
+    _CONFIG_DOIT_DIRS = frozenset({"config"})
+
+    def __init__(self, project_root: Path, watch: bool = True) -> None:
+        """Initialize the state. Nothing is read until the first lookup.
+
+        Args:
+            project_root: Root directory of the project.
+            watch: Whether to watch the project and keep results in memory.
+                Without watching, every lookup is computed fresh.
+        """
+        self.project_root = project_root.resolve()
+        self.watch = watch
+        self.spec_cache = SpecCache(self.project_root)
+        self.stats = StateStats()
+
+        self._entries: dict[tuple[str, Path], Any] = {}
+        self._generation = 0
+        self._lock = threading.RLock()
+        self._observer: Any = None
+        self._started = False
+        self._watched_roots: list[Path] = []
+        self._git_dir: Path | None = None
+
+        self._scanner: SpecScanner | None = None
+        self._validation_service: ValidationService | None = None
+
+    # ------------------------------------------------------------------
+    # Watching
+    # ------------------------------------------------------------------
+
+    @property
+    def is_watching(self) -> bool:
+        """Whether results are being kept (the watcher is running)."""
+        self._ensure_started()
+        return self._observer is not None
+
+    def start(self) -> bool:
+        """Start watching the project.
+
+        Returns:
+            True if the watcher is running.
+        """
+        with self._lock:
+            if self._started:
+                return self._observer is not None
+            self._started = True
+            if not self.watch:
+                return False
+
+            roots = [
+                self.project_root / name
+                for name in (self.SPECS_DIR, self.DOIT_DIR)
+                if (self.project_root / name).is_dir()
+            ]
+            git_dir = self._find_git_dir()
+            try:
+                handler = _InvalidatingHandler(self)
+                observer = Observer()
+                for root in roots:
+                    observer.schedule(handler, str(root), recursive=True)
+                if git_dir is not None:
+                    observer.schedule(handler, str(git_dir), recursive=False)
+                observer.daemon = True
+                observer.start()
+            except Exception as exc:
+                logger.warning("MCP project watcher unavailable, caching disabled: %s", exc)
+                return False
+
+            self._observer = observer
+            self._watched_roots = roots
+            self._git_dir = git_dir
+            return True
+
+    def stop(self) -> None:
+        """Stop watching and drop all entries."""
+        with self._lock:
+            observer, self._observer = self._observer, None
+            self._watched_roots = []
+            self._git_dir = None
+            self._started = False
+            self._drop_all()
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=5.0)
+
+    def _ensure_started(self) -> None:
+        if not self._started:
+            self.start()
+
+    def _find_git_dir(self) -> Path | None:
+        try:
+            result = run_git_command(["rev-parse", "--absolute-git-dir"], cwd=self.project_root)
+        except GitError:
+            return None
+        if not result.success or not result.stdout:
+            return None
+        return Path(result.stdout).resolve()
+
+    def _is_watched(self, path: Path) -> bool:
+        if path == self.project_root:
+            # Project-wide entries depend on every watched directory.
+            return bool(self._watched_roots)
+        if self._git_dir is not None and path.parent == self._git_dir:
+            return True
+        return any(path == root or path.is_relative_to(root) for root in self._watched_roots)
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    def invalidate(self, path: Path) -> None:
+        """Drop entries that depend on a changed path.
+
+        Args:
+            path: File or directory that was created, modified, deleted or
+                moved.
+        """
+        with self._lock:
+            if self._git_dir is not None and path.parent == self._git_dir:
+                if path.name == "index":
+                    self._drop(lambda kind, _key: kind == "status")
+                    self._scanner = None
+                elif path.name == "HEAD":
+                    self._drop(lambda kind, _key: kind in ("branch", "context"))
+                return
+
+            try:
+                relative = path.relative_to(self.project_root)
+            except ValueError:
+                return
+
+            if relative.parts[:1] == (self.DOIT_DIR,):
+                subdir = relative.parts[1] if len(relative.parts) > 1 else ""
+                top_level = len(relative.parts) < 2 or (
+                    len(relative.parts) == 2 and not path.is_dir()
+                )
+                if top_level or subdir in self._CONFIG_DOIT_DIRS:
+                    # .doit/ itself, a config file such as
+                    # validation-rules.yaml, or .doit/config/.
+                    self._drop_all()
+                    return
+                if subdir not in self._TRACKED_DOIT_DIRS:
+                    return
+
+            self._drop(lambda _kind, key: key == path or key in path.parents or path in key.parents)
+
+    def invalidate_all(self) -> None:
+        """Drop every entry and the services built from configuration."""
+        with self._lock:
+            self._drop_all()
+
+    def _drop(self, predicate: Callable[[str, Path], bool]) -> None:
+        stale = [entry for entry in self._entries if predicate(*entry)]
+        for entry in stale:
+            del self._entries[entry]
+        self.stats.invalidations += len(stale)
+        self._generation += 1
+
+    def _drop_all(self) -> None:
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
+        self._scanner = None
+        self._validation_service = None
+        self._generation += 1
+
+    def _lookup(self, kind: str, key: Path, compute: Callable[[], T]) -> T:
+        """Return a kept entry, computing and keeping it on a miss.
+
+        Results computed while an invalidation happened are returned but
+        not kept, since they may have read the file mid-change.
+        """
+        self._ensure_started()
+        entry = (kind, key)
+        with self._lock:
+            if entry in self._entries:
+                self.stats.hits += 1
+                return self._entries[entry]
+            self.stats.misses += 1
+            generation = self._generation
+            keep = self._observer is not None and self._is_watched(key)
+
+        value = compute()
+
+        if keep:
+            with self._lock:
+                if generation == self._generation:
+                    self._entries[entry] = value
+        return value
+
+    # ------------------------------------------------------------------
+    # Services
+    # ------------------------------------------------------------------
+
+    @property
+    def scanner(self) -> SpecScanner:
+        """Spec scanner sharing the state's cache.
+
+        While watching, the scanner (and its snapshot of staged files) is
+        kept until the git index changes. Without the watcher nothing would
+        report that, so a new scanner is built on every access.
+        """
+        from ..services.spec_scanner import SpecScanner
+
+        self._ensure_started()
+        with self._lock:
+            if self._observer is None:
+                return SpecScanner(self.project_root, cache=self.spec_cache)
+            if self._scanner is None:
+                self._scanner = SpecScanner(self.project_root, cache=self.spec_cache)
+            return self._scanner
+
+    @property
+    def validation_service(self) -> ValidationService:
+        """Validation service sharing the state's cache."""
+        with self._lock:
+            if self._validation_service is None:
+                from ..services.validation_service import ValidationService
+
+                self._validation_service = ValidationService(
+                    self.project_root, cache=self.spec_cache
+                )
+            return self._validation_service
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def spec_files(self) -> list[Path]:
+        """Return every top-level ``specs/*/spec.md``, sorted."""
+        specs_dir = self.project_root / self.SPECS_DIR
+        if not specs_dir.is_dir():
+            return []
+        return sorted(specs_dir.glob("*/spec.md"))
+
+    def spec_statuses(self) -> list[SpecStatus]:
+        """Return the validated status of every spec, sorted by name."""
+        scanner = self.scanner
+        return [
+            self._lookup(
+                "status", spec_file.parent, partial(scanner.scan_single, spec_file.parent.name)
+            )
+            for spec_file in self.spec_files()
+        ]
+
+    def validation(self, spec_path: Path) -> ValidationResult:
+        """Validate one spec file.
+
+        Unreadable or non-markdown files yield an error result, as in
+        `ValidationService.validate_directory`.
+        """
+        spec_path = spec_path.resolve()
+
+        def compute() -> ValidationResult:
+            service = self.validation_service
+            try:
+                return service.validate_file(spec_path)
+            except (FileNotFoundError, ValueError) as exc:
+                return service.file_error_result(spec_path, exc)
+
+        # Validation of a spec also reads the sibling tasks.md.
+        return self._lookup("validation", spec_path.parent, compute)
+
+    def validate_all(self) -> list[ValidationResult]:
+        """Validate every ``spec.md`` under ``specs/``."""
+        specs_dir = self.project_root / self.SPECS_DIR
+        if not specs_dir.is_dir():
+            return []
+        return [self.validation(path) for path in sorted(specs_dir.rglob("spec.md"))]
+
+    def tasks(self, tasks_path: Path) -> list[Task]:
+        """Parse a tasks.md file."""
+        from ..services.task_parser import TaskParser
+
+        tasks_path = tasks_path.resolve()
+        return self._lookup(
+            "tasks",
+            tasks_path,
+            lambda: TaskParser(tasks_path=tasks_path, cache=self.spec_cache).parse(),
+        )
+
+    def coverage(self, spec_path: Path) -> CoverageReport:
+        """Build the requirement coverage of a spec and its sibling tasks.md.
+
+        Raises:
+            FileNotFoundError: If the spec does not exist (errors are not kept).
+        """
+        from ..services.traceability_service import TraceabilityService
+
+        spec_path = spec_path.resolve()
+        service = TraceabilityService(self.project_root, cache=self.spec_cache)
+        # Coverage depends on both files, so it is kept per spec directory.
+        return self._lookup("coverage", spec_path.parent, lambda: service.build_report(spec_path))
+
+    def read_text(self, path: Path) -> str:
+        """Read a UTF-8 text file.
+
+        Raises:
+            OSError: If the file cannot be read (errors are not kept).
+        """
+        path = path.resolve()
+        return self._lookup("text", path, lambda: path.read_text(encoding="utf-8"))
+
+    def context(self) -> LoadedContext:
+        """Load all configured context sources."""
+        return self._lookup("context", self.project_root, lambda: self._fresh_loader().load())
+
+    def roadmap(self) -> ContextSource | None:
+        """Load the roadmap context source."""
+        roadmap_path = self.project_root / self.DOIT_DIR / "memory" / "roadmap.md"
+        return self._lookup("roadmap", roadmap_path, lambda: self._fresh_loader().load_roadmap())
+
+    def _fresh_loader(self) -> ContextLoader:
+        # ContextLoader memoizes file reads for its lifetime, so each miss
+        # uses a new instance (which also re-reads context.yaml).
+        from ..services.context_loader import ContextLoader
+
+        return ContextLoader(project_root=self.project_root)
+
+    def current_branch(self, compute: Callable[[], str | None]) -> str | None:
+        """Return the current branch, detected by ``compute`` on a miss.
+
+        Kept until the git directory's ``HEAD`` changes.
+        """
+        self._ensure_started()
+        git_dir = self._git_dir or self.project_root / ".git"
+        return self._lookup("branch", git_dir / "HEAD", compute)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize the state for the `doit_cache_stats` tool."""
+        watching = self.is_watching
+        with self._lock:
+            by_kind: dict[str, int] = {}
+            for kind, _key in self._entries:
+                by_kind[kind] = by_kind.get(kind, 0) + 1
+            return {
+                "project_root": str(self.project_root),
+                "watching": watching,
+                "entries": len(self._entries),
+                "entries_by_kind": by_kind,
+                **self.stats.to_dict(),
+                "spec_cache": self.spec_cache.stats.to_dict(),
+            }
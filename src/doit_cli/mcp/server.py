@@ -11,6 +11,8 @@ from pathlib import Path
 
 from mcp.server.fastmcp import FastMCP
 
+from .project_state import ProjectState
+from .tools.cache_tool import register_cache_tool
 from .tools.context_tool import register_context_tool
 from .tools.scaffold_tool import register_scaffold_tool
 from .tools.status_tool import register_status_tool
@@ -29,57 +31,67 @@ def _get_version() -> str:
         return "0.0.0-dev"
 
 
-def create_server() -> FastMCP:
+def create_server(project_root: Path | None = None, watch: bool = True) -> FastMCP:
     """Create and configure the doit MCP server.
 
+    Tools answer from a `ProjectState` that keeps parsed project data in
+    memory, invalidated per file as the project changes on disk.
+
+    Args:
+        project_root: Project the server operates on. Defaults to cwd.
+        watch: Whether to watch the project and keep results between calls.
+
     Returns:
         Configured FastMCP server with all tools and resources registered.
     """
     mcp = FastMCP("doit")
+    state = ProjectState(project_root or Path.cwd(), watch=watch)
 
     # Register all tools
-    register_validate_tool(mcp)
-    register_status_tool(mcp)
-    register_tasks_tool(mcp)
-    register_context_tool(mcp)
+    register_validate_tool(mcp, state)
+    register_status_tool(mcp, state)
+    register_tasks_tool(mcp, state)
+    register_context_tool(mcp, state)
     register_scaffold_tool(mcp)
     register_verify_tool(mcp)
+    register_cache_tool(mcp, state)
 
     # Register project memory as resources
-    _register_resources(mcp)
+    _register_resources(mcp, state)
 
     return mcp
 
 
-def _register_resources(mcp: FastMCP) -> None:
+def _register_resources(mcp: FastMCP, state: ProjectState) -> None:
     """Register project memory files as MCP resources."""
+    memory_dir = state.project_root / ".doit" / "memory"
 
     @mcp.resource("doit://memory/constitution")
     def get_constitution() -> str:
         """Project constitution - principles, tech stack, and governance."""
-        path = Path.cwd() / ".doit" / "memory" / "constitution.md"
+        path = memory_dir / "constitution.md"
         if not path.exists():
             raise FileNotFoundError(
                 f"Constitution not found at {path}. Run `doit init` to create one."
             )
-        return path.read_text(encoding="utf-8")
+        return state.read_text(path)
 
     @mcp.resource("doit://memory/roadmap")
     def get_roadmap() -> str:
         """Project roadmap - prioritized features and requirements."""
-        path = Path.cwd() / ".doit" / "memory" / "roadmap.md"
+        path = memory_dir / "roadmap.md"
         if not path.exists():
             raise FileNotFoundError(
                 f"Roadmap not found at {path}. Run `/doit.roadmapit` to create one."
             )
-        return path.read_text(encoding="utf-8")
+        return state.read_text(path)
 
     @mcp.resource("doit://memory/tech-stack")
     def get_tech_stack() -> str:
         """Tech stack decisions - languages, frameworks, and infrastructure."""
-        path = Path.cwd() / ".doit" / "memory" / "tech-stack.md"
+        path = memory_dir / "tech-stack.md"
         if not path.exists():
             raise FileNotFoundError(
                 f"Tech stack not found at {path}. Run `/doit.constitution` to create one."
             )
-        return path.read_text(encoding="utf-8")
+        return state.read_text(path)
@@ -0,0 +1,25 @@
+"""MCP tool for reporting the server's project-state cache."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from mcp.server.fastmcp import FastMCP
+
+if TYPE_CHECKING:
+    from ..project_state import ProjectState
+
+
+def register_cache_tool(mcp: FastMCP, state: ProjectState) -> None:
+    """Register the doit_cache_stats tool with the MCP server."""
+
+    @mcp.tool()
+    def doit_cache_stats() -> str:
+        """Report how the server's in-memory project state is performing.
+
+        Returns:
+            JSON with whether the project is being watched, the number of
+            kept entries (by kind), and hit, miss and invalidation counts.
+        """
+        return json.dumps(state.to_dict(), indent=2)
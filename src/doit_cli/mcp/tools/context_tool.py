@@ -5,14 +5,24 @@ from __future__ import annotations
 import json
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from mcp.server.fastmcp import FastMCP
 
+if TYPE_CHECKING:
+    from ..project_state import ProjectState
+
 logger = logging.getLogger(__name__)
 
 
-def register_context_tool(mcp: FastMCP) -> None:
-    """Register the doit_context tool with the MCP server."""
+def register_context_tool(mcp: FastMCP, state: ProjectState | None = None) -> None:
+    """Register the doit_context tool with the MCP server.
+
+    Args:
+        mcp: Server to register the tool with.
+        state: Warm project state to answer from. Without it, every call
+            loads context for the project in the current directory.
+    """
 
     @mcp.tool()
     def doit_context(sources: list[str] | None = None) -> str:
@@ -31,7 +41,10 @@ def register_context_tool(mcp: FastMCP) -> None:
         project_root = Path.cwd()
 
         try:
-            loader = ContextLoader(project_root=project_root)
+            if state is not None:
+                loaded = state.context()
+            else:
+                loaded = ContextLoader(project_root=project_root).load()
         except FileNotFoundError as e:
             return json.dumps(
                 {
@@ -50,7 +63,6 @@ def register_context_tool(mcp: FastMCP) -> None:
                 indent=2,
             )
 
-        loaded = loader.load()
         sources_data = []
 
         for source in loaded.sources:
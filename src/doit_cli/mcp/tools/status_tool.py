@@ -5,15 +5,26 @@ from __future__ import annotations
 import json
 import logging
 import re
+from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from mcp.server.fastmcp import FastMCP
 
+if TYPE_CHECKING:
+    from ..project_state import ProjectState
+
 logger = logging.getLogger(__name__)
 
 
-def register_status_tool(mcp: FastMCP) -> None:
-    """Register the doit_status tool with the MCP server."""
+def register_status_tool(mcp: FastMCP, state: ProjectState | None = None) -> None:
+    """Register the doit_status tool with the MCP server.
+
+    Args:
+        mcp: Server to register the tool with.
+        state: Warm project state to answer from. Without it, every call
+            scans the project in the current directory.
+    """
 
     @mcp.tool()
     def doit_status(
@@ -31,9 +42,10 @@ def register_status_tool(mcp: FastMCP) -> None:
         Returns:
             JSON with spec statuses, summary counts, and optional roadmap data.
         """
+        from ...models.status_models import StatusReport
         from ...services.status_reporter import StatusReporter
 
-        project_root = Path.cwd()
+        project_root = state.project_root if state is not None else Path.cwd()
 
         try:
             reporter = StatusReporter(project_root=project_root, validate=True)
@@ -60,10 +72,27 @@ def register_status_tool(mcp: FastMCP) -> None:
             }
             filter_state = state_map.get(status_filter.lower())
 
-        report = reporter.generate_report(
-            status_filter=filter_state,
-            blocking_only=blocking_only,
-        )
+        if state is not None:
+            try:
+                specs = state.spec_statuses()
+            except Exception as e:
+                logger.warning("Failed to scan specs: %s", e)
+                return json.dumps(
+                    {"error": str(e), "message": "Failed to scan specs."},
+                    indent=2,
+                )
+            if filter_state is not None:
+                specs = reporter.filter_by_status(specs, filter_state)
+            if blocking_only:
+                specs = reporter.filter_blocking(specs)
+            report = StatusReport(
+                specs=specs, generated_at=datetime.now(), project_root=project_root
+            )
+        else:
+            report = reporter.generate_report(
+                status_filter=filter_state,
+                blocking_only=blocking_only,
+            )
 
         specs_data: list[dict[str, object]] = []
         by_status: dict[str, int] = {}
@@ -95,8 +124,10 @@ def register_status_tool(mcp: FastMCP) -> None:
             try:
                 from ...services.context_loader import ContextLoader
 
-                loader = ContextLoader(project_root=project_root)
-                roadmap_source = loader.load_roadmap()
+                if state is not None:
+                    roadmap_source = state.roadmap()
+                else:
+                    roadmap_source = ContextLoader(project_root=project_root).load_roadmap()
                 if roadmap_source and roadmap_source.content:
                     # Parse roadmap items from content using regex
                     items = []
@@ -4,16 +4,33 @@ from __future__ import annotations
 
 import json
 import logging
-import subprocess
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from mcp.server.fastmcp import FastMCP
 
+from ...services.git_context import get_git_context
+
+if TYPE_CHECKING:
+    from ..project_state import ProjectState
+
 logger = logging.getLogger(__name__)
 
 
-def register_tasks_tool(mcp: FastMCP) -> None:
-    """Register the doit_tasks tool with the MCP server."""
+def _detect_branch(project_root: Path) -> str | None:
+    """Return the current git branch, or None if it cannot be determined."""
+    context = get_git_context(project_root)
+    return context.branch if context is not None else None
+
+
+def register_tasks_tool(mcp: FastMCP, state: ProjectState | None = None) -> None:
+    """Register the doit_tasks tool with the MCP server.
+
+    Args:
+        mcp: Server to register the tool with.
+        state: Warm project state to answer from. Without it, every call
+            reads the project in the current directory.
+    """
 
     @mcp.tool()
     def doit_tasks(
@@ -32,27 +49,16 @@ def register_tasks_tool(mcp: FastMCP) -> None:
             and completion percentage.
         """
         from ...services.task_parser import TaskParser
+        from ...services.traceability_service import TraceabilityService
 
-        project_root = Path.cwd()
+        project_root = state.project_root if state is not None else Path.cwd()
 
         # Auto-detect feature from git branch
         if not feature_name:
-            try:
-                result = subprocess.run(
-                    ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                    cwd=str(project_root),
-                )
-                if result.returncode == 0:
-                    feature_name = result.stdout.strip()
-            except subprocess.TimeoutExpired:
-                logger.debug("Git branch detection timed out")
-            except FileNotFoundError:
-                logger.debug("Git not found on PATH")
-            except OSError as e:
-                logger.debug("Git branch detection failed: %s", e)
+            if state is not None:
+                feature_name = state.current_branch(lambda: _detect_branch(project_root))
+            else:
+                feature_name = _detect_branch(project_root)
 
         if not feature_name:
             return json.dumps(
@@ -79,8 +85,10 @@ def register_tasks_tool(mcp: FastMCP) -> None:
                 indent=2,
             )
 
-        parser = TaskParser(tasks_path=tasks_path)
-        tasks = parser.parse()
+        if state is not None:
+            tasks = state.tasks(tasks_path)
+        else:
+            tasks = TaskParser(tasks_path=tasks_path).parse()
 
         tasks_data = []
         completed = 0
@@ -93,10 +101,7 @@ def register_tasks_tool(mcp: FastMCP) -> None:
                 "description": getattr(task, "description", str(task)),
                 "completed": is_complete,
                 "priority": getattr(task, "priority", None),
-                "requirement_refs": [
-                    ref.id if hasattr(ref, "id") else str(ref)
-                    for ref in getattr(task, "references", [])
-                ],
+                "requirement_refs": [ref.requirement_id for ref in getattr(task, "references", [])],
             }
             if include_dependencies:
                 task_entry["dependencies"] = getattr(task, "dependencies", [])
@@ -105,15 +110,31 @@ def register_tasks_tool(mcp: FastMCP) -> None:
         total = len(tasks_data)
         completion_pct = round(completed / total * 100, 1) if total > 0 else 0.0
 
-        return json.dumps(
-            {
-                "tasks": tasks_data,
-                "summary": {
-                    "total": total,
-                    "completed": completed,
-                    "pending": total - completed,
-                    "completion_percentage": completion_pct,
-                },
+        result: dict[str, Any] = {
+            "tasks": tasks_data,
+            "summary": {
+                "total": total,
+                "completed": completed,
+                "pending": total - completed,
+                "completion_percentage": completion_pct,
             },
-            indent=2,
-        )
+        }
+
+        spec_path = tasks_path.parent / "spec.md"
+        if spec_path.exists():
+            if state is not None:
+                report = state.coverage(spec_path)
+            else:
+                report = TraceabilityService(project_root).build_report(spec_path)
+            result["coverage"] = {
+                "requirements": report.total_count,
+                "covered": report.covered_count,
+                "coverage_percentage": round(report.coverage_percent, 1),
+                "uncovered": [r.id for r in report.get_uncovered_requirements()],
+                "orphaned_references": [
+                    {"task_line": task.line_number, "reference": ref_id}
+                    for task, ref_id in report.orphaned_references
+                ],
+            }
+
+        return json.dumps(result, indent=2)
@@ -5,14 +5,24 @@ from __future__ import annotations
 import json
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from mcp.server.fastmcp import FastMCP
 
+if TYPE_CHECKING:
+    from ..project_state import ProjectState
+
 logger = logging.getLogger(__name__)
 
 
-def register_validate_tool(mcp: FastMCP) -> None:
-    """Register the doit_validate tool with the MCP server."""
+def register_validate_tool(mcp: FastMCP, state: ProjectState | None = None) -> None:
+    """Register the doit_validate tool with the MCP server.
+
+    Args:
+        mcp: Server to register the tool with.
+        state: Warm project state to answer from. Without it, every call
+            validates the project in the current directory.
+    """
 
     @mcp.tool()
     def doit_validate(spec_path: str | None = None) -> str:
@@ -28,15 +38,24 @@ def register_validate_tool(mcp: FastMCP) -> None:
         """
         from ...services.validation_service import ValidationService
 
-        project_root = Path.cwd()
-        service = ValidationService(project_root=project_root)
+        if state is not None:
+            project_root = state.project_root
+            service = state.validation_service
+        else:
+            project_root = Path.cwd()
+            service = ValidationService(project_root=project_root)
 
         try:
             if spec_path:
                 path = Path(spec_path)
                 if not path.is_absolute():
                     path = project_root / path
-                results = [service.validate_file(path)]
+                if state is not None and path.is_file():
+                    results = [state.validation(path)]
+                else:
+                    results = [service.validate_file(path)]
+            elif state is not None:
+                results = state.validate_all()
             else:
                 results = service.validate_all()
         except Exception as e:
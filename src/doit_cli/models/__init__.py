@@ -2,101 +2,85 @@
 
 from __future__ import annotations
 
-from .agent import Agent
-from .context_config import (
-    CommandOverride,
-    ContextConfig,
-    ContextSource,
-    LoadedContext,
-    SourceConfig,
-)
-from .crossref_models import (
-    CoverageReport,
-    CoverageStatus,
-    CrossReference,
-    Requirement,
-    RequirementCoverage,
-    Task,
-    TaskReference,
-)
-from .diagram_models import (
-    AcceptanceScenario,
-    Cardinality,
-    DiagramResult,
-    DiagramSection,
-    DiagramType,
-    EntityAttribute,
-    EntityRelationship,
-    GeneratedDiagram,
-    ParsedEntity,
-    ParsedUserStory,
-)
-from .diagram_models import (
-    ValidationResult as DiagramValidationResult,
-)
-from .memory_contract import (
-    ConstitutionFrontmatter,
-    MemoryContractIssue,
-    MemoryIssueSeverity,
-    OpenQuestion,
-    split_frontmatter,
-)
-from .project import Project
-from .results import InitResult, VerifyCheck, VerifyResult, VerifyStatus
-from .search_models import (
-    ContentSnippet,
-    MemorySource,
-    QueryType,
-    SearchHistory,
-    SearchQuery,
-    SearchResult,
-    SourceFilter,
-    SourceType,
-)
-from .status_models import (
-    SpecState,
-    SpecStatus,
-    StatusReport,
-)
-from .template import Template
-from .validation_models import (
-    CustomRule,
-    RuleOverride,
-    Severity,
-    ValidationConfig,
-    ValidationIssue,
-    ValidationResult,
-    ValidationRule,
-    ValidationStatus,
-)
-from .wizard_models import (
-    BackupNotFoundError,
-    ConfigBackup,
-    WizardCancelledError,
-    WizardResult,
-    WizardState,
-    WizardStep,
-    WizardStepError,
-)
-from .wizard_models import (
-    ValidationResult as WizardValidationResult2,
-)
-from .workflow_models import (
-    NavigationCommand,
-    StateCorruptionError,
-    StepResponse,
-    Workflow,
-    WorkflowError,
-    WorkflowState,
-    WorkflowStatus,
-    WorkflowStep,
-)
-from .workflow_models import (
-    ValidationError as WorkflowValidationError,
-)
-from .workflow_models import (
-    ValidationResult as WorkflowValidationResult,
-)
+from importlib import import_module
+from typing import Any
+
+# Exports resolve on first attribute access so that importing one submodule
+# (e.g. from a single CLI command) does not pull in the whole package.
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "Agent": (".agent", "Agent"),
+    "CommandOverride": (".context_config", "CommandOverride"),
+    "ContextConfig": (".context_config", "ContextConfig"),
+    "ContextSource": (".context_config", "ContextSource"),
+    "LoadedContext": (".context_config", "LoadedContext"),
+    "SourceConfig": (".context_config", "SourceConfig"),
+    "CoverageReport": (".crossref_models", "CoverageReport"),
+    "CoverageStatus": (".crossref_models", "CoverageStatus"),
+    "CrossReference": (".crossref_models", "CrossReference"),
+    "Requirement": (".crossref_models", "Requirement"),
+    "RequirementCoverage": (".crossref_models", "RequirementCoverage"),
+    "Task": (".crossref_models", "Task"),
+    "TaskReference": (".crossref_models", "TaskReference"),
+    "AcceptanceScenario": (".diagram_models", "AcceptanceScenario"),
+    "Cardinality": (".diagram_models", "Cardinality"),
+    "DiagramResult": (".diagram_models", "DiagramResult"),
+    "DiagramSection": (".diagram_models", "DiagramSection"),
+    "DiagramType": (".diagram_models", "DiagramType"),
+    "EntityAttribute": (".diagram_models", "EntityAttribute"),
+    "EntityRelationship": (".diagram_models", "EntityRelationship"),
+    "GeneratedDiagram": (".diagram_models", "GeneratedDiagram"),
+    "ParsedEntity": (".diagram_models", "ParsedEntity"),
+    "ParsedUserStory": (".diagram_models", "ParsedUserStory"),
+    "DiagramValidationResult": (".diagram_models", "ValidationResult"),
+    "ConstitutionFrontmatter": (".memory_contract", "ConstitutionFrontmatter"),
+    "MemoryContractIssue": (".memory_contract", "MemoryContractIssue"),
+    "MemoryIssueSeverity": (".memory_contract", "MemoryIssueSeverity"),
+    "OpenQuestion": (".memory_contract", "OpenQuestion"),
+    "split_frontmatter": (".memory_contract", "split_frontmatter"),
+    "Project": (".project", "Project"),
+    "InitResult": (".results", "InitResult"),
+    "VerifyCheck": (".results", "VerifyCheck"),
+    "VerifyResult": (".results", "VerifyResult"),
+    "VerifyStatus": (".results", "VerifyStatus"),
+    "ContentSnippet": (".search_models", "ContentSnippet"),
+    "MemorySource": (".search_models", "MemorySource"),
+    "QueryType": (".search_models", "QueryType"),
+    "SearchHistory": (".search_models", "SearchHistory"),
+    "SearchQuery": (".search_models", "SearchQuery"),
+    "SearchResult": (".search_models", "SearchResult"),
+    "SourceFilter": (".search_models", "SourceFilter"),
+    "SourceType": (".search_models", "SourceType"),
+    "SpecState": (".status_models", "SpecState"),
+    "SpecStatus": (".status_models", "SpecStatus"),
+    "StatusReport": (".status_models", "StatusReport"),
+    "Template": (".template", "Template"),
+    "CustomRule": (".validation_models", "CustomRule"),
+    "RuleOverride": (".validation_models", "RuleOverride"),
+    "Severity": (".validation_models", "Severity"),
+    "ValidationConfig": (".validation_models", "ValidationConfig"),
+    "ValidationIssue": (".validation_models", "ValidationIssue"),
+    "ValidationResult": (".validation_models", "ValidationResult"),
+    "ValidationRule": (".validation_models", "ValidationRule"),
+    "ValidationStatus": (".validation_models", "ValidationStatus"),
+    "BackupNotFoundError": (".wizard_models", "BackupNotFoundError"),
+    "ConfigBackup": (".wizard_models", "ConfigBackup"),
+    "WizardCancelledError": (".wizard_models", "WizardCancelledError"),
+    "WizardResult": (".wizard_models", "WizardResult"),
+    "WizardState": (".wizard_models", "WizardState"),
+    "WizardStep": (".wizard_models", "WizardStep"),
+    "WizardStepError": (".wizard_models", "WizardStepError"),
+    "WizardValidationResult2": (".wizard_models", "ValidationResult"),
+    "NavigationCommand": (".workflow_models", "NavigationCommand"),
+    "StateCorruptionError": (".workflow_models", "StateCorruptionError"),
+    "StepResponse": (".workflow_models", "StepResponse"),
+    "Workflow": (".workflow_models", "Workflow"),
+    "WorkflowError": (".workflow_models", "WorkflowError"),
+    "WorkflowState": (".workflow_models", "WorkflowState"),
+    "WorkflowStatus": (".workflow_models", "WorkflowStatus"),
+    "WorkflowStep": (".workflow_models", "WorkflowStep"),
+    "WorkflowValidationError": (".workflow_models", "ValidationError"),
+    "WorkflowValidationResult": (".workflow_models", "ValidationResult"),
+}
 
 __all__ = [
     "AcceptanceScenario",
@@ -178,3 +162,17 @@ __all__ = [
     "WorkflowValidationError",
     "WorkflowValidationResult",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
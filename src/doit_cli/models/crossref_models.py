@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import csv
+import io
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -179,3 +181,123 @@ class CoverageReport:
             if rc.requirement.id == requirement_id:
                 return rc
         return None
+
+
+@dataclass
+class TraceabilityMatrix:
+    """Requirement-to-task coverage for every feature in a project.
+
+    Attributes:
+        reports: Coverage report per feature directory name, sorted by name
+    """
+
+    reports: dict[str, CoverageReport] = field(default_factory=dict)
+
+    # Columns of the flat export (one row per requirement-task link)
+    CSV_COLUMNS = (
+        "feature",
+        "requirement",
+        "status",
+        "task_line",
+        "task_completed",
+        "task_description",
+    )
+
+    @property
+    def total_count(self) -> int:
+        """Total number of requirements across all features."""
+        return sum(r.total_count for r in self.reports.values())
+
+    @property
+    def covered_count(self) -> int:
+        """Number of requirements with at least one linked task."""
+        return sum(r.covered_count for r in self.reports.values())
+
+    @property
+    def uncovered_count(self) -> int:
+        """Number of requirements with no linked tasks."""
+        return self.total_count - self.covered_count
+
+    @property
+    def orphaned_count(self) -> int:
+        """Number of task references to non-existent requirements."""
+        return sum(len(r.orphaned_references) for r in self.reports.values())
+
+    @property
+    def coverage_percent(self) -> float:
+        """Coverage percentage (0-100) across all features."""
+        if self.total_count == 0:
+            return 100.0
+        return (self.covered_count / self.total_count) * 100
+
+    def get_report(self, feature: str) -> CoverageReport | None:
+        """Get the coverage report for a feature directory name."""
+        return self.reports.get(feature)
+
+    def get_tasks(self, feature: str, requirement_id: str) -> list[Task]:
+        """Get the tasks in a feature that reference a requirement."""
+        report = self.reports.get(feature)
+        coverage = report.get_requirement_coverage(requirement_id) if report else None
+        return coverage.tasks if coverage else []
+
+    def rows(self) -> list[dict[str, str | int | bool | None]]:
+        """Flatten the matrix to one row per requirement-task link.
+
+        Uncovered requirements get a single row without task fields, and
+        orphaned references a row with status ``orphaned``.
+        """
+        rows: list[dict[str, str | int | bool | None]] = []
+        for feature, report in self.reports.items():
+            for rc in report.requirements:
+                linked: list[Task | None] = list(rc.tasks) or [None]
+                for task in linked:
+                    rows.append(
+                        {
+                            "feature": feature,
+                            "requirement": rc.requirement.id,
+                            "status": rc.status.value,
+                            "task_line": task.line_number if task else None,
+                            "task_completed": task.completed if task else None,
+                            "task_description": task.description if task else None,
+                        }
+                    )
+            for task, ref_id in report.orphaned_references:
+                rows.append(
+                    {
+                        "feature": feature,
+                        "requirement": ref_id,
+                        "status": "orphaned",
+                        "task_line": task.line_number,
+                        "task_completed": task.completed,
+                        "task_description": task.description,
+                    }
+                )
+        return rows
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "features": [
+                {
+                    "feature": feature,
+                    "coverage_percent": round(report.coverage_percent, 1),
+                    "covered_count": report.covered_count,
+                    "total_count": report.total_count,
+                    "orphaned_count": len(report.orphaned_references),
+                }
+                for feature, report in self.reports.items()
+            ],
+            "coverage_percent": round(self.coverage_percent, 1),
+            "covered_count": self.covered_count,
+            "total_count": self.total_count,
+            "orphaned_count": self.orphaned_count,
+            "links": self.rows(),
+        }
+
+    def to_csv(self) -> str:
+        """Export the flattened rows as CSV with a header line."""
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=self.CSV_COLUMNS, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(self.rows())
+        return buffer.getvalue()
@@ -254,16 +254,24 @@ class DiagramSection:
         start_line: Start line number (BEGIN marker)
         end_line: End line number (END marker)
         content: Content between markers
+        source_hash: Hash of the spec content the diagram was generated
+            from, recorded in the BEGIN marker (None if not recorded)
     """
 
     section_name: str
     start_line: int
     end_line: int
     content: str = ""
+    source_hash: str | None = None
 
     @property
     def begin_marker(self) -> str:
         """Generate the BEGIN marker comment."""
+        if self.source_hash:
+            return (
+                f'<!-- BEGIN:AUTO-GENERATED section="{self.section_name}" '
+                f'source="{self.source_hash}" -->'
+            )
         return f'<!-- BEGIN:AUTO-GENERATED section="{self.section_name}" -->'
 
     @property
@@ -337,6 +345,7 @@ class DiagramResult:
         diagrams: List of generated diagrams
         sections_found: AUTO-GENERATED sections found in file
         sections_updated: Sections that were updated
+        sections_unchanged: Sections skipped because their source is unchanged
         success: Overall success status
         error: Error message if failed
     """
@@ -345,6 +354,7 @@ class DiagramResult:
     diagrams: list[GeneratedDiagram] = field(default_factory=list)
     sections_found: list[DiagramSection] = field(default_factory=list)
     sections_updated: list[str] = field(default_factory=list)
+    sections_unchanged: list[str] = field(default_factory=list)
     success: bool = True
     error: str | None = None
 
@@ -131,7 +131,7 @@ class GitHubEpic:
         return cls(
             number=data["number"],
             title=data["title"],
-            state=data.get("state", "open"),
+            state=data.get("state", "open").lower(),
             labels=label_names,
             body=data.get("body", ""),
             url=data["url"],
@@ -6,7 +6,9 @@ issues that are part of an epic.
 
 from __future__ import annotations
 
+import contextlib
 from dataclasses import dataclass
+from datetime import datetime
 
 
 @dataclass
@@ -20,6 +22,7 @@ class GitHubFeature:
         labels: List of label names attached to the issue
         epic_number: Parent epic issue number
         url: GitHub issue URL
+        updated_at: When the issue was last updated
     """
 
     number: int
@@ -28,6 +31,7 @@ class GitHubFeature:
     labels: list[str]
     epic_number: int
     url: str
+    updated_at: datetime | None = None
 
     def __post_init__(self):
         """Validate feature data after initialization."""
@@ -101,13 +105,19 @@ class GitHubFeature:
         # Extract label names from label objects
         label_names = [label.get("name", "") for label in data.get("labels", [])]
 
+        updated_at = None
+        if data.get("updatedAt"):
+            with contextlib.suppress(ValueError):
+                updated_at = datetime.fromisoformat(data["updatedAt"].replace("Z", "+00:00"))
+
         return cls(
             number=data["number"],
             title=data["title"],
-            state=data.get("state", "open"),
+            state=data.get("state", "open").lower(),
             labels=label_names,
             epic_number=epic_number,
             url=data["url"],
+            updated_at=updated_at,
         )
 
     def to_dict(self) -> dict:
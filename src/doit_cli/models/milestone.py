@@ -41,3 +41,23 @@ class Milestone:
     def is_closed(self) -> bool:
         """Check if milestone is closed."""
         return self.state == "closed"
+
+
+@dataclass
+class EpicAssignment:
+    """A planned assignment of an epic to a priority milestone.
+
+    Attributes:
+        epic_number: GitHub issue number of the epic
+        milestone_title: Title of the milestone the epic belongs in
+        previous_milestone: Title of the epic's current milestone, if any
+    """
+
+    epic_number: int
+    milestone_title: str
+    previous_milestone: str | None = None
+
+    @property
+    def is_needed(self) -> bool:
+        """Check if the epic is not already in its milestone."""
+        return self.previous_milestone != self.milestone_title
@@ -129,6 +129,24 @@ class MemorySource:
             path: Path to the file
             source_type: Type of source (governance or spec)
 
+        Returns:
+            MemorySource instance
+        """
+        content = path.read_text(encoding="utf-8")
+        return cls.from_counts(path, source_type, len(content.splitlines()), len(content))
+
+    @classmethod
+    def from_counts(
+        cls, path: Path, source_type: SourceType, line_count: int, char_count: int
+    ) -> MemorySource:
+        """Create a MemorySource from already known line and character counts.
+
+        Args:
+            path: Path to the file
+            source_type: Type of source (governance or spec)
+            line_count: Number of lines in the file
+            char_count: Number of characters in the file
+
         Returns:
             MemorySource instance
         """
@@ -137,11 +155,8 @@ class MemorySource:
         file_id = hashlib.md5(str(path).encode()).hexdigest()[:16]
         last_modified = datetime.fromtimestamp(path.stat().st_mtime)
 
-        content = path.read_text(encoding="utf-8")
-        line_count = len(content.splitlines())
-
         # Estimate tokens (approximately 4 chars per token)
-        token_count = max(1, len(content) // 4)
+        token_count = max(1, char_count // 4)
 
         return cls(
             id=file_id,
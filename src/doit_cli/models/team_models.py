@@ -388,7 +388,7 @@ class TeamConfig:
 class Notification:
     """An alert about changes to shared memory files.
 
-    Stored in .doit/state/notifications.json.
+    Stored in the .doit/state/notifications.jsonl event log.
     """
 
     id: str
@@ -2,39 +2,49 @@
 
 from __future__ import annotations
 
-from .agent_detector import AgentDetector
-from .architecture_generator import ArchitectureGenerator
-from .backup_service import BackupService
-from .context_loader import ContextLoader, estimate_tokens, truncate_content
-from .coverage_calculator import CoverageCalculator
-from .crossref_service import CrossReferenceService
-from .diagram_service import DiagramService
-from .entity_parser import EntityParser
-from .er_diagram_generator import ERDiagramGenerator
-from .input_validator import (
-    ChoiceValidator,
-    InputValidator,
-    PathExistsValidator,
-    PatternValidator,
-    RequiredValidator,
-    chain_validators,
-    get_validator,
-    register_validator,
-    validate_step,
-)
-from .mermaid_validator import MermaidValidator
-from .requirement_parser import RequirementParser
-from .scaffolder import Scaffolder
-from .section_parser import SectionParser
-from .spec_scanner import NotADoitProjectError, SpecNotFoundError, SpecScanner
-from .state_manager import StateManager
-from .status_reporter import StatusReporter
-from .task_parser import TaskParser
-from .template_manager import TemplateManager
-from .user_journey_generator import UserJourneyGenerator
-from .user_story_parser import UserStoryParser
-from .validator import Validator
-from .workflow_engine import WorkflowEngine
+from importlib import import_module
+from typing import Any
+
+# Exports resolve on first attribute access so that importing one submodule
+# (e.g. from a single CLI command) does not pull in the whole package.
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "AgentDetector": (".agent_detector", "AgentDetector"),
+    "ArchitectureGenerator": (".architecture_generator", "ArchitectureGenerator"),
+    "BackupService": (".backup_service", "BackupService"),
+    "ContextLoader": (".context_loader", "ContextLoader"),
+    "estimate_tokens": (".context_loader", "estimate_tokens"),
+    "truncate_content": (".context_loader", "truncate_content"),
+    "CoverageCalculator": (".coverage_calculator", "CoverageCalculator"),
+    "CrossReferenceService": (".crossref_service", "CrossReferenceService"),
+    "DiagramService": (".diagram_service", "DiagramService"),
+    "EntityParser": (".entity_parser", "EntityParser"),
+    "ERDiagramGenerator": (".er_diagram_generator", "ERDiagramGenerator"),
+    "ChoiceValidator": (".input_validator", "ChoiceValidator"),
+    "InputValidator": (".input_validator", "InputValidator"),
+    "PathExistsValidator": (".input_validator", "PathExistsValidator"),
+    "PatternValidator": (".input_validator", "PatternValidator"),
+    "RequiredValidator": (".input_validator", "RequiredValidator"),
+    "chain_validators": (".input_validator", "chain_validators"),
+    "get_validator": (".input_validator", "get_validator"),
+    "register_validator": (".input_validator", "register_validator"),
+    "validate_step": (".input_validator", "validate_step"),
+    "MermaidValidator": (".mermaid_validator", "MermaidValidator"),
+    "RequirementParser": (".requirement_parser", "RequirementParser"),
+    "Scaffolder": (".scaffolder", "Scaffolder"),
+    "SectionParser": (".section_parser", "SectionParser"),
+    "SpecDocument": (".spec_document", "SpecDocument"),
+    "NotADoitProjectError": (".spec_scanner", "NotADoitProjectError"),
+    "SpecNotFoundError": (".spec_scanner", "SpecNotFoundError"),
+    "SpecScanner": (".spec_scanner", "SpecScanner"),
+    "StateManager": (".state_manager", "StateManager"),
+    "StatusReporter": (".status_reporter", "StatusReporter"),
+    "TaskParser": (".task_parser", "TaskParser"),
+    "TemplateManager": (".template_manager", "TemplateManager"),
+    "UserJourneyGenerator": (".user_journey_generator", "UserJourneyGenerator"),
+    "UserStoryParser": (".user_story_parser", "UserStoryParser"),
+    "Validator": (".validator", "Validator"),
+    "WorkflowEngine": (".workflow_engine", "WorkflowEngine"),
+}
 
 __all__ = [
     "AgentDetector",
@@ -59,6 +69,7 @@ __all__ = [
     "RequirementParser",
     "Scaffolder",
     "SectionParser",
+    "SpecDocument",
     "SpecNotFoundError",
     # Status dashboard
     "SpecScanner",
@@ -79,3 +90,17 @@ __all__ = [
     "truncate_content",
     "validate_step",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
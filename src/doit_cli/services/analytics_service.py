@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from datetime import date
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ..models.analytics_models import (
     AnalyticsReport,
@@ -20,8 +21,12 @@ from ..models.analytics_models import (
 )
 from ..models.status_models import SpecState
 from .date_inferrer import DateInferrer
+from .git_metadata import GitMetadataProvider
 from .spec_scanner import SpecScanner
 
+if TYPE_CHECKING:
+    from .spec_cache import SpecCache
+
 
 class AnalyticsService:
     """Service for generating spec analytics and metrics.
@@ -30,18 +35,23 @@ class AnalyticsService:
     SpecMetadata and aggregated analytics reports.
     """
 
-    def __init__(self, project_root: Path | None = None):
+    def __init__(self, project_root: Path | None = None, cache: SpecCache | None = None):
         """Initialize the analytics service.
 
         Args:
             project_root: Root directory of the project. Defaults to cwd.
+            cache: Optional parsed-spec cache passed to the scanner. A
+                disabled cache also disables the stored git history index.
 
         Raises:
             NotADoitProjectError: If not a valid doit project
         """
         self.project_root = project_root or Path.cwd()
-        self.scanner = SpecScanner(self.project_root, validate=False)
-        self.date_inferrer = DateInferrer(self.project_root)
+        self.scanner = SpecScanner(self.project_root, validate=False, cache=cache)
+        git_metadata = GitMetadataProvider(
+            self.project_root, enabled=cache.enabled if cache is not None else True
+        )
+        self.date_inferrer = DateInferrer(self.project_root, git_metadata=git_metadata)
 
     def get_all_specs(self) -> list[SpecMetadata]:
         """Get all specs with enriched metadata.
@@ -1,16 +1,70 @@
-"""Backup service for preserving files during updates."""
+"""Backup service for preserving files during updates.
+
+Backups are content-addressed. File contents are stored once as blobs in
+``.doit/backups/.objects/``, named by their SHA-256 digest, and each
+backup is a directory holding a ``manifest.json`` that maps the backed-up
+paths to blob digests plus the mode and mtime needed for an exact
+restore. Backing up unchanged files therefore only writes a manifest
+entry, and removing old backups frees space by garbage-collecting blobs
+no manifest references any more.
+
+Blobs are cloned with a copy-on-write reflink where the filesystem
+supports it and copied otherwise. They are never hardlinked to project
+files, which are edited in place after a backup is taken.
+
+Backup directories written before the object store existed (plain file
+copies, no manifest) are still listed, restored and sized as before.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import shutil
+import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
 
+from ..utils.atomic_write import write_text_atomic
+from ..utils.file_lock import file_lock
+
+# ioctl request number for FICLONE (linux/fs.h)
+_FICLONE = 0x40049409
+
+
+def _file_hash(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's bytes."""
+    with open(path, "rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+def _clone_file(source: Path, target: Path) -> None:
+    """Copy source's bytes to target, as a reflink when supported.
+
+    Falls back to a plain copy on other platforms and on filesystems
+    without copy-on-write clones.
+    """
+    if sys.platform == "linux":
+        import fcntl
+
+        try:
+            with open(source, "rb") as src, open(target, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            return
+        except OSError:
+            pass
+    shutil.copyfile(source, target)
+
 
 class BackupService:
     """Service for creating backups before update operations."""
 
     BACKUP_DIR = "backups"
+    OBJECTS_DIR = ".objects"
+    MANIFEST_FILE = "manifest.json"
+    MANIFEST_VERSION = 1
     TIMESTAMP_FORMAT = "%Y%m%dT%H%M%S"
 
     def __init__(self, project_path: Path):
@@ -22,6 +76,8 @@ class BackupService:
         self.project_path = project_path
         self.doit_folder = project_path / ".doit"
         self.backups_folder = self.doit_folder / self.BACKUP_DIR
+        self.objects_folder = self.backups_folder / self.OBJECTS_DIR
+        self._lock_path = self.objects_folder / ".lock"
 
     def create_backup(
         self,
@@ -30,6 +86,9 @@ class BackupService:
     ) -> Path | None:
         """Create a timestamped backup of specified files.
 
+        Only contents not already in the object store are copied. Backing
+        up again under an existing name adds to that backup.
+
         Args:
             files: List of file paths to backup
             backup_name: Optional custom backup name (defaults to timestamp)
@@ -45,27 +104,32 @@ class BackupService:
         backup_dir_name = backup_name or timestamp
         backup_dir = self.backups_folder / backup_dir_name
 
-        # Create backup directory
-        backup_dir.mkdir(parents=True, exist_ok=True)
-
-        # Copy each file preserving relative structure
-        for file_path in files:
-            if not file_path.exists():
-                continue
-
-            # Calculate relative path from project root
-            try:
-                rel_path = file_path.relative_to(self.project_path)
-            except ValueError:
-                # File is not under project path, use filename only
-                rel_path = Path(file_path.name)
-
-            # Create backup target path
-            backup_target = backup_dir / rel_path
-            backup_target.parent.mkdir(parents=True, exist_ok=True)
-
-            # Copy file
-            shutil.copy2(file_path, backup_target)
+        # Hold the store lock until the manifest references the new blobs,
+        # so a concurrent garbage collection cannot remove them
+        with file_lock(self._lock_path):
+            backup_dir.mkdir(parents=True, exist_ok=True)
+            entries = self._read_manifest(backup_dir) or {}
+
+            for file_path in files:
+                if not file_path.exists():
+                    continue
+
+                # Calculate relative path from project root
+                try:
+                    rel_path = file_path.relative_to(self.project_path)
+                except ValueError:
+                    # File is not under project path, use filename only
+                    rel_path = Path(file_path.name)
+
+                stat = file_path.stat()
+                entries[rel_path.as_posix()] = {
+                    "hash": self._store_blob(file_path),
+                    "size": stat.st_size,
+                    "mode": stat.st_mode & 0o7777,
+                    "mtime_ns": stat.st_mtime_ns,
+                }
+
+            self._write_manifest(backup_dir, entries)
 
         return backup_dir
 
@@ -112,6 +176,7 @@ class BackupService:
         if not self.backups_folder.exists():
             return []
 
+        # Hidden entries include the object store
         backups = [
             d for d in self.backups_folder.iterdir() if d.is_dir() and not d.name.startswith(".")
         ]
@@ -122,6 +187,9 @@ class BackupService:
     def restore_backup(self, backup_path: Path) -> dict:
         """Restore files from a backup.
 
+        Files are restored with the content, mode and mtime they had when
+        backed up. Files whose content already matches are not rewritten.
+
         Args:
             backup_path: Path to backup directory
 
@@ -137,21 +205,29 @@ class BackupService:
             result["errors"].append(f"Backup not found: {backup_path}")
             return result
 
-        # Walk through backup and restore files
-        for backup_file in backup_path.rglob("*"):
-            if not backup_file.is_file():
-                continue
+        entries = self._read_manifest(backup_path)
+        if entries is None:
+            return self._restore_legacy_backup(backup_path, result)
 
-            # Calculate original location
-            rel_path = backup_file.relative_to(backup_path)
+        for rel_path, entry in sorted(entries.items()):
             original_path = self.project_path / rel_path
+            blob_path = self._blob_path(entry["hash"])
 
             try:
-                # Ensure parent directory exists
-                original_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Copy backup file to original location
-                shutil.copy2(backup_file, original_path)
+                if not blob_path.exists():
+                    raise FileNotFoundError(f"missing object {entry['hash']}")
+
+                if not (
+                    original_path.is_file()
+                    and original_path.stat().st_size == entry["size"]
+                    and _file_hash(original_path) == entry["hash"]
+                ):
+                    # Ensure parent directory exists
+                    original_path.parent.mkdir(parents=True, exist_ok=True)
+                    _clone_file(blob_path, original_path)
+
+                os.chmod(original_path, entry["mode"])
+                os.utime(original_path, ns=(entry["mtime_ns"], entry["mtime_ns"]))
                 result["restored"].append(original_path)
             except Exception as e:
                 result["errors"].append(f"Failed to restore {rel_path}: {e}")
@@ -161,6 +237,8 @@ class BackupService:
     def cleanup_old_backups(self, keep_count: int = 5) -> list[Path]:
         """Remove old backups, keeping only the most recent ones.
 
+        Blobs referenced only by the removed backups are garbage-collected.
+
         Args:
             keep_count: Number of recent backups to keep
 
@@ -182,11 +260,53 @@ class BackupService:
                 # Skip backups that can't be removed (permission/missing)
                 pass
 
+        self.collect_garbage()
+        return removed
+
+    def collect_garbage(self) -> list[Path]:
+        """Remove blobs that no backup manifest references.
+
+        Also removes temp files left behind by interrupted backups.
+
+        Returns:
+            List of removed blob paths
+        """
+        removed: list[Path] = []
+        if not self.objects_folder.exists():
+            return removed
+
+        with file_lock(self._lock_path):
+            referenced: set[str] = set()
+            for backup_dir in self.list_backups():
+                entries = self._read_manifest(backup_dir)
+                if entries:
+                    referenced.update(entry["hash"] for entry in entries.values())
+
+            for bucket in self.objects_folder.iterdir():
+                if not bucket.is_dir():
+                    if bucket.name.startswith(".blob."):
+                        bucket.unlink(missing_ok=True)
+                    continue
+                for blob_path in bucket.iterdir():
+                    if bucket.name + blob_path.name in referenced:
+                        continue
+                    try:
+                        blob_path.unlink()
+                        removed.append(blob_path)
+                    except OSError:
+                        # Skip blobs that can't be removed (permission/missing)
+                        pass
+                if not any(bucket.iterdir()):
+                    bucket.rmdir()
+
         return removed
 
     def get_backup_size(self, backup_path: Path) -> int:
         """Calculate total size of a backup in bytes.
 
+        This is the size of the files the backup restores; blobs shared
+        with other backups are counted in each of them.
+
         Args:
             backup_path: Path to backup directory
 
@@ -196,9 +316,127 @@ class BackupService:
         if not backup_path.exists():
             return 0
 
+        entries = self._read_manifest(backup_path)
+        if entries is not None:
+            return sum(entry["size"] for entry in entries.values())
+
         total = 0
         for file_path in backup_path.rglob("*"):
             if file_path.is_file():
                 total += file_path.stat().st_size
 
         return total
+
+    def get_store_size(self) -> int:
+        """Calculate the bytes used by the object store.
+
+        Returns:
+            Total size of all blobs in bytes
+        """
+        if not self.objects_folder.exists():
+            return 0
+
+        return sum(
+            blob_path.stat().st_size
+            for bucket in self.objects_folder.iterdir()
+            if bucket.is_dir()
+            for blob_path in bucket.iterdir()
+        )
+
+    def _blob_path(self, digest: str) -> Path:
+        """Return the object store path of a blob."""
+        return self.objects_folder / digest[:2] / digest[2:]
+
+    def _store_blob(self, file_path: Path) -> str:
+        """Add a file's content to the object store.
+
+        Args:
+            file_path: File to store
+
+        Returns:
+            SHA-256 hex digest of the stored content
+        """
+        digest = _file_hash(file_path)
+        if self._blob_path(digest).exists():
+            return digest
+
+        # Clone to a temp file and name the blob after what was actually
+        # copied, in case the file changed since it was hashed
+        self.objects_folder.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=".blob.", suffix=".tmp", dir=self.objects_folder)
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            _clone_file(file_path, tmp_path)
+            digest = _file_hash(tmp_path)
+            blob_path = self._blob_path(digest)
+            blob_path.parent.mkdir(exist_ok=True)
+            os.replace(tmp_path, blob_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        return digest
+
+    def _read_manifest(self, backup_dir: Path) -> dict[str, dict] | None:
+        """Read the file entries of a backup.
+
+        Args:
+            backup_dir: Backup directory
+
+        Returns:
+            Entries keyed by relative path, or None for a legacy backup
+            (or one whose manifest can't be read)
+        """
+        manifest_path = backup_dir / self.MANIFEST_FILE
+        try:
+            data = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get("files"), dict):
+            return None
+        return data["files"]
+
+    def _write_manifest(self, backup_dir: Path, entries: dict[str, dict]) -> None:
+        """Write the file entries of a backup atomically.
+
+        Args:
+            backup_dir: Backup directory
+            entries: Entries keyed by relative path
+        """
+        data = {
+            "version": self.MANIFEST_VERSION,
+            "created_at": datetime.now().isoformat(),
+            "files": dict(sorted(entries.items())),
+        }
+        write_text_atomic(backup_dir / self.MANIFEST_FILE, json.dumps(data, indent=2) + "\n")
+
+    def _restore_legacy_backup(self, backup_path: Path, result: dict) -> dict:
+        """Restore a backup made of plain file copies.
+
+        Args:
+            backup_path: Path to backup directory
+            result: Result dict to fill
+
+        Returns:
+            The result dict
+        """
+        # Walk through backup and restore files
+        for backup_file in backup_path.rglob("*"):
+            if not backup_file.is_file():
+                continue
+
+            # Calculate original location
+            rel_path = backup_file.relative_to(backup_path)
+            original_path = self.project_path / rel_path
+
+            try:
+                # Ensure parent directory exists
+                original_path.parent.mkdir(parents=True, exist_ok=True)
+
+                # Copy backup file to original location
+                shutil.copy2(backup_file, original_path)
+                result["restored"].append(original_path)
+            except Exception as e:
+                result["errors"].append(f"Failed to restore {rel_path}: {e}")
+
+        return result
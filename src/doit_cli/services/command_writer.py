@@ -9,7 +9,9 @@ from ..models.sync_models import (
     FileOperation,
     OperationType,
     SyncResult,
+    SyncStatusEnum,
 )
+from .sync_manifest import SyncManifest, source_hash
 
 
 class CommandWriter:
@@ -17,17 +19,23 @@ class CommandWriter:
 
     DEFAULT_COMMANDS_DIR = ".claude/commands"
 
+    # Identifies this transformation in source hashes
+    GENERATOR = "claude-command"
+
     def __init__(
         self,
         project_root: Path | None = None,
+        manifest: SyncManifest | None = None,
     ):
         """Initialize the command writer.
 
         Args:
             project_root: Root directory of the project. Defaults to current directory.
+            manifest: Manifest of generated files. Defaults to the project's.
         """
         self.project_root = project_root or Path.cwd()
         self.commands_dir = self.project_root / self.DEFAULT_COMMANDS_DIR
+        self.manifest = manifest or SyncManifest(self.project_root)
 
     def get_commands_directory(self) -> Path:
         """Get the commands directory path."""
@@ -49,6 +57,21 @@ class CommandWriter:
         # Keep the original filename (e.g., doit.checkin.md)
         return self.commands_dir / template.path.name
 
+    def check_command(self, template: CommandTemplate) -> SyncStatusEnum:
+        """Check whether a template's command file is up-to-date.
+
+        Args:
+            template: The command template.
+
+        Returns:
+            Sync status of the command file.
+        """
+        return self.manifest.check(
+            self.get_command_path(template),
+            source_hash(template.content, self.GENERATOR),
+            lambda: template.content,
+        )
+
     def write_command(
         self,
         template: CommandTemplate,
@@ -63,22 +86,24 @@ class CommandWriter:
         Returns:
             FileOperation describing what happened.
         """
+        operation = self._write_command(template, force)
+        self.manifest.save()
+        return operation
+
+    def _write_command(self, template: CommandTemplate, force: bool) -> FileOperation:
+        """Write one command file without saving the manifest."""
         command_path = self.get_command_path(template)
         command_path_str = str(command_path)
 
         try:
             # Check if command already exists and is up-to-date
-            if command_path.exists() and not force:
-                command_mtime = command_path.stat().st_mtime
-                template_mtime = template.modified_at.timestamp()
-
-                if command_mtime >= template_mtime:
-                    return FileOperation(
-                        file_path=command_path_str,
-                        operation_type=OperationType.SKIPPED,
-                        success=True,
-                        message="Already up-to-date",
-                    )
+            if not force and self.check_command(template) == SyncStatusEnum.SYNCHRONIZED:
+                return FileOperation(
+                    file_path=command_path_str,
+                    operation_type=OperationType.SKIPPED,
+                    success=True,
+                    message="Already up-to-date",
+                )
 
             # Ensure directory exists
             self.ensure_commands_directory()
@@ -90,6 +115,9 @@ class CommandWriter:
 
             # Write file (direct copy of content, no transformation)
             command_path.write_text(template.content, encoding="utf-8")
+            self.manifest.record(
+                command_path, source_hash(template.content, self.GENERATOR), template.content
+            )
 
             return FileOperation(
                 file_path=command_path_str,
@@ -123,7 +151,8 @@ class CommandWriter:
         result = SyncResult(total_commands=len(templates))
 
         for template in templates:
-            operation = self.write_command(template, force=force)
+            operation = self._write_command(template, force)
             result.add_operation(operation)
 
+        self.manifest.save()
         return result
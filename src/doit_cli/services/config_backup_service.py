@@ -204,6 +204,8 @@ class ConfigBackupService:
             }
             if config.github.enterprise_host:
                 data["github"]["enterprise_host"] = config.github.enterprise_host
+            if config.github.backend != "gh_cli":
+                data["github"]["backend"] = config.github.backend
 
         elif config.provider == ProviderType.AZURE_DEVOPS:
             data["azure_devops"] = {
@@ -238,6 +240,7 @@ class ConfigBackupService:
             gh = data["github"]
             config.github.auth_method = gh.get("auth_method", "gh_cli")
             config.github.enterprise_host = gh.get("enterprise_host")
+            config.github.backend = gh.get("backend", "gh_cli")
 
         # Parse Azure DevOps config
         if "azure_devops" in data:
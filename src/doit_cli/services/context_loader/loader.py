@@ -11,7 +11,6 @@ from __future__ import annotations
 import logging
 import os
 import re
-import subprocess
 from datetime import datetime
 from pathlib import Path
 
@@ -20,6 +19,7 @@ from ...models.context_config import (
     ContextSource,
     LoadedContext,
 )
+from ..git_context import get_git_context
 from ..roadmap_summarizer import RoadmapSummarizer
 from .completed import format_completed_for_context, parse_completed_roadmap
 from .condenser import ContextCondenser
@@ -415,19 +415,8 @@ class ContextLoader:
 
     def get_current_branch(self) -> str | None:
         """Return current git branch name, or None if unavailable."""
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                capture_output=True,
-                text=True,
-                cwd=self.project_root,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except (subprocess.SubprocessError, FileNotFoundError, OSError):
-            pass
-        return None
+        context = get_git_context(self.project_root)
+        return context.branch if context is not None else None
 
     def extract_feature_name(self, branch: str) -> str | None:
         """Extract `NNN-feature-name` from a branch like `026-ai-context` or `feature/026-name`."""
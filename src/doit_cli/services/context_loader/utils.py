@@ -83,6 +83,31 @@ def estimate_tokens(text: str) -> int:
     return max(1, len(text) // 4)
 
 
+def _line_costs(lines: list[str]) -> tuple[list[int], int]:
+    """Return the cost of each line (with its newline) and the cost per token.
+
+    With tiktoken the cost is the line's token count and there is one cost
+    unit per token. Otherwise it is the character count, with four units
+    per token to match the `estimate_tokens` fallback. Summing per-line
+    costs lets callers track a running estimate without re-encoding the
+    text they have accumulated so far.
+    """
+    global _tiktoken_encoding
+
+    if _has_tiktoken():
+        try:
+            import tiktoken
+
+            if _tiktoken_encoding is None:
+                _tiktoken_encoding = tiktoken.get_encoding("cl100k_base")
+            encoded = _tiktoken_encoding.encode_batch(lines, disallowed_special=())
+            return [len(tokens) + 1 for tokens in encoded], 1
+        except (ImportError, ValueError, KeyError) as exc:
+            logger.debug("tiktoken estimate failed, falling back: %s", exc)
+
+    return [len(line) + 1 for line in lines], 4
+
+
 def truncate_content(content: str, max_tokens: int, path: Path) -> tuple[str, bool, int]:
     """Truncate content while preserving markdown structure.
 
@@ -93,6 +118,9 @@ def truncate_content(content: str, max_tokens: int, path: Path) -> tuple[str, bo
     3. Add a truncation notice pointing at the full file.
     4. Fill any remaining budget with content from the top of the file.
 
+    Each line is measured once and the running size is kept as a sum of
+    per-line costs, so truncation is linear in the size of the file.
+
     Returns:
         (truncated_content, was_truncated, original_tokens).
     """
@@ -102,70 +130,71 @@ def truncate_content(content: str, max_tokens: int, path: Path) -> tuple[str, bo
         return content, False, original_tokens
 
     lines = content.split("\n")
+    costs, units_per_token = _line_costs(lines)
     result_lines: list[str] = []
-    current_tokens = 0
+    # Running cost of result_lines. The last line's newline is not part of
+    # the joined text, hence the -1 when converting back to tokens.
+    current_cost = 0
+    blank_cost = 1
+
+    def as_tokens(cost: int) -> int:
+        return max(1, (cost - 1) // units_per_token)
 
     # Find title (first H1)
-    title_line = None
-    for line in lines:
+    for i, line in enumerate(lines):
         if line.startswith("# ") and not line.startswith("## "):
-            title_line = line
+            result_lines.append(line)
+            result_lines.append("")
+            current_cost = costs[i] + blank_cost
             break
 
-    if title_line:
-        result_lines.append(title_line)
-        result_lines.append("")
-        current_tokens = estimate_tokens("\n".join(result_lines))
-
     # Find Summary/Overview sections and H2 headers
     i = 0
     summary_found = False
-    while i < len(lines) and current_tokens < max_tokens * 0.7:
+    while i < len(lines) and as_tokens(current_cost) < max_tokens * 0.7:
         line = lines[i]
 
         # Check for Summary or Overview sections
         if re.match(r"^##\s+(Summary|Overview)", line, re.IGNORECASE):
             summary_found = True
-            section_lines = [line]
+            start = i
             i += 1
             while i < len(lines) and not lines[i].startswith("## "):
-                section_lines.append(lines[i])
                 i += 1
-            section_text = "\n".join(section_lines)
-            section_tokens = estimate_tokens(section_text)
-            if current_tokens + section_tokens < max_tokens * 0.9:
-                result_lines.extend(section_lines)
-                current_tokens += section_tokens
+            section_cost = sum(costs[start:i])
+            if as_tokens(current_cost + section_cost) < max_tokens * 0.9:
+                result_lines.extend(lines[start:i])
+                current_cost += section_cost
             continue
 
         # Collect H2 headers with first paragraph
         if line.startswith("## ") and not summary_found:
             result_lines.append(line)
             result_lines.append("")
+            current_cost += costs[i] + blank_cost
             i += 1
-            paragraph_lines = []
+            start = i
             while i < len(lines) and lines[i].strip() and not lines[i].startswith("#"):
-                paragraph_lines.append(lines[i])
                 i += 1
-            if paragraph_lines:
-                result_lines.extend(paragraph_lines)
+            if i > start:
+                result_lines.extend(lines[start:i])
                 result_lines.append("")
-            current_tokens = estimate_tokens("\n".join(result_lines))
+                current_cost += sum(costs[start:i]) + blank_cost
             continue
 
         i += 1
 
     # Fill remaining space with content from the top.
     target_tokens = max_tokens - 50  # Leave room for truncation notice
-    if current_tokens < target_tokens:
+    if as_tokens(current_cost) < target_tokens:
+        already_included = set(result_lines)
         remaining_content = []
-        for line in lines:
-            if line not in result_lines:
-                remaining_content.append(line)
-                test_result = "\n".join(result_lines + remaining_content)
-                if estimate_tokens(test_result) > target_tokens:
-                    remaining_content.pop()
+        for line, cost in zip(lines, costs, strict=True):
+            if line not in already_included:
+                if as_tokens(current_cost + cost) > target_tokens:
                     break
+                remaining_content.append(line)
+                current_cost += cost
         result_lines.extend(remaining_content)
 
     # Add truncation notice
@@ -69,13 +69,13 @@ class CoverageCalculator:
             tasks = self.task_parser.parse(tasks_path)
 
         # Build coverage data
-        return self._build_coverage_report(
+        return self.build_report(
             spec_path=str(spec_path),
             requirements=requirements,
             tasks=tasks,
         )
 
-    def _build_coverage_report(
+    def build_report(
         self,
         spec_path: str,
         requirements: list[Requirement],
@@ -91,27 +91,25 @@ class CoverageCalculator:
         Returns:
             CoverageReport with requirement-task mappings.
         """
-        # Build map of requirement ID -> requirement
-        req_map: dict[str, Requirement] = {r.id: r for r in requirements}
-
-        # Build requirement coverage entries
-        coverage_list: list[RequirementCoverage] = []
-        for req in requirements:
-            # Find tasks that reference this requirement
-            matching_tasks = [t for t in tasks if req.id in t.requirement_ids]
-            coverage_list.append(
-                RequirementCoverage(
-                    requirement=req,
-                    tasks=matching_tasks,
-                )
-            )
+        # Map requirement ID -> referencing tasks (file order, each task once)
+        tasks_by_requirement: dict[str, list[Task]] = {r.id: [] for r in requirements}
 
         # Find orphaned references (tasks referencing non-existent requirements)
         orphaned: list[tuple[Task, str]] = []
         for task in tasks:
+            linked: set[str] = set()
             for ref in task.references:
-                if ref.requirement_id not in req_map:
+                matching = tasks_by_requirement.get(ref.requirement_id)
+                if matching is None:
                     orphaned.append((task, ref.requirement_id))
+                elif ref.requirement_id not in linked:
+                    linked.add(ref.requirement_id)
+                    matching.append(task)
+
+        coverage_list = [
+            RequirementCoverage(requirement=req, tasks=list(tasks_by_requirement[req.id]))
+            for req in requirements
+        ]
 
         return CoverageReport(
             spec_path=spec_path,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ..models.crossref_models import (
     CoverageReport,
@@ -14,6 +15,9 @@ from .coverage_calculator import CoverageCalculator
 from .requirement_parser import RequirementParser
 from .task_parser import TaskParser
 
+if TYPE_CHECKING:
+    from .spec_cache import SpecCache
+
 
 class CrossReferenceService:
     """Service for managing cross-references between specs and tasks.
@@ -29,17 +33,19 @@ class CrossReferenceService:
         self,
         project_root: Path | None = None,
         specs_dir: str = "specs",
+        cache: SpecCache | None = None,
     ) -> None:
         """Initialize the service.
 
         Args:
             project_root: Root directory of the project. Defaults to cwd.
             specs_dir: Name of the specs directory.
+            cache: Optional parsed-spec cache shared by the parsers.
         """
         self.project_root = Path(project_root) if project_root else Path.cwd()
         self.specs_dir = specs_dir
-        self.requirement_parser = RequirementParser()
-        self.task_parser = TaskParser()
+        self.requirement_parser = RequirementParser(cache=cache)
+        self.task_parser = TaskParser(cache=cache)
         self.coverage_calculator = CoverageCalculator(
             self.requirement_parser,
             self.task_parser,
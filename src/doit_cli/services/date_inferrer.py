@@ -13,6 +13,10 @@ import re
 import subprocess
 from datetime import date, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .git_metadata import GitMetadataProvider, PathHistory
 
 
 class DateInferrer:
@@ -29,13 +33,17 @@ class DateInferrer:
         r"\*\*Status\*\*:\s*(Complete|Completed|Approved)", re.IGNORECASE
     )
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, git_metadata: GitMetadataProvider | None = None):
         """Initialize the date inferrer.
 
         Args:
             project_root: Root directory of the project
+            git_metadata: Batched git history for the specs directory. Git
+                dates for files it covers are looked up there instead of
+                running `git log` per file.
         """
         self.project_root = project_root
+        self.git_metadata = git_metadata
         self._git_available: bool | None = None
 
     def _is_git_available(self) -> bool:
@@ -164,6 +172,12 @@ class DateInferrer:
         except (OSError, UnicodeDecodeError):
             return False
 
+    def _indexed_history(self, spec_path: Path) -> PathHistory | None:
+        """Return the batched git history for a file, if the provider covers it."""
+        if self.git_metadata is None:
+            return None
+        return self.git_metadata.history(spec_path)
+
     def _get_git_first_commit_date(self, spec_path: Path) -> date | None:
         """Get the date of the first git commit for a file.
 
@@ -173,6 +187,10 @@ class DateInferrer:
         Returns:
             Date of first commit or None
         """
+        history = self._indexed_history(spec_path)
+        if history is not None:
+            return self._parse_optional_iso(history.first_added)
+
         try:
             result = subprocess.run(
                 [
@@ -211,6 +229,10 @@ class DateInferrer:
         Returns:
             Date of last modification or None
         """
+        history = self._indexed_history(spec_path)
+        if history is not None:
+            return self._parse_optional_iso(history.last_modified)
+
         try:
             result = subprocess.run(
                 [
@@ -244,6 +266,10 @@ class DateInferrer:
         Returns:
             Date of status change or None
         """
+        history = self._indexed_history(spec_path)
+        if history is not None:
+            return self._parse_optional_iso(history.status_changed)
+
         try:
             # Search git log for commits that mention status change
             result = subprocess.run(
@@ -328,6 +354,11 @@ class DateInferrer:
         except ValueError:
             return None
 
+    @classmethod
+    def _parse_optional_iso(cls, iso_str: str | None) -> date | None:
+        """Parse an ISO 8601 datetime string that may be missing."""
+        return cls._parse_iso_datetime(iso_str) if iso_str else None
+
     @staticmethod
     def _parse_iso_datetime(iso_str: str) -> date | None:
         """Parse an ISO 8601 datetime string to date.
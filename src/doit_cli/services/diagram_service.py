@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+from .. import __version__
 from ..models.diagram_models import (
     DiagramResult,
+    DiagramSection,
     DiagramType,
     GeneratedDiagram,
     ValidationResult,
@@ -16,6 +19,8 @@ from .entity_parser import EntityParser
 from .er_diagram_generator import ERDiagramGenerator
 from .mermaid_validator import MermaidValidator
 from .section_parser import SectionParser
+from .spec_cache import content_hash
+from .spec_document import SpecDocument
 from .user_journey_generator import UserJourneyGenerator
 from .user_story_parser import UserStoryParser
 
@@ -28,6 +33,11 @@ class DiagramService:
     2. Generate diagrams (flowcharts, ER diagrams)
     3. Validate Mermaid syntax
     4. Insert/replace in AUTO-GENERATED sections
+
+    Each inserted section records a hash of the spec lines its diagram
+    was generated from. A section whose recorded hash still matches is
+    not regenerated, and a file whose sections are all up to date is not
+    written.
     """
 
     # Section name mappings
@@ -37,6 +47,12 @@ class DiagramService:
         DiagramType.ARCHITECTURE: "architecture",
     }
 
+    # Diagram types generated when none are requested and their source exists
+    AUTO_TYPES = (DiagramType.USER_JOURNEY, DiagramType.ER_DIAGRAM)
+
+    # Hex digits of the source hash kept in the BEGIN marker
+    SOURCE_HASH_LENGTH = 16
+
     def __init__(self, strict: bool = False, backup: bool = True):
         """Initialize diagram service.
 
@@ -60,6 +76,7 @@ class DiagramService:
         file_path: Path,
         diagram_types: list[DiagramType] | None = None,
         insert: bool = True,
+        force: bool = False,
     ) -> DiagramResult:
         """Generate diagrams for a specification file.
 
@@ -67,6 +84,7 @@ class DiagramService:
             file_path: Path to spec.md or plan.md file
             diagram_types: Types to generate (default: auto-detect applicable)
             insert: If True, insert diagrams into file
+            force: If True, regenerate sections whose source is unchanged
 
         Returns:
             DiagramResult with generated diagrams and status
@@ -87,16 +105,39 @@ class DiagramService:
             result.error = f"Error reading file: {e}"
             return result
 
+        # Tokenize once; every parser below reads the same document
+        document = SpecDocument.parse(content)
+
         # Find existing AUTO-GENERATED sections
-        result.sections_found = self.section_parser.find_sections(content)
+        result.sections_found = self.section_parser.find_sections(document)
+
+        # Skip sections whose recorded source hash still matches, before
+        # parsing anything
+        candidates = list(self.AUTO_TYPES) if diagram_types is None else diagram_types
+        source_hashes: dict[DiagramType, str | None] = {}
+        pending: list[DiagramType] = []
+        for diagram_type in candidates:
+            source_hash = self.source_hash(document, diagram_type, result.sections_found)
+            section = self._target_section(result.sections_found, diagram_type)
+            if (
+                insert
+                and not force
+                and source_hash is not None
+                and section is not None
+                and section.source_hash == source_hash
+            ):
+                result.sections_unchanged.append(section.section_name)
+                continue
+            source_hashes[diagram_type] = source_hash
+            pending.append(diagram_type)
 
         # Auto-detect diagram types if not specified
         if diagram_types is None:
-            diagram_types = self._detect_applicable_types(content)
+            pending = [t for t in pending if self._is_applicable(document, t)]
 
         # Generate each diagram type
-        for diagram_type in diagram_types:
-            diagram = self._generate_diagram(content, diagram_type)
+        for diagram_type in pending:
+            diagram = self._generate_diagram(document, diagram_type)
             if diagram:
                 # Validate
                 validation = self.validator.validate(diagram.mermaid_content, diagram_type)
@@ -114,10 +155,12 @@ class DiagramService:
 
         # Insert diagrams into file if requested
         if insert and result.diagrams:
-            updated_content, sections_updated = self._insert_diagrams(content, result.diagrams)
+            updated_content, sections_updated = self._insert_diagrams(
+                content, result.diagrams, source_hashes
+            )
             result.sections_updated = sections_updated
 
-            if sections_updated:
+            if sections_updated and updated_content != content:
                 # Create backup and write file
                 try:
                     self._write_file(file_path, updated_content)
@@ -128,6 +171,74 @@ class DiagramService:
 
         return result
 
+    def generate_all(
+        self,
+        file_paths: list[Path],
+        diagram_types: list[DiagramType] | None = None,
+        force: bool = False,
+        jobs: int = 1,
+    ) -> list[DiagramResult]:
+        """Generate and insert diagrams for several files.
+
+        Args:
+            file_paths: Spec files to process
+            diagram_types: Types to generate (default: auto-detect applicable)
+            force: If True, regenerate sections whose source is unchanged
+            jobs: Files processed concurrently
+
+        Returns:
+            One DiagramResult per file, in input order
+        """
+        if jobs <= 1 or len(file_paths) <= 1:
+            return [self.generate(path, diagram_types, force=force) for path in file_paths]
+
+        with ThreadPoolExecutor(max_workers=min(jobs, len(file_paths))) as pool:
+            return list(
+                pool.map(lambda path: self.generate(path, diagram_types, force=force), file_paths)
+            )
+
+    def source_hash(
+        self,
+        content: str | SpecDocument,
+        diagram_type: DiagramType,
+        sections: list[DiagramSection] | None = None,
+    ) -> str | None:
+        """Hash the spec lines a diagram type is generated from.
+
+        Lines inside AUTO-GENERATED sections are left out, so writing a
+        diagram never changes its own source hash. The doit version is part
+        of the hash, so upgrading regenerates every diagram once.
+
+        Args:
+            content: File content, or its parsed document
+            diagram_type: Type of diagram
+            sections: AUTO-GENERATED sections of the content, if already found
+
+        Returns:
+            Truncated hex digest, or None if the content has no source for
+            this diagram type
+        """
+        document = SpecDocument.of(content)
+        if diagram_type == DiagramType.USER_JOURNEY:
+            source = self.user_story_parser.source_range(document)
+        elif diagram_type == DiagramType.ER_DIAGRAM:
+            source = self.entity_parser.source_range(document)
+        else:
+            return None
+        if source is None:
+            return None
+
+        if sections is None:
+            sections = self.section_parser.find_sections(document)
+        generated: set[int] = set()
+        for section in sections:
+            generated.update(range(section.start_line - 1, section.end_line))
+
+        start, end = source
+        lines = [document.lines[i] for i in range(start, end) if i not in generated]
+        digest = content_hash("\n".join([__version__, diagram_type.value, *lines]))
+        return digest[: self.SOURCE_HASH_LENGTH]
+
     def validate(self, content: str, diagram_type: DiagramType | None = None) -> ValidationResult:
         """Validate Mermaid diagram syntax.
 
@@ -170,32 +281,44 @@ class DiagramService:
 
         return success
 
-    def _detect_applicable_types(self, content: str) -> list[DiagramType]:
+    def _detect_applicable_types(self, content: str | SpecDocument) -> list[DiagramType]:
         """Detect which diagram types are applicable for content.
 
         Args:
-            content: File content
+            content: File content, or its parsed document
 
         Returns:
             List of applicable DiagramType values
         """
-        types = []
+        return [t for t in self.AUTO_TYPES if self._is_applicable(content, t)]
+
+    def _is_applicable(self, content: str | SpecDocument, diagram_type: DiagramType) -> bool:
+        """Check whether content has anything to draw for a diagram type.
+
+        Args:
+            content: File content, or its parsed document
+            diagram_type: Type of diagram
 
+        Returns:
+            True if the diagram type applies to the content
+        """
         # Check for user stories
-        if self.user_story_parser.count_stories(content) > 0:
-            types.append(DiagramType.USER_JOURNEY)
+        if diagram_type == DiagramType.USER_JOURNEY:
+            return self.user_story_parser.count_stories(content) > 0
 
         # Check for entities
-        if self.entity_parser.count_entities(content) > 0:
-            types.append(DiagramType.ER_DIAGRAM)
+        if diagram_type == DiagramType.ER_DIAGRAM:
+            return self.entity_parser.count_entities(content) > 0
 
-        return types
+        return False
 
-    def _generate_diagram(self, content: str, diagram_type: DiagramType) -> GeneratedDiagram | None:
+    def _generate_diagram(
+        self, content: str | SpecDocument, diagram_type: DiagramType
+    ) -> GeneratedDiagram | None:
         """Generate a single diagram type.
 
         Args:
-            content: File content
+            content: File content, or its parsed document
             diagram_type: Type of diagram to generate
 
         Returns:
@@ -224,48 +347,73 @@ class DiagramService:
         return None  # type: ignore[unreachable]
 
     def _insert_diagrams(
-        self, content: str, diagrams: list[GeneratedDiagram]
+        self,
+        content: str,
+        diagrams: list[GeneratedDiagram],
+        source_hashes: dict[DiagramType, str | None] | None = None,
     ) -> tuple[str, list[str]]:
         """Insert diagrams into AUTO-GENERATED sections.
 
         Args:
             content: Original file content
             diagrams: List of generated diagrams
+            source_hashes: Source hash to record per diagram type
 
         Returns:
             Tuple of (updated content, list of section names updated)
         """
         updated_content = content
         sections_updated = []
+        source_hashes = source_hashes or {}
 
         for diagram in diagrams:
-            section_name = self.SECTION_NAMES.get(diagram.diagram_type)
-            if not section_name:
+            section = self._target_section(
+                self.section_parser.find_sections(updated_content), diagram.diagram_type
+            )
+            if section is None:
+                # Section not found, skip
                 continue
 
-            # Check if section exists
-            if not self.section_parser.has_section(updated_content, section_name):
-                # Try to find alternate section names
-                alt_names = self._get_alternate_section_names(diagram.diagram_type)
-                for alt_name in alt_names:
-                    if self.section_parser.has_section(updated_content, alt_name):
-                        section_name = alt_name
-                        break
-                else:
-                    # Section not found, skip
-                    continue
-
             # Replace section content
             wrapped_content = diagram.wrapped_content
             updated_content, success = self.section_parser.replace_section_content(
-                updated_content, section_name, wrapped_content
+                updated_content,
+                section.section_name,
+                wrapped_content,
+                source_hash=source_hashes.get(diagram.diagram_type),
             )
 
             if success:
-                sections_updated.append(section_name)
+                sections_updated.append(section.section_name)
 
         return updated_content, sections_updated
 
+    def _target_section(
+        self, sections: list[DiagramSection], diagram_type: DiagramType
+    ) -> DiagramSection | None:
+        """Find the section a diagram type is inserted into.
+
+        Args:
+            sections: AUTO-GENERATED sections of the file
+            diagram_type: Type of diagram
+
+        Returns:
+            The section under the primary name, else under the first
+            alternate name found, else None
+        """
+        section_name = self.SECTION_NAMES.get(diagram_type)
+        if not section_name:
+            return None
+
+        by_name: dict[str, DiagramSection] = {}
+        for section in sections:
+            by_name.setdefault(section.section_name, section)
+
+        for name in (section_name, *self._get_alternate_section_names(diagram_type)):
+            if name in by_name:
+                return by_name[name]
+        return None
+
     def _get_alternate_section_names(self, diagram_type: DiagramType) -> list[str]:
         """Get alternate section names for a diagram type.
 
@@ -6,11 +6,17 @@ from datetime import datetime
 from pathlib import Path
 
 from ..models.sync_models import CommandTemplate, SyncStatus, SyncStatusEnum
+from .prompt_writer import PromptWriter
 from .template_reader import TemplateReader
 
 
 class DriftDetector:
-    """Detects when command templates and prompts are out of sync."""
+    """Detects when command templates and prompts are out of sync.
+
+    A prompt is in sync when its content is what the template transforms
+    to. The sync manifest answers this from file stats for prompts written
+    by `doit sync-prompts`, so only unrecorded prompts are transformed.
+    """
 
     DEFAULT_PROMPTS_DIR = ".github/prompts"
 
@@ -25,6 +31,7 @@ class DriftDetector:
         reader = TemplateReader(self.project_root)
         self.templates_dir = reader.get_templates_directory()
         self.prompts_dir = self.project_root / self.DEFAULT_PROMPTS_DIR
+        self.prompt_writer = PromptWriter(project_root=self.project_root)
 
     def get_prompt_path(self, template: CommandTemplate) -> Path:
         """Get the expected prompt file path for a template.
@@ -46,10 +53,10 @@ class DriftDetector:
         Returns:
             SyncStatus indicating whether prompt is synchronized.
         """
-        prompt_path = self.get_prompt_path(template)
+        status = self.prompt_writer.check_prompt(template)
         now = datetime.now()
 
-        if not prompt_path.exists():
+        if status == SyncStatusEnum.MISSING:
             return SyncStatus(
                 command_name=template.name,
                 status=SyncStatusEnum.MISSING,
@@ -57,16 +64,12 @@ class DriftDetector:
                 reason="No corresponding prompt file exists",
             )
 
-        # Compare timestamps
-        prompt_mtime = prompt_path.stat().st_mtime
-        template_mtime = template.modified_at.timestamp()
-
-        if template_mtime > prompt_mtime:
+        if status == SyncStatusEnum.OUT_OF_SYNC:
             return SyncStatus(
                 command_name=template.name,
                 status=SyncStatusEnum.OUT_OF_SYNC,
                 checked_at=now,
-                reason="Command template modified after prompt was generated",
+                reason="Prompt content differs from the transformed command template",
             )
 
         return SyncStatus(
@@ -85,7 +88,9 @@ class DriftDetector:
         Returns:
             List of SyncStatus for each template.
         """
-        return [self.check_sync_status(t) for t in templates]
+        statuses = [self.check_sync_status(t) for t in templates]
+        self.prompt_writer.manifest.save()
+        return statuses
 
     def get_out_of_sync(self, templates: list[CommandTemplate]) -> list[SyncStatus]:
         """Get only the templates that are out of sync.
@@ -10,6 +10,7 @@ from ..models.diagram_models import (
     EntityRelationship,
     ParsedEntity,
 )
+from .spec_document import SpecDocument
 
 
 class EntityParser:
@@ -19,10 +20,8 @@ class EntityParser:
     from the Key Entities markdown section.
     """
 
-    # Pattern for Key Entities section header
-    SECTION_HEADER_PATTERN = re.compile(
-        r"^##\s*Key\s+Entities\s*$|^###\s*Key\s+Entities\s*$", re.IGNORECASE | re.MULTILINE
-    )
+    # Title of the Key Entities section (## or ### heading)
+    SECTION_TITLE_PATTERN = re.compile(r"Key\s+Entities", re.IGNORECASE)
 
     # Pattern for entity bullet: - **EntityName**: Description
     ENTITY_PATTERN = re.compile(r"^[-*]\s+\*\*([A-Za-z][A-Za-z0-9_]*)\*\*:\s*(.+)$", re.MULTILINE)
@@ -62,25 +61,20 @@ class EntityParser:
         (re.compile(r"\b(\w+)_id\b", re.IGNORECASE), "uuid", False, True),  # FK pattern
     ]
 
-    def parse(self, content: str) -> list[ParsedEntity]:
+    def parse(self, content: str | SpecDocument) -> list[ParsedEntity]:
         """Parse all entities from spec content.
 
         Args:
-            content: Full content of spec.md file
+            content: Full content of spec.md file, or its parsed document
 
         Returns:
             List of ParsedEntity objects
         """
-        # Find Key Entities section
-        section_content = self._extract_key_entities_section(content)
-        if not section_content:
-            return []
-
         entities = []
         entity_names: set[str] = set()
 
-        # Find all entity definitions
-        for match in self.ENTITY_PATTERN.finditer(section_content):
+        # Find all entity definitions in the Key Entities section
+        for match in self._entity_matches(SpecDocument.of(content)):
             entity_name = match.group(1).strip()
             description = match.group(2).strip()
 
@@ -109,29 +103,30 @@ class EntityParser:
 
         return entities
 
-    def _extract_key_entities_section(self, content: str) -> str | None:
-        """Extract the Key Entities section from content.
+    def _entity_matches(self, document: SpecDocument) -> list[re.Match[str]]:
+        """Match entity bullets in the Key Entities section.
+
+        The section runs from its heading to the next ``##`` heading, so a
+        ``### Key Entities`` subsection also covers any sibling ``###``
+        subsections that follow it.
 
         Args:
-            content: Full file content
+            document: Parsed spec
 
         Returns:
-            Key Entities section content, or None if not found
+            ENTITY_PATTERN matches, in document order
         """
-        match = self.SECTION_HEADER_PATTERN.search(content)
-        if not match:
-            return None
-
-        start_pos = match.end()
-
-        # Find next section header
-        next_section = re.search(r"^##\s+[^#]", content[start_pos:], re.MULTILINE)
-        if next_section:
-            end_pos = start_pos + next_section.start()
-        else:
-            end_pos = len(content)
+        section = self.source_range(document)
+        if section is None:
+            return []
 
-        return content[start_pos:end_pos]
+        start, end = section
+        matches = []
+        for item in document.list_items_in(start + 1, end):
+            match = self.ENTITY_PATTERN.match(item.line)
+            if match:
+                matches.append(match)
+        return matches
 
     def _extract_attributes(self, entity_name: str, description: str) -> list[EntityAttribute]:
         """Extract attributes from entity description.
@@ -303,16 +298,40 @@ class EntityParser:
 
         return ""
 
-    def count_entities(self, content: str) -> int:
+    def count_entities(self, content: str | SpecDocument) -> int:
         """Count entities in content without full parsing.
 
         Args:
-            content: Spec content to check
+            content: Spec content to check, or its parsed document
 
         Returns:
             Number of entities found
         """
-        section = self._extract_key_entities_section(content)
-        if not section:
-            return 0
-        return len(self.ENTITY_PATTERN.findall(section))
+        return len(self._entity_matches(SpecDocument.of(content)))
+
+    def source_range(self, content: str | SpecDocument) -> tuple[int, int] | None:
+        """Return the lines of the Key Entities section.
+
+        Args:
+            content: Spec content to check, or its parsed document
+
+        Returns:
+            ``(start, end)`` 0-based, end-exclusive line indices from the
+            section heading to the next ``##`` heading, or None if there
+            is no Key Entities section
+        """
+        document = SpecDocument.of(content)
+        heading = next(
+            (
+                h
+                for h in document.headings
+                if h.level in (2, 3) and self.SECTION_TITLE_PATTERN.fullmatch(h.title)
+            ),
+            None,
+        )
+        if heading is None:
+            return None
+
+        next_section = document.next_heading(heading.index, max_level=2)
+        end = next_section.index if next_section else len(document.lines)
+        return heading.index, end
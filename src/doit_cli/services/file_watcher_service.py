@@ -2,14 +2,21 @@
 
 This module provides the FileWatcherService class for monitoring
 .doit/memory/ directory changes using the watchdog library.
+
+File system events are handed to a `ChangeQueue`, which merges them per
+path on a single worker thread and dispatches batches. A bulk operation
+such as `git checkout` therefore yields one notification per batch
+instead of one timer restart and duplicate entries per event.
 """
 
 from __future__ import annotations
 
 import logging
+import queue
 import threading
+import time
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -27,7 +34,7 @@ class FileChangeEvent:
     """Represents a file change event."""
 
     path: str  # Relative path from .doit/memory/
-    event_type: str  # 'created', 'modified', 'deleted', 'moved'
+    event_type: str  # 'created', 'modified', 'deleted'
     timestamp: datetime = field(default_factory=datetime.now)
     is_directory: bool = False
 
@@ -82,23 +89,28 @@ class MemoryFileHandler(FileSystemEventHandler):
         except ValueError:
             return Path(src_path).name
 
+    @staticmethod
+    def _as_str(path: bytes | str) -> str:
+        # watchdog's event paths can be bytes|str depending on platform;
+        # coerce to str for the rest of the pipeline.
+        return path.decode() if isinstance(path, bytes) else path
+
+    def _emit(self, path: str, event_type: str, is_directory: bool) -> None:
+        self.on_change(
+            FileChangeEvent(
+                path=self._get_relative_path(path),
+                event_type=event_type,
+                timestamp=datetime.now(),
+                is_directory=is_directory,
+            )
+        )
+
     def _handle_event(self, event: FileSystemEvent, event_type: str) -> None:
         """Handle a file system event."""
-        # watchdog's FileSystemEvent.src_path can be bytes|str depending on
-        # platform; coerce to str for the rest of the pipeline.
-        src_path = (
-            event.src_path.decode() if isinstance(event.src_path, bytes) else event.src_path
-        )
+        src_path = self._as_str(event.src_path)
         if self._should_ignore(src_path):
             return
-
-        change_event = FileChangeEvent(
-            path=self._get_relative_path(src_path),
-            event_type=event_type,
-            timestamp=datetime.now(),
-            is_directory=event.is_directory,
-        )
-        self.on_change(change_event)
+        self._emit(src_path, event_type, event.is_directory)
 
     def on_created(self, event: FileSystemEvent) -> None:
         """Handle file/directory creation."""
@@ -113,8 +125,161 @@ class MemoryFileHandler(FileSystemEventHandler):
         self._handle_event(event, "deleted")
 
     def on_moved(self, event: FileSystemEvent) -> None:
-        """Handle file/directory move."""
-        self._handle_event(event, "moved")
+        """Handle file/directory move as a deletion plus a creation.
+
+        A move from an ignored temporary file onto a tracked one (how
+        atomic writes replace a file) is reported as a modification.
+        """
+        src_path = self._as_str(event.src_path)
+        dest_path = self._as_str(event.dest_path)
+        src_ignored = self._should_ignore(src_path)
+        dest_ignored = self._should_ignore(dest_path)
+
+        if not src_ignored:
+            self._emit(src_path, "deleted", event.is_directory)
+        if not dest_ignored:
+            self._emit(dest_path, "modified" if src_ignored else "created", event.is_directory)
+
+
+@dataclass
+class WatcherStats:
+    """Counters for the change pipeline.
+
+    Every received event is eventually either coalesced or dispatched.
+    """
+
+    received: int = 0  # Events reported by the file system
+    coalesced: int = 0  # Events merged into a later one or cancelled
+    dispatched: int = 0  # Events delivered in a batch
+    batches: int = 0  # Batches delivered
+
+
+# Queue item telling the worker to flush and exit
+_STOP = object()
+
+
+class ChangeQueue:
+    """Single-thread queue that coalesces file changes by path.
+
+    Events are queued without blocking the watchdog thread and merged per
+    path by one worker thread: the last event wins, a file created and then
+    deleted within a batch disappears, and one deleted and re-created
+    becomes a modification. A batch is dispatched once no event has
+    arrived for ``quiet_period`` seconds, or at most ``max_latency``
+    seconds after its first event, so a long bulk operation still produces
+    regular updates.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[list[FileChangeEvent]], None],
+        quiet_period: float,
+        max_latency: float,
+    ):
+        """Initialize the queue.
+
+        Args:
+            dispatch: Called on the worker thread with each batch
+            quiet_period: Seconds without events before a batch is flushed
+            max_latency: Maximum seconds between a batch's first event and
+                its dispatch
+        """
+        self.dispatch = dispatch
+        self.quiet_period = quiet_period
+        self.max_latency = max_latency
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._stats = WatcherStats()
+        self._stats_lock = threading.Lock()
+
+    @property
+    def stats(self) -> WatcherStats:
+        """Snapshot of the pipeline counters."""
+        with self._stats_lock:
+            return replace(self._stats)
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="doit-file-watcher", daemon=True)
+            self._thread.start()
+
+    def put(self, event: FileChangeEvent) -> None:
+        """Queue an event (safe to call from any thread)."""
+        self._queue.put(event)
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Dispatch pending changes and stop the worker thread."""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        pending: dict[str, FileChangeEvent] = {}
+        first_at = last_at = 0.0
+
+        while True:
+            timeout = None
+            if pending:
+                deadline = min(last_at + self.quiet_period, first_at + self.max_latency)
+                timeout = max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                break
+            if item is not None:
+                now = time.monotonic()
+                if not pending:
+                    first_at = now
+                last_at = now
+                self._merge(pending, item)
+
+            if pending and time.monotonic() >= min(
+                last_at + self.quiet_period, first_at + self.max_latency
+            ):
+                self._flush(pending)
+
+        self._flush(pending)
+
+    def _merge(self, pending: dict[str, FileChangeEvent], event: FileChangeEvent) -> None:
+        """Fold ``event`` into the pending batch."""
+        previous = pending.get(event.path)
+        with self._stats_lock:
+            self._stats.received += 1
+            if previous is not None:
+                self._stats.coalesced += 1
+
+        if previous is None:
+            pending[event.path] = event
+        elif previous.event_type == "created" and event.event_type == "deleted":
+            del pending[event.path]
+            with self._stats_lock:
+                self._stats.coalesced += 1
+        elif previous.event_type == "created":
+            pending[event.path] = replace(event, event_type="created")
+        elif previous.event_type == "deleted" and event.event_type == "created":
+            pending[event.path] = replace(event, event_type="modified")
+        else:
+            pending[event.path] = event
+
+    def _flush(self, pending: dict[str, FileChangeEvent]) -> None:
+        """Dispatch the pending batch, isolating dispatch failures."""
+        if not pending:
+            return
+        batch = list(pending.values())
+        pending.clear()
+        with self._stats_lock:
+            self._stats.dispatched += len(batch)
+            self._stats.batches += 1
+        try:
+            self.dispatch(batch)
+        except Exception:
+            # The worker must survive a failing batch; the error is logged
+            logger.exception("file-change dispatch raised; continuing")
 
 
 class FileWatcherService:
@@ -122,12 +287,13 @@ class FileWatcherService:
 
     This service:
     - Watches the .doit/memory/ directory for changes
-    - Debounces rapid changes to avoid notification spam
+    - Coalesces rapid changes per file to avoid notification spam
     - Triggers notifications via NotificationService
     - Runs in a background thread
     """
 
     DEBOUNCE_SECONDS = 2.0  # Wait 2 seconds after last change before notifying
+    MAX_LATENCY_SECONDS = 10.0  # Notify at least this often during bulk changes
 
     def __init__(
         self,
@@ -150,10 +316,11 @@ class FileWatcherService:
         # doesn't accept it as a type annotation, so we fall back to Any.
         self._observer: Any = None
         self._is_running = False
-        self._pending_changes: list[FileChangeEvent] = []
-        self._last_change_time: datetime | None = None
-        self._debounce_timer: threading.Timer | None = None
-        self._lock = threading.Lock()
+        self._queue = ChangeQueue(
+            self._process_changes,
+            quiet_period=self.DEBOUNCE_SECONDS,
+            max_latency=self.MAX_LATENCY_SECONDS,
+        )
         self._on_change_callbacks: list[Callable[[list[FileChangeEvent]], None]] = []
 
     @property
@@ -166,6 +333,11 @@ class FileWatcherService:
         """Check if watcher is running."""
         return self._is_running
 
+    @property
+    def stats(self) -> WatcherStats:
+        """Counters for events received, coalesced and dispatched."""
+        return self._queue.stats
+
     def add_change_callback(self, callback: Callable[[list[FileChangeEvent]], None]) -> None:
         """Add a callback for batched change notifications.
 
@@ -176,50 +348,21 @@ class FileWatcherService:
 
     def _on_file_change(self, event: FileChangeEvent) -> None:
         """Handle a single file change event."""
-        with self._lock:
-            self._pending_changes.append(event)
-            self._last_change_time = datetime.now()
-
-            # Cancel existing timer
-            if self._debounce_timer:
-                self._debounce_timer.cancel()
-
-            # Start new debounce timer
-            self._debounce_timer = threading.Timer(
-                self.DEBOUNCE_SECONDS, self._process_pending_changes
-            )
-            self._debounce_timer.start()
-
-    def _process_pending_changes(self) -> None:
-        """Process accumulated changes after debounce period."""
-        with self._lock:
-            if not self._pending_changes:
-                return
-
-            changes = self._pending_changes.copy()
-            self._pending_changes.clear()
-
-        # Deduplicate changes for the same file
-        seen_paths = {}
-        for change in changes:
-            key = change.path
-            # Keep the latest event for each path
-            seen_paths[key] = change
-
-        unique_changes = list(seen_paths.values())
+        self._queue.put(event)
 
+    def _process_changes(self, changes: list[FileChangeEvent]) -> None:
+        """Deliver a coalesced batch of changes (runs on the queue's thread)."""
         # Call registered callbacks — user callbacks are untyped, so we
         # must isolate any failure to avoid stalling the watcher. Exception
         # is intentional here and the error is logged for debugging.
         for callback in self._on_change_callbacks:
             try:
-                callback(unique_changes)
+                callback(changes)
             except Exception:
                 logger.exception("file-change callback raised; continuing")
 
         # Create notification if there are file changes
-        if unique_changes:
-            self._create_change_notification(unique_changes)
+        self._create_change_notification(changes)
 
     def _create_change_notification(self, changes: list[FileChangeEvent]) -> None:
         """Create notification for file changes."""
@@ -256,6 +399,7 @@ class FileWatcherService:
                 on_change=self._on_file_change,
             )
 
+            self._queue.start()
             self._observer = Observer()
             self._observer.schedule(handler, str(self.memory_dir), recursive=True)
             self._observer.start()
@@ -263,6 +407,7 @@ class FileWatcherService:
             return True
 
         except Exception:
+            self._queue.stop()
             self._is_running = False
             return False
 
@@ -271,21 +416,15 @@ class FileWatcherService:
         if not self._is_running:
             return
 
-        # Cancel debounce timer
-        if self._debounce_timer:
-            self._debounce_timer.cancel()
-            self._debounce_timer = None
-
-        # Process any remaining changes
-        if self._pending_changes:
-            self._process_pending_changes()
-
-        # Stop observer
+        # Stop observer first so no events arrive after the final flush
         if self._observer:
             self._observer.stop()
             self._observer.join(timeout=5.0)
             self._observer = None
 
+        # Dispatch any remaining changes
+        self._queue.stop()
+
         self._is_running = False
 
     def wait(self, timeout: float | None = None) -> None:
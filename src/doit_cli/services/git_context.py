@@ -0,0 +1,390 @@
+"""Per-process git repository context read from the `.git` directory.
+
+Branch, HEAD commit, remote URL and GitHub repo slug used to be looked up
+with a fresh `git`/`gh` process by each service that needed them
+(`GitHubProvider`, `GitHubService`, `GitHubLinkerService`, `ContextLoader`,
+`HookValidator`, `doit xref`), often several times per command.
+`GitContext` reads them straight from the repository's files instead and
+keeps each value until the file it came from changes: `HEAD` (and the ref
+it points to) for the branch and commit, `config` for remotes. A checkout
+or commit is therefore picked up on the next lookup without any explicit
+invalidation.
+
+`get_git_context()` returns one shared context per repository.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+from .git_objects import diff_index_to_head
+from .git_utils import GitError, GitFormatError, run_git_command
+
+T = TypeVar("T")
+
+# File stat fingerprint: (mtime_ns, size), or None if the file is missing
+_Signature = tuple[int, int] | None
+
+
+def _signature(path: Path) -> _Signature:
+    """Fingerprint a file so changes to it can be detected with one stat."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read(path: Path) -> str | None:
+    """Read a small text file, or None if it does not exist."""
+    try:
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+_SECTION = re.compile(r'\[\s*([-.\w]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+_KEY = re.compile(r"([A-Za-z][-A-Za-z0-9]*)\s*(=)?\s*")
+_UNESCAPE = re.compile(r"\\(.)")
+
+
+def _config_key(name: str) -> str:
+    """Canonical config key: section and variable names are case-insensitive."""
+    section, _, rest = name.partition(".")
+    subsection, _, variable = rest.rpartition(".")
+    if subsection:
+        return f"{section.lower()}.{subsection}.{variable.lower()}"
+    return f"{section.lower()}.{variable.lower()}"
+
+
+def _is_url_rewrite(key: str) -> bool:
+    return key.startswith("url.") and key.endswith(("insteadof", "pushinsteadof"))
+
+
+def _parse_config_value(text: str, lines: Iterator[str]) -> str:
+    """Decode a config value: quotes, escapes, comments and continuations."""
+    out: list[str] = []
+    quoted = False
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if char == '"':
+            quoted = not quoted
+        elif char in "#;" and not quoted:
+            break
+        elif char == "\\":
+            if i + 1 == len(text):
+                text, i = next(lines, ""), 0
+                continue
+            escaped = text[i + 1]
+            out.append({"n": "\n", "t": "\t", "b": "\b"}.get(escaped, escaped))
+            i += 2
+            continue
+        else:
+            out.append(char)
+        i += 1
+    return "".join(out).strip()
+
+
+def _load_config(files: list[Path]) -> dict[str, list[str]] | None:
+    """Merge config files into ``key -> values``, or None if one has includes."""
+    config: dict[str, list[str]] = {}
+    worktree_config = files[-1]
+    for path in files:
+        enabled = config.get("extensions.worktreeconfig", ["false"])[-1]
+        if path == worktree_config and enabled.lower() not in ("true", "yes", "on", "1"):
+            continue
+        text = _read(path)
+        if text is None:
+            continue
+        section = ""
+        lines = iter(text.splitlines())
+        for line in lines:
+            rest = line.strip()
+            if rest.startswith("["):
+                match = _SECTION.match(rest)
+                if match is None:
+                    return None
+                name, subsection = match.groups()
+                section = name.lower()
+                if subsection is not None:
+                    section += "." + _UNESCAPE.sub(r"\1", subsection)
+                if section == "include" or section.startswith("includeif."):
+                    return None
+                rest = rest[match.end() :].strip()
+            match = _KEY.match(rest)
+            if not section or match is None:
+                continue
+            value = _parse_config_value(rest[match.end() :], lines) if match.group(2) else "true"
+            config.setdefault(f"{section}.{match.group(1).lower()}", []).append(value)
+    return config
+
+
+def parse_repo_slug(remote_url: str, host: str = "github.com") -> str | None:
+    """Extract ``owner/repo`` from an SSH, scp-style or HTTPS remote URL.
+
+    Args:
+        remote_url: Remote URL such as ``git@github.com:owner/repo.git``
+        host: Host name the remote must point at
+
+    Returns:
+        The repository slug, or None if the URL is not on ``host``
+    """
+    match = re.search(rf"{re.escape(host)}(?::\d+)?[:/]+(.+?)(?:\.git)?/*$", remote_url.strip())
+    return match.group(1) if match else None
+
+
+@dataclass
+class GitContext:
+    """Branch, HEAD, remotes and repo slug of one repository.
+
+    Attributes:
+        root: Working tree root
+        git_dir: The repository's git directory (per worktree)
+        common_dir: Directory holding refs and config shared by worktrees
+    """
+
+    root: Path
+    git_dir: Path
+    common_dir: Path
+    _cache: dict[str, tuple[Any, Any]] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @classmethod
+    def discover(cls, start: Path | None = None) -> GitContext | None:
+        """Find the repository containing ``start`` (default: the current directory).
+
+        Handles `.git` directories as well as the `.git` files used by
+        worktrees and submodules, and honours ``GIT_DIR``/``GIT_WORK_TREE``
+        as set for hooks.
+
+        Returns:
+            The context, or None if ``start`` is not inside a git repository
+        """
+        start = (start or Path.cwd()).resolve()
+        if os.environ.get("GIT_DIR"):
+            git_dir = (start / os.environ["GIT_DIR"]).resolve()
+            root = Path(os.environ.get("GIT_WORK_TREE") or start).resolve()
+            return cls(root=root, git_dir=git_dir, common_dir=cls._common_dir(git_dir))
+
+        for directory in (start, *start.parents):
+            dot_git = directory / ".git"
+            if dot_git.is_dir():
+                git_dir = dot_git
+            elif dot_git.is_file():
+                pointer = _read(dot_git) or ""
+                if not pointer.startswith("gitdir:"):
+                    continue
+                git_dir = (directory / pointer[len("gitdir:") :].strip()).resolve()
+            else:
+                continue
+
+            return cls(root=directory, git_dir=git_dir, common_dir=cls._common_dir(git_dir))
+        return None
+
+    @staticmethod
+    def _common_dir(git_dir: Path) -> Path:
+        """The directory with shared refs and config (differs for worktrees)."""
+        common = _read(git_dir / "commondir")
+        return (git_dir / common.strip()).resolve() if common else git_dir
+
+    # -------------------------------------------------------------------------
+    # HEAD and branch
+    # -------------------------------------------------------------------------
+
+    @property
+    def head_ref(self) -> str | None:
+        """The ref HEAD points at (e.g. ``refs/heads/main``), or None if detached."""
+        head = self._head()
+        return head[len("ref:") :].strip() if head.startswith("ref:") else None
+
+    @property
+    def branch(self) -> str | None:
+        """The current branch name, or None on a detached HEAD."""
+        ref = self.head_ref
+        return ref.removeprefix("refs/heads/") if ref else None
+
+    @property
+    def head_sha(self) -> str | None:
+        """The commit HEAD resolves to, or None before the first commit."""
+        ref = self.head_ref
+        if ref is None:
+            return self._head() or None
+        return self.resolve_ref(ref)
+
+    def resolve_ref(self, ref: str) -> str | None:
+        """Resolve a full ref name to a commit from loose or packed refs."""
+        for directory in (self.git_dir, self.common_dir):
+            loose = _read(directory / ref)
+            if loose is not None:
+                value = loose.strip()
+                return self.resolve_ref(value[4:].strip()) if value.startswith("ref:") else value
+        return self._packed_refs().get(ref)
+
+    def _head(self) -> str:
+        """Contents of HEAD, re-read only after HEAD changes."""
+        path = self.git_dir / "HEAD"
+        return self._cached("head", _signature(path), lambda: (_read(path) or "").strip())
+
+    def _packed_refs(self) -> dict[str, str]:
+        """Refs listed in packed-refs, re-read only after the file changes."""
+        path = self.common_dir / "packed-refs"
+
+        def load() -> dict[str, str]:
+            refs = {}
+            for line in (_read(path) or "").splitlines():
+                if line and line[0] not in "#^":
+                    sha, _, name = line.partition(" ")
+                    refs[name.strip()] = sha
+            return refs
+
+        return self._cached("packed-refs", _signature(path), load)
+
+    # -------------------------------------------------------------------------
+    # Config and remotes
+    # -------------------------------------------------------------------------
+
+    def config_value(self, name: str) -> str | None:
+        """Value of a config key as ``git config <name>`` reports it.
+
+        System, global, repository and worktree config are layered in Git's
+        order; the last value wins. Falls back to ``git config`` when a
+        config file uses includes or ``-c`` overrides are in effect.
+        """
+        config = self._config()
+        if config is None:
+            try:
+                result = run_git_command(["config", name], cwd=self.root)
+            except GitError:
+                return None
+            return result.stdout if result.success else None
+        values = config.get(_config_key(name))
+        return values[-1] if values else None
+
+    def remote_url(self, remote: str = "origin") -> str | None:
+        """URL of a remote as configured in the repository's config.
+
+        Falls back to ``git remote get-url`` when the config uses includes
+        or URL rewrites.
+        """
+        config = self._config()
+        if config is None or any(_is_url_rewrite(key) for key in config):
+            try:
+                result = run_git_command(["remote", "get-url", remote], cwd=self.root)
+            except GitError:
+                return None
+            return result.stdout if result.success else None
+        values = config.get(_config_key(f"remote.{remote}.url"))
+        return values[0] if values else None
+
+    def repo_slug(self, host: str = "github.com", remote: str = "origin") -> str | None:
+        """``owner/repo`` of a remote on ``host``, or None if it is elsewhere."""
+        url = self.remote_url(remote)
+        return parse_repo_slug(url, host) if url else None
+
+    def _config_files(self) -> list[Path]:
+        """Config files in the order Git applies them."""
+        files = []
+        if not os.environ.get("GIT_CONFIG_NOSYSTEM"):
+            files.append(Path(os.environ.get("GIT_CONFIG_SYSTEM", "/etc/gitconfig")))
+        if "GIT_CONFIG_GLOBAL" in os.environ:
+            files.append(Path(os.environ["GIT_CONFIG_GLOBAL"]))
+        else:
+            try:
+                home = Path.home()
+            except RuntimeError:
+                home = None
+            xdg = os.environ.get("XDG_CONFIG_HOME")
+            if xdg:
+                files.append(Path(xdg) / "git" / "config")
+            elif home is not None:
+                files.append(home / ".config" / "git" / "config")
+            if home is not None:
+                files.append(home / ".gitconfig")
+        files.append(self.common_dir / "config")
+        files.append(self.git_dir / "config.worktree")
+        return files
+
+    def _config(self) -> dict[str, list[str]] | None:
+        """Merged config values, or None if only `git config` can read them."""
+        if os.environ.get("GIT_CONFIG_PARAMETERS") or os.environ.get("GIT_CONFIG_COUNT"):
+            return None
+        files = self._config_files()
+        return self._cached(
+            "config", tuple(_signature(path) for path in files), lambda: _load_config(files)
+        )
+
+    # -------------------------------------------------------------------------
+    # Index
+    # -------------------------------------------------------------------------
+
+    def staged_files(self) -> tuple[str, ...]:
+        """Paths staged for commit, like ``git diff --cached --no-renames``.
+
+        Reads the index (``GIT_INDEX_FILE`` if set, as during
+        ``git commit <paths>``) and HEAD's trees directly.
+
+        Raises:
+            GitFormatError: If the repository uses a format that needs `git`
+        """
+        if os.environ.get("GIT_OBJECT_DIRECTORY") or os.environ.get(
+            "GIT_ALTERNATE_OBJECT_DIRECTORIES"
+        ):
+            raise GitFormatError("Custom object directories are not supported")
+        if (self.config_value("extensions.objectformat") or "sha1") != "sha1":
+            raise GitFormatError("Only SHA-1 repositories are supported")
+
+        index_file = os.environ.get("GIT_INDEX_FILE")
+        index = Path(index_file).resolve() if index_file else self.git_dir / "index"
+        head_sha = self.head_sha
+        return self._cached(
+            f"staged:{index}",
+            (_signature(index), head_sha),
+            lambda: tuple(diff_index_to_head(self.common_dir / "objects", index, head_sha)),
+        )
+
+    # -------------------------------------------------------------------------
+    # Cache
+    # -------------------------------------------------------------------------
+
+    def _cached(self, key: str, signature: Any, compute: Callable[[], T]) -> T:
+        """Return the cached value for ``key`` unless its source file changed."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] == signature:
+                return entry[1]
+        value = compute()
+        with self._lock:
+            self._cache[key] = (signature, value)
+        return value
+
+    def invalidate(self) -> None:
+        """Forget every cached value."""
+        with self._lock:
+            self._cache.clear()
+
+
+_contexts: dict[Path, GitContext] = {}
+_contexts_lock = threading.Lock()
+
+
+def get_git_context(cwd: Path | None = None) -> GitContext | None:
+    """Get the shared GitContext for the repository containing ``cwd``.
+
+    Args:
+        cwd: Directory inside the repository (default: the current directory)
+
+    Returns:
+        The repository's context, or None outside a git repository
+    """
+    context = GitContext.discover(cwd)
+    if context is None:
+        return None
+    with _contexts_lock:
+        return _contexts.setdefault(context.git_dir, context)
@@ -0,0 +1,241 @@
+"""Batched git history for spec date inference.
+
+`DateInferrer` used to spawn up to three `git log` processes per spec
+(first commit, last modification, status change), so `doit analytics`
+on a repository with hundreds of specs ran more than a thousand git
+processes. `GitMetadataProvider` reads the history of a directory
+(``specs/`` by default) with two passes instead: one ``git log
+--name-status`` for add/modify dates and one pickaxe (``-S``) pass for
+status changes. It keeps a per-path index in memory.
+
+The index is stored in `.doit/cache/git-history.json` together with the
+HEAD commit it describes. A later run with the same HEAD reads no history
+at all; if HEAD moved forward, only the new commits are read. A rewritten
+history (HEAD no longer descends from the stored commit) triggers a full
+rebuild.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..utils.atomic_write import write_text_atomic
+from .git_utils import GitError, run_git_command
+
+logger = logging.getLogger(__name__)
+
+# Bump when the shape of the stored index changes.
+INDEX_FORMAT_VERSION = 1
+
+# Text whose appearance/disappearance marks a status change (matches the
+# per-file pickaxe query `DateInferrer` used before).
+STATUS_COMPLETE_MARKER = "Status**: Complete"
+
+# Emitted by `--format=%x00...` at the start of each commit header line.
+_COMMIT_MARKER = "\x00"
+
+
+@dataclass
+class PathHistory:
+    """Git dates known for one path, as ISO 8601 author dates.
+
+    Attributes:
+        first_added: Oldest commit adding the file, following renames
+        last_modified: Most recent commit touching the path
+        status_changed: Most recent commit changing the number of
+            ``Status**: Complete`` occurrences in the file
+    """
+
+    first_added: str | None = None
+    last_modified: str | None = None
+    status_changed: str | None = None
+
+
+@dataclass
+class GitMetadataProvider:
+    """Per-path git history index for one directory of the repository.
+
+    Attributes:
+        project_root: Root of the doit project (git commands run here)
+        directory: Directory whose history is indexed, relative to the
+            project root
+        enabled: Whether the stored index is read and written
+    """
+
+    CACHE_PATH = ".doit/cache/git-history.json"
+
+    project_root: Path
+    directory: str = "specs"
+    enabled: bool = True
+    _toplevel: Path | None = field(default=None, init=False, repr=False)
+    _paths: dict[str, PathHistory] | None = field(default=None, init=False, repr=False)
+    _loaded: bool = field(default=False, init=False, repr=False)
+
+    @property
+    def cache_path(self) -> Path:
+        """Location of the stored index."""
+        return self.project_root / self.CACHE_PATH
+
+    def history(self, path: Path) -> PathHistory | None:
+        """Return the git history of a file covered by this provider.
+
+        Args:
+            path: File to look up.
+
+        Returns:
+            Its dates (empty if git never saw the file), or None if the path
+            is outside the indexed directory or git history is unavailable,
+            in which case callers should query git themselves.
+        """
+        paths = self._ensure_loaded()
+        if paths is None or self._toplevel is None:
+            return None
+        directory = (self.project_root / self.directory).resolve()
+        resolved = Path(path).resolve()
+        if not resolved.is_relative_to(directory):
+            return None
+        key = resolved.relative_to(self._toplevel).as_posix()
+        return paths.get(key, PathHistory())
+
+    # ------------------------------------------------------------------
+    # Index construction
+    # ------------------------------------------------------------------
+
+    def _ensure_loaded(self) -> dict[str, PathHistory] | None:
+        if self._loaded:
+            return self._paths
+        self._loaded = True
+        try:
+            self._paths = self._load()
+        except GitError as exc:
+            logger.debug("git history unavailable: %s", exc)
+            self._paths = None
+        return self._paths
+
+    def _load(self) -> dict[str, PathHistory] | None:
+        result = run_git_command(["rev-parse", "--show-toplevel", "HEAD"], cwd=self.project_root)
+        if not result.success:
+            # Not a repository, or no commits yet.
+            return None
+        toplevel, head = result.stdout.splitlines()[:2]
+        self._toplevel = Path(toplevel).resolve()
+
+        stored_head, paths = self._read_stored()
+        if stored_head == head:
+            return paths
+        if stored_head is None or not self._is_ancestor(stored_head, head):
+            stored_head, paths = None, {}
+
+        revisions = f"{stored_head}..{head}" if stored_head else head
+        self._apply_changes(paths, revisions)
+        self._apply_status_changes(paths, revisions)
+        self._write_stored(head, paths)
+        return paths
+
+    def _is_ancestor(self, ancestor: str, head: str) -> bool:
+        result = run_git_command(
+            ["merge-base", "--is-ancestor", ancestor, head], cwd=self.project_root
+        )
+        return result.success
+
+    def _log(self, revisions: str, *options: str) -> list[tuple[str, list[list[str]]]]:
+        """Run one ``git log`` pass, oldest commit first.
+
+        Returns:
+            ``(author_date, file_lines)`` per commit, where each file line
+            is the tab-separated fields of a ``--name-status`` or
+            ``--name-only`` line.
+        """
+        result = run_git_command(
+            [
+                "-c",
+                "core.quotePath=false",
+                "log",
+                "--reverse",
+                "--format=%x00%aI",
+                *options,
+                revisions,
+                "--",
+                self.directory,
+            ],
+            cwd=self.project_root,
+        )
+        if not result.success:
+            raise GitError("git log failed", result.returncode, result.stderr)
+
+        commits: list[tuple[str, list[list[str]]]] = []
+        for line in result.stdout.splitlines():
+            if line.startswith(_COMMIT_MARKER):
+                commits.append((line[1:], []))
+            elif line and commits:
+                commits[-1][1].append(line.split("\t"))
+        return commits
+
+    def _apply_changes(self, paths: dict[str, PathHistory], revisions: str) -> None:
+        """Record add/modify dates from a ``--name-status`` pass."""
+        for author_date, changes in self._log(revisions, "--name-status", "-M"):
+            for fields in changes:
+                status = fields[0][:1]
+                if status == "R" and len(fields) == 3:
+                    old, new = fields[1], fields[2]
+                    # `git log --follow` on the new name reaches the add
+                    # commit of the old one.
+                    paths.setdefault(old, PathHistory()).last_modified = author_date
+                    entry = paths.setdefault(new, PathHistory())
+                    entry.first_added = paths[old].first_added
+                    entry.last_modified = author_date
+                    continue
+                entry = paths.setdefault(fields[-1], PathHistory())
+                if status == "A" and entry.first_added is None:
+                    entry.first_added = author_date
+                entry.last_modified = author_date
+
+    def _apply_status_changes(self, paths: dict[str, PathHistory], revisions: str) -> None:
+        """Record status-change dates from a pickaxe pass."""
+        options = ("--name-only", "--no-renames", "-S", STATUS_COMPLETE_MARKER)
+        for author_date, files in self._log(revisions, *options):
+            for fields in files:
+                paths.setdefault(fields[0], PathHistory()).status_changed = author_date
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _read_stored(self) -> tuple[str | None, dict[str, PathHistory]]:
+        if not self.enabled:
+            return None, {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None, {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != INDEX_FORMAT_VERSION
+            or data.get("directory") != self.directory
+        ):
+            return None, {}
+        try:
+            paths = {key: PathHistory(**value) for key, value in data["paths"].items()}
+        except (KeyError, TypeError, AttributeError):
+            return None, {}
+        return data.get("head"), paths
+
+    def _write_stored(self, head: str, paths: dict[str, PathHistory]) -> None:
+        """Persist the index. Failures are logged and swallowed."""
+        if not self.enabled or not (self.project_root / ".doit").is_dir():
+            return
+        payload: dict[str, Any] = {
+            "version": INDEX_FORMAT_VERSION,
+            "directory": self.directory,
+            "head": head,
+            "paths": {key: vars(value) for key, value in paths.items()},
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_text_atomic(self.cache_path, json.dumps(payload, sort_keys=True))
+        except OSError as exc:
+            logger.debug("git history index not written: %s", exc)
@@ -0,0 +1,429 @@
+"""Read the Git index and object database without running `git`.
+
+Pre-commit hooks need the list of staged paths, which `git diff --cached`
+computes by comparing the index with the tree of HEAD. This module does
+the same comparison in-process: it parses the index (versions 2 and 3),
+reads HEAD's trees from loose objects or pack files, and skips every
+directory whose cached tree in the index still matches HEAD, so a commit
+touching a few files reads only a few tree objects.
+
+Formats it does not understand (index v4, split or sparse indexes,
+intent-to-add entries, SHA-256 repositories) raise `GitFormatError`;
+callers fall back to the `git` command.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import zlib
+from pathlib import Path
+from types import TracebackType
+
+from .git_utils import GitFormatError
+
+OBJ_COMMIT = 1
+OBJ_TREE = 2
+OBJ_BLOB = 3
+OBJ_TAG = 4
+OBJ_OFS_DELTA = 6
+OBJ_REF_DELTA = 7
+
+_TYPE_NAMES = {b"commit": OBJ_COMMIT, b"tree": OBJ_TREE, b"blob": OBJ_BLOB, b"tag": OBJ_TAG}
+
+# Index entry: ctime, mtime (sec + nsec each), dev, ino, mode, uid, gid, size
+_ENTRY_STAT = struct.Struct(">10I")
+_ENTRY_FLAGS = struct.Struct(">H")
+_INTENT_TO_ADD = 0x2000
+_TREE_MODE = 0o040000
+
+# Extensions that change the meaning of the entries; everything else
+# (REUC, UNTR, FSMN, EOIE, IEOT, ...) is optional and can be ignored
+_UNSUPPORTED_EXTENSIONS = {b"link", b"sdir"}
+
+IndexEntries = dict[str, tuple[int, str]]
+
+
+def read_index(path: Path) -> tuple[IndexEntries, dict[str, str]]:
+    """Parse a Git index file.
+
+    Args:
+        path: Path to the index (usually `.git/index`)
+
+    Returns:
+        ``(entries, cache_tree)``: the ``mode``/``sha`` of every path
+        (conflicted paths map to mode 0), and the tree sha of every
+        directory (``""`` for the root, ``"dir/"`` otherwise) whose cached
+        tree is still valid
+
+    Raises:
+        GitFormatError: If the index uses an unsupported format
+    """
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return {}, {}
+    except OSError as e:
+        raise GitFormatError(f"Cannot read index: {e}") from e
+
+    if len(data) < 32 or data[:4] != b"DIRC":
+        raise GitFormatError("Not a Git index")
+    version, count = struct.unpack_from(">II", data, 4)
+    if version not in (2, 3):
+        raise GitFormatError(f"Unsupported index version {version}")
+
+    entries: IndexEntries = {}
+    offset = 12
+    for _ in range(count):
+        start = offset
+        mode = _ENTRY_STAT.unpack_from(data, offset)[6]
+        offset += _ENTRY_STAT.size
+        sha = data[offset : offset + 20].hex()
+        offset += 20
+        (flags,) = _ENTRY_FLAGS.unpack_from(data, offset)
+        offset += 2
+        if flags & 0x4000:
+            (extended,) = _ENTRY_FLAGS.unpack_from(data, offset)
+            offset += 2
+            if extended & _INTENT_TO_ADD:
+                raise GitFormatError("Index has intent-to-add entries")
+        end = data.index(b"\0", offset)
+        name = data[offset:end].decode("utf-8", errors="surrogateescape")
+        offset = start + ((end - start + 8) & ~7)
+
+        stage = (flags >> 12) & 3
+        entries[name] = (0, "") if stage else (mode, sha)
+
+    cache_tree: dict[str, str] = {}
+    checksum_at = len(data) - 20
+    while offset + 8 <= checksum_at:
+        signature = data[offset : offset + 4]
+        (size,) = struct.unpack_from(">I", data, offset + 4)
+        body = data[offset + 8 : offset + 8 + size]
+        offset += 8 + size
+        if signature == b"TREE":
+            _parse_cache_tree(body, cache_tree)
+        elif signature in _UNSUPPORTED_EXTENSIONS or not signature[:1].isupper():
+            raise GitFormatError(f"Unsupported index extension {signature!r}")
+    return entries, cache_tree
+
+
+def _parse_cache_tree(body: bytes, cache_tree: dict[str, str]) -> None:
+    """Collect the valid directories of the TREE extension (stored pre-order)."""
+    offset = 0
+
+    def node(prefix: str) -> None:
+        nonlocal offset
+        end = body.index(b"\0", offset)
+        name = body[offset:end].decode("utf-8", errors="surrogateescape")
+        newline = body.index(b"\n", end)
+        entry_count, subtrees = (int(n) for n in body[end + 1 : newline].split(b" "))
+        offset = newline + 1
+        path = f"{prefix}{name}/" if name else prefix
+        if entry_count >= 0:
+            cache_tree[path] = body[offset : offset + 20].hex()
+            offset += 20
+        for _ in range(subtrees):
+            node(path)
+
+    if body:
+        node("")
+
+
+class ObjectStore:
+    """Read-only access to loose and packed objects.
+
+    Use as a context manager so that pack files mapped into memory are
+    released (Git cannot delete mapped packs on Windows).
+    """
+
+    def __init__(self, objects_dir: Path):
+        self.objects_dir = objects_dir
+        self._packs: list[_Pack] | None = None
+
+    def __enter__(self) -> ObjectStore:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap every opened pack."""
+        for pack in self._packs or []:
+            pack.close()
+        self._packs = None
+
+    def read(self, sha: str) -> tuple[int, bytes]:
+        """Read an object.
+
+        Returns:
+            ``(type, content)`` with one of the ``OBJ_*`` type codes
+
+        Raises:
+            GitFormatError: If the object cannot be found or decoded
+        """
+        loose = self.objects_dir / sha[:2] / sha[2:]
+        try:
+            raw = zlib.decompress(loose.read_bytes())
+        except FileNotFoundError:
+            pass
+        except (OSError, zlib.error) as e:
+            raise GitFormatError(f"Cannot read object {sha}: {e}") from e
+        else:
+            header, _, content = raw.partition(b"\0")
+            return _TYPE_NAMES[header.split(b" ")[0]], content
+
+        binary = bytes.fromhex(sha)
+        for pack in self._load_packs():
+            offset = pack.find(binary)
+            if offset is not None:
+                return pack.read(offset, self)
+        raise GitFormatError(f"Object {sha} not found")
+
+    def read_tree(self, sha: str) -> list[tuple[int, str, str]]:
+        """Read a tree as ``(mode, name, sha)`` entries."""
+        obj_type, content = self.read(sha)
+        if obj_type != OBJ_TREE:
+            raise GitFormatError(f"Object {sha} is not a tree")
+        entries = []
+        offset = 0
+        while offset < len(content):
+            space = content.index(b" ", offset)
+            end = content.index(b"\0", space)
+            mode = int(content[offset:space], 8)
+            name = content[space + 1 : end].decode("utf-8", errors="surrogateescape")
+            entries.append((mode, name, content[end + 1 : end + 21].hex()))
+            offset = end + 21
+        return entries
+
+    def commit_tree(self, sha: str) -> str:
+        """The root tree of a commit."""
+        obj_type, content = self.read(sha)
+        if obj_type != OBJ_COMMIT or not content.startswith(b"tree "):
+            raise GitFormatError(f"Object {sha} is not a commit")
+        return content[5:45].decode("ascii")
+
+    def _load_packs(self) -> list[_Pack]:
+        if self._packs is None:
+            if (self.objects_dir / "info" / "alternates").exists():
+                raise GitFormatError("Repository uses alternate object stores")
+            pack_dir = self.objects_dir / "pack"
+            self._packs = [_Pack(idx) for idx in sorted(pack_dir.glob("pack-*.idx"))]
+        return self._packs
+
+
+class _Pack:
+    """One pack file and its version 2 index, mapped into memory."""
+
+    def __init__(self, idx_path: Path):
+        self._maps: list[mmap.mmap] = []
+        self.idx = self._map(idx_path)
+        self.data = self._map(idx_path.with_suffix(".pack"))
+        if self.idx[:8] != b"\377tOc\0\0\0\2":
+            self.close()
+            raise GitFormatError(f"Unsupported pack index {idx_path.name}")
+        self.count = struct.unpack_from(">I", self.idx, 8 + 255 * 4)[0]
+        self._deltas: dict[int, tuple[int, bytes]] = {}
+
+    def _map(self, path: Path) -> mmap.mmap:
+        try:
+            with path.open("rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            self.close()
+            raise GitFormatError(f"Cannot read {path.name}: {e}") from e
+        self._maps.append(mapped)
+        return mapped
+
+    def close(self) -> None:
+        for mapped in self._maps:
+            mapped.close()
+        self._maps = []
+
+    def find(self, sha: bytes) -> int | None:
+        """Offset of an object in the pack, or None if it is not in it."""
+        first = sha[0]
+        low = struct.unpack_from(">I", self.idx, 8 + (first - 1) * 4)[0] if first else 0
+        high = struct.unpack_from(">I", self.idx, 8 + first * 4)[0]
+        names = 8 + 256 * 4
+        while low < high:
+            mid = (low + high) // 2
+            candidate = self.idx[names + mid * 20 : names + mid * 20 + 20]
+            if candidate < sha:
+                low = mid + 1
+            elif candidate > sha:
+                high = mid
+            else:
+                return self._offset(mid)
+        return None
+
+    def _offset(self, position: int) -> int:
+        offsets = 8 + 256 * 4 + self.count * 24
+        (offset,) = struct.unpack_from(">I", self.idx, offsets + position * 4)
+        if offset & 0x80000000:
+            large = offsets + self.count * 4 + (offset & 0x7FFFFFFF) * 8
+            (offset,) = struct.unpack_from(">Q", self.idx, large)
+        return offset
+
+    def read(self, offset: int, store: ObjectStore) -> tuple[int, bytes]:
+        """Read and, for deltas, reconstruct the object at ``offset``."""
+        cached = self._deltas.get(offset)
+        if cached is not None:
+            return cached
+
+        byte = self.data[offset]
+        obj_type = (byte >> 4) & 7
+        size = byte & 0x0F
+        shift = 4
+        pos = offset + 1
+        while byte & 0x80:
+            byte = self.data[pos]
+            size |= (byte & 0x7F) << shift
+            shift += 7
+            pos += 1
+
+        if obj_type == OBJ_OFS_DELTA:
+            byte = self.data[pos]
+            distance = byte & 0x7F
+            pos += 1
+            while byte & 0x80:
+                byte = self.data[pos]
+                distance = ((distance + 1) << 7) | (byte & 0x7F)
+                pos += 1
+            base_type, base = self.read(offset - distance, store)
+        elif obj_type == OBJ_REF_DELTA:
+            base_type, base = store.read(self.data[pos : pos + 20].hex())
+            pos += 20
+
+        content = self._inflate(pos, size)
+        if obj_type in (OBJ_OFS_DELTA, OBJ_REF_DELTA):
+            result = (base_type, _apply_delta(base, content))
+            self._deltas[offset] = result
+            return result
+        return obj_type, content
+
+    def _inflate(self, pos: int, size: int) -> bytes:
+        decompressor = zlib.decompressobj()
+        chunks = []
+        produced = 0
+        chunk_size = max(4096, size)
+        while produced < size or not decompressor.eof:
+            block = self.data[pos : pos + chunk_size]
+            if not block:
+                raise GitFormatError("Truncated pack object")
+            pos += len(block)
+            out = decompressor.decompress(block)
+            produced += len(out)
+            chunks.append(out)
+            if decompressor.eof:
+                break
+        return b"".join(chunks)
+
+
+def _apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Rebuild an object from its base and a pack delta."""
+    pos = 0
+
+    def varint() -> int:
+        nonlocal pos
+        value = shift = 0
+        while True:
+            byte = delta[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                return value
+
+    varint()  # source size
+    target_size = varint()
+    out = bytearray()
+    while pos < len(delta):
+        op = delta[pos]
+        pos += 1
+        if op & 0x80:
+            copy_offset = copy_size = 0
+            for i in range(4):
+                if op & (1 << i):
+                    copy_offset |= delta[pos] << (8 * i)
+                    pos += 1
+            for i in range(3):
+                if op & (0x10 << i):
+                    copy_size |= delta[pos] << (8 * i)
+                    pos += 1
+            out += base[copy_offset : copy_offset + (copy_size or 0x10000)]
+        elif op:
+            out += delta[pos : pos + op]
+            pos += op
+        else:
+            raise GitFormatError("Invalid delta instruction")
+    if len(out) != target_size:
+        raise GitFormatError("Delta produced the wrong size")
+    return bytes(out)
+
+
+def _normalize_mode(mode: int) -> int:
+    """Map legacy tree modes (e.g. 100664) to the ones Git writes today."""
+    if mode & 0o170000 == 0o100000:
+        return 0o100755 if mode & 0o111 else 0o100644
+    return mode
+
+
+def diff_index_to_head(objects_dir: Path, index_path: Path, head_sha: str | None) -> list[str]:
+    """Paths that differ between the index and HEAD (``git diff --cached``).
+
+    Renames are reported as a deletion plus an addition, like
+    ``--no-renames``.
+
+    Args:
+        objects_dir: The repository's `objects` directory
+        index_path: Index to compare
+        head_sha: Commit HEAD points at, or None before the first commit
+
+    Returns:
+        Changed paths, sorted like Git sorts them
+
+    Raises:
+        GitFormatError: If the index or an object cannot be read
+    """
+    entries, cache_tree = read_index(index_path)
+    head: IndexEntries = {}
+    unchanged: set[str] = set()
+
+    if head_sha:
+        with ObjectStore(objects_dir) as store:
+
+            def walk(tree_sha: str, prefix: str) -> None:
+                if cache_tree.get(prefix) == tree_sha:
+                    unchanged.add(prefix)
+                    return
+                for mode, name, sha in store.read_tree(tree_sha):
+                    if mode == _TREE_MODE:
+                        walk(sha, f"{prefix}{name}/")
+                    else:
+                        head[f"{prefix}{name}"] = (_normalize_mode(mode), sha)
+
+            walk(store.commit_tree(head_sha), "")
+
+    def in_unchanged_tree(path: str) -> bool:
+        if "" in unchanged:
+            return True
+        end = path.find("/")
+        while end != -1:
+            if path[: end + 1] in unchanged:
+                return True
+            end = path.find("/", end + 1)
+        return False
+
+    changed = {
+        path
+        for path, entry in entries.items()
+        if head.get(path) != entry and not in_unchanged_tree(path)
+    }
+    changed.update(path for path in head if path not in entries)
+    return sorted(changed, key=lambda p: p.encode("utf-8", errors="surrogateescape"))
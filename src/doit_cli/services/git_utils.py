@@ -7,7 +7,8 @@ used in team memory file synchronization.
 from __future__ import annotations
 
 import subprocess
-from dataclasses import dataclass
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
@@ -38,6 +39,12 @@ class GitRemoteError(GitError):
     pass
 
 
+class GitFormatError(GitError):
+    """Repository files use a format that cannot be read without Git."""
+
+    pass
+
+
 class GitConflictError(GitError):
     """Git merge conflict detected."""
 
@@ -70,6 +77,56 @@ class GitCommandResult:
     returncode: int
 
 
+@dataclass(frozen=True)
+class StagedFiles:
+    """Snapshot of the paths staged in the Git index.
+
+    Read once with `get_staged_files` and shared by everything that needs
+    it during a run (e.g. a pre-commit hook), so membership checks cost no
+    further subprocesses.
+
+    Attributes:
+        paths: Staged paths relative to the repository root, in Git's order
+        root: Repository root (working tree), if known
+    """
+
+    paths: tuple[str, ...] = ()
+    root: Path | None = None
+    _lookup: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_lookup", frozenset(self.paths))
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._lookup
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.paths)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def contains_file(self, path: Path, root: Path) -> bool:
+        """Check whether a file is staged, matching its exact path.
+
+        Args:
+            path: File to check
+            root: Directory the staged paths are relative to when the
+                snapshot doesn't know the repository root
+
+        Returns:
+            True if ``path`` relative to the repository root is staged
+        """
+        try:
+            if self.root is not None:
+                relative = Path(path).resolve().relative_to(self.root.resolve())
+            else:
+                relative = path.relative_to(root)
+        except ValueError:
+            return False
+        return relative.as_posix() in self
+
+
 def run_git_command(
     args: list[str],
     cwd: Path | None = None,
@@ -142,33 +199,48 @@ def is_git_repo(path: Path | None = None) -> bool:
 
 
 def get_current_branch(cwd: Path | None = None) -> str:
-    """Get the current Git branch name."""
+    """Get the current Git branch name ("" on a detached HEAD)."""
+    from .git_context import get_git_context
+
+    context = get_git_context(cwd)
+    if context is not None:
+        return context.branch or ""
     result = run_git_command(["branch", "--show-current"], cwd=cwd, check=True)
     return result.stdout
 
 
 def get_remote_url(remote: str = "origin", cwd: Path | None = None) -> str | None:
     """Get the URL of a Git remote."""
-    result = run_git_command(["remote", "get-url", remote], cwd=cwd)
-    return result.stdout if result.success else None
+    from .git_context import get_git_context
+
+    context = get_git_context(cwd)
+    return context.remote_url(remote) if context is not None else None
 
 
 def has_remote(remote: str = "origin", cwd: Path | None = None) -> bool:
     """Check if a remote exists."""
-    result = run_git_command(["remote", "get-url", remote], cwd=cwd)
-    return result.success
+    return get_remote_url(remote, cwd) is not None
+
+
+def get_config_value(name: str, cwd: Path | None = None) -> str | None:
+    """Get a Git configuration value (read from the config files when possible)."""
+    from .git_context import get_git_context
+
+    context = get_git_context(cwd)
+    if context is not None:
+        return context.config_value(name)
+    result = run_git_command(["config", name], cwd=cwd)
+    return result.stdout if result.success else None
 
 
 def get_user_email(cwd: Path | None = None) -> str | None:
     """Get the Git user email from configuration."""
-    result = run_git_command(["config", "user.email"], cwd=cwd)
-    return result.stdout if result.success else None
+    return get_config_value("user.email", cwd)
 
 
 def get_user_name(cwd: Path | None = None) -> str | None:
     """Get the Git user name from configuration."""
-    result = run_git_command(["config", "user.name"], cwd=cwd)
-    return result.stdout if result.success else None
+    return get_config_value("user.name", cwd)
 
 
 def get_status(cwd: Path | None = None) -> GitStatus:
@@ -229,6 +301,37 @@ def get_status(cwd: Path | None = None) -> GitStatus:
     )
 
 
+def get_staged_files(cwd: Path | None = None) -> StagedFiles:
+    """Read the paths staged for commit.
+
+    The index and HEAD are compared in-process (see `GitContext.staged_files`);
+    repositories in formats that reader does not handle fall back to a
+    single ``git diff --cached``. Renames are listed as both paths.
+
+    Returns:
+        StagedFiles snapshot; empty if Git is unavailable or the command fails
+    """
+    from .git_context import get_git_context
+
+    context = get_git_context(cwd)
+    root = context.root if context is not None else None
+    if context is not None:
+        try:
+            return StagedFiles(context.staged_files(), root)
+        except GitFormatError:
+            pass
+    try:
+        result = run_git_command(
+            ["-c", "core.quotePath=false", "diff", "--cached", "--name-only", "--no-renames"],
+            cwd=cwd,
+        )
+    except GitError:
+        return StagedFiles()
+    if not result.success:
+        return StagedFiles()
+    return StagedFiles(tuple(line for line in result.stdout.splitlines() if line), root)
+
+
 def fetch(remote: str = "origin", cwd: Path | None = None) -> GitCommandResult:
     """Fetch from remote repository."""
     return run_git_command(["fetch", remote], cwd=cwd, check=True)
@@ -2,16 +2,26 @@
 
 This service handles reading, writing, and validating cached GitHub epic data
 to minimize API calls and support offline mode.
+
+Epics and their features are cached as separate entries. Each entry
+records when it was fetched (``fetchedAt``) next to GitHub's own
+``updatedAt``, and each kind records when it was last synced so a refresh
+only has to ask GitHub for what changed since then.
 """
 
 from __future__ import annotations
 
 import json
+from datetime import datetime
 from pathlib import Path
 
 from ..models.github_epic import GitHubEpic
+from ..models.github_feature import GitHubFeature
 from ..models.sync_metadata import SyncMetadata
 
+# Entity kinds stored in the cache file, each as a list of GitHub JSON records
+ENTITY_KINDS = ("epics", "features")
+
 
 class CacheError(Exception):
     """Base exception for cache-related errors."""
@@ -23,7 +33,8 @@ class GitHubCacheService:
     """Service for managing GitHub epic cache.
 
     Handles reading and writing epic data to a JSON cache file with
-    TTL-based validation and corruption handling.
+    TTL-based validation and corruption handling. Stale entries stay in
+    the file and can still be read for offline mode (``allow_stale``).
     """
 
     def __init__(self, cache_path: Path | None = None):
@@ -71,12 +82,22 @@ class GitHubCacheService:
         except OSError as e:
             raise CacheError(f"Failed to read cache file: {e}") from e
 
-    def save_cache(self, epics: list[GitHubEpic], metadata: SyncMetadata) -> None:
-        """Save epics and metadata to cache file.
+    def save_cache(
+        self,
+        epics: list[GitHubEpic],
+        metadata: SyncMetadata,
+        synced_at: datetime | None = None,
+        full_sync: bool = True,
+    ) -> None:
+        """Save epics, their features and metadata to cache file.
+
+        Entries whose data did not change keep their original ``fetchedAt``.
 
         Args:
             epics: List of GitHubEpic instances to cache
             metadata: Sync metadata to store
+            synced_at: When the fetch started. Default: metadata.last_sync
+            full_sync: False when epics were merged from an incremental fetch
 
         Raises:
             CacheError: If cache cannot be written
@@ -87,13 +108,61 @@ class GitHubCacheService:
             >>> metadata = SyncMetadata.create_new("https://github.com/owner/repo")
             >>> service.save_cache([], metadata)
         """
+        synced_at = synced_at or metadata.last_sync
+        cache_data = self._load_for_update()
+        previous = {kind: _by_number(cache_data.get(kind, [])) for kind in ENTITY_KINDS}
+        now = datetime.now().isoformat()
+
+        epic_records = []
+        feature_records = []
+        for epic in epics:
+            record = epic.to_dict()
+            record.pop("features", None)
+            epic_records.append(_stamp(record, previous["epics"], now))
+            for feature in epic.features:
+                feature_records.append(_stamp(_feature_record(feature), previous["features"], now))
+
+        cache_data["metadata"] = metadata.to_dict()
+        cache_data["epics"] = epic_records
+        cache_data["features"] = feature_records
+        synced = cache_data.setdefault("syncedAt", {})
+        synced["epics"] = synced["features"] = synced_at.isoformat()
+        if full_sync:
+            synced["full"] = synced_at.isoformat()
+        self._write(cache_data)
+
+    def get_synced_at(self, kind: str = "epics") -> datetime | None:
+        """Get when a kind of entity was last synced from GitHub.
+
+        Args:
+            kind: One of ENTITY_KINDS, or ``full`` for the last full fetch
+
+        Returns:
+            Start time of the last sync, or None if never synced
+        """
         try:
-            cache_data = {
-                "version": "1.0.0",
-                "metadata": metadata.to_dict(),
-                "epics": [epic.to_dict() for epic in epics],
-            }
+            cache_data = self.load_cache()
+            if cache_data is None:
+                return None
+            value = cache_data.get("syncedAt", {}).get(kind)
+            return datetime.fromisoformat(value) if value else None
+        except (CacheError, AttributeError, TypeError, ValueError):
+            return None
 
+    def _load_for_update(self) -> dict:
+        """Load the cache to modify it, starting over if it is missing or corrupted."""
+        try:
+            cache_data = self.load_cache()
+        except CacheError:
+            cache_data = None
+        if cache_data is None:
+            cache_data = {"metadata": None, "epics": []}
+        cache_data["version"] = "1.0.0"
+        return cache_data
+
+    def _write(self, cache_data: dict) -> None:
+        """Write cache data atomically."""
+        try:
             # Write atomically by writing to temp file then renaming
             temp_path = self.cache_path.with_suffix(".tmp")
 
@@ -125,11 +194,15 @@ class GitHubCacheService:
             metadata = SyncMetadata.from_dict(cache_data["metadata"])
             return metadata.is_valid
 
-        except (CacheError, KeyError, ValueError):
+        except (CacheError, KeyError, TypeError, ValueError):
             return False
 
-    def get_epics(self) -> list[GitHubEpic] | None:
-        """Get epics from cache if valid.
+    def get_epics(self, allow_stale: bool = False) -> list[GitHubEpic] | None:
+        """Get epics, with their cached features, from cache if valid.
+
+        Args:
+            allow_stale: Return epics even if the cache TTL has expired
+                (offline mode and incremental refresh)
 
         Returns:
             List of GitHubEpic instances, or None if cache is invalid
@@ -140,7 +213,7 @@ class GitHubCacheService:
             >>> epics is None or isinstance(epics, list)
             True
         """
-        if not self.is_valid():
+        if not allow_stale and not self.is_valid():
             return None
 
         try:
@@ -148,10 +221,20 @@ class GitHubCacheService:
             if cache_data is None:
                 return None
 
+            features: dict[int, list[GitHubFeature]] = {}
+            for feature_data in cache_data.get("features", []):
+                try:
+                    feature = GitHubFeature.from_gh_json(feature_data, feature_data["epicNumber"])
+                    features.setdefault(feature.epic_number, []).append(feature)
+                except (ValueError, KeyError) as e:
+                    print(f"Warning: Skipping corrupted feature in cache: {e}")
+                    continue
+
             epics = []
             for epic_data in cache_data["epics"]:
                 try:
                     epic = GitHubEpic.from_gh_json(epic_data)
+                    epic.features = features.get(epic.number, [])
                     epics.append(epic)
                 except (ValueError, KeyError) as e:
                     print(f"Warning: Skipping corrupted epic in cache: {e}")
@@ -181,7 +264,7 @@ class GitHubCacheService:
 
             return SyncMetadata.from_dict(cache_data["metadata"])
 
-        except (CacheError, KeyError, ValueError):
+        except (CacheError, KeyError, TypeError, ValueError):
             return None
 
     def invalidate(self) -> None:
@@ -214,3 +297,31 @@ class GitHubCacheService:
             return None
 
         return metadata.age_minutes
+
+
+def _by_number(records: list[dict]) -> dict[int, dict]:
+    """Index cached records by issue/milestone number, keeping their order."""
+    return {record["number"]: record for record in records if "number" in record}
+
+
+def _stamp(record: dict, previous: dict[int, dict], now: str) -> dict:
+    """Set ``fetchedAt``, keeping the old stamp if the record did not change."""
+    old = previous.get(record["number"])
+    if old is not None and {k: v for k, v in old.items() if k != "fetchedAt"} == record:
+        record["fetchedAt"] = old.get("fetchedAt", now)
+    else:
+        record["fetchedAt"] = now
+    return record
+
+
+def _feature_record(feature: GitHubFeature) -> dict:
+    """Convert a feature to GitHub JSON format (what from_gh_json reads)."""
+    return {
+        "number": feature.number,
+        "title": feature.title,
+        "state": feature.state,
+        "labels": [{"name": label} for label in feature.labels],
+        "url": feature.url,
+        "updatedAt": feature.updated_at.isoformat() if feature.updated_at else None,
+        "epicNumber": feature.epic_number,
+    }
@@ -19,6 +19,7 @@ from ..utils.spec_parser import (
     get_epic_reference,
     remove_epic_reference,
 )
+from .git_context import get_git_context, parse_repo_slug
 from .github_service import GitHubService, GitHubServiceError
 
 
@@ -349,7 +350,7 @@ class GitHubLinkerService:
         subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30)
 
     def _get_repo_slug(self) -> str:
-        """Get repository slug (owner/repo) from git remote.
+        """Get repository slug (owner/repo) from the shared git context.
 
         Returns:
             Repository slug in format "owner/repo"
@@ -357,27 +358,15 @@ class GitHubLinkerService:
         Raises:
             GitHubServiceError: If git remote not found or malformed
         """
-        try:
-            result = subprocess.run(
-                ["git", "remote", "get-url", "origin"], capture_output=True, text=True, check=True
-            )
-            remote_url = result.stdout.strip()
-
-            # Parse GitHub URL
-            # SSH: git@github.com:owner/repo.git
-            # HTTPS: https://github.com/owner/repo.git
-            if "github.com" not in remote_url:
-                raise GitHubServiceError(f"Not a GitHub repository: {remote_url}")
-
-            if remote_url.startswith("git@"):
-                slug = remote_url.split(":")[-1].replace(".git", "")
-            else:
-                slug = remote_url.split("github.com/")[-1].replace(".git", "")
+        context = get_git_context()
+        remote_url = context.remote_url() if context is not None else None
+        if remote_url is None:
+            raise GitHubServiceError("Failed to get git remote URL")
 
-            return slug
-
-        except subprocess.CalledProcessError:
-            raise GitHubServiceError("Failed to get git remote URL") from None
+        slug = parse_repo_slug(remote_url)
+        if slug is None:
+            raise GitHubServiceError(f"Not a GitHub repository: {remote_url}")
+        return slug
 
     def create_epic_for_roadmap_item(
         self, title: str, priority: str, feature_description: str | None = None
@@ -474,16 +463,11 @@ class GitHubLinkerService:
         Returns:
             Relative path from repo root (e.g., "specs/040-feature/spec.md")
         """
-        try:
-            # Get repo root
-            result = subprocess.run(
-                ["git", "rev-parse", "--show-toplevel"], capture_output=True, text=True, check=True
-            )
-            repo_root = Path(result.stdout.strip())
-
-            # Get relative path
-            return str(spec_path.relative_to(repo_root))
-
-        except (subprocess.CalledProcessError, ValueError):
-            # Fallback: assume current directory is repo root
-            return str(spec_path)
+        context = get_git_context()
+        if context is not None:
+            try:
+                return str(spec_path.relative_to(context.root))
+            except ValueError:
+                pass
+        # Fallback: assume current directory is repo root
+        return str(spec_path)
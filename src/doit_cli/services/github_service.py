@@ -29,14 +29,21 @@ When you edit a caller, consider one of:
 from __future__ import annotations
 
 import json
+import re
 import subprocess
+import threading
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 from ..models.fixit_models import GitHubIssue
 from ..models.github_epic import GitHubEpic
 from ..models.milestone import Milestone
 from ..utils.github_auth import has_gh_cli, is_gh_authenticated
+from .git_context import get_git_context
 
 if TYPE_CHECKING:
     from ..models.github_feature import GitHubFeature
@@ -52,6 +59,15 @@ _DEPRECATION_MSG = (
 
 _deprecation_emitted = False
 
+# Concurrent `gh issue list` searches used by fetch_epics_with_features.
+DEFAULT_FETCH_WORKERS = 8
+
+# Results per `gh issue list` search of changed features; more are paged.
+SEARCH_PAGE_SIZE = 200
+
+# Feature issues reference their epic as "Part of Epic #123" in the body.
+_EPIC_REFERENCE = re.compile(r"part of epic #(\d+)", re.IGNORECASE)
+
 
 def _emit_deprecation_once() -> None:
     """Emit the module-level DeprecationWarning at most once per process."""
@@ -80,6 +96,57 @@ class GitHubAPIError(GitHubServiceError):
     pass
 
 
+class GitHubRateLimitError(GitHubAPIError):
+    """Raised when GitHub rejects a request because of rate limiting."""
+
+    pass
+
+
+@dataclass
+class EpicFetchResult:
+    """Outcome of `GitHubService.fetch_epics_with_features`.
+
+    Attributes:
+        epics: Fetched epics, in API order, with ``features`` populated
+        failures: Epic number -> error for epics whose features could not
+            be fetched (their ``features`` is left empty)
+        timings: Seconds spent per stage (``epics``, ``features``)
+    """
+
+    epics: list[GitHubEpic]
+    failures: dict[int, Exception] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+class _RateLimitThrottle:
+    """Pause shared by concurrent workers after a rate-limit response."""
+
+    def __init__(self, backoff_seconds: float) -> None:
+        self.backoff_seconds = backoff_seconds
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def back_off(self, attempt: int) -> None:
+        """Delay all workers by ``backoff_seconds * 2**attempt`` from now."""
+        resume_at = time.monotonic() + self.backoff_seconds * 2**attempt
+        with self._lock:
+            self._resume_at = max(self._resume_at, resume_at)
+
+    def wait(self) -> None:
+        """Sleep until the current back-off has passed."""
+        with self._lock:
+            delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _search_timestamp(moment: datetime) -> str:
+    """Format a time for GitHub's ``updated:`` search qualifier (UTC)."""
+    if moment.tzinfo is None:
+        moment = moment.astimezone()
+    return moment.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 class GitHubService:
     """Manages GitHub operations via gh CLI.
 
@@ -110,7 +177,9 @@ class GitHubService:
         """Get the GitHubProvider instance for provider abstraction operations.
 
         This method provides access to the new provider abstraction layer
-        while maintaining backward compatibility with existing code.
+        while maintaining backward compatibility with existing code. The
+        configured backend applies, so ``backend: http`` returns the REST
+        provider.
 
         Returns:
             GitHubProvider instance.
@@ -121,9 +190,12 @@ class GitHubService:
             issue = provider.create_issue(IssueCreateRequest(title="Bug"))
         """
         if self._provider is None:
-            from .providers.github import GitHubProvider
+            from .provider_config import ProviderConfig
+            from .provider_factory import ProviderFactory
 
-            self._provider = GitHubProvider(timeout=self.timeout)
+            self._provider = ProviderFactory.create_github(
+                ProviderConfig.load().github, self.timeout
+            )
         return self._provider
 
     def _verify_gh_cli(self) -> None:
@@ -269,11 +341,14 @@ class GitHubService:
     # Epic Operations
     # ==========================================================================
 
-    def fetch_epics(self, state: str = "open") -> list[GitHubEpic]:
+    def fetch_epics(
+        self, state: str = "open", updated_since: datetime | None = None
+    ) -> list[GitHubEpic]:
         """Fetch all GitHub issues labeled as 'epic'.
 
         Args:
             state: Issue state to filter by (open, closed, or all). Default: open
+            updated_since: Only return epics updated at or after this time
 
         Returns:
             List of GitHubEpic instances
@@ -290,22 +365,26 @@ class GitHubService:
         """
         self._ensure_authenticated()
 
+        command = [
+            "gh",
+            "issue",
+            "list",
+            "--label",
+            "epic",
+            "--state",
+            state,
+            "--json",
+            "number,title,labels,body,url,state,createdAt,updatedAt",
+            "--limit",
+            "200",  # Support up to 200 epics per spec
+        ]
+        if updated_since is not None:
+            command += ["--search", f"updated:>={_search_timestamp(updated_since)}"]
+
         try:
             # Run gh CLI to fetch issues with 'epic' label
             result = subprocess.run(
-                [
-                    "gh",
-                    "issue",
-                    "list",
-                    "--label",
-                    "epic",
-                    "--state",
-                    state,
-                    "--json",
-                    "number,title,labels,body,url,state,createdAt,updatedAt",
-                    "--limit",
-                    "200",  # Support up to 200 epics per spec
-                ],
+                command,
                 capture_output=True,
                 text=True,
                 timeout=self.timeout,
@@ -314,7 +393,7 @@ class GitHubService:
             if result.returncode != 0:
                 # Check for rate limit error
                 if "rate limit" in result.stderr.lower():
-                    raise GitHubAPIError(
+                    raise GitHubRateLimitError(
                         "GitHub API rate limit exceeded. Try again later or use --skip-github flag."
                     )
                 raise GitHubAPIError(f"GitHub CLI error: {result.stderr}")
@@ -369,7 +448,10 @@ class GitHubService:
             3
         """
         self._ensure_authenticated()
+        return self._search_epic_features(epic_number)
 
+    def _search_epic_features(self, epic_number: int) -> list[GitHubFeature]:
+        """Run the feature search for one epic (authentication already checked)."""
         try:
             # Search for issues mentioning "Part of Epic #XXX"
             search_query = f"is:open part of epic #{epic_number}"
@@ -382,7 +464,7 @@ class GitHubService:
                     "--search",
                     search_query,
                     "--json",
-                    "number,title,labels,state,url",
+                    "number,title,labels,state,url,updatedAt",
                     "--limit",
                     "100",
                 ],
@@ -393,7 +475,7 @@ class GitHubService:
 
             if result.returncode != 0:
                 if "rate limit" in result.stderr.lower():
-                    raise GitHubAPIError("GitHub API rate limit exceeded. Try again later.")
+                    raise GitHubRateLimitError("GitHub API rate limit exceeded. Try again later.")
                 raise GitHubAPIError(f"GitHub CLI error: {result.stderr}")
 
             issues_data = json.loads(result.stdout)
@@ -417,6 +499,224 @@ class GitHubService:
         except json.JSONDecodeError as e:
             raise GitHubAPIError(f"Failed to parse GitHub CLI response: {e}") from e
 
+    def fetch_epics_with_features(
+        self,
+        state: str = "open",
+        max_workers: int = DEFAULT_FETCH_WORKERS,
+        max_retries: int = 3,
+        backoff_seconds: float = 2.0,
+    ) -> EpicFetchResult:
+        """Fetch epics and the features of every epic concurrently.
+
+        Feature searches run in a bounded thread pool (each one is a `gh`
+        subprocess). When GitHub reports a rate limit, every worker pauses
+        for an exponentially growing delay before the search is retried.
+
+        Args:
+            state: Epic state to filter by (open, closed, or all).
+            max_workers: Maximum concurrent feature searches.
+            max_retries: Retries per epic after a rate-limit error.
+            backoff_seconds: Delay before the first retry; doubles each time.
+
+        Returns:
+            EpicFetchResult with epics, per-epic failures and stage timings.
+
+        Raises:
+            GitHubAuthError: If GitHub authentication is not available
+            GitHubAPIError: If the epics themselves cannot be fetched
+        """
+        started = time.perf_counter()
+        epics = self.fetch_epics(state=state)
+        result = EpicFetchResult(epics=epics)
+        result.timings["epics"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        self._fetch_features_concurrently(
+            epics, result.failures, max_workers, max_retries, backoff_seconds
+        )
+        result.timings["features"] = time.perf_counter() - started
+        return result
+
+    def fetch_epic_changes(
+        self,
+        cached: list[GitHubEpic],
+        since: datetime,
+        state: str = "open",
+        max_workers: int = DEFAULT_FETCH_WORKERS,
+        max_retries: int = 3,
+        backoff_seconds: float = 2.0,
+    ) -> EpicFetchResult:
+        """Bring cached epics up to date with what changed on GitHub since a time.
+
+        Instead of re-reading every epic and searching features per epic,
+        this asks GitHub only for epics and feature issues updated since
+        ``since`` (two searches), then merges them into ``cached``. Only
+        epics that are new to the cache get a full feature search.
+
+        Epics that lost their ``epic`` label and deleted issues are not
+        reported by an ``updated:`` search; a full fetch clears those.
+
+        Args:
+            cached: Epics from the previous sync, with ``features`` populated.
+            since: Start of the previous sync.
+            state: Epic state to keep (open, closed, or all).
+            max_workers: Maximum concurrent feature searches for new epics.
+            max_retries: Retries per epic after a rate-limit error.
+            backoff_seconds: Delay before the first retry; doubles each time.
+
+        Returns:
+            EpicFetchResult with the merged epics, per-epic failures and
+            stage timings.
+
+        Raises:
+            GitHubAuthError: If GitHub authentication is not available
+            GitHubAPIError: If the changed epics or features cannot be fetched
+        """
+        started = time.perf_counter()
+        by_number = {epic.number: epic for epic in cached}
+        new_epics = []
+        for epic in self.fetch_epics(state="all", updated_since=since):
+            previous = by_number.pop(epic.number, None)
+            if state != "all" and epic.state != state:
+                continue
+            if previous is None:
+                new_epics.append(epic)
+            else:
+                epic.features = previous.features
+            by_number[epic.number] = epic
+        result = EpicFetchResult(epics=sorted(by_number.values(), key=lambda e: -e.number))
+        result.timings["epics"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        self._fetch_features_concurrently(
+            new_epics, result.failures, max_workers, max_retries, backoff_seconds
+        )
+        updated = self._search_updated_features(since)
+        # A feature may have been closed or moved to other epics
+        changed = {feature.number for feature in updated}
+        for epic in result.epics:
+            epic.features = [f for f in epic.features if f.number not in changed]
+        for feature in updated:
+            parent = by_number.get(feature.epic_number)
+            if parent is not None and feature.is_open:
+                parent.features.append(feature)
+        result.timings["features"] = time.perf_counter() - started
+        return result
+
+    def _fetch_features_concurrently(
+        self,
+        epics: list[GitHubEpic],
+        failures: dict[int, Exception],
+        max_workers: int,
+        max_retries: int,
+        backoff_seconds: float,
+    ) -> None:
+        """Populate ``features`` of each epic, recording failures per epic number."""
+        if not epics:
+            return
+        throttle = _RateLimitThrottle(backoff_seconds)
+
+        def fetch(epic: GitHubEpic) -> list[GitHubFeature]:
+            attempt = 0
+            while True:
+                throttle.wait()
+                try:
+                    return self._search_epic_features(epic.number)
+                except GitHubRateLimitError:
+                    if attempt >= max_retries:
+                        raise
+                    throttle.back_off(attempt)
+                    attempt += 1
+
+        workers = max(1, min(max_workers, len(epics)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [(epic, pool.submit(fetch, epic)) for epic in epics]
+            for epic, future in futures:
+                try:
+                    epic.features = future.result()
+                except Exception as e:
+                    epic.features = []
+                    failures[epic.number] = e
+
+    def _search_updated_features(self, since: datetime) -> list[GitHubFeature]:
+        """Find feature issues of any epic, open or closed, updated since a time.
+
+        Results are sorted by ``updatedAt`` and paged by restarting the
+        search from the last timestamp seen, so a large batch of changes is
+        not cut off at the ``--limit`` of a single search.
+
+        A feature that references several epics ("Part of Epic #1 ... Part
+        of Epic #2") is returned once per epic.
+        """
+        issues: dict[int, dict] = {}
+        while True:
+            page = self._search_issues(
+                f'"part of epic" updated:>={_search_timestamp(since)} sort:updated-asc'
+            )
+            issues.update((issue["number"], issue) for issue in page)
+            if len(page) < SEARCH_PAGE_SIZE:
+                break
+            last = page[-1].get("updatedAt")
+            last_updated = datetime.fromisoformat(last.replace("Z", "+00:00")) if last else None
+            if last_updated is None or _search_timestamp(last_updated) == _search_timestamp(since):
+                # A whole page shares one timestamp; the search cannot advance
+                print(
+                    f"Warning: More than {SEARCH_PAGE_SIZE} features were updated at "
+                    f"{_search_timestamp(since)}; some changes may be missing. "
+                    "Run with --refresh to fetch everything."
+                )
+                break
+            since = last_updated
+
+        from ..models.github_feature import GitHubFeature
+
+        features = []
+        for issue_data in issues.values():
+            epic_numbers = dict.fromkeys(
+                int(number) for number in _EPIC_REFERENCE.findall(issue_data.get("body") or "")
+            )
+            for epic_number in epic_numbers:
+                try:
+                    features.append(GitHubFeature.from_gh_json(issue_data, epic_number))
+                except (ValueError, KeyError) as e:
+                    print(f"Warning: Skipping malformed feature #{issue_data.get('number')}: {e}")
+                    break
+        return features
+
+    def _search_issues(self, search: str) -> list[dict]:
+        """Run one ``gh issue list`` search over open and closed issues."""
+        try:
+            result = subprocess.run(
+                [
+                    "gh",
+                    "issue",
+                    "list",
+                    "--state",
+                    "all",
+                    "--search",
+                    search,
+                    "--json",
+                    "number,title,labels,state,url,body,updatedAt",
+                    "--limit",
+                    str(SEARCH_PAGE_SIZE),
+                ],
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+            )
+
+            if result.returncode != 0:
+                if "rate limit" in result.stderr.lower():
+                    raise GitHubRateLimitError("GitHub API rate limit exceeded. Try again later.")
+                raise GitHubAPIError(f"GitHub CLI error: {result.stderr}")
+
+            return json.loads(result.stdout)
+
+        except subprocess.TimeoutExpired:
+            raise GitHubAPIError(f"GitHub CLI timeout after {self.timeout} seconds") from None
+        except json.JSONDecodeError as e:
+            raise GitHubAPIError(f"Failed to parse GitHub CLI response: {e}") from e
+
     def create_epic(
         self, title: str, body: str, priority: str = "P3", labels: list[str] | None = None
     ) -> GitHubEpic:
@@ -474,7 +774,7 @@ class GitHubService:
 
             if result.returncode != 0:
                 if "rate limit" in result.stderr.lower():
-                    raise GitHubAPIError("GitHub API rate limit exceeded")
+                    raise GitHubRateLimitError("GitHub API rate limit exceeded")
                 raise GitHubAPIError(f"Failed to create epic: {result.stderr}")
 
             # Extract issue URL from output
@@ -543,7 +843,7 @@ class GitHubService:
 
             if result.returncode != 0:
                 if "rate limit" in result.stderr.lower():
-                    raise GitHubAPIError("GitHub API rate limit exceeded. Try again later.")
+                    raise GitHubRateLimitError("GitHub API rate limit exceeded. Try again later.")
                 raise GitHubAPIError(f"GitHub CLI error: {result.stderr}")
 
             # Parse JSON response
@@ -627,7 +927,7 @@ class GitHubService:
 
             if result.returncode != 0:
                 if "rate limit" in result.stderr.lower():
-                    raise GitHubAPIError("GitHub API rate limit exceeded")
+                    raise GitHubRateLimitError("GitHub API rate limit exceeded")
                 if "422" in result.stderr:
                     raise GitHubAPIError(f"Milestone with title '{title}' already exists")
                 raise GitHubAPIError(f"Failed to create milestone: {result.stderr}")
@@ -692,7 +992,7 @@ class GitHubService:
 
             if result.returncode != 0:
                 if "rate limit" in result.stderr.lower():
-                    raise GitHubAPIError("GitHub API rate limit exceeded")
+                    raise GitHubRateLimitError("GitHub API rate limit exceeded")
                 if "404" in result.stderr:
                     raise GitHubAPIError(f"Milestone #{milestone_number} not found")
                 raise GitHubAPIError(f"Failed to close milestone: {result.stderr}")
@@ -772,7 +1072,7 @@ class GitHubService:
     # ==========================================================================
 
     def _get_repo_slug(self) -> str:
-        """Get the repository slug (owner/repo) from git remote.
+        """Get the repository slug (owner/repo) from the shared git context.
 
         Returns:
             Repository slug in format "owner/repo"
@@ -780,37 +1080,11 @@ class GitHubService:
         Raises:
             GitHubAPIError: If not a GitHub repository or no remote found
         """
-        try:
-            result = subprocess.run(
-                ["git", "remote", "get-url", "origin"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            if result.returncode != 0:
-                raise GitHubAPIError("Failed to get git remote: Not in a git repository?")
-
-            remote_url = result.stdout.strip()
-
-            # Parse GitHub URL (supports both HTTPS and SSH)
-            # HTTPS: https://github.com/owner/repo.git
-            # SSH: git@github.com:owner/repo.git
-            if "github.com" not in remote_url:
-                raise GitHubAPIError("Not a GitHub repository")
-
-            if remote_url.startswith("git@github.com:"):
-                # SSH format
-                slug = remote_url.replace("git@github.com:", "").replace(".git", "")
-            elif "github.com/" in remote_url:
-                # HTTPS format
-                slug = remote_url.split("github.com/")[1].replace(".git", "")
-            else:
-                raise GitHubAPIError("Unable to parse GitHub repository URL")
-
-            return slug
-
-        except subprocess.TimeoutExpired:
-            raise GitHubAPIError("Git command timeout") from None
-        except Exception as e:
-            raise GitHubAPIError(f"Failed to get repository slug: {e}") from e
+        context = get_git_context()
+        if context is None or context.remote_url() is None:
+            raise GitHubAPIError("Failed to get git remote: Not in a git repository?")
+
+        slug = context.repo_slug()
+        if slug is None:
+            raise GitHubAPIError("Not a GitHub repository")
+        return slug
@@ -5,11 +5,12 @@ from __future__ import annotations
 import fnmatch
 import logging
 import re
-import subprocess
 from datetime import datetime
 from pathlib import Path
 
 from ..models.hook_config import HookConfig
+from .git_context import get_git_context
+from .git_utils import GitError, StagedFiles, get_staged_files, get_user_email
 
 logger = logging.getLogger(__name__)
 
@@ -47,17 +48,21 @@ class HookValidator:
         self,
         project_root: Path | None = None,
         config: HookConfig | None = None,
+        staged_files: StagedFiles | None = None,
     ):
         """Initialize the validator.
 
         Args:
             project_root: Root directory of the project (defaults to cwd)
             config: Hook configuration (loads from file if not provided)
+            staged_files: Snapshot of the Git index (read on first use if
+                not provided)
         """
         self.project_root = project_root or Path.cwd()
         self.config = config or self._load_config()
         self.specs_dir = self.project_root / "specs"
         self.logs_dir = self.project_root / ".doit" / "logs"
+        self._staged_files = staged_files
 
     def _load_config(self) -> HookConfig:
         """Load configuration from file or return defaults."""
@@ -72,21 +77,8 @@ class HookValidator:
         Returns:
             Branch name or None if not on a branch (detached HEAD)
         """
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                capture_output=True,
-                text=True,
-                cwd=self.project_root,
-            )
-            if result.returncode == 0:
-                branch = result.stdout.strip()
-                if branch == "HEAD":
-                    return None  # Detached HEAD state
-                return branch
-        except (subprocess.SubprocessError, FileNotFoundError):
-            pass
-        return None
+        context = get_git_context(self.project_root)
+        return context.branch if context is not None else None
 
     def get_staged_files(self) -> list[str]:
         """Get list of staged files for commit.
@@ -94,18 +86,14 @@ class HookValidator:
         Returns:
             List of staged file paths relative to project root
         """
-        try:
-            result = subprocess.run(
-                ["git", "diff", "--cached", "--name-only"],
-                capture_output=True,
-                text=True,
-                cwd=self.project_root,
-            )
-            if result.returncode == 0:
-                return [f for f in result.stdout.strip().split("\n") if f]
-        except (subprocess.SubprocessError, FileNotFoundError):
-            pass
-        return []
+        return list(self.staged_files)
+
+    @property
+    def staged_files(self) -> StagedFiles:
+        """Snapshot of the Git index, read at most once per validator."""
+        if self._staged_files is None:
+            self._staged_files = get_staged_files(self.project_root)
+        return self._staged_files
 
     def is_protected_branch(self, branch: str) -> bool:
         """Check if branch is protected (skip validation).
@@ -483,17 +471,9 @@ class HookValidator:
     def _get_git_user(self) -> str | None:
         """Get the current Git user email."""
         try:
-            result = subprocess.run(
-                ["git", "config", "user.email"],
-                capture_output=True,
-                text=True,
-                cwd=self.project_root,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except (subprocess.SubprocessError, FileNotFoundError):
-            pass
-        return None
+            return get_user_email(self.project_root)
+        except GitError:
+            return None
 
     def get_bypass_report(self) -> list[dict]:
         """Get bypass events from the log.
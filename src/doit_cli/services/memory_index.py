@@ -0,0 +1,432 @@
+"""Persistent inverted index for `doit memory search`.
+
+Keyword and natural-language searches used to read every memory and spec
+file and regex-scan every line on each query. `MemoryIndex` keeps, per
+file, a term -> line-number posting list plus the section table used for
+relevance scoring, stored in `.doit/cache/memory-index.json`. Postings are
+kept as one ``term line,line,...`` text block per file, so loading the
+index is cheap and a query term is looked up with a single regex scan.
+
+Entries are refreshed incrementally: a file whose mtime and size are
+unchanged is trusted as-is; otherwise its content hash decides whether it
+is re-tokenized. A search then only opens files whose postings can
+contain the query, and only regex-checks the candidate lines, so results
+(and their relevance scores) are identical to a full scan.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..utils.atomic_write import write_text_atomic
+from .spec_cache import content_hash
+
+logger = logging.getLogger(__name__)
+
+# Bump when the shape of stored entries changes.
+INDEX_FORMAT_VERSION = 1
+
+_WORD = re.compile(r"\w+")
+
+
+def section_boundaries(lines: list[str]) -> list[tuple[int, str]]:
+    """Compute where the search section changes, line by line.
+
+    The section of a line is the last ``## `` heading at or above it
+    (lower-cased), or the ``# `` title if no ``## `` heading precedes it.
+
+    Args:
+        lines: File content split with ``str.splitlines()``.
+
+    Returns:
+        ``(line_number, section)`` pairs, 1-based, in ascending order.
+    """
+    boundaries: list[tuple[int, str]] = []
+    current = ""
+    for number, line in enumerate(lines, 1):
+        if line.startswith("## "):
+            current = line[3:].strip().lower()
+        elif line.startswith("# ") and not current:
+            current = line[2:].strip().lower()
+        else:
+            continue
+        boundaries.append((number, current))
+    return boundaries
+
+
+def _section_at(sections: list[tuple[int, str]], line_number: int) -> str:
+    """Look up the section of a line in a `section_boundaries()` table."""
+    position = bisect_right(sections, line_number, key=_boundary_line)
+    return sections[position - 1][1] if position else ""
+
+
+@dataclass(frozen=True)
+class LineMap:
+    """Lines and section table of one file, computed once per search.
+
+    Scoring, context extraction and result rendering look lines and
+    sections up here instead of re-splitting the file for every match.
+
+    Attributes:
+        lines: ``content.splitlines()``
+        sections: ``(line_number, section)`` boundaries
+        word_count: Number of whitespace-separated words
+    """
+
+    lines: list[str]
+    sections: list[tuple[int, str]]
+    word_count: int
+
+    @classmethod
+    def build(cls, content: str, lines: list[str] | None = None) -> LineMap:
+        """Split content once into lines and its section table.
+
+        Args:
+            content: Full file content.
+            lines: ``content.splitlines()``, if the caller already has it.
+
+        Returns:
+            The line map.
+        """
+        if lines is None:
+            lines = content.splitlines()
+        return cls(lines, section_boundaries(lines), len(content.split()))
+
+    def line(self, line_number: int) -> str:
+        """Return a 1-based line, or ``""`` if out of range."""
+        return self.lines[line_number - 1] if 0 < line_number <= len(self.lines) else ""
+
+    def section_for_line(self, line_number: int) -> str:
+        """Return the section (lower-cased) a line belongs to, or ``""``."""
+        return _section_at(self.sections, line_number)
+
+
+@dataclass
+class IndexedFile:
+    """Index entry for one searchable file.
+
+    Attributes:
+        path: Absolute path of the file
+        mtime_ns: Modification time when indexed
+        size: Size in bytes when indexed
+        digest: SHA-256 of the content
+        line_count: Number of lines (``str.splitlines()``)
+        char_count: Number of characters
+        word_count: Number of whitespace-separated words
+        sections: ``(line_number, section)`` boundaries
+        postings: One ``term line,line,...`` row per lower-cased term
+    """
+
+    path: Path
+    mtime_ns: int
+    size: int
+    digest: str
+    line_count: int
+    char_count: int
+    word_count: int
+    sections: list[tuple[int, str]] = field(default_factory=list)
+    postings: str = ""
+
+    @classmethod
+    def build(cls, path: Path, content: str, mtime_ns: int, size: int) -> IndexedFile:
+        """Tokenize file content into an entry."""
+        line_map = LineMap.build(content)
+        postings: dict[str, list[str]] = {}
+        for number, line in enumerate(line_map.lines, 1):
+            for term in set(_WORD.findall(line.lower())):
+                postings.setdefault(term, []).append(str(number))
+        return cls(
+            path=path,
+            mtime_ns=mtime_ns,
+            size=size,
+            digest=content_hash(content),
+            line_count=len(line_map.lines),
+            char_count=len(content),
+            word_count=line_map.word_count,
+            sections=line_map.sections,
+            postings="".join(f"{term} {','.join(postings[term])}\n" for term in sorted(postings)),
+        )
+
+    def lines_matching(self, token: str, term_pattern: re.Pattern[str]) -> set[int]:
+        """Return lines containing a term that `term_pattern` selects for `token`."""
+        if token not in self.postings:
+            return set()
+        return {
+            int(number)
+            for row in term_pattern.finditer(self.postings)
+            for number in row.group(1).split(",")
+        }
+
+    def section_for_line(self, line_number: int) -> str:
+        """Return the section (lower-cased) a line belongs to, or ``""``."""
+        return _section_at(self.sections, line_number)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict (path excluded)."""
+        return {
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+            "digest": self.digest,
+            "line_count": self.line_count,
+            "char_count": self.char_count,
+            "word_count": self.word_count,
+            "sections": [list(boundary) for boundary in self.sections],
+            "postings": self.postings,
+        }
+
+    @classmethod
+    def from_dict(cls, path: Path, data: dict[str, Any]) -> IndexedFile:
+        """Rebuild an entry stored by `to_dict`."""
+        return cls(
+            path=path,
+            mtime_ns=data["mtime_ns"],
+            size=data["size"],
+            digest=data["digest"],
+            line_count=data["line_count"],
+            char_count=data["char_count"],
+            word_count=data["word_count"],
+            sections=[(line, name) for line, name in data["sections"]],
+            postings=data["postings"],
+        )
+
+
+@dataclass
+class IndexStats:
+    """Counters for one index refresh.
+
+    Attributes:
+        reused: Files served from the stored index
+        indexed: Files (re-)tokenized because they changed
+        removed: Stored entries dropped because the file is gone
+    """
+
+    reused: int = 0
+    indexed: int = 0
+    removed: int = 0
+
+    def __str__(self) -> str:
+        return f"{self.reused} reused, {self.indexed} indexed, {self.removed} removed"
+
+
+@dataclass
+class MemoryIndex:
+    """On-disk inverted index of memory and spec files.
+
+    Call `refresh()` with the files a search covers, `candidates()` to
+    narrow a literal query to lines, and `save()` once the search is done.
+    A disabled index (``--no-cache``) refreshes in memory but never
+    writes.
+
+    Attributes:
+        project_root: Root of the doit project
+        enabled: Whether the stored index is read and written
+        stats: Counters for the last refresh
+    """
+
+    INDEX_PATH = ".doit/cache/memory-index.json"
+
+    project_root: Path
+    enabled: bool = True
+    stats: IndexStats = field(default_factory=IndexStats)
+    _entries: dict[str, IndexedFile] | None = field(default=None, init=False, repr=False)
+    _dirty: bool = field(default=False, init=False, repr=False)
+
+    @property
+    def index_path(self) -> Path:
+        """Location of the index file."""
+        return self.project_root / self.INDEX_PATH
+
+    def refresh(self, files: Iterable[Path]) -> dict[Path, IndexedFile]:
+        """Bring the entries for `files` up to date.
+
+        Unreadable files are skipped, matching a full scan.
+
+        Args:
+            files: Files the search will cover.
+
+        Returns:
+            Entry for each readable file, keyed by the given path.
+        """
+        entries = self._load()
+        self.stats = IndexStats()
+        refreshed: dict[Path, IndexedFile] = {}
+        seen: set[str] = set()
+        for path in files:
+            key = self._key(path)
+            seen.add(key)
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entry = entries.get(key)
+            if entry is not None and (entry.mtime_ns, entry.size) == (
+                stat.st_mtime_ns,
+                stat.st_size,
+            ):
+                entry.path = path
+                refreshed[path] = entry
+                self.stats.reused += 1
+                continue
+            try:
+                content = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+            digest = content_hash(content)
+            if entry is not None and entry.digest == digest:
+                # Touched but unchanged: keep postings, remember the new stat.
+                entry.path, entry.mtime_ns, entry.size = path, stat.st_mtime_ns, stat.st_size
+                self.stats.reused += 1
+            else:
+                entry = IndexedFile.build(path, content, stat.st_mtime_ns, stat.st_size)
+                self.stats.indexed += 1
+            entries[key] = entry
+            refreshed[path] = entry
+            self._dirty = True
+
+        gone = [
+            key for key in entries if key not in seen and not (self.project_root / key).exists()
+        ]
+        for key in gone:
+            del entries[key]
+            self.stats.removed += 1
+            self._dirty = True
+        return refreshed
+
+    def candidates(
+        self, entries: dict[Path, IndexedFile], literals: list[str]
+    ) -> dict[Path, set[int]] | None:
+        """Narrow a literal (or any-of-literals) query to candidate lines.
+
+        A line can only contain a literal if it contains every word of the
+        literal: inner words as whole words, the first word as the end of
+        a word, the last word as the start of one (see `_literal_terms`).
+        Candidates are a superset of the real matches; callers still run
+        the query regex on them.
+
+        Args:
+            entries: Entries returned by `refresh()`.
+            literals: Literal query strings; a line may match any of them.
+
+        Returns:
+            Candidate line numbers per file (files without candidates are
+            absent), or None if some literal has no word characters and
+            cannot be narrowed by the index.
+        """
+        requirements = [_literal_terms(literal) for literal in literals]
+        if not requirements or any(not terms for terms in requirements):
+            return None
+
+        term_patterns = {
+            (token, mode): _term_pattern(token, mode)
+            for terms in requirements
+            for token, mode in terms
+        }
+
+        result: dict[Path, set[int]] = {}
+        for path, entry in entries.items():
+            lines: set[int] = set()
+            for terms in requirements:
+                literal_lines: set[int] | None = None
+                for token_mode in terms:
+                    token_lines = entry.lines_matching(token_mode[0], term_patterns[token_mode])
+                    literal_lines = (
+                        token_lines if literal_lines is None else literal_lines & token_lines
+                    )
+                    if not literal_lines:
+                        break
+                lines |= literal_lines or set()
+            if lines:
+                result[path] = lines
+        return result
+
+    def save(self) -> None:
+        """Write the index if it changed. No-op when disabled.
+
+        Failures are logged and swallowed: the index is an optimization
+        and must never fail a search.
+        """
+        if not self.enabled or not self._dirty or self._entries is None:
+            return
+        if not (self.project_root / ".doit").is_dir():
+            return
+        payload = {
+            "version": INDEX_FORMAT_VERSION,
+            "files": {key: entry.to_dict() for key, entry in self._entries.items()},
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            write_text_atomic(self.index_path, json.dumps(payload, sort_keys=True))
+            self._dirty = False
+        except OSError as exc:
+            logger.debug("memory index not written: %s", exc)
+        logger.debug("memory index: %s", self.stats)
+
+    def _load(self) -> dict[str, IndexedFile]:
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        if not self.enabled:
+            return self._entries
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return self._entries
+        if isinstance(data, dict) and data.get("version") == INDEX_FORMAT_VERSION:
+            try:
+                self._entries = {
+                    key: IndexedFile.from_dict(self.project_root / key, value)
+                    for key, value in data.get("files", {}).items()
+                }
+            except (KeyError, TypeError, ValueError) as exc:
+                logger.debug("memory index ignored: %s", exc)
+                self._entries = {}
+        return self._entries
+
+    def _key(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return path.resolve().as_posix()
+
+
+def _boundary_line(boundary: tuple[int, str]) -> int:
+    return boundary[0]
+
+
+def _literal_terms(literal: str) -> list[tuple[str, str]]:
+    """Split a literal into (lower-cased word, match mode) requirements.
+
+    The mode says how the word must relate to a word of a matching line:
+    ``exact`` when the literal has non-word characters on both sides of
+    it, ``prefix``/``suffix`` when only after/before it, and ``substring``
+    when it touches both ends of the literal.
+    """
+    lowered = literal.lower()
+    terms = []
+    for match in _WORD.finditer(lowered):
+        bounded_before = match.start() > 0
+        bounded_after = match.end() < len(lowered)
+        if bounded_before and bounded_after:
+            mode = "exact"
+        elif bounded_before:
+            mode = "prefix"
+        elif bounded_after:
+            mode = "suffix"
+        else:
+            mode = "substring"
+        terms.append((match.group(), mode))
+    return terms
+
+
+def _term_pattern(token: str, mode: str) -> re.Pattern[str]:
+    """Compile a pattern selecting the posting rows a query word can match."""
+    before = r"\w*" if mode in ("suffix", "substring") else ""
+    after = r"\w*" if mode in ("prefix", "substring") else ""
+    return re.compile(rf"^{before}{re.escape(token)}{after} ([\d,]+)$", re.MULTILINE)
@@ -23,6 +23,7 @@ from ..models.search_models import (
     SourceType,
 )
 from .context_loader import ContextLoader
+from .memory_index import LineMap, MemoryIndex
 from .query_interpreter import InterpretedQuery, QueryInterpreter
 
 
@@ -42,18 +43,29 @@ class MemorySearchService:
         "functional requirements": 0.5,
     }
 
-    def __init__(self, project_root: Path, console: Console | None = None):
+    def __init__(
+        self,
+        project_root: Path,
+        console: Console | None = None,
+        use_index: bool = True,
+    ):
         """Initialize the memory search service.
 
         Args:
             project_root: Root directory of the project.
             console: Rich console for output (creates one if not provided).
+            use_index: Narrow searches with the persistent index in
+                `.doit/cache/`; when False every file is scanned.
         """
         self.project_root = project_root
         self.console = console or Console()
+        self.index = MemoryIndex(project_root, enabled=use_index)
         self.context_loader = ContextLoader(project_root)
         self.query_interpreter = QueryInterpreter()
         self.history = SearchHistory()
+        # Line maps of the files matched by the last search; reset per search
+        # so results are always rendered from the content they matched.
+        self._line_maps: dict[Path, LineMap] = {}
 
     def _classify_source_type(self, path: Path) -> SourceType:
         """Classify a file path as governance or spec.
@@ -85,52 +97,44 @@ class MemorySearchService:
         else:  # ALL
             return self.context_loader.get_all_searchable_files()
 
-    def _find_section_for_line(self, content: str, line_number: int) -> str:
-        """Find which section a line belongs to.
+    def _line_map(self, path: Path) -> LineMap | None:
+        """Return the line map of a file, building it once per search.
 
         Args:
-            content: Full file content.
-            line_number: Line number to check.
+            path: File to look up.
 
         Returns:
-            Section name (lowercase) or empty string.
+            The file's line map, or None if it cannot be read.
         """
-        lines = content.splitlines()
-        current_section = ""
-
-        for _i, line in enumerate(lines[:line_number], 1):
-            if line.startswith("## "):
-                current_section = line[3:].strip().lower()
-            elif line.startswith("# ") and not current_section:
-                current_section = line[2:].strip().lower()
-
-        return current_section
+        line_map = self._line_maps.get(path)
+        if line_map is None:
+            try:
+                content = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                return None
+            line_map = self._line_maps[path] = LineMap.build(content)
+        return line_map
 
     def _calculate_relevance_score(
         self,
-        content: str,
-        query_text: str,
+        line_map: LineMap,
         line_number: int,
         match_count: int,
-        total_lines: int,
     ) -> float:
         """Calculate relevance score for a search result.
 
         Formula: score = (tf_score * 0.5) + (position_score * 0.3) + (section_bonus * 0.2)
 
         Args:
-            content: Full file content.
-            query_text: Original search query.
+            line_map: Lines and sections of the file.
             line_number: Line where match was found.
             match_count: Number of matches in file.
-            total_lines: Total lines in file.
 
         Returns:
             Relevance score between 0.0 and 1.0.
         """
         # Term frequency score (normalized)
-        words = len(content.split())
-        tf_score = min(1.0, match_count / max(words, 1) * 100)
+        tf_score = min(1.0, match_count / max(line_map.word_count, 1) * 100)
 
         # Position score (earlier is better)
         if line_number <= 10:
@@ -141,14 +145,11 @@ class MemorySearchService:
             position_score = 0.3
 
         # Check if line is in a header
-        lines = content.splitlines()
-        if line_number <= len(lines):
-            line = lines[line_number - 1]
-            if line.startswith("#"):
-                position_score = 1.0
+        if line_map.line(line_number).startswith("#"):
+            position_score = 1.0
 
         # Section bonus
-        section = self._find_section_for_line(content, line_number)
+        section = line_map.section_for_line(line_number)
         section_bonus = 0.0
         for key, bonus in self.PRIORITY_SECTIONS.items():
             if key in section:
@@ -160,19 +161,19 @@ class MemorySearchService:
         return min(1.0, max(0.0, score))
 
     def _extract_context(
-        self, content: str, line_number: int, context_lines: int = 2
+        self, line_map: LineMap, line_number: int, context_lines: int = 2
     ) -> tuple[str, str, str]:
         """Extract context around a matched line.
 
         Args:
-            content: Full file content.
+            line_map: Lines and sections of the file.
             line_number: Line where match was found (1-indexed).
             context_lines: Number of context lines before/after.
 
         Returns:
             Tuple of (context_before, matched_line, context_after).
         """
-        lines = content.splitlines()
+        lines = line_map.lines
         idx = line_number - 1
 
         if idx < 0 or idx >= len(lines):
@@ -188,17 +189,26 @@ class MemorySearchService:
 
         return context_before, matched_line, context_after
 
-    def search_keyword(self, query: SearchQuery) -> tuple[list[SearchResult], list[MemorySource]]:
+    def search_keyword(
+        self, query: SearchQuery, literals: list[str] | None = None
+    ) -> tuple[list[SearchResult], list[MemorySource]]:
         """Search for keywords across memory files.
 
+        Keyword and phrase queries are narrowed to candidate lines with the
+        search index; regex queries scan every line unless `literals` says
+        which literal strings the pattern is made of.
+
         Args:
             query: The search query with parameters.
+            literals: Literal strings of which a match must contain at least
+                one (defaults to the query text for non-regex queries).
 
         Returns:
             Tuple of (list of search results, list of memory sources).
         """
         results: list[SearchResult] = []
         sources: dict[str, MemorySource] = {}
+        self._line_maps = {}
 
         # Get files to search
         files = self._get_files_for_filter(query.source_filter)
@@ -221,24 +231,51 @@ class MemorySearchService:
         except re.error as e:
             raise ValueError(f"Invalid regex pattern: {e}") from e
 
+        if literals is None and (
+            query.query_type == QueryType.PHRASE
+            or (query.query_type != QueryType.REGEX and not query.use_regex)
+        ):
+            literals = [query.query_text]
+
+        # Narrow the search to candidate lines when the index can
+        use_index = self.index.enabled and bool(literals)
+        entries = self.index.refresh(files) if use_index else {}
+        candidates = self.index.candidates(entries, literals) if use_index else None
+
         # Search each file
         for file_path in files:
+            source_type = self._classify_source_type(file_path)
+            entry = entries.get(file_path)
+            if candidates is not None and entry is not None and file_path not in candidates:
+                # No line can match; report the file as searched without reading it.
+                source = MemorySource.from_counts(
+                    file_path, source_type, entry.line_count, entry.char_count
+                )
+                sources[source.id] = source
+                continue
+
             try:
                 content = file_path.read_text(encoding="utf-8")
             except (OSError, UnicodeDecodeError):
                 continue
 
             lines = content.splitlines()
-            source_type = self._classify_source_type(file_path)
 
             # Create memory source
-            source = MemorySource.from_path(file_path, source_type)
+            source = MemorySource.from_counts(file_path, source_type, len(lines), len(content))
             sources[source.id] = source
 
             # Find matches
+            line_numbers = (
+                sorted(candidates[file_path])
+                if candidates is not None and file_path in candidates
+                else range(1, len(lines) + 1)
+            )
             file_matches = []
-            for i, line in enumerate(lines, 1):
-                matches = list(regex.finditer(line))
+            for i in line_numbers:
+                if i > len(lines):
+                    break
+                matches = list(regex.finditer(lines[i - 1]))
                 if matches:
                     for match in matches:
                         file_matches.append((i, match.group(), match.start(), match.end()))
@@ -247,14 +284,13 @@ class MemorySearchService:
                 continue
 
             # Calculate relevance for each match
+            line_map = self._line_maps[file_path] = LineMap.build(content, lines)
             match_count = len(file_matches)
             for line_number, matched_text, _start, _end in file_matches:
-                relevance = self._calculate_relevance_score(
-                    content, query.query_text, line_number, match_count, len(lines)
-                )
+                relevance = self._calculate_relevance_score(line_map, line_number, match_count)
 
                 context_before, _matched_line, context_after = self._extract_context(
-                    content, line_number
+                    line_map, line_number
                 )
 
                 result = SearchResult(
@@ -268,6 +304,8 @@ class MemorySearchService:
                 )
                 results.append(result)
 
+        self.index.save()
+
         # Sort by relevance and limit results
         results.sort(key=lambda r: r.relevance_score, reverse=True)
         results = results[: query.max_results]
@@ -315,24 +353,21 @@ class MemorySearchService:
             use_regex=True,
         )
 
-        # Execute keyword search
-        results, sources = self.search_keyword(keyword_query)
+        # Execute keyword search; the terms let the index narrow the scan
+        results, sources = self.search_keyword(keyword_query, literals=search_terms)
 
         # Boost results that match section hints
         if interpreted.section_hints:
             for result in results:
                 source = next((s for s in sources if s.id == result.source_id), None)
                 if source:
-                    try:
-                        content = source.file_path.read_text(encoding="utf-8")
-                        section = self._find_section_for_line(content, result.line_number)
-                        for hint in interpreted.section_hints:
-                            if hint.lower() in section:
-                                # Boost score by 10%
-                                result.relevance_score = min(1.0, result.relevance_score * 1.1)
-                                break
-                    except (OSError, UnicodeDecodeError):
-                        pass
+                    # Built by search_keyword for every file with a match
+                    section = self._line_maps[source.file_path].section_for_line(result.line_number)
+                    for hint in interpreted.section_hints:
+                        if hint.lower() in section:
+                            # Boost score by 10%
+                            result.relevance_score = min(1.0, result.relevance_score * 1.1)
+                            break
 
             # Re-sort after boosting
             results.sort(key=lambda r: r.relevance_score, reverse=True)
@@ -419,12 +454,10 @@ class MemorySearchService:
         line_content = ""
 
         # Get the full matched line
-        try:
-            content = source.file_path.read_text(encoding="utf-8")
-            lines = content.splitlines()
-            if 0 < result.line_number <= len(lines):
-                line_content = lines[result.line_number - 1]
-        except (OSError, UnicodeDecodeError):
+        line_map = self._line_map(source.file_path)
+        if line_map is not None:
+            line_content = line_map.line(result.line_number)
+        else:
             line_content = result.matched_text
 
         # Highlight matches in the line
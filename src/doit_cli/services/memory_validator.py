@@ -26,6 +26,7 @@ from ..models.memory_contract import (
     OpenQuestion,
     split_frontmatter,
 )
+from .spec_document import SpecDocument
 
 # Tokens a freshly-scaffolded file contains. When three or more distinct
 # tokens are present we treat the file as unfilled; fewer tokens are
@@ -69,12 +70,6 @@ class MemoryValidationReport:
         }
 
 
-# Heading regexes. Anchored at start-of-line so ``##`` inside code fences
-# doesn't accidentally count. Compiled once.
-_H2_HEADING = re.compile(r"^(##)\s+(.+?)\s*$", re.MULTILINE)
-_H3_HEADING = re.compile(r"^(###)\s+(.+?)\s*$", re.MULTILINE)
-
-
 def validate_project(project_root: Path | str) -> MemoryValidationReport:
     """Validate a project's memory files.
 
@@ -168,8 +163,10 @@ def _validate_constitution(
         # If the file is a placeholder, structural checks below are noise.
         return issues
 
+    document = SpecDocument.parse(body)
+
     # Structural: require ## Purpose & Goals and ### Project Purpose below it.
-    if not _has_heading(body, 2, "Purpose & Goals"):
+    if not _has_heading(document, 2, "Purpose & Goals"):
         issues.append(
             MemoryContractIssue(
                 file=rel,
@@ -177,7 +174,7 @@ def _validate_constitution(
                 message="missing required `## Purpose & Goals` section",
             )
         )
-    elif not _has_heading(body, 3, "Project Purpose"):
+    elif not _has_heading(document, 3, "Project Purpose"):
         issues.append(
             MemoryContractIssue(
                 file=rel,
@@ -217,8 +214,9 @@ def _validate_tech_stack(
         ]
 
     issues: list[MemoryContractIssue] = []
+    document = SpecDocument.parse(source)
 
-    if not _has_heading(source, 2, "Tech Stack"):
+    if not _has_heading(document, 2, "Tech Stack"):
         issues.append(
             MemoryContractIssue(
                 file=rel,
@@ -229,7 +227,7 @@ def _validate_tech_stack(
         return issues
 
     # At least one ### sub-heading under ## Tech Stack (Languages, Frameworks, …).
-    sub = _subheadings_under(source, "Tech Stack")
+    sub = _subheadings_under(document, "Tech Stack")
     if not sub:
         issues.append(
             MemoryContractIssue(
@@ -273,8 +271,9 @@ def _validate_roadmap(
         ]
 
     issues: list[MemoryContractIssue] = []
+    document = SpecDocument.parse(source)
 
-    if not _has_heading(source, 2, "Active Requirements"):
+    if not _has_heading(document, 2, "Active Requirements"):
         issues.append(
             MemoryContractIssue(
                 file=rel,
@@ -284,7 +283,7 @@ def _validate_roadmap(
         )
     else:
         priority_subs = [
-            s for s in _subheadings_under(source, "Active Requirements")
+            s for s in _subheadings_under(document, "Active Requirements")
             if re.match(r"^p[1-4]\b", s, re.IGNORECASE)
         ]
         if not priority_subs:
@@ -301,8 +300,8 @@ def _validate_roadmap(
 
     # ## Open Questions is optional (empty list is a valid state) but when
     # present its table must obey the fixed column order.
-    if _has_heading(source, 2, "Open Questions"):
-        issues.extend(_validate_open_questions_table(rel, source))
+    if _has_heading(document, 2, "Open Questions"):
+        issues.extend(_validate_open_questions_table(rel, document))
 
     return issues
 
@@ -346,9 +345,10 @@ def _validate_personas(
         ]
 
     issues: list[MemoryContractIssue] = []
+    document = SpecDocument.parse(source)
 
     for h2_title in REQUIRED_PERSONAS_H2:
-        if not _has_heading(source, 2, h2_title):
+        if not _has_heading(document, 2, h2_title):
             issues.append(
                 MemoryContractIssue(
                     file=rel,
@@ -362,7 +362,7 @@ def _validate_personas(
         return issues
 
     # Count + validate `### Persona: …` headings under ## Detailed Profiles.
-    persona_headings = _subheadings_under(source, "Detailed Profiles")
+    persona_headings = _subheadings_under(document, "Detailed Profiles")
     valid_count = 0
     for heading in persona_headings:
         stripped = heading.strip()
@@ -408,44 +408,22 @@ def _is_placeholder(source: str) -> bool:
     return hits >= PLACEHOLDER_THRESHOLD
 
 
-def _has_heading(source: str, depth: int, title: str) -> bool:
-    target = title.strip().lower()
-    pattern = _H2_HEADING if depth == 2 else _H3_HEADING
-    for match in pattern.finditer(source):
-        if match.group(2).strip().lower() == target:
-            return True
-    return False
+def _has_heading(document: SpecDocument, depth: int, title: str) -> bool:
+    return document.has_heading(depth, title)
 
 
-def _subheadings_under(source: str, h2_title: str) -> list[str]:
+def _subheadings_under(document: SpecDocument, h2_title: str) -> list[str]:
     """Return the text of every `### sub-heading` found between the given
     ``## <h2_title>`` heading and the next H2 (or end of file)."""
 
-    target = h2_title.strip().lower()
-    lines = source.splitlines()
-    depth2 = 0
-    in_section = False
-    out: list[str] = []
-    for line in lines:
-        m2 = re.match(r"^(##)\s+(.+?)\s*$", line)
-        if m2:
-            if in_section:
-                # Reached the next H2 — stop.
-                break
-            if m2.group(2).strip().lower() == target:
-                in_section = True
-                depth2 = 1
-            continue
-        if in_section:
-            m3 = re.match(r"^(###)\s+(.+?)\s*$", line)
-            if m3:
-                out.append(m3.group(2).strip())
-    _ = depth2  # kept for clarity even though the flag suffices
-    return out
+    section = document.section(h2_title, level=2)
+    if section is None:
+        return []
+    return [heading.title for heading in document.subheadings(section)]
 
 
 def _validate_open_questions_table(
-    rel: str, source: str
+    rel: str, document: SpecDocument
 ) -> list[MemoryContractIssue]:
     """Parse the Open Questions section and flag column-order and priority issues.
 
@@ -455,17 +433,14 @@ def _validate_open_questions_table(
     picked up by the docs generator's parser.
     """
 
-    # Extract the slice of text between "## Open Questions" and the next H2.
-    m = re.search(r"^##\s+Open Questions\s*$", source, re.MULTILINE | re.IGNORECASE)
-    if not m:
+    # Table rows between "## Open Questions" and the next H2.
+    section = document.section("Open Questions", level=2)
+    if section is None:
         return []
 
-    rest = source[m.end():]
-    next_h2 = re.search(r"^##\s+", rest, re.MULTILINE)
-    section = rest[: next_h2.start()] if next_h2 else rest
-
-    # Find the first GFM table header row in the section.
-    rows = [line for line in section.splitlines() if line.lstrip().startswith("|")]
+    rows = [
+        row for table in document.tables_in(section.start + 1, section.end) for row in table.rows
+    ]
     if len(rows) < 2:
         return []  # empty table (header + divider only, or nothing)
 
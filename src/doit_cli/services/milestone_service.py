@@ -8,18 +8,24 @@ lifecycle based on roadmap completion status.
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from rich.console import Console
 
-from ..models.milestone import Milestone
+from ..models.milestone import EpicAssignment, Milestone
 from ..models.priority import PRIORITY_LEVELS, get_priority
+from ..models.provider_models import IssueUpdateRequest
 from ..models.sync_operation import (
     SyncAction,
     SyncOperation,
     SyncStatus,
 )
 from .github_service import GitHubService, GitHubServiceError
+from .providers.exceptions import ProviderError
+
+# Concurrent milestone updates applied by assign_epics_to_milestones
+ASSIGN_WORKERS = 8
 
 
 class MilestoneService:
@@ -203,97 +209,99 @@ class MilestoneService:
     ) -> None:
         """Assign each epic to its corresponding priority milestone.
 
+        Builds the plan from one bulk lookup of current assignments, then
+        applies only the needed changes concurrently. In dry-run mode the
+        plan is printed and nothing is changed.
+
         Args:
             epic_by_priority: Dictionary mapping priorities to epic numbers
             milestones: List of available milestones
             sync_op: SyncOperation to track results
+        """
+        plan = self.plan_epic_assignments(epic_by_priority, milestones)
+        needed = [assignment for assignment in plan if assignment.is_needed]
 
-        Raises:
-            GitHubServiceError: If GitHub API operations fail
+        if plan:
+            self.console.print(
+                f"  [dim]Plan: {len(needed)} to change, "
+                f"{len(plan) - len(needed)} already assigned[/dim]"
+            )
+
+        errors: dict[int, Exception] = {}
+        if needed and not self.dry_run:
+            errors = self._apply_assignments(needed)
+
+        for assignment in plan:
+            self._record_assignment(assignment, errors.get(assignment.epic_number), sync_op)
+
+    def plan_epic_assignments(
+        self,
+        epic_by_priority: dict[str, list[int]],
+        milestones: list[Milestone],
+    ) -> list[EpicAssignment]:
+        """Compute the milestone each epic belongs in and where it is now.
+
+        Args:
+            epic_by_priority: Dictionary mapping priorities to epic numbers
+            milestones: List of available milestones
+
+        Returns:
+            One EpicAssignment per epic, in roadmap order
         """
-        # Build milestone lookup by title
         milestone_by_title = {ms.title: ms for ms in milestones}
+        targets: dict[int, str] = {}
 
-        # Process each priority
         for priority_level, epic_numbers in epic_by_priority.items():
             if not epic_numbers:
                 continue
 
-            priority = get_priority(priority_level)
-            milestone_title = priority.milestone_title
-
-            # Find the milestone
+            milestone_title = get_priority(priority_level).milestone_title
             if milestone_title not in milestone_by_title:
                 self.console.print(
                     f"  ⚠️  [yellow]Warning:[/yellow] Milestone '{milestone_title}' not found, skipping epic assignment"
                 )
                 continue
 
-            # Assign each epic to the milestone
             for epic_number in epic_numbers:
-                try:
-                    # Check existing assignment
-                    previous_milestone = self.check_existing_assignment(epic_number)
+                targets[epic_number] = milestone_title
 
-                    if previous_milestone == milestone_title:
-                        # Already assigned correctly
-                        sync_op.add_result(
-                            action=SyncAction.ASSIGN_EPIC,
-                            target=f"#{epic_number}",
-                            status=SyncStatus.SKIPPED,
-                            message=f"Already assigned to {milestone_title}",
-                        )
-                        self.console.print(
-                            f"  • [dim]#{epic_number}[/dim] already in {milestone_title}"
-                        )
-                    else:
-                        # Assign or reassign
-                        if self.dry_run:
-                            sync_op.add_result(
-                                action=SyncAction.ASSIGN_EPIC,
-                                target=f"#{epic_number}",
-                                status=SyncStatus.SKIPPED,
-                                message=f"Dry run - would assign to {milestone_title}",
-                            )
-                            if previous_milestone:
-                                self.console.print(
-                                    f"  ✓ [yellow]Would reassign:[/yellow] #{epic_number} "
-                                    f"from '{previous_milestone}' to '{milestone_title}'"
-                                )
-                            else:
-                                self.console.print(
-                                    f"  ✓ [yellow]Would assign:[/yellow] #{epic_number} to {milestone_title}"
-                                )
-                        else:
-                            self._assign_epic_to_milestone(epic_number, milestone_title)
-
-                            sync_op.add_result(
-                                action=SyncAction.ASSIGN_EPIC,
-                                target=f"#{epic_number}",
-                                status=SyncStatus.SUCCESS,
-                                message=f"Assigned to {milestone_title}",
-                            )
-
-                            if previous_milestone:
-                                self.console.print(
-                                    f"  ✓ [green]Reassigned:[/green] #{epic_number} "
-                                    f"from '{previous_milestone}' to '{milestone_title}'"
-                                )
-                            else:
-                                self.console.print(
-                                    f"  ✓ [green]Assigned:[/green] #{epic_number} to {milestone_title}"
-                                )
-
-                except GitHubServiceError as e:
-                    sync_op.add_result(
-                        action=SyncAction.ASSIGN_EPIC,
-                        target=f"#{epic_number}",
-                        status=SyncStatus.ERROR,
-                        message=str(e),
-                    )
-                    self.console.print(
-                        f"  ✗ [red]Error:[/red] Failed to assign #{epic_number}: {e}"
-                    )
+        current = self.fetch_current_milestones(list(targets), milestones)
+        return [
+            EpicAssignment(epic_number, milestone_title, current.get(epic_number))
+            for epic_number, milestone_title in targets.items()
+        ]
+
+    def fetch_current_milestones(
+        self, epic_numbers: list[int], milestones: list[Milestone]
+    ) -> dict[int, str | None]:
+        """Look up the current milestone title of many epics at once.
+
+        Uses the provider's batch issue lookup; if that fails, each epic is
+        checked individually.
+
+        Args:
+            epic_numbers: GitHub issue numbers
+            milestones: Known milestones, used to resolve titles
+
+        Returns:
+            Dictionary mapping epic numbers to milestone titles (None if unassigned)
+        """
+        if not epic_numbers:
+            return {}
+
+        try:
+            provider = self.github_service.get_provider()
+            issues = provider.get_issues([str(number) for number in epic_numbers])
+            titles = {str(ms.number): ms.title for ms in milestones}
+            if any(i.milestone_id and i.milestone_id not in titles for i in issues):
+                titles.update({ms.provider_id: ms.title for ms in provider.list_milestones()})
+        except ProviderError:
+            return {number: self.check_existing_assignment(number) for number in epic_numbers}
+
+        return {
+            int(issue.provider_id): titles.get(issue.milestone_id) if issue.milestone_id else None
+            for issue in issues
+        }
 
     def check_existing_assignment(self, epic_number: int) -> str | None:
         """Check if epic is already assigned to a milestone.
@@ -326,40 +334,94 @@ class MilestoneService:
             # If we can't check, assume not assigned
             return None
 
-    def _assign_epic_to_milestone(self, epic_number: int, milestone_title: str) -> None:
-        """Assign epic to milestone using gh CLI.
+    def _apply_assignments(self, assignments: list[EpicAssignment]) -> dict[int, Exception]:
+        """Apply assignments concurrently through the provider.
 
         Args:
-            epic_number: GitHub issue number
-            milestone_title: Milestone title to assign to
+            assignments: Assignments that need a change
 
-        Raises:
-            GitHubServiceError: If assignment fails
+        Returns:
+            Dictionary mapping epic numbers to the error that failed them
         """
-        import subprocess
+        provider = self.github_service.get_provider()
 
-        try:
-            result = subprocess.run(
-                [
-                    "gh",
-                    "issue",
-                    "edit",
-                    str(epic_number),
-                    "--milestone",
-                    milestone_title,
-                ],
-                capture_output=True,
-                text=True,
-                timeout=10,
+        def apply(assignment: EpicAssignment) -> Exception | None:
+            try:
+                provider.update_issue(
+                    str(assignment.epic_number),
+                    IssueUpdateRequest(milestone_id=assignment.milestone_title),
+                )
+                return None
+            except ProviderError as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(ASSIGN_WORKERS, len(assignments))) as pool:
+            results = pool.map(apply, assignments)
+            return {
+                assignment.epic_number: error
+                for assignment, error in zip(assignments, results, strict=True)
+                if error is not None
+            }
+
+    def _record_assignment(
+        self,
+        assignment: EpicAssignment,
+        error: Exception | None,
+        sync_op: SyncOperation,
+    ) -> None:
+        """Add an assignment's result to the sync operation and print it."""
+        epic_number = assignment.epic_number
+        milestone_title = assignment.milestone_title
+        previous_milestone = assignment.previous_milestone
+
+        if not assignment.is_needed:
+            sync_op.add_result(
+                action=SyncAction.ASSIGN_EPIC,
+                target=f"#{epic_number}",
+                status=SyncStatus.SKIPPED,
+                message=f"Already assigned to {milestone_title}",
             )
-
-            if result.returncode != 0:
-                raise GitHubServiceError(f"Failed to assign epic: {result.stderr}")
-
-        except subprocess.TimeoutExpired:
-            raise GitHubServiceError("GitHub CLI timeout") from None
-        except Exception as e:
-            raise GitHubServiceError(f"Failed to assign epic: {e}") from e
+            self.console.print(f"  • [dim]#{epic_number}[/dim] already in {milestone_title}")
+        elif self.dry_run:
+            sync_op.add_result(
+                action=SyncAction.ASSIGN_EPIC,
+                target=f"#{epic_number}",
+                status=SyncStatus.SKIPPED,
+                message=f"Dry run - would assign to {milestone_title}",
+            )
+            if previous_milestone:
+                self.console.print(
+                    f"  ✓ [yellow]Would reassign:[/yellow] #{epic_number} "
+                    f"from '{previous_milestone}' to '{milestone_title}'"
+                )
+            else:
+                self.console.print(
+                    f"  ✓ [yellow]Would assign:[/yellow] #{epic_number} to {milestone_title}"
+                )
+        elif error is not None:
+            sync_op.add_result(
+                action=SyncAction.ASSIGN_EPIC,
+                target=f"#{epic_number}",
+                status=SyncStatus.ERROR,
+                message=str(error),
+            )
+            self.console.print(f"  ✗ [red]Error:[/red] Failed to assign #{epic_number}: {error}")
+        else:
+            sync_op.add_result(
+                action=SyncAction.ASSIGN_EPIC,
+                target=f"#{epic_number}",
+                status=SyncStatus.SUCCESS,
+                message=f"Assigned to {milestone_title}",
+            )
+            if previous_milestone:
+                self.console.print(
+                    f"  ✓ [green]Reassigned:[/green] #{epic_number} "
+                    f"from '{previous_milestone}' to '{milestone_title}'"
+                )
+            else:
+                self.console.print(
+                    f"  ✓ [green]Assigned:[/green] #{epic_number} to {milestone_title}"
+                )
 
     def detect_completed_priorities(self) -> list[str]:
         """Check roadmap.md and completed_roadmap.md for empty priority sections.
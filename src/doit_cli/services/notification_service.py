@@ -2,36 +2,61 @@
 
 This module provides the NotificationService class for managing
 change notifications between team members.
+
+Notifications are kept in an append-only JSONL log
+(``.doit/state/notifications.jsonl``). Creating a notification or marking
+one as read appends a single line, so the cost of an event does not grow
+with the history. Concurrent writers, such as `doit team watch` and a
+command run in another terminal, are serialised by a lock file and
+cannot overwrite each other's events. Settings and the read cursor
+(the log offset before which every notification is read) are stored in
+``notifications.json``. The log is compacted once it has doubled in size
+since the last compaction: expired and excess entries are dropped and
+read markers folded in.
 """
 
 from __future__ import annotations
 
 import json
+import uuid
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any
 
 from doit_cli.models.team_models import (
     Notification,
     NotificationSettings,
     NotificationType,
 )
+from doit_cli.utils.atomic_write import write_text_atomic
+from doit_cli.utils.file_lock import file_lock
 
 
 @dataclass
 class NotificationState:
-    """State stored in notifications.json."""
+    """Notification settings and read cursor, plus the replayed notifications.
+
+    Only ``settings``, ``last_batch_sent``, ``read_cursor`` and ``log_id``
+    are stored in notifications.json; ``notifications`` is rebuilt from the
+    log (older files that still embed notifications are migrated on the
+    first write).
+    """
 
     notifications: list[Notification] = field(default_factory=list)
     settings: NotificationSettings = field(default_factory=NotificationSettings)
     last_batch_sent: datetime | None = None
+    read_cursor: int = 0  # Log offset before which every notification is read
+    log_id: str | None = None  # Compaction the read cursor belongs to
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
-            "notifications": [n.to_dict() for n in self.notifications],
             "settings": self.settings.to_dict(),
             "last_batch_sent": self.last_batch_sent.isoformat() if self.last_batch_sent else None,
+            "read_cursor": self.read_cursor,
+            "log_id": self.log_id,
         }
 
     @classmethod
@@ -43,6 +68,8 @@ class NotificationState:
             last_batch_sent=datetime.fromisoformat(data["last_batch_sent"])
             if data.get("last_batch_sent")
             else None,
+            read_cursor=data.get("read_cursor", 0),
+            log_id=data.get("log_id"),
         )
 
 
@@ -59,6 +86,7 @@ class NotificationService:
 
     MAX_NOTIFICATIONS = 100  # Keep last 100 notifications
     MAX_BATCH_SIZE = 10  # Maximum notifications per batch
+    COMPACT_MIN_BYTES = 64 * 1024  # Never compact a smaller log
 
     def __init__(self, project_root: Path | None = None):
         """Initialize NotificationService.
@@ -68,14 +96,29 @@ class NotificationService:
         """
         self.project_root = project_root or Path.cwd()
         self._state: NotificationState | None = None
+        self._migrated = False
 
     @property
     def state_path(self) -> Path:
         """Get path to notifications state file."""
         return self.project_root / ".doit" / "state" / "notifications.json"
 
-    def _load_state(self) -> NotificationState:
-        """Load notification state from file."""
+    @property
+    def log_path(self) -> Path:
+        """Get path to the append-only notification log."""
+        return self.project_root / ".doit" / "state" / "notifications.jsonl"
+
+    @property
+    def lock_path(self) -> Path:
+        """Get path to the lock file serialising writers."""
+        return self.project_root / ".doit" / "state" / "notifications.lock"
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+
+    def _read_state_file(self) -> NotificationState:
+        """Load settings and read cursor from notifications.json."""
         if self.state_path.exists():
             try:
                 with open(self.state_path, encoding="utf-8") as f:
@@ -85,15 +128,101 @@ class NotificationService:
                 pass
         return NotificationState()
 
-    def _save_state(self, state: NotificationState) -> None:
-        """Save notification state to file."""
+    def _write_state_file(self, state: NotificationState) -> None:
+        """Save settings and read cursor (caller holds the lock)."""
         self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        write_text_atomic(self.state_path, json.dumps(state.to_dict(), indent=2))
+
+    def _read_log(self, start: int = 0) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Yield ``(offset, record)`` for every complete log line from ``start``."""
+        if not self.log_path.exists():
+            return
+        with open(self.log_path, "rb") as handle:
+            handle.seek(start)
+            offset = start
+            for line in handle:
+                line_offset = offset
+                offset += len(line)
+                if not line.endswith(b"\n"):
+                    break  # Another process is still writing this line
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict):
+                    yield line_offset, record
+
+    def _log_id(self) -> str | None:
+        """ID of the compaction that wrote the current log, if any."""
+        for _, record in self._read_log():
+            return record.get("log_id") if record.get("op") == "header" else None
+        return None
+
+    def _replay(self, state: NotificationState, start: int = 0) -> dict[str, Notification]:
+        """Apply log records from ``start`` on top of ``state.notifications``."""
+        notifications = {n.id: n for n in state.notifications}
+        cursor = state.read_cursor
+        for offset, record in self._read_log(start):
+            op = record.get("op")
+            if offset == 0:
+                log_id = record.get("log_id") if op == "header" else None
+                if log_id != state.log_id:
+                    cursor = 0  # The log was replaced; read flags are folded in
+            if op == "create":
+                notification = Notification.from_dict(record["notification"])
+                notification.read = notification.read or offset < cursor
+                notifications[notification.id] = notification
+            elif op == "read" and record.get("id") in notifications:
+                notifications[record["id"]].read = True
+        return notifications
+
+    def _load_state(self) -> NotificationState:
+        """Load settings and rebuild the notifications from the log."""
+        state = self._read_state_file()
+        notifications = self._replay(state)
+        state.notifications = self._prune_notifications(list(notifications.values()))
+        return state
 
-        # Prune old notifications
-        state.notifications = self._prune_notifications(state.notifications)
+    def _append(self, record: dict[str, Any]) -> int:
+        """Append one record to the log (caller holds the lock).
 
-        with open(self.state_path, "w", encoding="utf-8") as f:
-            json.dump(state.to_dict(), f, indent=2)
+        Returns:
+            Size of the log afterwards
+        """
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "ab") as f:
+            f.write(line.encode("utf-8"))
+            return f.tell()
+
+    def _compact(self, state: NotificationState) -> None:
+        """Rewrite the log with only ``state.notifications`` (caller holds the lock)."""
+        records = "".join(
+            json.dumps({"op": "create", "notification": n.to_dict()}, separators=(",", ":")) + "\n"
+            for n in state.notifications
+        )
+        state.log_id = uuid.uuid4().hex
+        state.read_cursor = 0
+        header = {"op": "header", "log_id": state.log_id, "size": len(records.encode("utf-8"))}
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        write_text_atomic(self.log_path, json.dumps(header) + "\n" + records)
+        self._write_state_file(state)
+
+    def _needs_compaction(self, log_size: int) -> bool:
+        """Whether the log has doubled since it was last compacted."""
+        if log_size <= self.COMPACT_MIN_BYTES:
+            return False
+        for _, record in self._read_log():
+            compacted = record.get("size", 0) if record.get("op") == "header" else 0
+            return log_size > 2 * compacted
+        return True
+
+    def _migrate_legacy(self) -> None:
+        """Move notifications embedded in an old notifications.json into the log."""
+        if not self._migrated:
+            if self._read_state_file().notifications:
+                self._compact(self._load_state())
+            self._migrated = True
 
     def _prune_notifications(self, notifications: list[Notification]) -> list[Notification]:
         """Remove expired and excess notifications."""
@@ -122,6 +251,8 @@ class NotificationService:
     ) -> Notification:
         """Create a new notification.
 
+        Appends one record to the log; the existing history is not read.
+
         Args:
             notification_type: Type of notification
             title: Short title
@@ -140,10 +271,18 @@ class NotificationService:
             affected_files=affected_files,
         )
 
-        state = self.get_state()
-        state.notifications.append(notification)
-        self._save_state(state)
-        self._state = state
+        with file_lock(self.lock_path):
+            self._migrate_legacy()
+            log_size = self._append({"op": "create", "notification": notification.to_dict()})
+            if self._needs_compaction(log_size):
+                self._state = self._load_state()
+                self._compact(self._state)
+                return notification
+
+        if self._state is not None:
+            self._state.notifications = self._prune_notifications(
+                [*self._state.notifications, notification]
+            )
 
         return notification
 
@@ -152,6 +291,7 @@ class NotificationService:
         unread_only: bool = False,
         limit: int = 50,
         notification_type: NotificationType | None = None,
+        offset: int = 0,
     ) -> list[Notification]:
         """Get notifications.
 
@@ -159,6 +299,7 @@ class NotificationService:
             unread_only: Only return unread notifications
             limit: Maximum number to return
             notification_type: Filter by type
+            offset: Number of matching notifications to skip (for paging)
 
         Returns:
             List of Notification objects (newest first)
@@ -177,37 +318,59 @@ class NotificationService:
         # Sort by created_at descending (newest first)
         notifications.sort(key=lambda n: n.created_at, reverse=True)
 
-        # Limit
-        return notifications[:limit]
+        # Page
+        return notifications[offset : offset + limit]
 
     def get_unread_count(self) -> int:
-        """Get count of unread notifications."""
+        """Get count of unread notifications.
+
+        Without a loaded state, only the log after the read cursor is read.
+        """
+        if self._state is None:
+            stored = self._read_state_file()
+            if not stored.notifications and stored.log_id == self._log_id():
+                unread = [
+                    n
+                    for n in self._replay(stored, start=stored.read_cursor).values()
+                    if not n.read and not n.is_expired()
+                ]
+                return min(len(unread), self.MAX_NOTIFICATIONS)
         state = self.get_state()
         return sum(1 for n in state.notifications if not n.read)
 
     def mark_read(self, notification_id: str | None = None) -> int:
         """Mark notification(s) as read.
 
+        Marking one notification appends a read record; marking all moves
+        the read cursor to the end of the log.
+
         Args:
             notification_id: Specific ID to mark, or None for all
 
         Returns:
             Number of notifications marked as read
         """
-        state = self.get_state()
-        count = 0
-
-        for notification in state.notifications:
-            if notification_id is None or notification.id == notification_id:
-                if not notification.read:
-                    notification.read = True
-                    count += 1
-
-        if count > 0:
-            self._save_state(state)
-            self._state = state
-
-        return count
+        with file_lock(self.lock_path):
+            self._migrate_legacy()
+            state = self._state = self._load_state()
+            targets = [
+                n
+                for n in state.notifications
+                if not n.read and (notification_id is None or n.id == notification_id)
+            ]
+            if not targets:
+                return 0
+
+            if notification_id is None:
+                state.log_id = self._log_id()
+                state.read_cursor = self.log_path.stat().st_size
+                self._write_state_file(state)
+            else:
+                self._append({"op": "read", "id": notification_id})
+
+        for notification in targets:
+            notification.read = True
+        return len(targets)
 
     def get_settings(self) -> NotificationSettings:
         """Get notification settings."""
@@ -233,22 +396,26 @@ class NotificationService:
         Returns:
             Updated NotificationSettings
         """
-        state = self.get_state()
-        settings = state.settings
-
-        if enabled is not None:
-            settings.enabled = enabled
-        if batch_interval_minutes is not None:
-            settings.batch_interval_minutes = batch_interval_minutes
-        if on_sync is not None:
-            settings.on_sync = on_sync
-        if on_conflict is not None:
-            settings.on_conflict = on_conflict
-        if on_member_change is not None:
-            settings.on_member_change = on_member_change
-
-        self._save_state(state)
-        self._state = state
+        with file_lock(self.lock_path):
+            self._migrate_legacy()
+            stored = self._read_state_file()
+            settings = stored.settings
+
+            if enabled is not None:
+                settings.enabled = enabled
+            if batch_interval_minutes is not None:
+                settings.batch_interval_minutes = batch_interval_minutes
+            if on_sync is not None:
+                settings.on_sync = on_sync
+            if on_conflict is not None:
+                settings.on_conflict = on_conflict
+            if on_member_change is not None:
+                settings.on_member_change = on_member_change
+
+            self._write_state_file(stored)
+
+        if self._state is not None:
+            self._state.settings = settings
 
         return settings
 
@@ -288,9 +455,12 @@ class NotificationService:
         batch = unread[-self.MAX_BATCH_SIZE :]
 
         # Update last batch sent
-        state.last_batch_sent = datetime.now()
-        self._save_state(state)
-        self._state = state
+        with file_lock(self.lock_path):
+            self._migrate_legacy()
+            stored = self._read_state_file()
+            stored.last_batch_sent = datetime.now()
+            self._write_state_file(stored)
+        state.last_batch_sent = stored.last_batch_sent
 
         return batch
 
@@ -300,11 +470,12 @@ class NotificationService:
         Returns:
             Number of notifications cleared
         """
-        state = self.get_state()
-        count = len(state.notifications)
-        state.notifications = []
-        self._save_state(state)
-        self._state = state
+        with file_lock(self.lock_path):
+            self._migrate_legacy()
+            state = self._state = self._load_state()
+            count = len(state.notifications)
+            state.notifications = []
+            self._compact(state)
         return count
 
     # Convenience methods for creating specific notification types
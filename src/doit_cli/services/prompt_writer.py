@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 
 from ..models.sync_models import (
@@ -9,8 +10,10 @@ from ..models.sync_models import (
     FileOperation,
     OperationType,
     SyncResult,
+    SyncStatusEnum,
 )
 from .prompt_transformer import PromptTransformer
+from .sync_manifest import SyncManifest, source_hash
 
 
 class PromptWriter:
@@ -18,20 +21,26 @@ class PromptWriter:
 
     DEFAULT_PROMPTS_DIR = ".github/prompts"
 
+    # Identifies this transformation in source hashes
+    GENERATOR = "copilot-prompt"
+
     def __init__(
         self,
         project_root: Path | None = None,
         transformer: PromptTransformer | None = None,
+        manifest: SyncManifest | None = None,
     ):
         """Initialize the prompt writer.
 
         Args:
             project_root: Root directory of the project. Defaults to current directory.
             transformer: Transformer to use. Defaults to new PromptTransformer.
+            manifest: Manifest of generated files. Defaults to the project's.
         """
         self.project_root = project_root or Path.cwd()
         self.prompts_dir = self.project_root / self.DEFAULT_PROMPTS_DIR
         self.transformer = transformer or PromptTransformer()
+        self.manifest = manifest or SyncManifest(self.project_root)
 
     def get_prompts_directory(self) -> Path:
         """Get the prompts directory path."""
@@ -52,6 +61,24 @@ class PromptWriter:
         """
         return self.prompts_dir / template.prompt_filename
 
+    def check_prompt(self, template: CommandTemplate) -> SyncStatusEnum:
+        """Check whether a template's prompt file is up-to-date.
+
+        The template is only transformed if the manifest has no matching
+        entry for the prompt file.
+
+        Args:
+            template: The command template.
+
+        Returns:
+            Sync status of the prompt file.
+        """
+        return self.manifest.check(
+            self.get_prompt_path(template),
+            source_hash(template.content, self.GENERATOR),
+            lambda: self.transformer.transform(template),
+        )
+
     def write_prompt(
         self,
         template: CommandTemplate,
@@ -66,25 +93,32 @@ class PromptWriter:
         Returns:
             FileOperation describing what happened.
         """
+        operation = self._write_prompt(template, force)
+        self.manifest.save()
+        return operation
+
+    def _write_prompt(self, template: CommandTemplate, force: bool) -> FileOperation:
+        """Write one prompt file without saving the manifest."""
         prompt_path = self.get_prompt_path(template)
         prompt_path_str = str(prompt_path)
+        source = source_hash(template.content, self.GENERATOR)
+        render = cache(lambda: self.transformer.transform(template))
 
         try:
             # Check if prompt already exists and is up-to-date
-            if prompt_path.exists() and not force:
-                prompt_mtime = prompt_path.stat().st_mtime
-                template_mtime = template.modified_at.timestamp()
-
-                if prompt_mtime >= template_mtime:
-                    return FileOperation(
-                        file_path=prompt_path_str,
-                        operation_type=OperationType.SKIPPED,
-                        success=True,
-                        message="Already up-to-date",
-                    )
+            if (
+                not force
+                and self.manifest.check(prompt_path, source, render) == SyncStatusEnum.SYNCHRONIZED
+            ):
+                return FileOperation(
+                    file_path=prompt_path_str,
+                    operation_type=OperationType.SKIPPED,
+                    success=True,
+                    message="Already up-to-date",
+                )
 
             # Transform content
-            content = self.transformer.transform(template)
+            content = render()
 
             # Ensure directory exists
             self.ensure_prompts_directory()
@@ -96,6 +130,7 @@ class PromptWriter:
 
             # Write file
             prompt_path.write_text(content, encoding="utf-8")
+            self.manifest.record(prompt_path, source, content)
 
             return FileOperation(
                 file_path=prompt_path_str,
@@ -129,7 +164,8 @@ class PromptWriter:
         result = SyncResult(total_commands=len(templates))
 
         for template in templates:
-            operation = self.write_prompt(template, force=force)
+            operation = self._write_prompt(template, force)
             result.add_operation(operation)
 
+        self.manifest.save()
         return result
@@ -33,6 +33,7 @@ class GitHubConfig:
 
     auth_method: str = "gh_cli"  # or "token"
     enterprise_host: str | None = None
+    backend: str = "gh_cli"  # or "http" for the native REST client
 
 
 @dataclass
@@ -122,6 +123,7 @@ class ProviderConfig:
             config.github = GitHubConfig(
                 auth_method=gh.get("auth_method", "gh_cli"),
                 enterprise_host=gh.get("enterprise_host"),
+                backend=gh.get("backend", "gh_cli"),
             )
 
         # Parse Azure DevOps config
@@ -181,6 +183,8 @@ class ProviderConfig:
             }
             if self.github.enterprise_host:
                 data["github"]["enterprise_host"] = self.github.enterprise_host
+            if self.github.backend != "gh_cli":
+                data["github"]["backend"] = self.github.backend
 
         elif self.provider == ProviderType.AZURE_DEVOPS:
             data["azure_devops"] = {
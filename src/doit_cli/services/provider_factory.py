@@ -6,14 +6,15 @@ the appropriate git provider based on configuration.
 
 from __future__ import annotations
 
-import subprocess
 from typing import TYPE_CHECKING
 
+from .git_context import get_git_context
 from .providers.base import GitProvider, ProviderType
 from .providers.exceptions import ProviderError, ProviderNotConfiguredError
 
 if TYPE_CHECKING:
-    from .provider_config import ProviderConfig
+    from .provider_config import GitHubConfig, ProviderConfig
+    from .providers.github import GitHubProvider
 
 
 class ProviderFactory:
@@ -60,9 +61,7 @@ class ProviderFactory:
 
         # Instantiate the appropriate provider
         if provider_type == ProviderType.GITHUB:
-            from .providers.github import GitHubProvider
-
-            return GitHubProvider()
+            return cls.create_github(config.github)
 
         elif provider_type == ProviderType.AZURE_DEVOPS:
             from .providers.azure_devops import AzureDevOpsProvider
@@ -77,6 +76,35 @@ class ProviderFactory:
         else:
             raise ProviderError(f"Unknown provider type: {provider_type}")
 
+    @classmethod
+    def create_github(
+        cls, github_config: GitHubConfig | None = None, timeout: int = 30
+    ) -> GitHubProvider:
+        """Create the GitHub provider for the configured backend.
+
+        ``backend: http`` selects the REST client when a token is available;
+        otherwise the gh CLI provider is used.
+
+        Args:
+            github_config: GitHub configuration (default: gh CLI backend).
+            timeout: Timeout in seconds for API requests or gh commands.
+
+        Returns:
+            GitHubHTTPProvider or GitHubProvider instance.
+        """
+        from ..utils.github_auth import get_github_token
+        from .providers.github import GitHubProvider
+
+        if github_config is not None and github_config.backend == "http":
+            host = github_config.enterprise_host
+            token = get_github_token(host)
+            if token:
+                from .providers.github_http import GitHubHTTPProvider
+
+                return GitHubHTTPProvider(timeout=timeout, host=host, token=token)
+
+        return GitHubProvider(timeout=timeout)
+
     @classmethod
     def detect_provider(cls) -> ProviderType | None:
         """Auto-detect provider from git remote URL.
@@ -88,17 +116,12 @@ class ProviderFactory:
             ProviderType if detected, None if detection fails.
         """
         try:
-            result = subprocess.run(
-                ["git", "remote", "get-url", "origin"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            if result.returncode != 0:
+            context = get_git_context()
+            remote_url = context.remote_url() if context is not None else None
+            if remote_url is None:
                 return None
 
-            remote_url = result.stdout.strip().lower()
+            remote_url = remote_url.lower()
 
             # Check for GitHub (including enterprise)
             if "github.com" in remote_url or "ghe." in remote_url:
@@ -114,7 +137,7 @@ class ProviderFactory:
 
             return None
 
-        except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
+        except Exception:
             return None
 
     @classmethod
@@ -7,6 +7,8 @@ using direct REST API calls via httpx.
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
@@ -29,7 +31,7 @@ from ...models.provider_models import (
     PullRequest,
 )
 from ..provider_config import AzureDevOpsConfig
-from .base import GitProvider, ProviderType
+from .base import GitProvider, ProviderType, iter_pages
 from .exceptions import (
     AuthenticationError,
     NetworkError,
@@ -38,6 +40,15 @@ from .exceptions import (
     ValidationError,
 )
 
+# Maximum IDs accepted by the work items batch endpoint per request
+WORK_ITEMS_BATCH_SIZE = 200
+
+# Concurrent batch requests issued by list_issues
+BATCH_FETCH_WORKERS = 4
+
+# Pull requests requested per page by iter_pull_requests
+PULL_REQUESTS_PAGE_SIZE = 100
+
 
 class AzureDevOpsLabelMapper:
     """Maps labels between unified format and Azure DevOps work item types/tags."""
@@ -206,6 +217,51 @@ class AzureDevOpsProvider(GitProvider):
         """List Azure DevOps work items matching filters."""
         self._ensure_authenticated()
 
+        try:
+            ids = self._query_work_item_ids(filters)
+
+            # Limit results
+            if filters and filters.limit:
+                ids = ids[: filters.limit]
+
+            # Fetch full details in batches instead of one request per item
+            return self._get_work_items(ids)
+
+        except httpx.TimeoutException:
+            raise NetworkError("Azure DevOps API timeout", is_timeout=True) from None
+        except httpx.RequestError as e:
+            raise NetworkError(f"Azure DevOps network error: {e}") from e
+
+    def iter_issues(
+        self, filters: IssueFilters | None = None, prefetch: bool = False
+    ) -> Iterator[Issue]:
+        """Stream Azure DevOps work items matching filters, one batch at a time.
+
+        The WIQL query returns every matching ID up front; details are then
+        requested WORK_ITEMS_BATCH_SIZE items at a time as they are consumed.
+        """
+        self._ensure_authenticated()
+
+        try:
+            ids = self._query_work_item_ids(filters)
+
+            def fetch(start: int) -> tuple[list[Issue], int | None]:
+                end = start + WORK_ITEMS_BATCH_SIZE
+                batch = self._get_work_items_batch(ids[start:end])
+                return [self._parse_work_item(item) for item in batch], (
+                    end if end < len(ids) else None
+                )
+
+            if ids:
+                yield from iter_pages(fetch, 0, prefetch)
+
+        except httpx.TimeoutException:
+            raise NetworkError("Azure DevOps API timeout", is_timeout=True) from None
+        except httpx.RequestError as e:
+            raise NetworkError(f"Azure DevOps network error: {e}") from e
+
+    def _query_work_item_ids(self, filters: IssueFilters | None) -> list[int]:
+        """Run the WIQL query for the filters and return matching work item IDs."""
         # Build WIQL query
         conditions = []
 
@@ -228,44 +284,22 @@ class AzureDevOpsProvider(GitProvider):
         if filters and filters.limit:
             wiql += " ORDER BY [System.Id] DESC"
 
-        try:
-            client = self._get_client()
-            url = (
-                f"https://dev.azure.com/{self.config.organization}/"
-                f"{self.config.project}/_apis/wit/wiql"
-            )
-
-            response = client.post(
-                url,
-                params={"api-version": self.config.api_version},
-                json={"query": wiql},
-            )
-
-            if response.status_code != 200:
-                raise ProviderError(f"Azure DevOps query error: {response.text}")
-
-            data = response.json()
-            work_items = data.get("workItems", [])
-
-            # Limit results
-            if filters and filters.limit:
-                work_items = work_items[: filters.limit]
+        client = self._get_client()
+        url = (
+            f"https://dev.azure.com/{self.config.organization}/{self.config.project}/_apis/wit/wiql"
+        )
 
-            # Fetch full details for each work item
-            issues = []
-            for wi in work_items:
-                try:
-                    issue = self.get_issue(str(wi["id"]))
-                    issues.append(issue)
-                except ResourceNotFoundError:
-                    continue
+        response = client.post(
+            url,
+            params={"api-version": self.config.api_version},
+            json={"query": wiql},
+        )
 
-            return issues
+        if response.status_code != 200:
+            raise ProviderError(f"Azure DevOps query error: {response.text}")
 
-        except httpx.TimeoutException:
-            raise NetworkError("Azure DevOps API timeout", is_timeout=True) from None
-        except httpx.RequestError as e:
-            raise NetworkError(f"Azure DevOps network error: {e}") from e
+        data = response.json()
+        return [wi["id"] for wi in data.get("workItems", [])]
 
     def update_issue(self, issue_id: str, updates: IssueUpdateRequest) -> Issue:
         """Update an Azure DevOps work item."""
@@ -403,25 +437,9 @@ class AzureDevOpsProvider(GitProvider):
         self._ensure_authenticated()
         repo_id = self._get_repository_id()
 
-        params: dict[str, Any] = {"api-version": self.config.api_version}
-
-        if filters:
-            if filters.state:
-                state_map = {
-                    PRState.OPEN: "active",
-                    PRState.MERGED: "completed",
-                    PRState.CLOSED: "abandoned",
-                }
-                params["searchCriteria.status"] = state_map.get(filters.state, "active")
-
-            if filters.source_branch:
-                params["searchCriteria.sourceRefName"] = f"refs/heads/{filters.source_branch}"
-
-            if filters.target_branch:
-                params["searchCriteria.targetRefName"] = f"refs/heads/{filters.target_branch}"
-
-            if filters.limit:
-                params["$top"] = filters.limit
+        params = self._pull_request_params(filters)
+        if filters and filters.limit:
+            params["$top"] = filters.limit
 
         try:
             client = self._get_client()
@@ -443,6 +461,56 @@ class AzureDevOpsProvider(GitProvider):
         except httpx.RequestError as e:
             raise NetworkError(f"Azure DevOps network error: {e}") from e
 
+    def iter_pull_requests(
+        self, filters: PRFilters | None = None, prefetch: bool = False
+    ) -> Iterator[PullRequest]:
+        """Stream Azure DevOps pull requests matching filters, page by page."""
+        self._ensure_authenticated()
+        repo_id = self._get_repository_id()
+
+        params = self._pull_request_params(filters)
+        params["$top"] = PULL_REQUESTS_PAGE_SIZE
+        url = (
+            f"https://dev.azure.com/{self.config.organization}/"
+            f"{self.config.project}/_apis/git/repositories/{repo_id}/pullrequests"
+        )
+
+        def fetch(skip: int) -> tuple[list[PullRequest], int | None]:
+            response = self._get_client().get(url, params={**params, "$skip": skip})
+            if response.status_code != 200:
+                raise ProviderError(f"Azure DevOps error: {response.text}")
+            page = response.json().get("value", [])
+            next_skip = skip + len(page) if len(page) == PULL_REQUESTS_PAGE_SIZE else None
+            return [self._parse_pull_request(pr) for pr in page], next_skip
+
+        try:
+            yield from iter_pages(fetch, 0, prefetch)
+        except httpx.TimeoutException:
+            raise NetworkError("Azure DevOps API timeout", is_timeout=True) from None
+        except httpx.RequestError as e:
+            raise NetworkError(f"Azure DevOps network error: {e}") from e
+
+    def _pull_request_params(self, filters: PRFilters | None) -> dict[str, Any]:
+        """Build query parameters for listing pull requests (without ``$top``)."""
+        params: dict[str, Any] = {"api-version": self.config.api_version}
+
+        if filters:
+            if filters.state:
+                state_map = {
+                    PRState.OPEN: "active",
+                    PRState.MERGED: "completed",
+                    PRState.CLOSED: "abandoned",
+                }
+                params["searchCriteria.status"] = state_map.get(filters.state, "active")
+
+            if filters.source_branch:
+                params["searchCriteria.sourceRefName"] = f"refs/heads/{filters.source_branch}"
+
+            if filters.target_branch:
+                params["searchCriteria.targetRefName"] = f"refs/heads/{filters.target_branch}"
+
+        return params
+
     # -------------------------------------------------------------------------
     # Milestone Operations (Iterations)
     # -------------------------------------------------------------------------
@@ -587,6 +655,51 @@ class AzureDevOpsProvider(GitProvider):
             )
         return self._client
 
+    def _get_work_items(self, ids: list[int]) -> list[Issue]:
+        """Fetch work items by ID through the batch endpoint.
+
+        IDs are sent in chunks of WORK_ITEMS_BATCH_SIZE, with up to
+        BATCH_FETCH_WORKERS chunks in flight over the shared client. Work
+        items that no longer exist are skipped; the order of ``ids`` is kept.
+        """
+        chunks = [
+            ids[start : start + WORK_ITEMS_BATCH_SIZE]
+            for start in range(0, len(ids), WORK_ITEMS_BATCH_SIZE)
+        ]
+        if not chunks:
+            return []
+
+        workers = min(BATCH_FETCH_WORKERS, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            batches = list(pool.map(self._get_work_items_batch, chunks))
+
+        return [self._parse_work_item(item) for batch in batches for item in batch]
+
+    def _get_work_items_batch(self, ids: list[int]) -> list[dict]:
+        """Fetch one chunk of work items (at most WORK_ITEMS_BATCH_SIZE IDs)."""
+        client = self._get_client()
+        url = (
+            f"https://dev.azure.com/{self.config.organization}/"
+            f"{self.config.project}/_apis/wit/workitemsbatch"
+        )
+
+        response = client.post(
+            url,
+            params={"api-version": self.config.api_version},
+            # "omit" returns null for deleted items instead of failing the batch
+            json={"ids": ids, "errorPolicy": "omit"},
+        )
+
+        if response.status_code == 401:
+            raise AuthenticationError(
+                "Azure DevOps authentication failed. Check your PAT.",
+                provider="Azure DevOps",
+            )
+        elif response.status_code != 200:
+            raise ProviderError(f"Azure DevOps error: {response.text}")
+
+        return [item for item in response.json().get("value", []) if item]
+
     def _get_repository_id(self) -> str:
         """Get the repository ID for the current project."""
         try:
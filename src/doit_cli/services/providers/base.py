@@ -7,6 +7,8 @@ implementations must follow.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
 
 from ...models.provider_models import (
@@ -21,6 +23,7 @@ from ...models.provider_models import (
     PRFilters,
     PullRequest,
 )
+from .exceptions import ResourceNotFoundError
 
 
 class ProviderType(Enum):
@@ -133,6 +136,29 @@ class GitProvider(ABC):
         """
         pass
 
+    def get_issues(self, issue_ids: list[str]) -> list[Issue]:
+        """Get several issues at once, skipping IDs that do not exist.
+
+        The default implementation calls get_issue for each ID; providers
+        with a batch API override it.
+
+        Args:
+            issue_ids: The issue IDs to fetch.
+
+        Returns:
+            The Issue objects that exist, in request order.
+
+        Raises:
+            AuthenticationError: If not authenticated.
+        """
+        issues = []
+        for issue_id in issue_ids:
+            try:
+                issues.append(self.get_issue(issue_id))
+            except ResourceNotFoundError:
+                continue
+        return issues
+
     # -------------------------------------------------------------------------
     # Pull Request Operations
     # -------------------------------------------------------------------------
@@ -228,6 +254,61 @@ class GitProvider(ABC):
         """
         pass
 
+    # -------------------------------------------------------------------------
+    # Streaming Operations
+    # -------------------------------------------------------------------------
+
+    def iter_issues(
+        self, filters: IssueFilters | None = None, prefetch: bool = False
+    ) -> Iterator[Issue]:
+        """Stream every issue matching the given filters, page by page.
+
+        Unlike list_issues, ``filters.limit`` is ignored: all matches are
+        yielded, and pages are only requested as the caller consumes them.
+        Use ``itertools.islice`` to stop early.
+
+        The default implementation yields from list_issues; providers with
+        paginated APIs override it.
+
+        Args:
+            filters: Optional filters to apply (``limit`` is ignored).
+            prefetch: Request the next page while the current one is consumed.
+
+        Yields:
+            Matching Issue objects.
+        """
+        yield from self.list_issues(filters)
+
+    def iter_pull_requests(
+        self, filters: PRFilters | None = None, prefetch: bool = False
+    ) -> Iterator[PullRequest]:
+        """Stream every pull request matching the given filters, page by page.
+
+        See iter_issues for how ``limit`` and ``prefetch`` are handled.
+
+        Args:
+            filters: Optional filters to apply (``limit`` is ignored).
+            prefetch: Request the next page while the current one is consumed.
+
+        Yields:
+            Matching PullRequest objects.
+        """
+        yield from self.list_pull_requests(filters)
+
+    def iter_milestones(
+        self, state: MilestoneState | None = None, prefetch: bool = False
+    ) -> Iterator[Milestone]:
+        """Stream every milestone, page by page.
+
+        Args:
+            state: Optional state filter (open/closed).
+            prefetch: Request the next page while the current one is consumed.
+
+        Yields:
+            Milestone objects.
+        """
+        yield from self.list_milestones(state)
+
     # -------------------------------------------------------------------------
     # Helper Methods (common to all providers)
     # -------------------------------------------------------------------------
@@ -269,6 +350,7 @@ from functools import wraps
 from typing import TypeVar
 
 T = TypeVar("T")
+C = TypeVar("C")
 
 
 def with_retry(
@@ -330,3 +412,49 @@ def with_retry(
         return wrapper
 
     return decorator
+
+
+# =============================================================================
+# Pagination Utilities
+# =============================================================================
+
+
+def iter_pages(
+    fetch_page: Callable[[C], tuple[list[T], C | None]],
+    first: C,
+    prefetch: bool = False,
+) -> Iterator[T]:
+    """Yield items page by page, following the cursor each page returns.
+
+    Args:
+        fetch_page: Fetches the page at a cursor and returns its items and
+            the cursor of the next page (None on the last page).
+        first: Cursor of the first page (page number, offset, URL, ...).
+        prefetch: Fetch the next page in a background thread while the
+            caller consumes the current one.
+
+    Yields:
+        Items of each page, in order. No page is requested before the
+        previous one has been reached (or, with prefetch, started).
+
+    Example:
+        def fetch(page):
+            items = api.get("/issues", params={"page": page})
+            return items, page + 1 if items else None
+
+        for issue in iter_pages(fetch, 1, prefetch=True):
+            ...
+    """
+    if not prefetch:
+        cursor: C | None = first
+        while cursor is not None:
+            items, cursor = fetch_page(cursor)
+            yield from items
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future: Future[tuple[list[T], C | None]] | None = pool.submit(fetch_page, first)
+        while future is not None:
+            items, cursor = future.result()
+            future = pool.submit(fetch_page, cursor) if cursor is not None else None
+            yield from items
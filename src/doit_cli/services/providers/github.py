@@ -8,7 +8,9 @@ from __future__ import annotations
 
 import json
 import subprocess
+from collections.abc import Iterator
 from datetime import datetime
+from typing import Any
 
 from ...models.provider_models import (
     Issue,
@@ -26,7 +28,8 @@ from ...models.provider_models import (
     PRState,
     PullRequest,
 )
-from .base import GitProvider, ProviderType
+from ..git_context import get_git_context
+from .base import GitProvider, ProviderType, iter_pages
 from .exceptions import (
     AuthenticationError,
     NetworkError,
@@ -36,6 +39,18 @@ from .exceptions import (
     ValidationError,
 )
 
+# Items per page requested by the iter_* methods (GitHub's maximum)
+API_PAGE_SIZE = 100
+
+# Issues fetched per GraphQL query by get_issues
+GRAPHQL_BATCH_SIZE = 100
+
+# Issue fields requested through GraphQL (the gh CLI JSON shape, plus nodes)
+_GRAPHQL_ISSUE_FIELDS = (
+    "number title body state url createdAt updatedAt "
+    "labels(first: 100) { nodes { name } } milestone { number title }"
+)
+
 
 class GitHubLabelMapper:
     """Maps labels between unified format and GitHub format."""
@@ -87,6 +102,7 @@ class GitHubProvider(GitProvider):
             timeout: Timeout in seconds for gh CLI commands.
         """
         self.timeout = timeout
+        self._authenticated = False
 
     @property
     def provider_type(self) -> ProviderType:
@@ -233,6 +249,57 @@ class GitHubProvider(GitProvider):
         except json.JSONDecodeError as e:
             raise ProviderError(f"Failed to parse GitHub response: {e}") from e
 
+    def get_issues(self, issue_ids: list[str]) -> list[Issue]:
+        """Get several GitHub issues with one GraphQL query per batch.
+
+        Numbers that do not resolve to an issue (missing, or pull requests)
+        are skipped.
+        """
+        self._ensure_authenticated()
+        numbers = list(dict.fromkeys(int(self._extract_provider_id(i)) for i in issue_ids))
+        owner, name = self._get_repo_slug().split("/", 1)
+
+        issues = []
+        for start in range(0, len(numbers), GRAPHQL_BATCH_SIZE):
+            batch = numbers[start : start + GRAPHQL_BATCH_SIZE]
+            fields = " ".join(
+                f"i{number}: issue(number: {number}) {{ {_GRAPHQL_ISSUE_FIELDS} }}"
+                for number in batch
+            )
+            data = self._graphql(
+                "query($owner: String!, $name: String!) "
+                f"{{ repository(owner: $owner, name: $name) {{ {fields} }} }}",
+                {"owner": owner, "name": name},
+            )
+            repository = data.get("repository") or {}
+            for number in batch:
+                node = repository.get(f"i{number}")
+                if node:
+                    labels = (node.get("labels") or {}).get("nodes", [])
+                    issues.append(self._parse_issue({**node, "labels": labels}))
+        return issues
+
+    def iter_issues(
+        self, filters: IssueFilters | None = None, prefetch: bool = False
+    ) -> Iterator[Issue]:
+        """Stream GitHub issues matching filters from the paginated REST API."""
+        self._ensure_authenticated()
+
+        params: dict[str, Any] = {}
+        if filters:
+            if filters.state:
+                params["state"] = "open" if filters.state == IssueState.OPEN else "closed"
+            if filters.labels:
+                params["labels"] = ",".join(filters.labels)
+            if filters.milestone_id:
+                params["milestone"] = self._extract_provider_id(filters.milestone_id)
+
+        endpoint = f"repos/{self._get_repo_slug()}/issues"
+        for item in self._iter_api(endpoint, params, prefetch):
+            # The issues endpoint also returns pull requests
+            if "pull_request" not in item:
+                yield self._parse_issue(self._rest_issue(item))
+
     def update_issue(self, issue_id: str, updates: IssueUpdateRequest) -> Issue:
         """Update a GitHub issue."""
         self._ensure_authenticated()
@@ -250,6 +317,10 @@ class GitHubProvider(GitProvider):
             for label in updates.labels:
                 cmd.extend(["--add-label", label])
 
+        if updates.milestone_id:
+            # gh matches milestones by title
+            cmd.extend(["--milestone", updates.milestone_id])
+
         try:
             if len(cmd) > 3:  # Only run if there are updates
                 result = subprocess.run(
@@ -409,6 +480,28 @@ class GitHubProvider(GitProvider):
         except json.JSONDecodeError as e:
             raise ProviderError(f"Failed to parse GitHub response: {e}") from e
 
+    def iter_pull_requests(
+        self, filters: PRFilters | None = None, prefetch: bool = False
+    ) -> Iterator[PullRequest]:
+        """Stream GitHub pull requests matching filters from the paginated REST API."""
+        self._ensure_authenticated()
+        repo_slug = self._get_repo_slug()
+
+        params: dict[str, Any] = {}
+        state = filters.state if filters else None
+        if state:
+            # The REST API reports merged pull requests as closed
+            params["state"] = "open" if state == PRState.OPEN else "closed"
+        if filters and filters.source_branch:
+            params["head"] = f"{repo_slug.split('/')[0]}:{filters.source_branch}"
+        if filters and filters.target_branch:
+            params["base"] = filters.target_branch
+
+        for item in self._iter_api(f"repos/{repo_slug}/pulls", params, prefetch):
+            pull_request = self._parse_pull_request(self._rest_pull_request(item))
+            if state is None or pull_request.state == state:
+                yield pull_request
+
     # -------------------------------------------------------------------------
     # Milestone Operations
     # -------------------------------------------------------------------------
@@ -485,34 +578,22 @@ class GitHubProvider(GitProvider):
             raise ProviderError(f"Failed to parse GitHub response: {e}") from e
 
     def list_milestones(self, state: MilestoneState | None = None) -> list[Milestone]:
-        """List GitHub milestones."""
-        self._ensure_authenticated()
-        repo_slug = self._get_repo_slug()
-
-        try:
-            result = subprocess.run(
-                ["gh", "api", f"repos/{repo_slug}/milestones"],
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-            )
-
-            if result.returncode != 0:
-                self._handle_error(result.stderr)
-
-            data = json.loads(result.stdout)
+        """List GitHub milestones (all pages; every state unless filtered)."""
+        return list(self.iter_milestones(state))
 
-            # Filter by state if requested
-            if state:
-                state_str = "open" if state == MilestoneState.OPEN else "closed"
-                data = [m for m in data if m.get("state") == state_str]
+    def iter_milestones(
+        self, state: MilestoneState | None = None, prefetch: bool = False
+    ) -> Iterator[Milestone]:
+        """Stream GitHub milestones from the paginated REST API."""
+        self._ensure_authenticated()
 
-            return [self._parse_milestone(item) for item in data]
+        params: dict[str, Any] = {"state": "all"}
+        if state:
+            params["state"] = "open" if state == MilestoneState.OPEN else "closed"
 
-        except subprocess.TimeoutExpired:
-            raise NetworkError("GitHub CLI timeout", is_timeout=True) from None
-        except json.JSONDecodeError as e:
-            raise ProviderError(f"Failed to parse GitHub response: {e}") from e
+        endpoint = f"repos/{self._get_repo_slug()}/milestones"
+        for item in self._iter_api(endpoint, params, prefetch):
+            yield self._parse_milestone(item)
 
     # -------------------------------------------------------------------------
     # Issue Comments and Closing
@@ -587,7 +668,6 @@ class GitHubProvider(GitProvider):
             Tuple of (local_exists, remote_exists).
         """
         local_exists = False
-        remote_exists = False
 
         try:
             local = subprocess.run(
@@ -600,6 +680,10 @@ class GitHubProvider(GitProvider):
         except (subprocess.SubprocessError, FileNotFoundError):
             pass
 
+        return local_exists, self._remote_branch_exists(branch_name)
+
+    def _remote_branch_exists(self, branch_name: str) -> bool:
+        """Check the branch on origin with `git ls-remote`."""
         try:
             remote = subprocess.run(
                 ["git", "ls-remote", "--heads", "origin", branch_name],
@@ -607,11 +691,9 @@ class GitHubProvider(GitProvider):
                 text=True,
                 timeout=self.timeout,
             )
-            remote_exists = bool(remote.returncode == 0 and remote.stdout.strip())
+            return bool(remote.returncode == 0 and remote.stdout.strip())
         except (subprocess.SubprocessError, FileNotFoundError):
-            pass
-
-        return local_exists, remote_exists
+            return False
 
     def create_branch(self, branch_name: str, from_branch: str = "main") -> bool:
         """Create a new local branch from `from_branch` and switch to it.
@@ -639,7 +721,9 @@ class GitHubProvider(GitProvider):
     # -------------------------------------------------------------------------
 
     def _ensure_authenticated(self) -> None:
-        """Verify gh CLI is available and authenticated."""
+        """Verify gh CLI is available and authenticated (once per provider)."""
+        if self._authenticated:
+            return
         try:
             result = subprocess.run(
                 ["gh", "auth", "status"],
@@ -652,6 +736,7 @@ class GitHubProvider(GitProvider):
                     "GitHub CLI not authenticated. Run: gh auth login",
                     provider="GitHub",
                 )
+            self._authenticated = True
         except FileNotFoundError:
             raise AuthenticationError(
                 "GitHub CLI (gh) not installed. Install from: https://cli.github.com",
@@ -673,33 +758,110 @@ class GitHubProvider(GitProvider):
         else:
             raise ProviderError(f"GitHub error: {stderr}")
 
-    def _get_repo_slug(self) -> str:
-        """Get the repository slug (owner/repo) from git remote."""
+    def _graphql(self, query: str, variables: dict[str, str]) -> dict[str, Any]:
+        """Run a GraphQL query via ``gh api graphql`` and return its data.
+
+        Partial results are returned when some fields failed to resolve.
+        """
+        cmd = ["gh", "api", "graphql", "-f", f"query={query}"]
+        for key, value in variables.items():
+            cmd.extend(["-f", f"{key}={value}"])
+
         try:
             result = subprocess.run(
-                ["git", "remote", "get-url", "origin"],
+                cmd,
                 capture_output=True,
                 text=True,
-                timeout=5,
+                timeout=self.timeout,
             )
+        except subprocess.TimeoutExpired:
+            raise NetworkError("GitHub CLI timeout", is_timeout=True) from None
 
-            if result.returncode != 0:
-                raise ProviderError("Not in a git repository")
+        try:
+            data = json.loads(result.stdout).get("data") if result.stdout.strip() else None
+        except json.JSONDecodeError as e:
+            raise ProviderError(f"Failed to parse GitHub response: {e}") from e
+        if data is None:
+            self._handle_error(result.stderr)
+        return data or {}
 
-            remote_url = result.stdout.strip()
+    def _iter_api(
+        self, endpoint: str, params: dict[str, Any], prefetch: bool = False
+    ) -> Iterator[dict]:
+        """Stream items of a paginated REST list endpoint via ``gh api``.
 
-            # Parse GitHub URL
-            if remote_url.startswith("git@github.com:"):
-                slug = remote_url.replace("git@github.com:", "").replace(".git", "")
-            elif "github.com/" in remote_url:
-                slug = remote_url.split("github.com/")[1].replace(".git", "")
-            else:
-                raise ProviderError("Not a GitHub repository")
+        Pages of API_PAGE_SIZE items are requested one ``gh api`` call at a
+        time; a short page ends the listing.
+        """
 
-            return slug
+        def fetch(page: int) -> tuple[list[dict], int | None]:
+            cmd = ["gh", "api", "--method", "GET", endpoint]
+            for key, value in {**params, "per_page": API_PAGE_SIZE, "page": page}.items():
+                cmd.extend(["-f", f"{key}={value}"])
 
-        except subprocess.TimeoutExpired:
-            raise NetworkError("Git command timeout", is_timeout=True) from None
+            try:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=self.timeout,
+                )
+
+                if result.returncode != 0:
+                    self._handle_error(result.stderr)
+
+                items = json.loads(result.stdout)
+
+            except subprocess.TimeoutExpired:
+                raise NetworkError("GitHub CLI timeout", is_timeout=True) from None
+            except json.JSONDecodeError as e:
+                raise ProviderError(f"Failed to parse GitHub response: {e}") from e
+
+            return items, page + 1 if len(items) == API_PAGE_SIZE else None
+
+        return iter_pages(fetch, 1, prefetch)
+
+    @staticmethod
+    def _rest_issue(data: dict) -> dict:
+        """Convert a REST API issue to the gh CLI JSON shape _parse_issue reads."""
+        return {
+            "number": data["number"],
+            "title": data["title"],
+            "body": data.get("body"),
+            "state": data.get("state", "open"),
+            "url": data["html_url"],
+            "createdAt": data.get("created_at", ""),
+            "updatedAt": data.get("updated_at", ""),
+            "labels": data.get("labels", []),
+            "milestone": data.get("milestone"),
+        }
+
+    @staticmethod
+    def _rest_pull_request(data: dict) -> dict:
+        """Convert a REST API pull request to the gh CLI JSON shape."""
+        return {
+            "number": data["number"],
+            "title": data["title"],
+            "body": data.get("body"),
+            "state": "merged" if data.get("merged_at") else data.get("state", "open"),
+            "url": data["html_url"],
+            "createdAt": data.get("created_at", ""),
+            "mergedAt": data.get("merged_at"),
+            "headRefName": data.get("head", {}).get("ref", ""),
+            "baseRefName": data.get("base", {}).get("ref", ""),
+            "labels": data.get("labels", []),
+        }
+
+    def _get_repo_slug(self, host: str = "github.com") -> str:
+        """Get the repository slug (owner/repo) from the shared git context."""
+        context = get_git_context()
+        if context is None or context.remote_url() is None:
+            raise ProviderError("Not in a git repository")
+
+        slug = context.repo_slug(host)
+        if slug is None:
+            raise ProviderError(f"Not a {'GitHub' if host == 'github.com' else host} repository")
+        return slug
 
     def _parse_issue(self, data: dict) -> Issue:
         """Parse gh CLI JSON output into Issue model."""
@@ -0,0 +1,625 @@
+"""GitHub provider implementation using the REST API over HTTP.
+
+This module provides a GitProvider for GitHub that talks to the REST API
+directly through a pooled httpx client instead of spawning the gh CLI for
+every operation. It is selected with ``backend: http`` in the GitHub
+section of ``.doit/config/provider.yaml``; the gh-based GitHubProvider
+remains the default and the fallback when no token is available.
+
+Features:
+    - Token authentication (GH_TOKEN/GITHUB_TOKEN or the gh CLI's stored token)
+    - Issue, pull request and milestone management over one connection pool
+    - Link-header pagination
+    - GitHub Enterprise Server support
+"""
+
+from __future__ import annotations
+
+import ssl
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import replace
+from typing import Any
+
+import httpx
+
+from ...models.provider_models import (
+    Issue,
+    IssueCreateRequest,
+    IssueFilters,
+    IssueState,
+    IssueUpdateRequest,
+    Milestone,
+    MilestoneCreateRequest,
+    MilestoneState,
+    PRCreateRequest,
+    PRFilters,
+    PRState,
+    PullRequest,
+)
+from ...utils.github_auth import get_github_token
+from .base import iter_pages
+from .exceptions import (
+    AuthenticationError,
+    NetworkError,
+    ProviderError,
+    RateLimitError,
+    ResourceNotFoundError,
+    ValidationError,
+)
+from .github import API_PAGE_SIZE, GitHubLabelMapper, GitHubProvider
+
+# REST API version sent with every request
+API_VERSION = "2022-11-28"
+
+
+# =============================================================================
+# GitHubAPIClient - HTTP client for GitHub REST API
+# =============================================================================
+
+
+class GitHubAPIClient:
+    """HTTP client for the GitHub REST API.
+
+    Handles authentication, error responses, and pagination. One pooled
+    httpx client is reused for every request, so connections and TLS
+    sessions are kept alive between calls.
+
+    Args:
+        token: API token (Bearer authentication).
+        host: GitHub Enterprise host, or None for github.com.
+        timeout: Request timeout in seconds.
+    """
+
+    def __init__(self, token: str, host: str | None = None, timeout: int = 30):
+        self.token = token
+        self.host = host or "github.com"
+        self.base_url = f"https://{host}/api/v3" if host else "https://api.github.com"
+        self.timeout = timeout
+        self._client: httpx.Client | None = None
+
+    @property
+    def client(self) -> httpx.Client:
+        """Lazy-initialize and return the HTTP client."""
+        if self._client is None:
+            self._client = httpx.Client(
+                base_url=self.base_url,
+                headers={
+                    "Authorization": f"Bearer {self.token}",
+                    "Accept": "application/vnd.github+json",
+                    "X-GitHub-Api-Version": API_VERSION,
+                },
+                timeout=self.timeout,
+            )
+        return self._client
+
+    def close(self) -> None:
+        """Close the HTTP client."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _request(self, method: str, endpoint: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, converting transport failures to NetworkError."""
+        try:
+            return self.client.request(method, endpoint, **kwargs)
+        except ssl.SSLError as e:
+            raise NetworkError(
+                f"SSL certificate error connecting to {self.host}. "
+                "For GitHub Enterprise, ensure your certificate is valid.",
+                cause=e,
+            ) from e
+        except httpx.TimeoutException as e:
+            raise NetworkError(
+                "Request timed out. Check your network connection.",
+                cause=e,
+                is_timeout=True,
+            ) from e
+        except httpx.TransportError as e:
+            raise NetworkError(
+                f"Could not connect to {self.host}. Check your network connection.",
+                cause=e,
+            ) from e
+
+    def _handle_response(self, response: httpx.Response) -> Any:
+        """Handle HTTP response and raise appropriate exceptions.
+
+        Args:
+            response: The httpx Response object.
+
+        Returns:
+            Parsed JSON response (empty dict for 204 No Content).
+
+        Raises:
+            AuthenticationError: For 401 responses and permission 403s.
+            RateLimitError: For 429 responses and rate limit 403s.
+            ResourceNotFoundError: For 404 responses.
+            ValidationError: For 422 responses.
+            NetworkError: For 5xx responses.
+            ProviderError: For other error responses.
+        """
+        if response.status_code == 401:
+            raise AuthenticationError(
+                "GitHub authentication failed. Check GH_TOKEN or run: gh auth login",
+                provider="GitHub",
+            )
+
+        if response.status_code == 429 or (
+            response.status_code == 403 and response.headers.get("X-RateLimit-Remaining") == "0"
+        ):
+            raise RateLimitError(
+                "GitHub API rate limit exceeded.",
+                retry_after=self._retry_after(response),
+            )
+
+        if response.status_code == 403:
+            raise AuthenticationError(
+                f"Insufficient permissions for this operation: {self._message(response)}",
+                provider="GitHub",
+            )
+
+        if response.status_code == 404:
+            raise ResourceNotFoundError("resource", "unknown")
+
+        if response.status_code == 422:
+            raise ValidationError(f"GitHub validation error: {self._message(response)}")
+
+        if response.status_code >= 500:
+            raise NetworkError(f"GitHub server error ({response.status_code}). Try again later.")
+
+        if not response.is_success:
+            raise ProviderError(f"GitHub API error: {self._message(response)}")
+
+        if response.status_code == 204 or not response.content:
+            return {}
+
+        return response.json()
+
+    @staticmethod
+    def _message(response: httpx.Response) -> str:
+        """Extract the error message from a GitHub error response."""
+        try:
+            data = response.json()
+        except ValueError:
+            return response.text or f"Error {response.status_code}"
+        message = str(data.get("message", f"Error {response.status_code}"))
+        errors = data.get("errors") or []
+        details = [e.get("message") or e.get("code") for e in errors if isinstance(e, dict)]
+        if details:
+            message = f"{message} ({', '.join(str(d) for d in details if d)})"
+        return message
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> int:
+        """Seconds to wait before retrying a rate-limited request."""
+        if response.headers.get("Retry-After"):
+            return int(response.headers["Retry-After"])
+        reset = response.headers.get("X-RateLimit-Reset")
+        if reset:
+            return max(int(reset) - int(time.time()), 0)
+        return 60
+
+    def get(self, endpoint: str, params: dict[str, Any] | None = None) -> Any:
+        """Make a GET request to the GitHub API.
+
+        Args:
+            endpoint: API endpoint path.
+            params: Optional query parameters.
+
+        Returns:
+            Parsed JSON response.
+        """
+        return self._handle_response(self._request("GET", endpoint, params=params))
+
+    def post(self, endpoint: str, data: dict[str, Any] | None = None) -> Any:
+        """Make a POST request to the GitHub API.
+
+        Args:
+            endpoint: API endpoint path.
+            data: Request body data.
+
+        Returns:
+            Parsed JSON response.
+        """
+        return self._handle_response(self._request("POST", endpoint, json=data or {}))
+
+    def patch(self, endpoint: str, data: dict[str, Any] | None = None) -> Any:
+        """Make a PATCH request to the GitHub API.
+
+        Args:
+            endpoint: API endpoint path.
+            data: Request body data.
+
+        Returns:
+            Parsed JSON response.
+        """
+        return self._handle_response(self._request("PATCH", endpoint, json=data or {}))
+
+    def graphql(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Run a GraphQL query against the same host and connection pool.
+
+        Args:
+            query: GraphQL query document.
+            variables: Optional query variables.
+
+        Returns:
+            The ``data`` member of the response; fields that failed to
+            resolve are None.
+
+        Raises:
+            ProviderError: If the response carries errors and no data.
+        """
+        result = self.post("graphql", {"query": query, "variables": variables or {}})
+        if result.get("errors") and not result.get("data"):
+            messages = ", ".join(str(e.get("message")) for e in result["errors"])
+            raise ProviderError(f"GitHub GraphQL error: {messages}")
+        return result.get("data") or {}
+
+    def iter_list(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream a list response page by page, following ``Link: rel="next"``.
+
+        Args:
+            endpoint: API endpoint path.
+            params: Optional query parameters.
+            prefetch: Request the next page while the current one is consumed.
+
+        Yields:
+            Parsed JSON objects.
+        """
+        first: tuple[str, dict[str, Any] | None] = (
+            endpoint,
+            {"per_page": API_PAGE_SIZE, **(params or {})},
+        )
+        return iter_pages(self._get_page, first, prefetch)
+
+    def _get_page(
+        self, request: tuple[str, dict[str, Any] | None]
+    ) -> tuple[list[dict[str, Any]], tuple[str, dict[str, Any] | None] | None]:
+        """Fetch one page and return its items with the request for the next page."""
+        endpoint, params = request
+        response = self._request("GET", endpoint, params=params)
+        items = self._handle_response(response) or []
+        next_url = response.links.get("next", {}).get("url")
+        # The next URL already carries every query parameter
+        return items, (next_url, None) if next_url else None
+
+
+# =============================================================================
+# GitHubHTTPProvider - GitProvider over the REST API
+# =============================================================================
+
+
+class GitHubHTTPProvider(GitHubProvider):
+    """GitHub implementation of the GitProvider interface over HTTP.
+
+    Every operation is a REST call on a shared GitHubAPIClient; results are
+    converted to the gh CLI JSON shape so GitHubProvider's parsers apply.
+    Local branch creation and checks still use git.
+
+    Usage:
+        provider = GitHubHTTPProvider()
+        if provider.is_available:
+            issue = provider.get_issue("42")
+
+    Args:
+        timeout: Timeout in seconds for API requests.
+        host: GitHub Enterprise host, or None for github.com.
+        token: API token (defaults to get_github_token()).
+    """
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        host: str | None = None,
+        token: str | None = None,
+    ):
+        super().__init__(timeout=timeout)
+        self.host = host
+        self._token = token
+        self._client: GitHubAPIClient | None = None
+        self._repo_slug: str | None = None
+        self._milestone_numbers: dict[str, int] = {}
+        self._milestone_lock = threading.Lock()
+
+    @property
+    def client(self) -> GitHubAPIClient:
+        """Lazy-initialize and return the API client."""
+        if self._client is None:
+            self._ensure_authenticated()
+            self._client = GitHubAPIClient(
+                token=self._token or "", host=self.host, timeout=self.timeout
+            )
+        return self._client
+
+    @property
+    def is_available(self) -> bool:
+        """Check if a token is available and accepted by the API."""
+        try:
+            self.client.get("user")
+            return True
+        except ProviderError:
+            return False
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        if self._client is not None:
+            self._client.close()
+
+    # -------------------------------------------------------------------------
+    # Issue Operations
+    # -------------------------------------------------------------------------
+
+    def create_issue(self, request: IssueCreateRequest) -> Issue:
+        """Create a new GitHub issue."""
+        labels = list(request.labels)
+        labels.extend(GitHubLabelMapper.type_to_labels(request.type))
+
+        data: dict[str, Any] = {"title": request.title}
+        if request.body:
+            data["body"] = request.body
+        if labels:
+            data["labels"] = labels
+        if request.milestone_id:
+            data["milestone"] = self._milestone_number(request.milestone_id)
+
+        result = self.client.post(self._repo_endpoint("issues"), data)
+        return self._parse_issue(self._rest_issue(result))
+
+    def get_issue(self, issue_id: str) -> Issue:
+        """Get a GitHub issue by number."""
+        provider_id = self._extract_provider_id(issue_id)
+        try:
+            result = self.client.get(self._repo_endpoint(f"issues/{provider_id}"))
+        except ResourceNotFoundError:
+            raise ResourceNotFoundError("Issue", provider_id) from None
+        return self._parse_issue(self._rest_issue(result))
+
+    def list_issues(self, filters: IssueFilters | None = None) -> list[Issue]:
+        """List GitHub issues matching filters (open issues by default)."""
+        filters = filters or IssueFilters()
+        if filters.state is None:
+            filters = replace(filters, state=IssueState.OPEN)
+        issues: list[Issue] = []
+        for issue in self.iter_issues(filters):
+            issues.append(issue)
+            if filters.limit and len(issues) >= filters.limit:
+                break
+        return issues
+
+    def iter_issues(
+        self, filters: IssueFilters | None = None, prefetch: bool = False
+    ) -> Iterator[Issue]:
+        """Stream GitHub issues matching filters from the paginated REST API."""
+        params: dict[str, Any] = {}
+        if filters:
+            if filters.state:
+                params["state"] = "open" if filters.state == IssueState.OPEN else "closed"
+            if filters.labels:
+                params["labels"] = ",".join(filters.labels)
+            if filters.milestone_id:
+                params["milestone"] = self._extract_provider_id(filters.milestone_id)
+
+        for item in self.client.iter_list(self._repo_endpoint("issues"), params, prefetch):
+            # The issues endpoint also returns pull requests
+            if "pull_request" not in item:
+                yield self._parse_issue(self._rest_issue(item))
+
+    def update_issue(self, issue_id: str, updates: IssueUpdateRequest) -> Issue:
+        """Update a GitHub issue; labels are added to the existing ones."""
+        provider_id = self._extract_provider_id(issue_id)
+
+        data: dict[str, Any] = {}
+        if updates.title:
+            data["title"] = updates.title
+        if updates.body:
+            data["body"] = updates.body
+        if updates.state:
+            data["state"] = "closed" if updates.state == IssueState.CLOSED else "open"
+        if updates.milestone_id:
+            data["milestone"] = self._milestone_number(updates.milestone_id)
+
+        if updates.labels:
+            self.client.post(
+                self._repo_endpoint(f"issues/{provider_id}/labels"),
+                {"labels": updates.labels},
+            )
+        if not data:
+            return self.get_issue(provider_id)
+
+        result = self.client.patch(self._repo_endpoint(f"issues/{provider_id}"), data)
+        return self._parse_issue(self._rest_issue(result))
+
+    # -------------------------------------------------------------------------
+    # Pull Request Operations
+    # -------------------------------------------------------------------------
+
+    def create_pull_request(self, request: PRCreateRequest) -> PullRequest:
+        """Create a new GitHub pull request."""
+        data: dict[str, Any] = {
+            "title": request.title,
+            "head": request.source_branch,
+            "base": request.target_branch,
+        }
+        if request.body:
+            data["body"] = request.body
+
+        result = self.client.post(self._repo_endpoint("pulls"), data)
+        if request.labels:
+            self.client.post(
+                self._repo_endpoint(f"issues/{result['number']}/labels"),
+                {"labels": request.labels},
+            )
+            result["labels"] = [{"name": label} for label in request.labels]
+        return self._parse_pull_request(self._rest_pull_request(result))
+
+    def get_pull_request(self, pr_id: str) -> PullRequest:
+        """Get a GitHub pull request by number."""
+        provider_id = self._extract_provider_id(pr_id)
+        try:
+            result = self.client.get(self._repo_endpoint(f"pulls/{provider_id}"))
+        except ResourceNotFoundError:
+            raise ResourceNotFoundError("Pull Request", provider_id) from None
+        return self._parse_pull_request(self._rest_pull_request(result))
+
+    def list_pull_requests(self, filters: PRFilters | None = None) -> list[PullRequest]:
+        """List GitHub pull requests matching filters (open by default)."""
+        filters = filters or PRFilters()
+        if filters.state is None:
+            filters = replace(filters, state=PRState.OPEN)
+        pull_requests: list[PullRequest] = []
+        for pull_request in self.iter_pull_requests(filters):
+            pull_requests.append(pull_request)
+            if filters.limit and len(pull_requests) >= filters.limit:
+                break
+        return pull_requests
+
+    def iter_pull_requests(
+        self, filters: PRFilters | None = None, prefetch: bool = False
+    ) -> Iterator[PullRequest]:
+        """Stream GitHub pull requests matching filters from the paginated REST API."""
+        repo_slug = self._get_repo_slug()
+
+        params: dict[str, Any] = {}
+        state = filters.state if filters else None
+        if state:
+            # The REST API reports merged pull requests as closed
+            params["state"] = "open" if state == PRState.OPEN else "closed"
+        if filters and filters.source_branch:
+            params["head"] = f"{repo_slug.split('/')[0]}:{filters.source_branch}"
+        if filters and filters.target_branch:
+            params["base"] = filters.target_branch
+
+        for item in self.client.iter_list(f"repos/{repo_slug}/pulls", params, prefetch):
+            pull_request = self._parse_pull_request(self._rest_pull_request(item))
+            if state is None or pull_request.state == state:
+                yield pull_request
+
+    # -------------------------------------------------------------------------
+    # Milestone Operations
+    # -------------------------------------------------------------------------
+
+    def create_milestone(self, request: MilestoneCreateRequest) -> Milestone:
+        """Create a new GitHub milestone."""
+        data: dict[str, Any] = {"title": request.title, "state": "open"}
+        if request.description:
+            data["description"] = request.description
+        if request.due_date:
+            data["due_on"] = request.due_date.isoformat()
+
+        try:
+            result = self.client.post(self._repo_endpoint("milestones"), data)
+        except ValidationError:
+            raise ValidationError(f"Milestone '{request.title}' already exists") from None
+        return self._parse_milestone(result)
+
+    def get_milestone(self, milestone_id: str) -> Milestone:
+        """Get a GitHub milestone by number."""
+        provider_id = self._extract_provider_id(milestone_id)
+        try:
+            result = self.client.get(self._repo_endpoint(f"milestones/{provider_id}"))
+        except ResourceNotFoundError:
+            raise ResourceNotFoundError("Milestone", provider_id) from None
+        return self._parse_milestone(result)
+
+    def iter_milestones(
+        self, state: MilestoneState | None = None, prefetch: bool = False
+    ) -> Iterator[Milestone]:
+        """Stream GitHub milestones from the paginated REST API."""
+        params: dict[str, Any] = {"state": "all"}
+        if state:
+            params["state"] = "open" if state == MilestoneState.OPEN else "closed"
+
+        for item in self.client.iter_list(self._repo_endpoint("milestones"), params, prefetch):
+            yield self._parse_milestone(item)
+
+    # -------------------------------------------------------------------------
+    # Issue Comments and Closing
+    # -------------------------------------------------------------------------
+
+    def add_issue_comment(self, issue_id: str, comment: str) -> bool:
+        """Post a comment on an issue.
+
+        Returns:
+            True if the comment posted, False if the issue was not found.
+            Raises on auth/network failure.
+        """
+        provider_id = self._extract_provider_id(issue_id)
+        try:
+            self.client.post(
+                self._repo_endpoint(f"issues/{provider_id}/comments"), {"body": comment}
+            )
+        except (ResourceNotFoundError, ValidationError):
+            return False
+        return True
+
+    def close_issue(self, issue_id: str, comment: str | None = None) -> bool:
+        """Close an issue, optionally posting a closing comment first.
+
+        Returns:
+            True if the close succeeded. Raises on auth/network failure.
+        """
+        provider_id = self._extract_provider_id(issue_id)
+        if comment and not self.add_issue_comment(provider_id, comment):
+            return False
+        try:
+            self.client.patch(self._repo_endpoint(f"issues/{provider_id}"), {"state": "closed"})
+        except (ResourceNotFoundError, ValidationError):
+            return False
+        return True
+
+    # -------------------------------------------------------------------------
+    # Helper Methods
+    # -------------------------------------------------------------------------
+
+    def _ensure_authenticated(self) -> None:
+        """Resolve the API token, raising if none is available."""
+        if not self._token:
+            self._token = get_github_token(self.host)
+        if not self._token:
+            raise AuthenticationError(
+                "No GitHub token available. Set GH_TOKEN or run: gh auth login",
+                provider="GitHub",
+            )
+
+    def _graphql(self, query: str, variables: dict[str, str]) -> dict[str, Any]:
+        """Run a GraphQL query over the pooled client."""
+        return self.client.graphql(query, variables)
+
+    def _remote_branch_exists(self, branch_name: str) -> bool:
+        """Check the branch on GitHub through the API."""
+        try:
+            self.client.get(self._repo_endpoint(f"branches/{branch_name}"))
+        except ProviderError:
+            return False
+        return True
+
+    def _repo_endpoint(self, path: str) -> str:
+        """Build a repository-scoped endpoint path."""
+        return f"repos/{self._get_repo_slug()}/{path}"
+
+    def _milestone_number(self, milestone_id: str) -> int:
+        """Resolve a milestone ID or title to its number (titles are cached)."""
+        provider_id = self._extract_provider_id(milestone_id)
+        if provider_id.isdigit():
+            return int(provider_id)
+        with self._milestone_lock:
+            if provider_id not in self._milestone_numbers:
+                self._milestone_numbers.update(
+                    (milestone.title, int(milestone.provider_id))
+                    for milestone in self.iter_milestones()
+                )
+        if provider_id not in self._milestone_numbers:
+            raise ResourceNotFoundError("Milestone", provider_id)
+        return self._milestone_numbers[provider_id]
+
+    def _get_repo_slug(self, host: str | None = None) -> str:
+        """Get the repository slug (owner/repo) of the configured host."""
+        if self._repo_slug is None:
+            self._repo_slug = super()._get_repo_slug(host or self.host or "github.com")
+        return self._repo_slug
@@ -18,7 +18,9 @@ from __future__ import annotations
 
 import os
 import ssl
+from collections.abc import Iterator
 from datetime import datetime
+from itertools import islice
 from typing import Any
 from urllib.parse import quote
 
@@ -40,7 +42,7 @@ from ...models.provider_models import (
     PRState,
     PullRequest,
 )
-from .base import GitProvider, ProviderType, with_retry
+from .base import GitProvider, ProviderType, iter_pages, with_retry
 from .exceptions import (
     AuthenticationError,
     NetworkError,
@@ -319,16 +321,66 @@ class GitLabAPIClient:
         response = self.client.get(endpoint, params=params)
         return self._handle_response(response)
 
-    def get_list(self, endpoint: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
-        """Make a GET request expecting a list response.
+    def get_list(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Make GET requests expecting a list response, following pagination.
 
         Args:
             endpoint: API endpoint path.
             params: Optional query parameters.
+            limit: Stop after this many items (default: all pages).
 
         Returns:
             List of parsed JSON objects.
         """
+        return list(islice(self.iter_list(endpoint, params), limit))
+
+    def iter_list(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream a list response page by page.
+
+        The next page comes from the ``X-Next-Page`` header (offset
+        pagination) or the ``Link: rel="next"`` URL (keyset pagination).
+
+        Args:
+            endpoint: API endpoint path.
+            params: Optional query parameters.
+            prefetch: Request the next page while the current one is consumed.
+
+        Yields:
+            Parsed JSON objects.
+        """
+        first: tuple[str, dict[str, Any] | None] = (endpoint, dict(params or {}))
+        return iter_pages(self._get_page, first, prefetch)
+
+    def _get_page(
+        self, request: tuple[str, dict[str, Any] | None]
+    ) -> tuple[list[dict[str, Any]], tuple[str, dict[str, Any] | None] | None]:
+        """Fetch one page and return its items with the request for the next page."""
+        endpoint, params = request
+        response = self._get_list_response(endpoint, params)
+
+        next_page = response.headers.get("X-Next-Page")
+        if next_page:
+            return response.json(), (endpoint, {**(params or {}), "page": next_page})
+        next_url = response.links.get("next", {}).get("url")
+        if next_url:
+            # Keyset pagination: the URL already carries every parameter
+            return response.json(), (next_url, None)
+        return response.json(), None
+
+    def _get_list_response(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> httpx.Response:
+        """Make a GET request for one page of a list, raising on errors."""
         response = self.client.get(endpoint, params=params)
         if response.status_code == 401:
             raise AuthenticationError(
@@ -342,7 +394,7 @@ class GitLabAPIClient:
             )
         if not response.is_success:
             self._handle_response(response)
-        return response.json()
+        return response
 
     def post(self, endpoint: str, data: dict[str, Any] | None = None) -> dict[str, Any]:
         """Make a POST request to the GitLab API.
@@ -735,6 +787,33 @@ class GitLabProvider(GitProvider):
         Returns:
             List of matching Issue objects.
         """
+        params = self._issue_params(filters)
+        limit = None
+        if filters and filters.limit:
+            params["per_page"] = min(filters.limit, 100)
+            limit = filters.limit
+
+        data = self._api.get_list(f"/projects/{self._encoded_path}/issues", params, limit=limit)
+        return [self._parse_issue(item) for item in data]
+
+    def iter_issues(
+        self, filters: IssueFilters | None = None, prefetch: bool = False
+    ) -> Iterator[Issue]:
+        """Stream every issue matching the given filters, page by page.
+
+        Args:
+            filters: Optional filters to apply (``limit`` is ignored).
+            prefetch: Request the next page while the current one is consumed.
+
+        Yields:
+            Matching Issue objects.
+        """
+        endpoint = f"/projects/{self._encoded_path}/issues"
+        for item in self._api.iter_list(endpoint, self._issue_params(filters), prefetch):
+            yield self._parse_issue(item)
+
+    def _issue_params(self, filters: IssueFilters | None) -> dict[str, Any]:
+        """Build query parameters for listing issues."""
         params: dict[str, Any] = {"per_page": 100}
 
         if filters:
@@ -749,11 +828,7 @@ class GitLabProvider(GitProvider):
             if filters.milestone_id:
                 params["milestone_id"] = self._extract_provider_id(filters.milestone_id)
 
-            if filters.limit:
-                params["per_page"] = min(filters.limit, 100)
-
-        data = self._api.get_list(f"/projects/{self._encoded_path}/issues", params)
-        return [self._parse_issue(item) for item in data]
+        return params
 
     @with_retry(max_retries=3)
     def update_issue(self, issue_id: str, updates: IssueUpdateRequest) -> Issue:
@@ -859,6 +934,35 @@ class GitLabProvider(GitProvider):
         Returns:
             List of matching PullRequest objects.
         """
+        params = self._pull_request_params(filters)
+        limit = None
+        if filters and filters.limit:
+            params["per_page"] = min(filters.limit, 100)
+            limit = filters.limit
+
+        data = self._api.get_list(
+            f"/projects/{self._encoded_path}/merge_requests", params, limit=limit
+        )
+        return [self._parse_pull_request(item) for item in data]
+
+    def iter_pull_requests(
+        self, filters: PRFilters | None = None, prefetch: bool = False
+    ) -> Iterator[PullRequest]:
+        """Stream every merge request matching the given filters, page by page.
+
+        Args:
+            filters: Optional filters to apply (``limit`` is ignored).
+            prefetch: Request the next page while the current one is consumed.
+
+        Yields:
+            Matching PullRequest objects.
+        """
+        endpoint = f"/projects/{self._encoded_path}/merge_requests"
+        for item in self._api.iter_list(endpoint, self._pull_request_params(filters), prefetch):
+            yield self._parse_pull_request(item)
+
+    def _pull_request_params(self, filters: PRFilters | None) -> dict[str, Any]:
+        """Build query parameters for listing merge requests."""
         params: dict[str, Any] = {"per_page": 100}
 
         if filters:
@@ -876,11 +980,7 @@ class GitLabProvider(GitProvider):
             if filters.target_branch:
                 params["target_branch"] = filters.target_branch
 
-            if filters.limit:
-                params["per_page"] = min(filters.limit, 100)
-
-        data = self._api.get_list(f"/projects/{self._encoded_path}/merge_requests", params)
-        return [self._parse_pull_request(item) for item in data]
+        return params
 
     # -------------------------------------------------------------------------
     # Milestone Operations
@@ -943,13 +1043,35 @@ class GitLabProvider(GitProvider):
         Returns:
             List of Milestone objects.
         """
+        data = self._api.get_list(
+            f"/projects/{self._encoded_path}/milestones", self._milestone_params(state)
+        )
+        return [self._parse_milestone(item) for item in data]
+
+    def iter_milestones(
+        self, state: MilestoneState | None = None, prefetch: bool = False
+    ) -> Iterator[Milestone]:
+        """Stream every milestone, page by page.
+
+        Args:
+            state: Optional state filter (open/closed).
+            prefetch: Request the next page while the current one is consumed.
+
+        Yields:
+            Milestone objects.
+        """
+        endpoint = f"/projects/{self._encoded_path}/milestones"
+        for item in self._api.iter_list(endpoint, self._milestone_params(state), prefetch):
+            yield self._parse_milestone(item)
+
+    def _milestone_params(self, state: MilestoneState | None) -> dict[str, Any]:
+        """Build query parameters for listing milestones."""
         params: dict[str, Any] = {"per_page": 100}
 
         if state:
             params["state"] = "active" if state == MilestoneState.OPEN else "closed"
 
-        data = self._api.get_list(f"/projects/{self._encoded_path}/milestones", params)
-        return [self._parse_milestone(item) for item in data]
+        return params
 
     def update_milestone(
         self,
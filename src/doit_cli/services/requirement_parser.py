@@ -4,8 +4,13 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ..models.crossref_models import Requirement
+from .spec_document import SpecDocument
+
+if TYPE_CHECKING:
+    from .spec_cache import SpecCache
 
 
 class RequirementParser:
@@ -22,13 +27,15 @@ class RequirementParser:
         re.MULTILINE,
     )
 
-    def __init__(self, spec_path: Path | None = None) -> None:
+    def __init__(self, spec_path: Path | None = None, cache: SpecCache | None = None) -> None:
         """Initialize parser with optional spec file path.
 
         Args:
             spec_path: Path to spec.md file. Can be set later via parse().
+            cache: Optional parsed-spec cache consulted by parse().
         """
         self.spec_path = spec_path
+        self.cache = cache
 
     def parse(self, spec_path: Path | None = None) -> list[Requirement]:
         """Parse spec.md and extract all functional requirements.
@@ -52,29 +59,35 @@ class RequirementParser:
             raise FileNotFoundError(f"Spec file not found: {path}")
 
         content = path.read_text(encoding="utf-8")
-        return self.parse_content(content, str(path))
+        if self.cache is None:
+            return self.parse_content(content, str(path))
+
+        requirements = self.cache.get_requirements(path, content)
+        if requirements is None:
+            requirements = self.parse_content(content, str(path))
+            self.cache.put_requirements(path, content, requirements)
+        return requirements
 
-    def parse_content(self, content: str, spec_path: str) -> list[Requirement]:
+    def parse_content(self, content: str | SpecDocument, spec_path: str) -> list[Requirement]:
         """Parse content string and extract requirements.
 
         Args:
-            content: Full content of spec.md file.
+            content: Full content of spec.md file, or its parsed document.
             spec_path: Path to associate with extracted requirements.
 
         Returns:
             List of Requirement objects sorted by ID.
         """
         requirements: list[Requirement] = []
-        lines = content.split("\n")
 
-        for line_num, line in enumerate(lines, start=1):
-            match = self.REQUIREMENT_PATTERN.match(line)
+        for item in SpecDocument.of(content).list_items:
+            match = self.REQUIREMENT_PATTERN.match(item.line)
             if match:
                 req = Requirement(
                     id=match.group("id"),
                     spec_path=spec_path,
                     description=match.group("description").strip(),
-                    line_number=line_num,
+                    line_number=item.line_number,
                 )
                 requirements.append(req)
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import re
+from bisect import bisect_left
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -14,23 +15,32 @@ from ..models.validation_models import (
     ValidationRule,
 )
 from ..rules.builtin_rules import get_builtin_rules
+from .spec_cache import rules_fingerprint
+from .spec_document import SpecDocument
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-    pass
+    from ..models.crossref_models import CoverageReport
+    from .spec_cache import SpecCache
 
 
 class RuleEngine:
     """Evaluates validation rules against spec content."""
 
-    def __init__(self, config: ValidationConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: ValidationConfig | None = None,
+        cache: SpecCache | None = None,
+    ) -> None:
         """Initialize rule engine.
 
         Args:
             config: Validation configuration. Uses defaults if None.
+            cache: Optional parsed-spec cache used by traceability rules.
         """
         self.config = config or ValidationConfig.default()
+        self.cache = cache
         self._rules: list[ValidationRule] = []
         self._load_rules()
 
@@ -65,6 +75,14 @@ class RuleEngine:
             )
             self._rules.append(custom_rule)
 
+    def fingerprint(self) -> str:
+        """Fingerprint of the configured rule set, for cache keys.
+
+        Returns:
+            Hex digest that changes when any rule (enabled or not) changes.
+        """
+        return rules_fingerprint(self._rules)
+
     def get_rules(self) -> list[ValidationRule]:
         """Get all active rules (builtin + custom, minus disabled).
 
@@ -75,22 +93,31 @@ class RuleEngine:
 
     def evaluate(
         self,
-        content: str,
+        content: str | SpecDocument,
         spec_path: Path,
     ) -> list[ValidationIssue]:
         """Evaluate all rules against spec content.
 
+        The spec is tokenized once and every rule reads the same document.
+
         Args:
-            content: Full text content of spec file.
+            content: Full text content of spec file, or its parsed document.
             spec_path: Path to spec (for context in messages).
 
         Returns:
             List of ValidationIssue for all violations found.
         """
         issues: list[ValidationIssue] = []
+        document = SpecDocument.of(content)
+        rules = self.get_rules()
 
-        for rule in self.get_rules():
-            rule_issues = self.evaluate_rule(rule, content, spec_path)
+        # Traceability rules share one coverage report per spec
+        coverage = None
+        if any(rule.category == "traceability" for rule in rules):
+            coverage = self._traceability_report(document, spec_path)
+
+        for rule in rules:
+            rule_issues = self.evaluate_rule(rule, document, spec_path, coverage=coverage)
             issues.extend(rule_issues)
 
         return issues
@@ -98,15 +125,19 @@ class RuleEngine:
     def evaluate_rule(
         self,
         rule: ValidationRule,
-        content: str,
+        content: str | SpecDocument,
         spec_path: Path,
+        *,
+        coverage: CoverageReport | None = None,
     ) -> list[ValidationIssue]:
         """Evaluate a single rule against content.
 
         Args:
             rule: The rule to evaluate.
-            content: Spec file content.
+            content: Spec file content, or its parsed document.
             spec_path: Path for context.
+            coverage: Coverage report of the spec for traceability rules.
+                Built from ``content`` and the sibling tasks.md if omitted.
 
         Returns:
             List of issues found (empty if rule passes).
@@ -115,38 +146,43 @@ class RuleEngine:
 
         # Traceability rules have no pattern and require cross-file analysis
         if rule.category == "traceability":
-            issues = self._check_traceability(rule, spec_path)
+            if coverage is None:
+                coverage = self._traceability_report(SpecDocument.of(content), spec_path)
+            if coverage is not None:
+                issues = self._check_traceability(rule, coverage)
             return issues
 
         if not rule.pattern:
             return issues
 
+        document = SpecDocument.of(content)
+
         # Determine rule type based on category and pattern
         if rule.category == "structure":
             # Structure rules check for presence of sections
-            issues = self._check_section_present(rule, content)
+            issues = self._check_section_present(rule, document)
         elif rule.category in ("requirements", "naming"):
             # These rules check that patterns ARE followed where applicable
-            issues = self._check_pattern_compliance(rule, content)
+            issues = self._check_pattern_compliance(rule, document)
         elif rule.category == "acceptance":
             # Check user stories have acceptance scenarios
-            issues = self._check_acceptance_scenarios(rule, content)
+            issues = self._check_acceptance_scenarios(rule, document)
         elif rule.category == "clarity":
             # Clarity rules check for absence of problematic patterns
-            issues = self._check_pattern_absent(rule, content)
+            issues = self._check_pattern_absent(rule, document)
 
         return issues
 
     def _check_section_present(
         self,
         rule: ValidationRule,
-        content: str,
+        document: SpecDocument,
     ) -> list[ValidationIssue]:
         """Check if a required section is present.
 
         Args:
             rule: The structure rule to check.
-            content: Spec content.
+            document: Parsed spec.
 
         Returns:
             List with one issue if section missing, empty otherwise.
@@ -154,7 +190,7 @@ class RuleEngine:
         if not rule.pattern:
             return []
 
-        if not re.search(rule.pattern, content, re.MULTILINE | re.IGNORECASE):
+        if not re.search(rule.pattern, document.content, re.MULTILINE | re.IGNORECASE):
             return [
                 ValidationIssue(
                     rule_id=rule.id,
@@ -169,7 +205,7 @@ class RuleEngine:
     def _check_pattern_compliance(
         self,
         rule: ValidationRule,
-        content: str,
+        document: SpecDocument,
     ) -> list[ValidationIssue]:
         """Check that patterns are followed where applicable.
 
@@ -178,7 +214,7 @@ class RuleEngine:
 
         Args:
             rule: The pattern rule to check.
-            content: Spec content.
+            document: Parsed spec.
 
         Returns:
             List of issues for non-compliant patterns.
@@ -188,57 +224,35 @@ class RuleEngine:
         if not rule.pattern:
             return issues
 
-        # Find the relevant section
-        lines = content.split("\n")
-
-        # For FR naming, look in Requirements section
-        if rule.id == "fr-naming-convention":
-            in_section = False
-            for i, line in enumerate(lines):
-                if re.match(r"^##\s+Requirements", line, re.IGNORECASE):
-                    in_section = True
-                    continue
-                if in_section and line.startswith("##"):
-                    in_section = False
-                if in_section and line.strip().startswith("- **FR-"):
-                    # Check if it follows the pattern
-                    if not re.match(rule.pattern, line):
-                        issues.append(
-                            ValidationIssue(
-                                rule_id=rule.id,
-                                severity=rule.severity,
-                                line_number=i + 1,
-                                message=f"Line {i + 1}: {rule.description}",
-                                suggestion="Use format: - **FR-XXX**: Description",
-                            )
-                        )
-
-        # For SC naming, look in Success Criteria section
-        elif rule.id == "sc-naming-convention":
-            in_section = False
-            for i, line in enumerate(lines):
-                if re.match(r"^##\s+Success\s+Criteria", line, re.IGNORECASE):
-                    in_section = True
-                    continue
-                if in_section and line.startswith("##"):
-                    in_section = False
-                if in_section and line.strip().startswith("- **SC-"):
-                    if not re.match(rule.pattern, line):
+        # FR items live under ## Requirements, SC items under ## Success
+        # Criteria; only the text before the section's first sub-heading
+        # is checked.
+        naming = {
+            "fr-naming-convention": (r"Requirements", "- **FR-", "FR"),
+            "sc-naming-convention": (r"Success\s+Criteria", "- **SC-", "SC"),
+        }
+        if rule.id in naming:
+            title, prefix, kind = naming[rule.id]
+            for section in document.find_sections(title, level=2):
+                for item in document.list_items_in(section.start + 1, section.intro_end):
+                    if item.line.strip().startswith(prefix) and not re.match(
+                        rule.pattern, item.line
+                    ):
                         issues.append(
                             ValidationIssue(
                                 rule_id=rule.id,
                                 severity=rule.severity,
-                                line_number=i + 1,
-                                message=f"Line {i + 1}: {rule.description}",
-                                suggestion="Use format: - **SC-XXX**: Description",
+                                line_number=item.line_number,
+                                message=f"Line {item.line_number}: {rule.description}",
+                                suggestion=f"Use format: - **{kind}-XXX**: Description",
                             )
                         )
 
         # For feature branch format
         elif rule.id == "feature-branch-format":
-            if not re.search(rule.pattern, content, re.MULTILINE):
+            if not re.search(rule.pattern, document.content, re.MULTILINE):
                 # Check if there's a feature branch line at all
-                if re.search(r"\*\*Feature\s+Branch\*\*:", content):
+                if document.field("Feature Branch") is not None:
                     issues.append(
                         ValidationIssue(
                             rule_id=rule.id,
@@ -254,13 +268,16 @@ class RuleEngine:
     def _check_acceptance_scenarios(
         self,
         rule: ValidationRule,
-        content: str,
+        document: SpecDocument,
     ) -> list[ValidationIssue]:
         """Check that user stories have acceptance scenarios.
 
+        A story runs from its ``### User Story N`` heading to the next
+        story or the next ``##`` section.
+
         Args:
             rule: The acceptance rule to check.
-            content: Spec content.
+            document: Parsed spec.
 
         Returns:
             List of issues for user stories without scenarios.
@@ -270,57 +287,31 @@ class RuleEngine:
         if rule.id != "missing-acceptance-scenarios":
             return issues
 
-        # Find user story sections
-        lines = content.split("\n")
-        current_story = None
-        story_line = 0
-        has_scenarios = False
-
-        for i, line in enumerate(lines):
-            # Detect user story headers
-            if re.match(r"^###\s+User\s+Story\s+\d+", line, re.IGNORECASE):
-                # Check previous story
-                if current_story and not has_scenarios:
-                    issues.append(
-                        ValidationIssue(
-                            rule_id=rule.id,
-                            severity=rule.severity,
-                            line_number=story_line,
-                            message=f"{current_story} has no acceptance scenarios",
-                            suggestion="Add **Given/When/Then** scenarios under the user story",
-                        )
-                    )
-                current_story = line.strip().lstrip("#").strip()
-                story_line = i + 1
-                has_scenarios = False
-
-            # Detect acceptance scenarios
-            if current_story and re.search(r"\*\*Given\*\*.*\*\*When\*\*.*\*\*Then\*\*", line):
-                has_scenarios = True
-
-            # Detect next section (non-user story)
-            if current_story and re.match(r"^##[^#]", line):
-                if not has_scenarios:
-                    issues.append(
-                        ValidationIssue(
-                            rule_id=rule.id,
-                            severity=rule.severity,
-                            line_number=story_line,
-                            message=f"{current_story} has no acceptance scenarios",
-                            suggestion="Add **Given/When/Then** scenarios under the user story",
-                        )
-                    )
-                current_story = None
-                has_scenarios = False
-
-        # Check last story
-        if current_story and not has_scenarios:
+        scenario_lines = document.matching_lines(r"\*\*Given\*\*.*\*\*When\*\*.*\*\*Then\*\*")
+        stories = [
+            heading
+            for heading in document.headings
+            if heading.level == 3 and re.match(r"User\s+Story\s+\d+", heading.title, re.IGNORECASE)
+        ]
+
+        for position, story in enumerate(stories):
+            end = len(document.lines)
+            next_section = document.next_heading(story.index, max_level=2)
+            if next_section is not None:
+                end = next_section.index
+            if position + 1 < len(stories):
+                end = min(end, stories[position + 1].index)
+
+            # Any scenario line within [story line, end)?
+            first = bisect_left(scenario_lines, story.line_number)
+            if first < len(scenario_lines) and scenario_lines[first] <= end:
+                continue
             issues.append(
                 ValidationIssue(
                     rule_id=rule.id,
                     severity=rule.severity,
-                    line_number=story_line,
-                    message=f"{current_story} has no acceptance scenarios",
+                    line_number=story.line_number,
+                    message=f"{story.title} has no acceptance scenarios",
                     suggestion="Add **Given/When/Then** scenarios under the user story",
                 )
             )
@@ -330,13 +321,13 @@ class RuleEngine:
     def _check_pattern_absent(
         self,
         rule: ValidationRule,
-        content: str,
+        document: SpecDocument,
     ) -> list[ValidationIssue]:
         """Check that problematic patterns are absent.
 
         Args:
             rule: The clarity rule to check.
-            content: Spec content.
+            document: Parsed spec.
 
         Returns:
             List of issues where pattern is found.
@@ -349,22 +340,19 @@ class RuleEngine:
         # Special handling for TODO/FIXME in approved specs
         if rule.id == "todo-in-approved-spec":
             # Check if spec is in draft status
-            if re.search(r"\*\*Status\*\*:\s*Draft", content, re.IGNORECASE):
+            if any(value.lower().startswith("draft") for value in document.field_values("Status")):
                 return []  # Don't flag TODOs in draft specs
 
-        lines = content.split("\n")
-        for i, line in enumerate(lines):
-            matches = re.findall(rule.pattern, line, re.IGNORECASE)
-            if matches:
-                issues.append(
-                    ValidationIssue(
-                        rule_id=rule.id,
-                        severity=rule.severity,
-                        line_number=i + 1,
-                        message=f"Line {i + 1}: {rule.description}",
-                        suggestion=self._get_clarity_suggestion(rule.id),
-                    )
+        for line_number in document.matching_lines(rule.pattern, re.IGNORECASE):
+            issues.append(
+                ValidationIssue(
+                    rule_id=rule.id,
+                    severity=rule.severity,
+                    line_number=line_number,
+                    message=f"Line {line_number}: {rule.description}",
+                    suggestion=self._get_clarity_suggestion(rule.id),
                 )
+            )
 
         return issues
 
@@ -383,64 +371,73 @@ class RuleEngine:
         }
         return suggestions.get(rule_id, "Review and address this issue")
 
+    def _traceability_report(
+        self,
+        document: SpecDocument,
+        spec_path: Path,
+    ) -> CoverageReport | None:
+        """Build the coverage report checked by traceability rules.
+
+        Args:
+            document: Parsed spec content.
+            spec_path: Path to the spec file; its sibling tasks.md is read.
+
+        Returns:
+            CoverageReport, or None when the checks should be skipped.
+        """
+        # Skip traceability checks if tasks.md doesn't exist
+        if not (spec_path.parent / "tasks.md").exists():
+            return None
+
+        # Import here to avoid circular imports
+        from .traceability_service import TraceabilityService
+
+        try:
+            return TraceabilityService(cache=self.cache).build_report(spec_path, document)
+        except (OSError, ValueError, KeyError) as exc:
+            # Cross-reference validation is best-effort — missing specs or
+            # malformed requirement lists should not block the rule run.
+            logger.debug("cross-reference validation skipped: %s", exc)
+            return None
+
     def _check_traceability(
         self,
         rule: ValidationRule,
-        spec_path: Path,
+        coverage: CoverageReport,
     ) -> list[ValidationIssue]:
         """Check cross-reference traceability between spec.md and tasks.md.
 
         Args:
             rule: The traceability rule to check.
-            spec_path: Path to the spec file.
+            coverage: Coverage report of the spec and its tasks.md.
 
         Returns:
             List of issues found.
         """
         issues: list[ValidationIssue] = []
 
-        # Determine the feature directory from spec path
-        feature_dir = spec_path.parent
-        tasks_path = feature_dir / "tasks.md"
-
-        # Skip traceability checks if tasks.md doesn't exist
-        if not tasks_path.exists():
-            return issues
-
-        # Import here to avoid circular imports
-        from .crossref_service import CrossReferenceService
-
-        try:
-            service = CrossReferenceService()
-            uncovered, orphaned = service.validate_references(spec_path=spec_path)
-
-            if rule.id == "orphaned-task-reference":
-                for task, ref_id in orphaned:
-                    issues.append(
-                        ValidationIssue(
-                            rule_id=rule.id,
-                            severity=rule.severity,
-                            line_number=task.line_number,
-                            message=f"Task references non-existent requirement {ref_id}",
-                            suggestion=f"Verify {ref_id} exists in spec.md or remove the reference",
-                        )
+        if rule.id == "orphaned-task-reference":
+            for task, ref_id in coverage.orphaned_references:
+                issues.append(
+                    ValidationIssue(
+                        rule_id=rule.id,
+                        severity=rule.severity,
+                        line_number=task.line_number,
+                        message=f"Task references non-existent requirement {ref_id}",
+                        suggestion=f"Verify {ref_id} exists in spec.md or remove the reference",
                     )
+                )
 
-            elif rule.id == "uncovered-requirement":
-                for req_id in uncovered:
-                    issues.append(
-                        ValidationIssue(
-                            rule_id=rule.id,
-                            severity=rule.severity,
-                            line_number=0,
-                            message=f"Requirement {req_id} has no linked tasks",
-                            suggestion=f"Add [task description] [{req_id}] to tasks.md",
-                        )
+        elif rule.id == "uncovered-requirement":
+            for req in coverage.get_uncovered_requirements():
+                issues.append(
+                    ValidationIssue(
+                        rule_id=rule.id,
+                        severity=rule.severity,
+                        line_number=0,
+                        message=f"Requirement {req.id} has no linked tasks",
+                        suggestion=f"Add [task description] [{req.id}] to tasks.md",
                     )
-
-        except (OSError, ValueError, KeyError) as exc:
-            # Cross-reference validation is best-effort — missing specs or
-            # malformed requirement lists should not block the rule run.
-            logger.debug("cross-reference validation skipped: %s", exc)
+                )
 
         return issues
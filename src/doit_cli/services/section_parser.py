@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 
 from ..models.diagram_models import DiagramSection
+from .spec_document import SpecDocument
 
 
 class SectionParser:
@@ -14,27 +15,31 @@ class SectionParser:
     <!-- BEGIN:AUTO-GENERATED section="name" -->
     [content]
     <!-- END:AUTO-GENERATED -->
+
+    The BEGIN marker may also carry the hash of the content the section was
+    generated from: ``section="name" source="<hash>"``.
     """
 
-    # Regex pattern for BEGIN marker with section name
+    # Regex pattern for BEGIN marker with section name and optional source hash
     BEGIN_PATTERN = re.compile(
-        r'<!--\s*BEGIN:AUTO-GENERATED\s+section="([^"]+)"\s*-->', re.IGNORECASE
+        r'<!--\s*BEGIN:AUTO-GENERATED\s+section="([^"]+)"(?:\s+source="([^"]*)")?\s*-->',
+        re.IGNORECASE,
     )
 
     # Regex pattern for END marker
     END_PATTERN = re.compile(r"<!--\s*END:AUTO-GENERATED\s*-->", re.IGNORECASE)
 
-    def find_sections(self, content: str) -> list[DiagramSection]:
+    def find_sections(self, content: str | SpecDocument) -> list[DiagramSection]:
         """Find all AUTO-GENERATED sections in content.
 
         Args:
-            content: File content to parse
+            content: File content to parse, or its parsed document
 
         Returns:
             List of DiagramSection objects with section details
         """
         sections = []
-        lines = content.split("\n")
+        lines = SpecDocument.of(content).lines
 
         current_section: DiagramSection | None = None
         section_content_lines: list[str] = []
@@ -50,6 +55,7 @@ class SectionParser:
                     start_line=line_num,
                     end_line=0,  # Will be set when END found
                     content="",
+                    source_hash=begin_match.group(2) or None,
                 )
                 section_content_lines = []
                 continue
@@ -70,11 +76,11 @@ class SectionParser:
 
         return sections
 
-    def find_section(self, content: str, section_name: str) -> DiagramSection | None:
+    def find_section(self, content: str | SpecDocument, section_name: str) -> DiagramSection | None:
         """Find a specific AUTO-GENERATED section by name.
 
         Args:
-            content: File content to parse
+            content: File content to parse, or its parsed document
             section_name: Name of section to find (e.g., "user-journey")
 
         Returns:
@@ -87,7 +93,11 @@ class SectionParser:
         return None
 
     def replace_section_content(
-        self, content: str, section_name: str, new_content: str
+        self,
+        content: str,
+        section_name: str,
+        new_content: str,
+        source_hash: str | None = None,
     ) -> tuple[str, bool]:
         """Replace content within an AUTO-GENERATED section.
 
@@ -95,6 +105,8 @@ class SectionParser:
             content: Original file content
             section_name: Name of section to update
             new_content: New content to insert (without markers)
+            source_hash: Source hash to record in the BEGIN marker. The
+                marker is left as is when None.
 
         Returns:
             Tuple of (updated content, success boolean)
@@ -109,6 +121,12 @@ class SectionParser:
         before_lines = lines[: section.start_line]  # Includes BEGIN marker line
         after_lines = lines[section.end_line - 1 :]  # Starts from END marker line
 
+        if source_hash is not None:
+            section.source_hash = source_hash
+            before_lines[-1] = self.BEGIN_PATTERN.sub(
+                lambda _: section.begin_marker, before_lines[-1], count=1
+            )
+
         # Ensure new content has proper newlines
         new_content_clean = new_content.strip()
 
@@ -177,22 +195,18 @@ class SectionParser:
         Returns:
             Mermaid content without code fences, or None if not found
         """
-        content = section.content
-
         # Look for ```mermaid ... ``` block
-        mermaid_pattern = re.compile(r"```mermaid\s*\n(.*?)\n```", re.DOTALL | re.IGNORECASE)
-        match = mermaid_pattern.search(content)
-
-        if match:
-            return match.group(1).strip()
+        for block in SpecDocument.parse(section.content).code_blocks:
+            if block.language.lower() == "mermaid":
+                return block.content.strip()
 
         return None
 
-    def has_section(self, content: str, section_name: str) -> bool:
+    def has_section(self, content: str | SpecDocument, section_name: str) -> bool:
         """Check if a section exists in content.
 
         Args:
-            content: File content to check
+            content: File content to check, or its parsed document
             section_name: Name of section to look for
 
         Returns:
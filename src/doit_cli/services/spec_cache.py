@@ -0,0 +1,275 @@
+"""Persistent cache of parsed spec data keyed by file content hash.
+
+`doit status`, `doit validate` and `doit analytics` re-read and re-regex
+every `specs/*/spec.md` and `tasks.md` on each run. This cache stores the
+derived data (parsed status, requirements, tasks, validation issues) in
+`.doit/cache/specs.json` so unchanged files are served without parsing.
+
+Every entry is keyed by the SHA-256 of the file content. Validation
+results additionally carry a key combining the rule-set fingerprint, the
+doit version and the content hash of the sibling `tasks.md` (traceability
+rules read it), so editing the rules or the tasks file invalidates them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .. import __version__
+from ..models.crossref_models import Requirement, Task, TaskReference
+from ..models.validation_models import Severity, ValidationIssue, ValidationRule
+from ..utils.atomic_write import write_text_atomic
+
+logger = logging.getLogger(__name__)
+
+# Bump when the shape of cached values changes.
+CACHE_FORMAT_VERSION = 1
+
+
+def content_hash(content: str) -> str:
+    """Return the SHA-256 hex digest used to key cache entries."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def rules_fingerprint(rules: Iterable[ValidationRule]) -> str:
+    """Fingerprint a rule set (including disabled rules) and the doit version.
+
+    Args:
+        rules: Every configured rule, enabled or not.
+
+    Returns:
+        Hex digest that changes whenever a rule or the doit release changes.
+    """
+    payload = {
+        "version": __version__,
+        "rules": [asdict(rule) for rule in rules],
+    }
+    return content_hash(json.dumps(payload, sort_keys=True, default=str))
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache session.
+
+    Attributes:
+        hits: Lookups served from the cache
+        misses: Lookups that required parsing
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """Total lookups."""
+        return self.hits + self.misses
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert to a JSON-serializable dict."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def __str__(self) -> str:
+        return f"{self.hits} hits, {self.misses} misses"
+
+
+@dataclass
+class SpecCache:
+    """On-disk cache for parsed spec and tasks files.
+
+    Lookups take the file path and its content; a stale entry (content
+    changed) is a miss. Call `save()` once at the end of a run to persist
+    new entries. A disabled cache (``--no-cache``) always misses and never
+    writes, but still counts misses.
+
+    Attributes:
+        project_root: Root of the doit project
+        enabled: Whether lookups and writes are performed
+        stats: Hit/miss counters for this session
+    """
+
+    CACHE_PATH = ".doit/cache/specs.json"
+
+    project_root: Path
+    enabled: bool = True
+    stats: CacheStats = field(default_factory=CacheStats)
+    _entries: dict[str, dict[str, Any]] | None = field(default=None, init=False, repr=False)
+    _dirty: bool = field(default=False, init=False, repr=False)
+
+    @property
+    def cache_path(self) -> Path:
+        """Location of the cache file."""
+        return self.project_root / self.CACHE_PATH
+
+    # ------------------------------------------------------------------
+    # Typed accessors
+    # ------------------------------------------------------------------
+
+    def get_status(self, path: Path, content: str) -> str | None:
+        """Return the cached raw status value for a spec, if fresh."""
+        return self._get(path, content, "status")
+
+    def put_status(self, path: Path, content: str, status: str) -> None:
+        """Store the parsed status value for a spec."""
+        self._put(path, content, "status", status)
+
+    def get_validation(
+        self, path: Path, content: str, key: str
+    ) -> tuple[list[ValidationIssue], int] | None:
+        """Return cached (issues, quality_score) for a spec, if fresh."""
+        value = self._get(path, content, "validation", key=key)
+        if value is None:
+            return None
+        issues = [
+            ValidationIssue(
+                rule_id=item["rule_id"],
+                severity=Severity(item["severity"]),
+                line_number=item["line_number"],
+                message=item["message"],
+                suggestion=item.get("suggestion"),
+            )
+            for item in value["issues"]
+        ]
+        return issues, value["quality_score"]
+
+    def put_validation(
+        self,
+        path: Path,
+        content: str,
+        key: str,
+        issues: list[ValidationIssue],
+        quality_score: int,
+    ) -> None:
+        """Store validation output for a spec under a rules/tasks key."""
+        value = {
+            "key": key,
+            "issues": [
+                {
+                    "rule_id": issue.rule_id,
+                    "severity": issue.severity.value,
+                    "line_number": issue.line_number,
+                    "message": issue.message,
+                    "suggestion": issue.suggestion,
+                }
+                for issue in issues
+            ],
+            "quality_score": quality_score,
+        }
+        self._put(path, content, "validation", value)
+
+    def get_requirements(self, path: Path, content: str) -> list[Requirement] | None:
+        """Return cached requirements for a spec, if fresh."""
+        value = self._get(path, content, "requirements")
+        if value is None:
+            return None
+        return [Requirement(**{**item, "spec_path": str(path)}) for item in value]
+
+    def put_requirements(self, path: Path, content: str, requirements: list[Requirement]) -> None:
+        """Store parsed requirements for a spec."""
+        self._put(path, content, "requirements", [asdict(req) for req in requirements])
+
+    def get_tasks(self, path: Path, content: str) -> list[Task] | None:
+        """Return cached tasks for a tasks file, if fresh."""
+        value = self._get(path, content, "tasks")
+        if value is None:
+            return None
+        return [
+            Task(
+                id=item["id"],
+                tasks_file=str(path),
+                description=item["description"],
+                completed=item["completed"],
+                line_number=item["line_number"],
+                references=[TaskReference(**ref) for ref in item["references"]],
+            )
+            for item in value
+        ]
+
+    def put_tasks(self, path: Path, content: str, tasks: list[Task]) -> None:
+        """Store parsed tasks for a tasks file."""
+        self._put(path, content, "tasks", [asdict(task) for task in tasks])
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self) -> None:
+        """Write new entries to disk. No-op when disabled or unchanged.
+
+        Failures are logged and swallowed: the cache is an optimization and
+        must never fail the command that uses it.
+        """
+        if not self.enabled or not self._dirty or self._entries is None:
+            return
+        if not (self.project_root / ".doit").is_dir():
+            # Never create .doit/ outside a doit project.
+            return
+        payload = {"version": CACHE_FORMAT_VERSION, "entries": self._entries}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_text_atomic(self.cache_path, json.dumps(payload, sort_keys=True))
+            self._dirty = False
+        except OSError as exc:
+            logger.debug("spec cache not written: %s", exc)
+        logger.debug("spec cache: %s", self.stats)
+
+    def clear(self) -> None:
+        """Drop all entries and delete the cache file."""
+        self._entries = {}
+        self._dirty = False
+        try:
+            self.cache_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return self._entries
+        if isinstance(data, dict) and data.get("version") == CACHE_FORMAT_VERSION:
+            entries = data.get("entries")
+            if isinstance(entries, dict):
+                self._entries = entries
+        return self._entries
+
+    def _key(self, path: Path) -> str:
+        try:
+            return Path(path).resolve().relative_to(self.project_root.resolve()).as_posix()
+        except ValueError:
+            return Path(path).resolve().as_posix()
+
+    def _get(self, path: Path, content: str, kind: str, key: str | None = None) -> Any:
+        value = None
+        if self.enabled:
+            entry = self._load().get(self._key(path))
+            if entry is not None and entry.get("hash") == content_hash(content):
+                value = entry.get(kind)
+            if key is not None and value is not None and value.get("key") != key:
+                value = None
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+
+    def _put(self, path: Path, content: str, kind: str, value: Any) -> None:
+        if not self.enabled:
+            return
+        entries = self._load()
+        key = self._key(path)
+        digest = content_hash(content)
+        entry = entries.get(key)
+        if entry is None or entry.get("hash") != digest:
+            entry = {"hash": digest}
+            entries[key] = entry
+        entry[kind] = value
+        self._dirty = True
@@ -0,0 +1,403 @@
+"""Single-pass markdown model shared by the spec parsers and rules.
+
+Validation rules, the diagram parsers, the requirement parser, the spec
+scanner and the memory validator all need the same structural facts about
+a markdown file: its headings and the sections they open, list items,
+tables, fenced code blocks and bold ``**Field**: value`` lines.
+`SpecDocument` tokenizes a file once into those pieces so each consumer
+looks up what it needs instead of re-splitting and re-scanning the text.
+
+Lines inside fenced code blocks are never reported as headings, list
+items, tables or fields. A fence that is never closed is treated as plain
+text rather than swallowing the rest of the file.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TypeVar
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*$")
+_FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})\s*([^`\s]*)")
+_LIST_ITEM = re.compile(r"^(\s*)([-*+]|\d+[.)])\s+(.*)$")
+_FIELD = re.compile(r"\*\*([^*\n]+?)\*\*:[ \t]*(.*)")
+
+_T = TypeVar("_T", "Heading", "ListItem", "Table")
+
+
+@dataclass(frozen=True)
+class Heading:
+    """An ATX heading.
+
+    Attributes:
+        level: Number of leading ``#`` characters (1-6)
+        title: Heading text without the ``#`` markers
+        line_number: 1-based line number
+    """
+
+    level: int
+    title: str
+    line_number: int
+
+    @property
+    def index(self) -> int:
+        """0-based line index."""
+        return self.line_number - 1
+
+
+@dataclass(frozen=True)
+class Section:
+    """A heading and the lines it governs.
+
+    Attributes:
+        heading: The heading that opens the section
+        end: 0-based line index (exclusive) of the next heading at the same
+            or a higher level, or the line count
+        intro_end: 0-based line index (exclusive) of the first heading of
+            any level after this one, i.e. the end of the section's own
+            text before its first subsection
+    """
+
+    heading: Heading
+    end: int
+    intro_end: int
+
+    @property
+    def start(self) -> int:
+        """0-based line index of the heading line."""
+        return self.heading.index
+
+
+@dataclass(frozen=True)
+class ListItem:
+    """A bullet or numbered list item line.
+
+    Attributes:
+        line_number: 1-based line number
+        indent: Leading whitespace width
+        marker: ``-``, ``*``, ``+`` or ``N.`` / ``N)``
+        text: Item text after the marker
+        line: The raw line
+    """
+
+    line_number: int
+    indent: int
+    marker: str
+    text: str
+    line: str
+
+
+@dataclass(frozen=True)
+class Table:
+    """A run of consecutive ``|``-prefixed lines.
+
+    Attributes:
+        line_number: 1-based line number of the first row
+        rows: Raw row lines, including the divider row
+    """
+
+    line_number: int
+    rows: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class CodeBlock:
+    """A fenced code block.
+
+    Attributes:
+        line_number: 1-based line number of the opening fence
+        end_line_number: 1-based line number of the closing fence
+        language: Info string after the opening fence (may be empty)
+        content: Text between the fences
+    """
+
+    line_number: int
+    end_line_number: int
+    language: str
+    content: str
+
+
+@dataclass(frozen=True, eq=False)
+class SpecDocument:
+    """Tokenized view of a markdown file.
+
+    Build with `SpecDocument.parse()`, or `SpecDocument.of()` to accept
+    either raw text or an already parsed document. Line indices passed to
+    and returned from the range helpers are 0-based and end-exclusive;
+    the ``line_number`` attributes of the tokens are 1-based.
+
+    Attributes:
+        content: The original text
+        lines: ``content.split("\\n")``
+        headings: Headings in document order
+        sections: One section per heading, in the same order
+        list_items: List item lines in document order
+        tables: Tables in document order
+        code_blocks: Fenced code blocks in document order
+        fields: Normalized bold field name -> values in document order
+    """
+
+    content: str
+    lines: tuple[str, ...]
+    line_starts: tuple[int, ...]
+    headings: tuple[Heading, ...]
+    sections: tuple[Section, ...]
+    list_items: tuple[ListItem, ...]
+    tables: tuple[Table, ...]
+    code_blocks: tuple[CodeBlock, ...]
+    fields: Mapping[str, tuple[str, ...]]
+
+    @classmethod
+    def parse(cls, content: str) -> SpecDocument:
+        """Tokenize markdown content in a single pass.
+
+        Repeated calls with the same text return the same document.
+
+        Args:
+            content: Full text of the file.
+
+        Returns:
+            The parsed document.
+        """
+        return _parse_cached(content)
+
+    @classmethod
+    def of(cls, source: str | SpecDocument) -> SpecDocument:
+        """Return `source` if already parsed, otherwise parse it."""
+        if isinstance(source, SpecDocument):
+            return source
+        return cls.parse(source)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def line_number_at(self, offset: int) -> int:
+        """Return the 1-based line number containing a character offset."""
+        return bisect_right(self.line_starts, offset)
+
+    def text(self, start: int, end: int) -> str:
+        """Return the text of lines ``[start, end)`` joined by newlines."""
+        return "\n".join(self.lines[start:end])
+
+    def find_sections(self, title_pattern: str, level: int | None = None) -> list[Section]:
+        """Return sections whose title starts with a pattern (case-insensitive).
+
+        Args:
+            title_pattern: Regex matched at the start of the heading title.
+            level: Only consider headings at this level.
+
+        Returns:
+            Matching sections in document order.
+        """
+        pattern = re.compile(title_pattern, re.IGNORECASE)
+        return [
+            section
+            for section in self.sections
+            if (level is None or section.heading.level == level)
+            and pattern.match(section.heading.title)
+        ]
+
+    def section(self, title: str, level: int | None = None) -> Section | None:
+        """Return the first section whose title equals `title` (case-insensitive)."""
+        target = title.strip().lower()
+        for section in self.sections:
+            if (level is None or section.heading.level == level) and (
+                section.heading.title.lower() == target
+            ):
+                return section
+        return None
+
+    def has_heading(self, level: int, title: str) -> bool:
+        """Return whether a heading with this level and title exists."""
+        return self.section(title, level) is not None
+
+    def subheadings(self, section: Section) -> list[Heading]:
+        """Return the headings one level below `section` inside it."""
+        level = section.heading.level + 1
+        return [h for h in self.headings_in(section.start + 1, section.end) if h.level == level]
+
+    def next_heading(self, after: int, max_level: int = 6) -> Heading | None:
+        """Return the first heading after line index `after` at `max_level` or above."""
+        for heading in self.headings_in(after + 1, len(self.lines)):
+            if heading.level <= max_level:
+                return heading
+        return None
+
+    def headings_in(self, start: int, end: int) -> tuple[Heading, ...]:
+        """Return headings on lines ``[start, end)``."""
+        return _slice_by_line(self.headings, start, end)
+
+    def list_items_in(self, start: int, end: int) -> tuple[ListItem, ...]:
+        """Return list items on lines ``[start, end)``."""
+        return _slice_by_line(self.list_items, start, end)
+
+    def tables_in(self, start: int, end: int) -> tuple[Table, ...]:
+        """Return tables starting on lines ``[start, end)``."""
+        return _slice_by_line(self.tables, start, end)
+
+    def field(self, name: str) -> str | None:
+        """Return the first value of a bold ``**Name**: value`` field."""
+        values = self.fields.get(_field_key(name))
+        return values[0] if values else None
+
+    def field_values(self, name: str) -> tuple[str, ...]:
+        """Return every value of a bold ``**Name**: value`` field."""
+        return self.fields.get(_field_key(name), ())
+
+    def matching_lines(self, pattern: str, flags: int = 0) -> list[int]:
+        """Return 1-based numbers of lines on which `pattern` matches.
+
+        Equivalent to searching each line separately, but runs one regex
+        scan over the whole text.
+
+        Args:
+            pattern: Regular expression, evaluated per line.
+            flags: Extra `re` flags (`re.MULTILINE` is always added).
+
+        Returns:
+            Sorted line numbers.
+        """
+        compiled = re.compile(pattern, flags | re.MULTILINE)
+        found: set[int] = set()
+        for match in compiled.finditer(self.content):
+            first = self.line_number_at(match.start())
+            if "\n" not in match.group(0):
+                found.add(first)
+                continue
+            # The match crosses a line break, so it would not exist in a
+            # per-line search; re-check each spanned line on its own.
+            last = self.line_number_at(match.end())
+            for number in range(first, last + 1):
+                if compiled.search(self.lines[number - 1]):
+                    found.add(number)
+        return sorted(found)
+
+
+def _field_key(name: str) -> str:
+    return " ".join(name.split()).lower()
+
+
+def _line_number(token: Heading | ListItem | Table) -> int:
+    return token.line_number
+
+
+def _slice_by_line(items: tuple[_T, ...], start: int, end: int) -> tuple[_T, ...]:
+    """Slice tokens (sorted by ``line_number``) to 0-based lines ``[start, end)``."""
+    low = bisect_left(items, start + 1, key=_line_number)
+    return items[low : bisect_left(items, end + 1, lo=low, key=_line_number)]
+
+
+def _closing_fences(lines: list[str]) -> dict[int, int]:
+    """Map each opening fence line index to its closing fence line index."""
+    pairs: dict[int, int] = {}
+    open_index: int | None = None
+    fence = ""
+    for index, line in enumerate(lines):
+        match = _FENCE.match(line)
+        if match is None:
+            continue
+        marker = match.group(1)
+        if open_index is None:
+            open_index, fence = index, marker
+        elif (
+            marker[0] == fence[0]
+            and len(marker) >= len(fence)
+            and not line.strip().lstrip(marker[0])
+        ):
+            pairs[open_index] = index
+            open_index = None
+    return pairs
+
+
+@lru_cache(maxsize=32)
+def _parse_cached(content: str) -> SpecDocument:
+    lines = content.split("\n")
+    line_starts: list[int] = []
+    offset = 0
+    for line in lines:
+        line_starts.append(offset)
+        offset += len(line) + 1
+
+    fences = _closing_fences(lines)
+    headings: list[Heading] = []
+    list_items: list[ListItem] = []
+    tables: list[Table] = []
+    code_blocks: list[CodeBlock] = []
+    fields: dict[str, list[str]] = {}
+    table_start = -1
+
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        if not line.lstrip().startswith("|") and table_start >= 0:
+            tables.append(Table(table_start + 1, tuple(lines[table_start:index])))
+            table_start = -1
+
+        close = fences.get(index)
+        if close is not None:
+            language = _FENCE.match(line).group(2)  # type: ignore[union-attr]
+            code_blocks.append(
+                CodeBlock(index + 1, close + 1, language, "\n".join(lines[index + 1 : close]))
+            )
+            index = close + 1
+            continue
+
+        heading_match = _HEADING.match(line)
+        if heading_match:
+            headings.append(Heading(len(heading_match.group(1)), heading_match.group(2), index + 1))
+        else:
+            item = _LIST_ITEM.match(line)
+            if item:
+                list_items.append(
+                    ListItem(
+                        line_number=index + 1,
+                        indent=len(item.group(1)),
+                        marker=item.group(2),
+                        text=item.group(3),
+                        line=line,
+                    )
+                )
+            if line.lstrip().startswith("|") and table_start < 0:
+                table_start = index
+
+        if "**" in line:
+            for field in _FIELD.finditer(line):
+                fields.setdefault(_field_key(field.group(1)), []).append(field.group(2).strip())
+        index += 1
+
+    if table_start >= 0:
+        tables.append(Table(table_start + 1, tuple(lines[table_start:])))
+
+    # Each section ends where the next heading at its level or above
+    # starts; a stack of still-open headings resolves that in one pass.
+    ends = [len(lines)] * len(headings)
+    open_positions: list[int] = []
+    for position, heading in enumerate(headings):
+        while open_positions and headings[open_positions[-1]].level >= heading.level:
+            ends[open_positions.pop()] = heading.index
+        open_positions.append(position)
+    sections = [
+        Section(
+            heading,
+            ends[position],
+            headings[position + 1].index if position + 1 < len(headings) else len(lines),
+        )
+        for position, heading in enumerate(headings)
+    ]
+
+    return SpecDocument(
+        content=content,
+        lines=tuple(lines),
+        line_starts=tuple(line_starts),
+        headings=tuple(headings),
+        sections=tuple(sections),
+        list_items=tuple(list_items),
+        tables=tuple(tables),
+        code_blocks=tuple(code_blocks),
+        fields={name: tuple(values) for name, values in fields.items()},
+    )
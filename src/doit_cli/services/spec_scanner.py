@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import re
-import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ..models.status_models import SpecState, SpecStatus, StatusReport
+from ..models.validation_models import ValidationResult
+from .git_utils import StagedFiles, get_staged_files
+from .spec_document import SpecDocument
+
+if TYPE_CHECKING:
+    from .spec_cache import SpecCache
 
 
 class NotADoitProjectError(Exception):
@@ -33,7 +38,8 @@ class SpecScanner:
 
     # Regex pattern to extract status from spec.md
     # Matches: **Status**: Draft (or In Progress, Complete, Approved)
-    STATUS_PATTERN = re.compile(r"\*\*Status\*\*:\s*([A-Za-z]+(?:\s+[A-Za-z]+)?)", re.IGNORECASE)
+    # Status value in a `**Status**: <value>` field
+    STATUS_VALUE_PATTERN = re.compile(r"[A-Za-z]+(?:\s+[A-Za-z]+)?")
 
     # Default specs directory name
     SPECS_DIR = "specs"
@@ -42,6 +48,8 @@ class SpecScanner:
         self,
         project_root: Path | None = None,
         validate: bool = True,
+        cache: SpecCache | None = None,
+        staged_files: StagedFiles | None = None,
     ) -> None:
         """Initialize scanner with project root directory.
 
@@ -49,12 +57,17 @@ class SpecScanner:
             project_root: Root directory of the doit project.
                          Defaults to current working directory.
             validate: Whether to run validation on specs.
+            cache: Optional parsed-spec cache for status and validation.
+            staged_files: Snapshot of the Git index to check drafts against.
+                Read on first use if not given.
 
         Raises:
             NotADoitProjectError: If project_root lacks .doit/ directory.
         """
         self.project_root = project_root or Path.cwd()
         self.validate = validate
+        self.cache = cache
+        self._staged_files = staged_files
         # Lazy-loaded in the `validator` property below. Typed as Any to
         # avoid a circular import on ValidationService at module scope.
         self._validator: Any = None
@@ -74,13 +87,20 @@ class SpecScanner:
             try:
                 from .validation_service import ValidationService
 
-                self._validator = ValidationService(self.project_root)
+                self._validator = ValidationService(self.project_root, cache=self.cache)
             except ImportError:
                 # Validation service not available
                 self._validator = None
         return self._validator
 
-    def scan(self, include_validation: bool = True) -> list[SpecStatus]:
+    @property
+    def staged_files(self) -> StagedFiles:
+        """Snapshot of the Git index, read at most once per scanner."""
+        if self._staged_files is None:
+            self._staged_files = get_staged_files(self.project_root)
+        return self._staged_files
+
+    def scan(self, include_validation: bool = True, jobs: int = 1) -> list[SpecStatus]:
         """Scan specs/ directory and return all spec statuses.
 
         Discovers all subdirectories in specs/ that contain a spec.md file
@@ -88,6 +108,9 @@ class SpecScanner:
 
         Args:
             include_validation: Whether to include validation results.
+            jobs: Worker processes for validation. 1 validates serially;
+                  0 or less uses one worker per CPU. Results are identical
+                  to a serial scan.
 
         Returns:
             List of SpecStatus objects, one per spec directory.
@@ -110,14 +133,27 @@ class SpecScanner:
             if len(relative_path.parts) > 1:
                 continue
 
-            status = self._parse_spec(spec_name, spec_file)
-
-            # Add validation if enabled
-            if include_validation and self.validate and self.validator:
-                status = self._add_validation(status)
-                status = self._compute_blocking(status)
+            statuses.append(self._parse_spec(spec_name, spec_file))
+
+        # Add validation if enabled
+        if include_validation and self.validate and self.validator:
+            # Unreadable specs already carry an error and are not validated.
+            outcomes = iter(
+                self.validator.validate_files(
+                    [status.path for status in statuses if not status.error],
+                    jobs,
+                    return_exceptions=True,
+                )
+            )
+            statuses = [
+                self._compute_blocking(
+                    status if status.error else self._with_validation(status, next(outcomes))
+                )
+                for status in statuses
+            ]
 
-            statuses.append(status)
+        if self.cache is not None:
+            self.cache.save()
 
         return statuses
 
@@ -159,7 +195,7 @@ class SpecScanner:
         """
         try:
             content = spec_file.read_text(encoding="utf-8")
-            status = self._parse_status(content)
+            status = self._cached_status(spec_file, content)
             last_modified = datetime.fromtimestamp(spec_file.stat().st_mtime)
 
             return SpecStatus(
@@ -184,6 +220,18 @@ class SpecScanner:
                 error=f"Unable to read file: {e}",
             )
 
+    def _cached_status(self, spec_file: Path, content: str) -> SpecState:
+        """Parse status, consulting the spec cache when one is configured."""
+        if self.cache is None:
+            return self._parse_status(content)
+
+        cached = self.cache.get_status(spec_file, content)
+        if cached is not None:
+            return SpecState(cached)
+        status = self._parse_status(content)
+        self.cache.put_status(spec_file, content, status.value)
+        return status
+
     def _parse_status(self, content: str) -> SpecState:
         """Extract status from spec.md content.
 
@@ -195,12 +243,11 @@ class SpecScanner:
         Returns:
             SpecState enum value, or ERROR if not found/parseable
         """
-        match = self.STATUS_PATTERN.search(content)
-        if not match:
-            return SpecState.ERROR
-
-        status_text = match.group(1).strip()
-        return SpecState.from_string(status_text)
+        for value in SpecDocument.parse(content).field_values("Status"):
+            match = self.STATUS_VALUE_PATTERN.match(value)
+            if match:
+                return SpecState.from_string(match.group(0).strip())
+        return SpecState.ERROR
 
     def _add_validation(self, spec_status: SpecStatus) -> SpecStatus:
         """Add validation result to a SpecStatus.
@@ -215,17 +262,26 @@ class SpecScanner:
             return spec_status
 
         try:
-            result = self.validator.validate_file(spec_status.path)
-            return SpecStatus(
-                name=spec_status.name,
-                path=spec_status.path,
-                status=spec_status.status,
-                last_modified=spec_status.last_modified,
-                validation_result=result,
-                is_blocking=spec_status.is_blocking,
-                error=spec_status.error,
-            )
+            outcome: ValidationResult | Exception = self.validator.validate_file(spec_status.path)
         except Exception as e:
+            outcome = e
+        return self._with_validation(spec_status, outcome)
+
+    def _with_validation(
+        self,
+        spec_status: SpecStatus,
+        outcome: ValidationResult | Exception,
+    ) -> SpecStatus:
+        """Attach a validation outcome (result or raised error) to a SpecStatus.
+
+        Args:
+            spec_status: SpecStatus the outcome belongs to.
+            outcome: ValidationResult, or the exception validation raised.
+
+        Returns:
+            Updated SpecStatus with validation_result or error populated.
+        """
+        if isinstance(outcome, Exception):
             # Validation failed, mark as error
             return SpecStatus(
                 name=spec_status.name,
@@ -234,8 +290,17 @@ class SpecScanner:
                 last_modified=spec_status.last_modified,
                 validation_result=None,
                 is_blocking=spec_status.is_blocking,
-                error=f"Validation error: {e}",
+                error=f"Validation error: {outcome}",
             )
+        return SpecStatus(
+            name=spec_status.name,
+            path=spec_status.path,
+            status=spec_status.status,
+            last_modified=spec_status.last_modified,
+            validation_result=outcome,
+            is_blocking=spec_status.is_blocking,
+            error=spec_status.error,
+        )
 
     def _compute_blocking(self, spec_status: SpecStatus) -> SpecStatus:
         """Compute whether a spec is blocking commits.
@@ -285,26 +350,7 @@ class SpecScanner:
         Returns:
             True if the file is in git's staging area.
         """
-        try:
-            result = subprocess.run(
-                ["git", "diff", "--cached", "--name-only"],
-                capture_output=True,
-                text=True,
-                cwd=self.project_root,
-            )
-            if result.returncode != 0:
-                return False
-
-            # Check if spec path (relative) is in staged files
-            try:
-                relative_path = spec_path.relative_to(self.project_root)
-                return str(relative_path) in result.stdout
-            except ValueError:
-                return False
-
-        except (FileNotFoundError, subprocess.SubprocessError):
-            # Git not available or command failed
-            return False
+        return self.staged_files.contains_file(spec_path, self.project_root)
 
     def generate_report(self, include_validation: bool = True) -> StatusReport:
         """Scan all specs and generate a StatusReport.
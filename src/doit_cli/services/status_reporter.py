@@ -4,10 +4,14 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ..models.status_models import SpecState, SpecStatus, StatusReport
 from .spec_scanner import SpecScanner
 
+if TYPE_CHECKING:
+    from .spec_cache import SpecCache
+
 
 class StatusReporter:
     """Aggregates spec statuses into reports with statistics and filtering.
@@ -20,6 +24,7 @@ class StatusReporter:
         self,
         project_root: Path | None = None,
         validate: bool = True,
+        cache: SpecCache | None = None,
     ) -> None:
         """Initialize reporter with project root.
 
@@ -27,8 +32,9 @@ class StatusReporter:
             project_root: Root directory of the doit project.
                          Defaults to current working directory.
             validate: Whether to run validation on specs.
+            cache: Optional parsed-spec cache passed to the scanner.
         """
-        self.scanner = SpecScanner(project_root, validate=validate)
+        self.scanner = SpecScanner(project_root, validate=validate, cache=cache)
         self.project_root = self.scanner.project_root
 
     def generate_report(
@@ -36,6 +42,7 @@ class StatusReporter:
         status_filter: SpecState | None = None,
         blocking_only: bool = False,
         recent_days: int | None = None,
+        jobs: int = 1,
     ) -> StatusReport:
         """Generate a status report with optional filtering.
 
@@ -43,12 +50,13 @@ class StatusReporter:
             status_filter: Only include specs with this status.
             blocking_only: Only include specs blocking commits.
             recent_days: Only include specs modified in last N days.
+            jobs: Worker processes used to validate specs.
 
         Returns:
             StatusReport with filtered specs and computed statistics.
         """
         # Scan all specs
-        specs = self.scanner.scan(include_validation=True)
+        specs = self.scanner.scan(include_validation=True, jobs=jobs)
 
         # Apply filters
         specs = self._apply_filters(
@@ -0,0 +1,169 @@
+"""Content-hash manifest of files generated by `doit sync-prompts`.
+
+`PromptWriter`, `CommandWriter` and `DriftDetector` used to compare the
+mtimes of command templates and their generated prompts/commands. A fresh
+clone or checkout resets every mtime, so sync rewrote every output and
+drift detection reported false drift.
+
+The manifest, stored in `.doit/cache/sync-manifest.json`, records for each
+generated file the hash of the source it was generated from, the hash of
+the content written, and the size and mtime it had afterwards. An output
+is up to date when its source hash matches and either its stat matches
+(no read needed) or its content still hashes to the recorded value. Only
+outputs without a matching entry (first run, new clone) are re-rendered,
+and those whose content already matches are recorded without being
+rewritten.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .. import __version__
+from ..models.sync_models import SyncStatusEnum
+from ..utils.atomic_write import write_text_atomic
+from .spec_cache import content_hash
+
+logger = logging.getLogger(__name__)
+
+# Bump when the shape of manifest entries changes.
+MANIFEST_FORMAT_VERSION = 1
+
+
+def source_hash(content: str, generator: str) -> str:
+    """Hash a template for one kind of generated output.
+
+    Args:
+        content: Template content.
+        generator: Name of the transformation producing the output
+            (e.g. ``"copilot-prompt"``). The doit version is included, so an
+            upgrade re-checks every output once.
+
+    Returns:
+        Hex digest identifying the output's expected content.
+    """
+    return content_hash(f"{__version__}\n{generator}\n{content}")
+
+
+def _read_output(path: Path) -> str:
+    """Read a generated file exactly as written (no newline translation)."""
+    with open(path, encoding="utf-8", errors="replace", newline="") as handle:
+        return handle.read()
+
+
+@dataclass
+class SyncManifest:
+    """Source and output hashes of generated agent files.
+
+    Call `save()` once at the end of a run to persist new entries.
+
+    Attributes:
+        project_root: Root of the doit project
+    """
+
+    CACHE_PATH = ".doit/cache/sync-manifest.json"
+
+    project_root: Path
+    _entries: dict[str, dict[str, Any]] | None = field(default=None, init=False, repr=False)
+    _dirty: bool = field(default=False, init=False, repr=False)
+
+    @property
+    def cache_path(self) -> Path:
+        """Location of the manifest file."""
+        return self.project_root / self.CACHE_PATH
+
+    def check(self, output_path: Path, source: str, render: Callable[[], str]) -> SyncStatusEnum:
+        """Check whether a generated file matches its source.
+
+        Args:
+            output_path: Generated file.
+            source: `source_hash` of the template it is generated from.
+            render: Produces the expected content. Only called when the
+                manifest can't vouch for the file.
+
+        Returns:
+            MISSING if the file doesn't exist, SYNCHRONIZED if its content is
+            what the source generates, else OUT_OF_SYNC.
+        """
+        try:
+            stat = output_path.stat()
+        except FileNotFoundError:
+            return SyncStatusEnum.MISSING
+
+        entry = self._load().get(self._key(output_path))
+        if entry is not None and entry.get("source") == source:
+            if entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+                return SyncStatusEnum.SYNCHRONIZED
+            content = _read_output(output_path)
+            if content_hash(content) == entry.get("output"):
+                # Touched but unchanged
+                self.record(output_path, source, content)
+                return SyncStatusEnum.SYNCHRONIZED
+        else:
+            content = _read_output(output_path)
+
+        if content == render():
+            self.record(output_path, source, content)
+            return SyncStatusEnum.SYNCHRONIZED
+        return SyncStatusEnum.OUT_OF_SYNC
+
+    def record(self, output_path: Path, source: str, content: str) -> None:
+        """Record a generated file as it is on disk now.
+
+        Args:
+            output_path: Generated file, already written.
+            source: `source_hash` of the template it was generated from.
+            content: Content of the file.
+        """
+        stat = output_path.stat()
+        self._load()[self._key(output_path)] = {
+            "source": source,
+            "output": content_hash(content),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write new entries to disk. No-op when unchanged.
+
+        Failures are logged and swallowed: the manifest is an optimization
+        and must never fail the command that uses it.
+        """
+        if not self._dirty or self._entries is None:
+            return
+        if not (self.project_root / ".doit").is_dir():
+            # Never create .doit/ outside a doit project.
+            return
+        payload = {"version": MANIFEST_FORMAT_VERSION, "entries": self._entries}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_text_atomic(self.cache_path, json.dumps(payload, sort_keys=True))
+            self._dirty = False
+        except OSError as exc:
+            logger.debug("sync manifest not written: %s", exc)
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return self._entries
+        if isinstance(data, dict) and data.get("version") == MANIFEST_FORMAT_VERSION:
+            entries = data.get("entries")
+            if isinstance(entries, dict):
+                self._entries = entries
+        return self._entries
+
+    def _key(self, path: Path) -> str:
+        try:
+            return Path(path).resolve().relative_to(self.project_root.resolve()).as_posix()
+        except ValueError:
+            return Path(path).resolve().as_posix()
@@ -5,9 +5,40 @@ from __future__ import annotations
 import hashlib
 import re
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ..models.crossref_models import Task, TaskReference
 
+if TYPE_CHECKING:
+    from .spec_cache import SpecCache
+
+
+class _TokenIndex:
+    """Normalized word sets of candidate descriptions, indexed by word.
+
+    A description is only scored against candidates sharing at least one
+    word with it; every other candidate has a similarity of 0. Scores are
+    the same Jaccard similarity as `TaskParser._calculate_similarity`.
+    """
+
+    def __init__(self, word_sets: list[frozenset[str]]) -> None:
+        self.word_sets = word_sets
+        self.postings: dict[str, list[int]] = {}
+        for position, words in enumerate(word_sets):
+            for word in words:
+                self.postings.setdefault(word, []).append(position)
+
+    def scores(self, words: frozenset[str]) -> dict[int, float]:
+        """Similarity of ``words`` to each candidate sharing a word, by position."""
+        shared: dict[int, int] = {}
+        for word in words:
+            for position in self.postings.get(word, ()):
+                shared[position] = shared.get(position, 0) + 1
+        return {
+            position: count / (len(words) + len(self.word_sets[position]) - count)
+            for position, count in shared.items()
+        }
+
 
 class TaskParser:
     """Parses tasks.md files to extract tasks and their requirement references.
@@ -30,13 +61,15 @@ class TaskParser:
     # Pattern to extract individual FR-XXX from comma-separated list
     FR_PATTERN = re.compile(r"FR-\d{3}")
 
-    def __init__(self, tasks_path: Path | None = None) -> None:
+    def __init__(self, tasks_path: Path | None = None, cache: SpecCache | None = None) -> None:
         """Initialize parser with optional tasks file path.
 
         Args:
             tasks_path: Path to tasks.md file. Can be set later via parse().
+            cache: Optional parsed-spec cache consulted by parse().
         """
         self.tasks_path = tasks_path
+        self.cache = cache
 
     def parse(self, tasks_path: Path | None = None) -> list[Task]:
         """Parse tasks.md and extract all tasks with their references.
@@ -60,7 +93,14 @@ class TaskParser:
             raise FileNotFoundError(f"Tasks file not found: {path}")
 
         content = path.read_text(encoding="utf-8")
-        return self.parse_content(content, str(path))
+        if self.cache is None:
+            return self.parse_content(content, str(path))
+
+        tasks = self.cache.get_tasks(path, content)
+        if tasks is None:
+            tasks = self.parse_content(content, str(path))
+            self.cache.put_tasks(path, content, tasks)
+        return tasks
 
     def parse_content(self, content: str, tasks_file: str) -> list[Task]:
         """Parse content string and extract tasks.
@@ -211,17 +251,21 @@ class TaskParser:
 
         result: list[Task] = []
         used_old_tasks: set[str] = set()
+        index = _TokenIndex([self._word_set(task.description) for task in old_tasks])
 
         for new_task in new_tasks:
             best_match: Task | None = None
             best_score = 0.0
 
-            for old_task in old_tasks:
+            # Only old tasks sharing a word can score above 0; visit them
+            # in file order so ties still go to the earliest one
+            scores = index.scores(self._word_set(new_task.description))
+            for position, score in sorted(scores.items()):
+                old_task = old_tasks[position]
                 # Skip already matched old tasks
                 if old_task.id in used_old_tasks:
                     continue
 
-                score = self._calculate_similarity(new_task.description, old_task.description)
                 if score > best_score and score >= similarity_threshold:
                     best_score = score
                     best_match = old_task
@@ -248,8 +292,8 @@ class TaskParser:
         Returns:
             Similarity score between 0.0 (no match) and 1.0 (identical).
         """
-        words1 = set(self._normalize_for_matching(text1).split())
-        words2 = set(self._normalize_for_matching(text2).split())
+        words1 = self._word_set(text1)
+        words2 = self._word_set(text2)
 
         if not words1 or not words2:
             return 0.0
@@ -259,6 +303,10 @@ class TaskParser:
 
         return len(intersection) / len(union) if union else 0.0
 
+    def _word_set(self, text: str) -> frozenset[str]:
+        """Words of a description after `_normalize_for_matching`."""
+        return frozenset(self._normalize_for_matching(text).split())
+
     def _normalize_for_matching(self, text: str) -> str:
         """Normalize description for similarity comparison.
 
@@ -299,6 +347,8 @@ class TaskParser:
         """
         lines = content.split("\n")
         result_lines: list[str] = []
+        keys = list(reference_map)
+        index = _TokenIndex([self._word_set(key) for key in keys])
 
         for line in lines:
             match = self.TASK_PATTERN.match(line)
@@ -307,12 +357,13 @@ class TaskParser:
                 cleaned = self._clean_description(description)
                 normalized = self._normalize_for_matching(cleaned)
 
-                # Look for matching references
+                # Look for matching references: the first key (in map order)
+                # that is similar enough
                 refs_to_add: list[TaskReference] = []
-                for key, refs in reference_map.items():
-                    if self._calculate_similarity(normalized, key) >= 0.7:
-                        refs_to_add = refs
-                        break
+                scores = index.scores(self._word_set(normalized))
+                matches = [position for position, score in scores.items() if score >= 0.7]
+                if matches:
+                    refs_to_add = reference_map[keys[min(matches)]]
 
                 if refs_to_add and not self.REFERENCE_PATTERN.search(line):
                     # Format references to add
@@ -0,0 +1,106 @@
+"""Project-wide requirement-to-task traceability."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ..models.crossref_models import CoverageReport, Task, TraceabilityMatrix
+from .coverage_calculator import CoverageCalculator
+from .requirement_parser import RequirementParser
+from .spec_document import SpecDocument
+from .task_parser import TaskParser
+
+if TYPE_CHECKING:
+    from .spec_cache import SpecCache
+
+
+class TraceabilityService:
+    """Builds the requirement-to-task matrix for every feature in a project.
+
+    Each feature's spec.md and tasks.md are parsed once, and the links
+    are kept in memory as a `TraceabilityMatrix`. `CrossReferenceService`
+    answers questions about one spec; this service backs the project-wide
+    views (`doit xref coverage --all`, traceability validation rules and
+    the MCP `doit_tasks` tool).
+    """
+
+    def __init__(
+        self,
+        project_root: Path | None = None,
+        specs_dir: str = "specs",
+        cache: SpecCache | None = None,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            project_root: Root directory of the project. Defaults to cwd.
+            specs_dir: Name of the specs directory.
+            cache: Optional parsed-spec cache shared by the parsers.
+        """
+        self.project_root = Path(project_root) if project_root else Path.cwd()
+        self.specs_dir = specs_dir
+        self.requirement_parser = RequirementParser(cache=cache)
+        self.task_parser = TaskParser(cache=cache)
+        self.coverage_calculator = CoverageCalculator(
+            self.requirement_parser,
+            self.task_parser,
+        )
+
+    def spec_files(self) -> list[Path]:
+        """Return every ``<specs_dir>/*/spec.md``, sorted by feature name."""
+        specs_dir = self.project_root / self.specs_dir
+        if not specs_dir.is_dir():
+            return []
+        return sorted(specs_dir.glob("*/spec.md"))
+
+    def build(self, features: list[str] | None = None) -> TraceabilityMatrix:
+        """Build the matrix for all features, or only the named ones.
+
+        Args:
+            features: Feature directory names to include. Names without a
+                spec.md are skipped.
+
+        Returns:
+            TraceabilityMatrix with one coverage report per feature.
+        """
+        spec_files = self.spec_files()
+        if features is not None:
+            wanted = set(features)
+            spec_files = [path for path in spec_files if path.parent.name in wanted]
+
+        return TraceabilityMatrix(
+            reports={path.parent.name: self.build_report(path) for path in spec_files}
+        )
+
+    def build_report(
+        self,
+        spec_path: Path,
+        spec_content: str | SpecDocument | None = None,
+    ) -> CoverageReport:
+        """Build the coverage report of one spec and its sibling tasks.md.
+
+        Args:
+            spec_path: Path to spec.md.
+            spec_content: Already-read spec content or document. The spec
+                is read from disk when omitted.
+
+        Returns:
+            CoverageReport for the spec.
+
+        Raises:
+            FileNotFoundError: If spec_content is omitted and spec.md
+                doesn't exist.
+        """
+        spec_path = Path(spec_path)
+        if spec_content is None:
+            requirements = self.requirement_parser.parse(spec_path)
+        else:
+            requirements = self.requirement_parser.parse_content(spec_content, str(spec_path))
+
+        tasks_path = spec_path.parent / "tasks.md"
+        tasks: list[Task] = []
+        if tasks_path.exists():
+            tasks = self.task_parser.parse(tasks_path)
+
+        return self.coverage_calculator.build_report(str(spec_path), requirements, tasks)
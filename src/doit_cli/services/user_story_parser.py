@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 
 from ..models.diagram_models import AcceptanceScenario, ParsedUserStory
+from .spec_document import Heading, SpecDocument
 
 
 class UserStoryParser:
@@ -33,39 +34,42 @@ class UserStoryParser:
         re.IGNORECASE | re.MULTILINE,
     )
 
-    def parse(self, content: str) -> list[ParsedUserStory]:
+    def parse(self, content: str | SpecDocument) -> list[ParsedUserStory]:
         """Parse all user stories from spec content.
 
         Args:
-            content: Full content of spec.md file
+            content: Full content of spec.md file, or its parsed document
 
         Returns:
             List of ParsedUserStory objects
         """
         stories: list[ParsedUserStory] = []
+        document = SpecDocument.of(content)
+        text = document.content
 
         # Find all story headers and their positions
-        header_matches = list(self.STORY_HEADER_PATTERN.finditer(content))
+        headers = self._story_headers(document)
 
-        if not header_matches:
+        if not headers:
             return stories
 
         # Extract each story's content
-        for i, match in enumerate(header_matches):
+        for i, (heading, match) in enumerate(headers):
             story_number = int(match.group(1))
             title = match.group(2).strip()
             priority = match.group(3).strip().upper()
 
             # Determine story content boundaries
-            start_pos = match.end()
-            if i + 1 < len(header_matches):
-                end_pos = header_matches[i + 1].start()
+            header_pos = document.line_starts[heading.index]
+            start_pos = header_pos + len(document.lines[heading.index])
+            if i + 1 < len(headers):
+                end_pos = document.line_starts[headers[i + 1][0].index]
             else:
                 # Last story - find next major section or end of file
-                next_section = self._find_next_section(content, start_pos)
-                end_pos = next_section if next_section else len(content)
+                next_section = document.next_heading(heading.index, max_level=2)
+                end_pos = document.line_starts[next_section.index] if next_section else len(text)
 
-            story_content = content[start_pos:end_pos].strip()
+            story_content = text[start_pos:end_pos].strip()
 
             # Extract description and scenarios
             description = self._extract_description(story_content)
@@ -78,17 +82,35 @@ class UserStoryParser:
                 priority=priority,
                 description=description,
                 scenarios=scenarios,
-                raw_text=content[match.start() : end_pos],
+                raw_text=text[header_pos:end_pos],
             )
             stories.append(story)
 
         return stories
 
-    def parse_single(self, content: str) -> ParsedUserStory | None:
+    def _story_headers(self, document: SpecDocument) -> list[tuple[Heading, re.Match[str]]]:
+        """Return each user story heading with its header-pattern match.
+
+        Args:
+            document: Parsed spec
+
+        Returns:
+            (heading, match) pairs in document order
+        """
+        headers = []
+        for heading in document.headings:
+            if heading.level != 3:
+                continue
+            match = self.STORY_HEADER_PATTERN.match(document.lines[heading.index])
+            if match:
+                headers.append((heading, match))
+        return headers
+
+    def parse_single(self, content: str | SpecDocument) -> ParsedUserStory | None:
         """Parse a single user story from content.
 
         Args:
-            content: Content containing one user story
+            content: Content containing one user story, or its parsed document
 
         Returns:
             ParsedUserStory if found, None otherwise
@@ -182,30 +204,13 @@ class UserStoryParser:
         text = " ".join(text.split())
         return text.strip()
 
-    def _find_next_section(self, content: str, start_pos: int) -> int | None:
-        """Find the position of the next major section.
-
-        Args:
-            content: Full file content
-            start_pos: Position to start searching from
-
-        Returns:
-            Position of next section header, or None if not found
-        """
-        # Look for ## or ### headers that aren't user stories
-        section_pattern = re.compile(r"^##\s+[^#]", re.MULTILINE)
-        match = section_pattern.search(content, start_pos)
-
-        if match:
-            return match.start()
-
-        return None
-
-    def get_story_by_number(self, content: str, story_number: int) -> ParsedUserStory | None:
+    def get_story_by_number(
+        self, content: str | SpecDocument, story_number: int
+    ) -> ParsedUserStory | None:
         """Get a specific user story by number.
 
         Args:
-            content: Spec content to parse
+            content: Spec content to parse, or its parsed document
             story_number: Story number to find (1, 2, 3...)
 
         Returns:
@@ -217,13 +222,34 @@ class UserStoryParser:
                 return story
         return None
 
-    def count_stories(self, content: str) -> int:
+    def count_stories(self, content: str | SpecDocument) -> int:
         """Count user stories in content without full parsing.
 
         Args:
-            content: Spec content to check
+            content: Spec content to check, or its parsed document
 
         Returns:
             Number of user stories found
         """
-        return len(self.STORY_HEADER_PATTERN.findall(content))
+        return len(self._story_headers(SpecDocument.of(content)))
+
+    def source_range(self, content: str | SpecDocument) -> tuple[int, int] | None:
+        """Return the lines the user stories are parsed from.
+
+        Args:
+            content: Spec content to check, or its parsed document
+
+        Returns:
+            ``(start, end)`` 0-based, end-exclusive line indices from the
+            first story heading to the end of the last story, or None if
+            there are no stories
+        """
+        document = SpecDocument.of(content)
+        headers = self._story_headers(document)
+        if not headers:
+            return None
+
+        last = headers[-1][0]
+        next_section = document.next_heading(last.index, max_level=2)
+        end = next_section.index if next_section else len(document.lines)
+        return headers[0][0].index, end
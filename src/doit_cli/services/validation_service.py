@@ -2,13 +2,46 @@
 
 from __future__ import annotations
 
+import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-from ..models.validation_models import ValidationConfig, ValidationResult
+from ..models.validation_models import (
+    Severity,
+    ValidationConfig,
+    ValidationIssue,
+    ValidationResult,
+)
 from .config_loader import load_validation_config
 from .rule_engine import RuleEngine
 from .score_calculator import ScoreCalculator
+from .spec_cache import SpecCache, content_hash
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Normalize a ``--jobs`` value: 0 or less means one worker per CPU."""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+# Per-process service used by pool workers; built once by the initializer.
+_worker_service: ValidationService | None = None
+
+
+def _init_worker(project_root: Path, config: ValidationConfig) -> None:
+    global _worker_service
+    _worker_service = ValidationService(project_root, config=config)
+
+
+def _evaluate_in_worker(spec_path: Path, content: str) -> ValidationResult:
+    assert _worker_service is not None, "worker not initialized"
+    return _worker_service._evaluate(spec_path, content)
 
 
 class ValidationService:
@@ -24,6 +57,7 @@ class ValidationService:
         self,
         project_root: Path | None = None,
         config: ValidationConfig | None = None,
+        cache: SpecCache | None = None,
     ) -> None:
         """Initialize validation service.
 
@@ -31,10 +65,14 @@ class ValidationService:
             project_root: Root directory for spec discovery. Defaults to cwd.
             config: Validation configuration. Uses defaults if None.
                     If None, attempts to load from .doit/validation-rules.yaml.
+            cache: Optional parsed-spec cache. When set, results for specs
+                   whose content, sibling tasks.md and rules are unchanged
+                   are served without evaluating rules.
         """
         self.project_root = project_root or Path.cwd()
         self.config = config or load_validation_config(self.project_root)
-        self.rule_engine = RuleEngine(config=self.config)
+        self.cache = cache
+        self.rule_engine = RuleEngine(config=self.config, cache=cache)
         self.score_calculator = ScoreCalculator()
 
     def validate_file(self, spec_path: Path) -> ValidationResult:
@@ -50,6 +88,116 @@ class ValidationService:
             FileNotFoundError: If spec_path doesn't exist.
             ValueError: If file is not a valid markdown file.
         """
+        spec_path, content = self._read_spec(spec_path)
+
+        # Handle empty files
+        if not content.strip():
+            return self._empty_file_result(spec_path)
+
+        result = self._cached_result(spec_path, content)
+        if result is None:
+            result = self._evaluate(spec_path, content)
+            self._store_result(spec_path, content, result)
+        return result
+
+    def validate_files(
+        self,
+        spec_files: list[Path],
+        jobs: int = 1,
+        *,
+        return_exceptions: bool = False,
+    ) -> list[ValidationResult | Exception]:
+        """Validate several spec files, optionally across worker processes.
+
+        Specs are independent and rule evaluation is CPU-bound, so with
+        ``jobs > 1`` cache misses are evaluated in a process pool. Files are
+        read and the cache is consulted in this process; results come back
+        in the order of ``spec_files`` and are identical to a serial run.
+
+        Args:
+            spec_files: Spec files to validate.
+            jobs: Worker processes to use. 1 validates serially; 0 or less
+                  uses one worker per CPU.
+            return_exceptions: Return errors raised for a file in its slot
+                  instead of raising the first one.
+
+        Returns:
+            One ValidationResult (or exception) per input file, in order.
+        """
+        jobs = resolve_jobs(jobs)
+        outcomes: list[ValidationResult | Exception | None] = [None] * len(spec_files)
+        misses: list[tuple[int, Path, str]] = []
+
+        for index, spec_file in enumerate(spec_files):
+            try:
+                spec_path, content = self._read_spec(spec_file)
+                if not content.strip():
+                    outcomes[index] = self._empty_file_result(spec_path)
+                    continue
+                cached = self._cached_result(spec_path, content)
+                if cached is not None:
+                    outcomes[index] = cached
+                elif jobs == 1:
+                    result = self._evaluate(spec_path, content)
+                    self._store_result(spec_path, content, result)
+                    outcomes[index] = result
+                else:
+                    misses.append((index, spec_path, content))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                outcomes[index] = e
+
+        if misses:
+            self._evaluate_in_pool(misses, jobs, outcomes, return_exceptions)
+
+        return [outcome for outcome in outcomes if outcome is not None]
+
+    def _evaluate_in_pool(
+        self,
+        misses: list[tuple[int, Path, str]],
+        jobs: int,
+        outcomes: list[ValidationResult | Exception | None],
+        return_exceptions: bool,
+    ) -> None:
+        """Evaluate cache misses in a process pool, filling ``outcomes``."""
+        pool: Executor
+        evaluate: Callable[[Path, str], ValidationResult]
+        try:
+            pool = ProcessPoolExecutor(
+                max_workers=min(jobs, len(misses)),
+                initializer=_init_worker,
+                initargs=(self.project_root, self.config),
+            )
+            evaluate = _evaluate_in_worker
+        except (OSError, NotImplementedError) as e:
+            # No multiprocessing support (e.g. restricted sandbox): go serial.
+            logger.debug("process pool unavailable, validating serially: %s", e)
+            pool = ThreadPoolExecutor(max_workers=1)
+            evaluate = self._evaluate
+
+        with pool:
+            futures = [
+                pool.submit(evaluate, spec_path, content) for _, spec_path, content in misses
+            ]
+            for (index, spec_path, content), future in zip(misses, futures, strict=True):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    outcomes[index] = e
+                    continue
+                self._store_result(spec_path, content, result)
+                outcomes[index] = result
+
+    def _read_spec(self, spec_path: Path) -> tuple[Path, str]:
+        """Resolve and read a spec file.
+
+        Raises:
+            FileNotFoundError: If spec_path doesn't exist.
+            ValueError: If file is not a readable markdown file.
+        """
         # Ensure path is absolute
         if not spec_path.is_absolute():
             spec_path = self.project_root / spec_path
@@ -66,26 +214,28 @@ class ValidationService:
         except (OSError, UnicodeDecodeError) as e:
             raise ValueError(f"Could not read file: {e}") from e
 
-        # Handle empty files
-        if not content.strip():
-            result = ValidationResult(
-                spec_path=str(spec_path),
-                validated_at=datetime.now(),
-            )
-            from ..models.validation_models import Severity, ValidationIssue
-
-            result.add_issue(
-                ValidationIssue(
-                    rule_id="empty-file",
-                    severity=Severity.ERROR,
-                    line_number=0,
-                    message="Spec file is empty",
-                    suggestion="Add content following the spec template structure",
-                )
+        return spec_path, content
+
+    def _empty_file_result(self, spec_path: Path) -> ValidationResult:
+        """Build the result reported for an empty spec file."""
+        result = ValidationResult(
+            spec_path=str(spec_path),
+            validated_at=datetime.now(),
+        )
+        result.add_issue(
+            ValidationIssue(
+                rule_id="empty-file",
+                severity=Severity.ERROR,
+                line_number=0,
+                message="Spec file is empty",
+                suggestion="Add content following the spec template structure",
             )
-            result.quality_score = 0
-            return result
+        )
+        result.quality_score = 0
+        return result
 
+    def _evaluate(self, spec_path: Path, content: str) -> ValidationResult:
+        """Evaluate all rules against spec content and score the result."""
         # Evaluate rules
         issues = self.rule_engine.evaluate(content, spec_path)
 
@@ -93,20 +243,58 @@ class ValidationService:
         score = self.score_calculator.calculate(issues)
 
         # Create result
-        result = ValidationResult(
+        return ValidationResult(
             spec_path=str(spec_path),
             issues=issues,
             quality_score=score,
             validated_at=datetime.now(),
         )
 
-        return result
+    def _cached_result(self, spec_path: Path, content: str) -> ValidationResult | None:
+        """Return a fresh result from the cache, or None on a miss."""
+        if self.cache is None:
+            return None
+        cached = self.cache.get_validation(spec_path, content, self._cache_key(spec_path))
+        if cached is None:
+            return None
+        issues, score = cached
+        return ValidationResult(
+            spec_path=str(spec_path),
+            issues=issues,
+            quality_score=score,
+            validated_at=datetime.now(),
+        )
+
+    def _store_result(self, spec_path: Path, content: str, result: ValidationResult) -> None:
+        """Record an evaluated result in the cache, if one is configured."""
+        if self.cache is not None:
+            self.cache.put_validation(
+                spec_path,
+                content,
+                self._cache_key(spec_path),
+                result.issues,
+                result.quality_score,
+            )
+
+    def _cache_key(self, spec_path: Path) -> str:
+        """Build the validation cache key for a spec.
+
+        Traceability rules read the sibling tasks.md, so its content is part
+        of the key alongside the rule-set fingerprint.
+        """
+        tasks_path = spec_path.parent / "tasks.md"
+        try:
+            tasks_hash = content_hash(tasks_path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError):
+            tasks_hash = ""
+        return f"{self.rule_engine.fingerprint()}:{tasks_hash}"
 
-    def validate_directory(self, specs_dir: Path) -> list[ValidationResult]:
+    def validate_directory(self, specs_dir: Path, jobs: int = 1) -> list[ValidationResult]:
         """Validate all spec files in a directory.
 
         Args:
             specs_dir: Directory containing spec files.
+            jobs: Worker processes to use (see validate_files).
 
         Returns:
             List of ValidationResult, one per spec file found.
@@ -117,43 +305,62 @@ class ValidationService:
         if not specs_dir.exists():
             return []
 
+        # Find all spec.md files in subdirectories
+        spec_files = sorted(specs_dir.rglob("spec.md"))
+        outcomes = self.validate_files(spec_files, jobs, return_exceptions=True)
+
         results: list[ValidationResult] = []
+        for spec_file, outcome in zip(spec_files, outcomes, strict=True):
+            if isinstance(outcome, (FileNotFoundError, ValueError)):
+                results.append(self.file_error_result(spec_file, outcome))
+            elif isinstance(outcome, Exception):
+                raise outcome
+            else:
+                results.append(outcome)
 
-        # Find all spec.md files in subdirectories
-        for spec_file in sorted(specs_dir.rglob("spec.md")):
-            try:
-                result = self.validate_file(spec_file)
-                results.append(result)
-            except (FileNotFoundError, ValueError) as e:
-                # Create error result for unreadable files
-                from ..models.validation_models import Severity, ValidationIssue
-
-                result = ValidationResult(
-                    spec_path=str(spec_file),
-                    validated_at=datetime.now(),
-                )
-                result.add_issue(
-                    ValidationIssue(
-                        rule_id="file-error",
-                        severity=Severity.ERROR,
-                        line_number=0,
-                        message=str(e),
-                        suggestion="Check file permissions and encoding",
-                    )
-                )
-                result.quality_score = 0
-                results.append(result)
+        if self.cache is not None:
+            self.cache.save()
 
         return results
 
-    def validate_all(self) -> list[ValidationResult]:
+    @staticmethod
+    def file_error_result(spec_file: Path, error: Exception) -> ValidationResult:
+        """Build the result reported for a spec file that could not be read.
+
+        Args:
+            spec_file: Path of the unreadable spec.
+            error: The error raised while reading it.
+
+        Returns:
+            ValidationResult with a single file-error issue and a zero score.
+        """
+        result = ValidationResult(
+            spec_path=str(spec_file),
+            validated_at=datetime.now(),
+        )
+        result.add_issue(
+            ValidationIssue(
+                rule_id="file-error",
+                severity=Severity.ERROR,
+                line_number=0,
+                message=str(error),
+                suggestion="Check file permissions and encoding",
+            )
+        )
+        result.quality_score = 0
+        return result
+
+    def validate_all(self, jobs: int = 1) -> list[ValidationResult]:
         """Validate all specs in project's specs/ directory.
 
+        Args:
+            jobs: Worker processes to use (see validate_files).
+
         Returns:
             List of ValidationResult for all specs found.
         """
         specs_dir = self.project_root / self.SPECS_DIR
-        return self.validate_directory(specs_dir)
+        return self.validate_directory(specs_dir, jobs)
 
     def get_summary(self, results: list[ValidationResult]) -> dict:
         """Generate summary statistics for multiple results.
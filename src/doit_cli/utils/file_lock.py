@@ -0,0 +1,52 @@
+"""Inter-process file lock.
+
+Serialises writers of shared state files (e.g. the notification log)
+across processes, such as a running `doit team watch` and a command run
+in another terminal. The lock is advisory and taken on a separate lock
+file, so readers never block and the data files can be replaced
+atomically while it is held.
+
+Uses ``fcntl.flock`` on POSIX and ``msvcrt.locking`` on Windows.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on ``path`` for the duration of the block.
+
+    Args:
+        path: Lock file. Created (with its parent directory) if missing.
+
+    Raises:
+        OSError: If the lock file cannot be created or locked.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, "a+b") as handle:
+        if os.name == "nt":
+            import msvcrt
+
+            handle.seek(0)
+            # LK_LOCK retries for about ten seconds before raising OSError
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)  # type: ignore[attr-defined]
+            try:
+                yield
+            finally:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)  # type: ignore[attr-defined]
+        else:
+            import fcntl
+
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
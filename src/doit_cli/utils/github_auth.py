@@ -6,9 +6,13 @@ verify that the GitHub CLI (gh) is available and authenticated.
 
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
 
+# Tokens already read from ``gh auth token``, keyed by host
+_gh_tokens: dict[str, str | None] = {}
+
 
 def has_github_remote() -> bool:
     """Check if the current directory is a git repository with a GitHub remote.
@@ -20,20 +24,8 @@ def has_github_remote() -> bool:
         >>> has_github_remote()  # In a GitHub repo
         True
     """
-    try:
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode != 0:
-            return False
-
-        remote_url = result.stdout.strip()
-        return "github.com" in remote_url
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return False
+    remote_url = _origin_url()
+    return remote_url is not None and "github.com" in remote_url
 
 
 def has_gh_cli() -> bool:
@@ -75,6 +67,53 @@ def is_gh_authenticated() -> bool:
         return False
 
 
+def get_github_token(host: str | None = None) -> str | None:
+    """Get an API token for github.com or a GitHub Enterprise host.
+
+    The ``GH_TOKEN``/``GITHUB_TOKEN`` environment variables win (or
+    ``GH_ENTERPRISE_TOKEN``/``GITHUB_ENTERPRISE_TOKEN`` for an enterprise
+    host); otherwise the token stored by ``gh auth login`` is read once per
+    host and reused.
+
+    Args:
+        host: Enterprise host name, or None for github.com
+
+    Returns:
+        The token, or None if no token is available
+
+    Examples:
+        >>> get_github_token()
+        'gho_...'  # If gh auth login has been run successfully
+    """
+    env_names = (
+        ("GH_ENTERPRISE_TOKEN", "GITHUB_ENTERPRISE_TOKEN") if host else ("GH_TOKEN", "GITHUB_TOKEN")
+    )
+    for name in env_names:
+        if os.environ.get(name):
+            return os.environ[name]
+
+    key = host or "github.com"
+    if key not in _gh_tokens:
+        _gh_tokens[key] = _read_gh_token(host)
+    return _gh_tokens[key]
+
+
+def _read_gh_token(host: str | None) -> str | None:
+    """Read the token stored by the GitHub CLI for a host."""
+    if not has_gh_cli():
+        return None
+
+    cmd = ["gh", "auth", "token"]
+    if host:
+        cmd.extend(["--hostname", host])
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    token = result.stdout.strip()
+    return token if result.returncode == 0 and token else None
+
+
 def get_github_config_status() -> tuple[bool, str]:
     """Get comprehensive GitHub configuration status.
 
@@ -112,34 +151,15 @@ def get_repository_name() -> str | None:
         >>> get_repository_name()
         'seanbarlow/doit'
     """
-    if not has_github_remote():
-        return None
+    from ..services.git_context import parse_repo_slug
 
-    try:
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode != 0:
-            return None
-
-        remote_url = result.stdout.strip()
-
-        # Parse repository name from URL (handles both HTTPS and SSH)
-        # HTTPS: https://github.com/owner/repo.git
-        # SSH: git@github.com:owner/repo.git
-        if "github.com/" in remote_url:
-            parts = remote_url.split("github.com/")[1]
-        elif "github.com:" in remote_url:
-            parts = remote_url.split("github.com:")[1]
-        else:
-            return None
-
-        # Remove .git suffix if present
-        repo_name = parts.replace(".git", "")
-        return repo_name
-
-    except (subprocess.TimeoutExpired, FileNotFoundError, IndexError):
-        return None
+    remote_url = _origin_url()
+    return parse_repo_slug(remote_url) if remote_url else None
+
+
+def _origin_url() -> str | None:
+    """Get the origin remote URL from the shared git context."""
+    from ..services.git_context import get_git_context
+
+    context = get_git_context()
+    return context.remote_url() if context is not None else None
@@ -107,6 +107,20 @@ class TestAnalyticsShowCommand:
         assert "by_status" in data
         assert "completion_pct" in data
 
+    def test_show_no_cache_option(self, doit_project_with_analytics):
+        """Test --no-cache is accepted after the subcommand and skips the cache."""
+        cache_file = doit_project_with_analytics / ".doit" / "cache" / "specs.json"
+
+        result = run_analytics_command(doit_project_with_analytics, "show", "--no-cache")
+
+        assert result.returncode == 0
+        assert not cache_file.exists()
+
+        result = run_analytics_command(doit_project_with_analytics, "show")
+
+        assert result.returncode == 0
+        assert cache_file.exists()
+
     def test_show_not_doit_project(self, non_doit_project):
         """Test show command in non-doit directory."""
         result = run_analytics_command(non_doit_project, "show")
@@ -264,6 +264,47 @@ class TestDiagramCommandAutoDetect:
         assert result.exit_code in [0, 1, 3]
 
 
+class TestDiagramGenerateAll:
+    """Tests for generating diagrams across all specs."""
+
+    @pytest.fixture
+    def project(self, tmp_path, sample_spec_content, monkeypatch):
+        """Create a project with two specs and chdir into it."""
+        for name in ("001-first", "002-second"):
+            spec_dir = tmp_path / "specs" / name
+            spec_dir.mkdir(parents=True)
+            (spec_dir / "spec.md").write_text(sample_spec_content, encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    def test_all_updates_then_skips(self, project):
+        """Test that a second --all run finds every spec up to date."""
+        first = runner.invoke(app, ["diagram", "generate", "--all"])
+        assert first.exit_code == 0
+        assert "2 specs: 2 updated, 0 up to date" in first.output
+        backups = sorted(project.glob("specs/*/*.bak"))
+
+        second = runner.invoke(app, ["diagram", "generate", "--all", "--jobs", "2"])
+        assert second.exit_code == 0
+        assert "2 specs: 0 updated, 2 up to date" in second.output
+        assert sorted(project.glob("specs/*/*.bak")) == backups
+
+    def test_all_force_regenerates(self, project):
+        """Test that --force regenerates up-to-date specs."""
+        runner.invoke(app, ["diagram", "generate", "--all"])
+
+        result = runner.invoke(app, ["diagram", "generate", "--all", "--force"])
+
+        assert result.exit_code == 0
+        assert "2 updated" in result.output
+
+    def test_all_rejects_file_argument(self, project):
+        """Test that --all cannot be combined with a file."""
+        result = runner.invoke(app, ["diagram", "generate", "--all", "specs/001-first/spec.md"])
+
+        assert result.exit_code != 0
+
+
 class TestDiagramCommandEdgeCases:
     """Tests for edge cases in diagram commands."""
 
@@ -359,6 +359,27 @@ class TestInitMemoryFilesPreservation:
             "constitution.md SHOULD be overwritten by --force"
         )
 
+    def test_update_backs_up_command_templates(self, project_dir):
+        """Test that --update backs up command files it overwrites."""
+        from doit_cli.main import app
+        from doit_cli.services.backup_service import BackupService
+
+        runner.invoke(app, ["init", str(project_dir), "--agent", "claude", "--yes"])
+        template = next((project_dir / ".claude" / "commands").glob("doit.*.md"))
+        template.write_text("# Custom Command Template\n", encoding="utf-8")
+
+        result = runner.invoke(
+            app, ["init", str(project_dir), "--agent", "claude", "--update", "--yes"]
+        )
+
+        assert result.exit_code == 0
+        service = BackupService(project_dir)
+        backups = service.list_backups()
+        assert len(backups) == 1
+        template.write_text("# Edited again\n", encoding="utf-8")
+        assert service.restore_backup(backups[0])["errors"] == []
+        assert template.read_text(encoding="utf-8") == "# Custom Command Template\n"
+
     def test_update_still_updates_command_templates(self, project_dir):
         """Test that --update still updates command templates even while preserving memory."""
         from doit_cli.main import app
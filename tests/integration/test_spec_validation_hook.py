@@ -3,6 +3,7 @@
 import pytest
 
 from doit_cli.models.hook_config import HookConfig, HookRule
+from doit_cli.services.git_utils import StagedFiles
 from doit_cli.services.hook_validator import HookValidator
 
 
@@ -205,28 +206,15 @@ class TestPreCommitWithValidation:
         self, spec_with_errors, hook_config_with_validation, monkeypatch
     ):
         """Test that pre-commit blocks commit when spec has errors."""
-
-        # Mock git commands to simulate being on feature branch
-        def mock_run(*args, **kwargs):
-            class MockResult:
-                returncode = 0
-                stdout = ""
-
-            cmd = args[0]
-            result = MockResult()
-
-            if "rev-parse" in cmd:
-                result.stdout = "001-test-feature\n"
-            elif "diff" in cmd:
-                result.stdout = "src/main.py\n"  # Code file to trigger validation
-
-            return result
-
-        monkeypatch.setattr("subprocess.run", mock_run)
+        # Simulate being on the feature branch
+        (spec_with_errors / ".git").mkdir(exist_ok=True)
+        (spec_with_errors / ".git" / "HEAD").write_text("ref: refs/heads/001-test-feature\n")
 
         validator = HookValidator(
             project_root=spec_with_errors,
             config=hook_config_with_validation,
+            # Code file to trigger validation
+            staged_files=StagedFiles(("src/main.py",)),
         )
 
         result = validator.validate_pre_commit()
@@ -246,6 +234,7 @@ class TestPreCommitWithValidation:
             class MockResult:
                 returncode = 0
                 stdout = ""
+                stderr = ""
 
             cmd = args[0]
             result = MockResult()
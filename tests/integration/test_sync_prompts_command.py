@@ -49,14 +49,7 @@ class TestSyncPromptsCommand:
         templates_dir = temp_dir / ".doit/templates/commands"
         templates_dir.mkdir(parents=True)
         (templates_dir / "doit.test.md").write_text("# Test")
-
-        prompts_dir = temp_dir / ".github/prompts"
-        prompts_dir.mkdir(parents=True)
-
-        import time
-
-        time.sleep(0.01)
-        (prompts_dir / "doit.test.prompt.md").write_text("# Prompt")
+        runner.invoke(app, ["sync-prompts", "--path", str(temp_dir)])
 
         # Run check mode
         result = runner.invoke(app, ["sync-prompts", "--check", "--path", str(temp_dir)])
@@ -90,14 +83,7 @@ class TestSyncPromptsCommand:
         templates_dir = temp_dir / ".doit/templates/commands"
         templates_dir.mkdir(parents=True)
         (templates_dir / "doit.test.md").write_text("# Template")
-
-        prompts_dir = temp_dir / ".github/prompts"
-        prompts_dir.mkdir(parents=True)
-
-        import time
-
-        time.sleep(0.01)
-        (prompts_dir / "doit.test.prompt.md").write_text("# Old prompt")
+        runner.invoke(app, ["sync-prompts", "--path", str(temp_dir)])
 
         # First run without force - should skip
         result1 = runner.invoke(app, ["sync-prompts", "--path", str(temp_dir)])
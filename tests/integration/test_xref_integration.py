@@ -208,6 +208,44 @@ class TestXrefCoverageCommand:
         assert "not found" in result.stdout.lower() or "error" in result.stdout.lower()
 
 
+class TestXrefCoverageAllCommand:
+    """Integration tests for xref coverage --all."""
+
+    def _add_orphaned_feature(self, project):
+        spec_dir = project / "specs" / "034-second-feature"
+        spec_dir.mkdir(parents=True)
+        (spec_dir / "spec.md").write_text("## Requirements\n\n- **FR-001**: Only one\n")
+        (spec_dir / "tasks.md").write_text("- [ ] T001 Build it, carefully [FR-001, FR-009]\n")
+
+    def test_coverage_all_json(self, xref_project):
+        """Test project-wide coverage as JSON."""
+        result = run_xref_command(xref_project, "coverage", "--all", "--format", "json")
+
+        assert result.returncode == 0
+        data = json.loads(result.stdout)
+        assert [f["feature"] for f in data["features"]] == ["033-test-feature"]
+        assert data["covered_count"] == data["total_count"] == 3
+        assert len(data["links"]) == 5
+
+    def test_coverage_all_csv_fails_on_orphans(self, xref_project):
+        """Test project-wide CSV export lists every link and orphan."""
+        self._add_orphaned_feature(xref_project)
+
+        result = run_xref_command(xref_project, "coverage", "--all", "--format", "csv")
+
+        assert result.returncode == 1
+        lines = result.stdout.splitlines()
+        assert lines[0] == "feature,requirement,status,task_line,task_completed,task_description"
+        assert len(lines) == 1 + 5 + 2
+        assert '034-second-feature,FR-009,orphaned,1,False,"T001 Build it, carefully"' in lines
+
+    def test_coverage_all_with_spec_name(self, xref_project):
+        """Test --all cannot be combined with a spec name."""
+        result = run_xref_command(xref_project, "coverage", "033-test-feature", "--all")
+
+        assert result.returncode == 2
+
+
 class TestXrefLocateCommand:
     """Integration tests for xref locate command."""
 
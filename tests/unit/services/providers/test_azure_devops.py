@@ -0,0 +1,171 @@
+"""Unit tests for AzureDevOpsProvider.
+
+Tests run the provider against an in-process fake Azure DevOps server
+(httpx.MockTransport) and count the requests it receives.
+"""
+
+import json
+import threading
+
+import httpx
+import pytest
+
+from doit_cli.models.provider_models import IssueFilters, IssueState, IssueType
+from doit_cli.services.provider_config import AzureDevOpsConfig
+from doit_cli.services.providers.azure_devops import (
+    WORK_ITEMS_BATCH_SIZE,
+    AzureDevOpsProvider,
+)
+from doit_cli.services.providers.exceptions import AuthenticationError, ProviderError
+
+
+class FakeAzureDevOps:
+    """Answers WIQL queries and work item requests for a fixed set of IDs."""
+
+    def __init__(self, ids: list[int], deleted: set[int] | None = None) -> None:
+        self.ids = ids
+        self.deleted = deleted or set()
+        self.requests: list[httpx.Request] = []
+        self.batch_status = 200
+        self._lock = threading.Lock()
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.requests.append(request)
+        path = request.url.path
+        if path.endswith("/_apis/wit/wiql"):
+            return httpx.Response(200, json={"workItems": [{"id": i} for i in self.ids]})
+        if path.endswith("/_apis/wit/workitemsbatch"):
+            if self.batch_status != 200:
+                return httpx.Response(self.batch_status, text="batch failed")
+            ids = json.loads(request.content)["ids"]
+            assert len(ids) <= WORK_ITEMS_BATCH_SIZE
+            return httpx.Response(
+                200,
+                json={
+                    "count": len(ids),
+                    "value": [None if i in self.deleted else self._work_item(i) for i in ids],
+                },
+            )
+        return httpx.Response(404)
+
+    def paths(self, suffix: str) -> list[str]:
+        return [r.url.path for r in self.requests if r.url.path.endswith(suffix)]
+
+    @staticmethod
+    def _work_item(work_item_id: int) -> dict:
+        return {
+            "id": work_item_id,
+            "url": f"https://dev.azure.com/org/proj/_apis/wit/workitems/{work_item_id}",
+            "fields": {
+                "System.Title": f"Item {work_item_id}",
+                "System.State": "Active",
+                "System.WorkItemType": "Bug",
+                "System.Tags": "backend; urgent",
+                "System.CreatedDate": "2026-01-21T10:00:00Z",
+                "System.ChangedDate": "2026-01-22T10:00:00Z",
+            },
+        }
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    """Provider with a configured org/project and PAT."""
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "test-pat")
+    return AzureDevOpsProvider(AzureDevOpsConfig(organization="org", project="proj"))
+
+
+def _serve(provider: AzureDevOpsProvider, server: FakeAzureDevOps) -> None:
+    provider._client = httpx.Client(transport=httpx.MockTransport(server.handle))
+
+
+class TestListIssues:
+    """list_issues fetches work item details through the batch endpoint."""
+
+    @pytest.mark.parametrize("count", [1, 200, 201, 500, 1000])
+    def test_request_count_is_one_per_batch(self, provider, count):
+        server = FakeAzureDevOps(list(range(1, count + 1)))
+        _serve(provider, server)
+
+        issues = provider.list_issues()
+
+        assert len(issues) == count
+        batches = -(-count // WORK_ITEMS_BATCH_SIZE)
+        assert len(server.paths("/workitemsbatch")) == batches
+        assert len(server.requests) == 1 + batches
+
+    def test_keeps_query_order_and_parses_work_items(self, provider):
+        ids = list(range(450, 0, -1))
+        server = FakeAzureDevOps(ids)
+        _serve(provider, server)
+
+        issues = provider.list_issues(IssueFilters(state=IssueState.OPEN, limit=500))
+
+        assert [issue.provider_id for issue in issues] == [str(i) for i in ids]
+        first = issues[0]
+        assert first.title == "Item 450"
+        assert first.type == IssueType.BUG
+        assert [label.name for label in first.labels] == ["backend", "urgent"]
+        assert first.url == "https://dev.azure.com/org/proj/_workitems/edit/450"
+
+    def test_deleted_work_items_are_skipped(self, provider):
+        server = FakeAzureDevOps([1, 2, 3], deleted={2})
+        _serve(provider, server)
+
+        issues = provider.list_issues()
+
+        assert [issue.provider_id for issue in issues] == ["1", "3"]
+
+    def test_limit_is_applied_before_fetching(self, provider):
+        server = FakeAzureDevOps(list(range(1, 1001)))
+        _serve(provider, server)
+
+        issues = provider.list_issues(IssueFilters(limit=10))
+
+        assert len(issues) == 10
+        assert len(server.paths("/workitemsbatch")) == 1
+
+    def test_no_matches_sends_no_batch(self, provider):
+        server = FakeAzureDevOps([])
+        _serve(provider, server)
+
+        assert provider.list_issues() == []
+        assert server.paths("/workitemsbatch") == []
+
+    def test_batch_auth_failure_raises(self, provider):
+        server = FakeAzureDevOps([1])
+        server.batch_status = 401
+        _serve(provider, server)
+
+        with pytest.raises(AuthenticationError):
+            provider.list_issues()
+
+    def test_batch_error_raises(self, provider):
+        server = FakeAzureDevOps([1])
+        server.batch_status = 500
+        _serve(provider, server)
+
+        with pytest.raises(ProviderError, match="batch failed"):
+            provider.list_issues()
+
+
+class TestIterIssues:
+    """iter_issues requests one batch at a time as items are consumed."""
+
+    def test_batches_are_requested_on_demand(self, provider):
+        server = FakeAzureDevOps(list(range(1, 1001)))
+        _serve(provider, server)
+
+        issues = provider.iter_issues()
+        first = [next(issues) for _ in range(WORK_ITEMS_BATCH_SIZE)]
+
+        assert first[0].provider_id == "1"
+        assert len(server.paths("/workitemsbatch")) == 1
+        assert len(first) + len(list(issues)) == 1000
+        assert len(server.paths("/workitemsbatch")) == 5
+
+    def test_limit_is_ignored(self, provider):
+        server = FakeAzureDevOps(list(range(1, 301)))
+        _serve(provider, server)
+
+        assert len(list(provider.iter_issues(IssueFilters(limit=10), prefetch=True))) == 300
@@ -0,0 +1,347 @@
+"""Unit tests for GitHubHTTPProvider.
+
+Tests run the provider against an in-process fake GitHub REST API
+(httpx.MockTransport) and inspect the requests it receives.
+"""
+
+import json
+import re
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from doit_cli.models.provider_models import (
+    IssueCreateRequest,
+    IssueFilters,
+    IssueState,
+    IssueUpdateRequest,
+    MilestoneCreateRequest,
+)
+from doit_cli.services.provider_config import GitHubConfig
+from doit_cli.services.provider_factory import ProviderFactory
+from doit_cli.services.providers.exceptions import (
+    AuthenticationError,
+    ProviderError,
+    RateLimitError,
+    ResourceNotFoundError,
+    ValidationError,
+)
+from doit_cli.services.providers.github import GitHubProvider
+from doit_cli.services.providers.github_http import GitHubAPIClient, GitHubHTTPProvider
+from doit_cli.utils import github_auth
+
+
+def _issue(number: int, **extra) -> dict:
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "body": "",
+        "state": "open",
+        "html_url": f"https://github.com/owner/repo/issues/{number}",
+        "created_at": "2026-01-21T10:00:00Z",
+        "updated_at": "2026-01-21T10:00:00Z",
+        "labels": [{"name": "bug"}],
+        **extra,
+    }
+
+
+class FakeGitHub:
+    """Serves a fixed set of issues and milestones for owner/repo."""
+
+    def __init__(self, issues: int = 3, page_size: int = 2) -> None:
+        self.issues = {n: _issue(n) for n in range(1, issues + 1)}
+        self.milestones = [{"number": 7, "title": "v1.0", "state": "open"}]
+        self.page_size = page_size
+        self.requests: list[httpx.Request] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path.removeprefix("/repos/owner/repo/")
+        body = json.loads(request.content) if request.content else {}
+
+        if path == "/graphql":
+            return self._graphql(body)
+        if request.method == "GET" and path == "issues":
+            return self._page(request, list(self.issues.values()))
+        if path.startswith("issues/") and path.count("/") == 1:
+            number = int(path.split("/")[1])
+            if number not in self.issues:
+                return httpx.Response(404, json={"message": "Not Found"})
+            if "milestone" in body:
+                body["milestone"] = {"number": body["milestone"]}
+            self.issues[number].update(body)
+            return httpx.Response(200, json=self.issues[number])
+        if request.method == "POST" and path == "issues":
+            number = max(self.issues) + 1
+            labels = [{"name": name} for name in body.get("labels", [])]
+            self.issues[number] = _issue(number, title=body["title"], labels=labels)
+            return httpx.Response(201, json=self.issues[number])
+        if request.method == "POST" and path.endswith("/comments"):
+            return httpx.Response(201, json={"id": 1})
+        if path == "milestones":
+            if request.method == "POST":
+                return httpx.Response(
+                    422,
+                    json={"message": "Validation Failed", "errors": [{"code": "already_exists"}]},
+                )
+            return self._page(request, self.milestones)
+        if path.startswith("branches/"):
+            status = 200 if path == "branches/main" else 404
+            return httpx.Response(status, json={"name": "main"})
+        return httpx.Response(404, json={"message": "Not Found"})
+
+    def _graphql(self, body: dict) -> httpx.Response:
+        numbers = [int(n) for n in re.findall(r"i(\d+): issue", body["query"])]
+        repository = {}
+        for number in numbers:
+            issue = self.issues.get(number)
+            repository[f"i{number}"] = issue and {
+                **issue,
+                "url": issue["html_url"],
+                "state": issue["state"].upper(),
+                "labels": {"nodes": issue["labels"]},
+                "milestone": {"number": 7, "title": "v1.0"},
+            }
+        errors = [{"message": "Could not resolve"}] if None in repository.values() else []
+        return httpx.Response(200, json={"data": {"repository": repository}, "errors": errors})
+
+    def _page(self, request: httpx.Request, items: list[dict]) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        start = (page - 1) * self.page_size
+        headers = {}
+        if start + self.page_size < len(items):
+            url = request.url.copy_merge_params({"page": page + 1})
+            headers["Link"] = f'<{url}>; rel="next"'
+        return httpx.Response(200, json=items[start : start + self.page_size], headers=headers)
+
+
+def _provider(server: FakeGitHub) -> GitHubHTTPProvider:
+    provider = GitHubHTTPProvider(token="t")
+    api = GitHubAPIClient(token="t")
+    api._client = httpx.Client(base_url=api.base_url, transport=httpx.MockTransport(server.handle))
+    provider._client = api
+    provider._repo_slug = "owner/repo"
+    return provider
+
+
+class TestGitHubAPIClient:
+    """The client authenticates every request and maps error statuses."""
+
+    def _client(self, response: httpx.Response) -> GitHubAPIClient:
+        api = GitHubAPIClient(token="secret")
+        api._client = httpx.Client(
+            base_url=api.base_url,
+            headers=api.client.headers,
+            transport=httpx.MockTransport(lambda request: response),
+        )
+        return api
+
+    def test_enterprise_host_uses_api_v3(self):
+        assert GitHubAPIClient(token="t", host="ghe.example.com").base_url == (
+            "https://ghe.example.com/api/v3"
+        )
+        assert GitHubAPIClient(token="t").base_url == "https://api.github.com"
+
+    def test_sends_bearer_token(self):
+        headers = GitHubAPIClient(token="secret").client.headers
+
+        assert headers["Authorization"] == "Bearer secret"
+        assert headers["Accept"] == "application/vnd.github+json"
+
+    def test_exhausted_rate_limit_raises_rate_limit_error(self):
+        api = self._client(
+            httpx.Response(403, headers={"X-RateLimit-Remaining": "0", "Retry-After": "30"})
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            api.get("user")
+        assert exc_info.value.retry_after == 30
+
+    @pytest.mark.parametrize("status", [401, 403])
+    def test_auth_failures_raise_authentication_error(self, status):
+        api = self._client(httpx.Response(status, json={"message": "Bad credentials"}))
+
+        with pytest.raises(AuthenticationError):
+            api.get("user")
+
+    def test_graphql_errors_raise(self):
+        api = self._client(httpx.Response(200, json={"errors": [{"message": "bad field"}]}))
+
+        with pytest.raises(Exception, match="bad field"):
+            api.graphql("{ viewer { login } }")
+
+
+class TestGitHubHTTPProvider:
+    """Operations are REST calls over one pooled client."""
+
+    def test_operations_share_one_http_client(self):
+        server = FakeGitHub()
+        provider = _provider(server)
+        pool = provider.client.client
+
+        provider.get_issue("1")
+        provider.list_issues()
+        provider.add_issue_comment("1", "hi")
+
+        assert provider.client.client is pool
+        assert len(server.requests) == 4
+
+    def test_get_issue_parses_rest_json(self):
+        issue = _provider(FakeGitHub()).get_issue("github:issue:2")
+
+        assert issue.provider_id == "2"
+        assert issue.url == "https://github.com/owner/repo/issues/2"
+        assert [label.name for label in issue.labels] == ["bug"]
+
+    def test_missing_issue_raises_not_found(self):
+        with pytest.raises(ResourceNotFoundError, match="Issue not found: 99"):
+            _provider(FakeGitHub()).get_issue("99")
+
+    def test_iter_issues_follows_link_header_and_skips_pull_requests(self):
+        server = FakeGitHub(issues=5)
+        server.issues[3]["pull_request"] = {"url": "..."}
+
+        issues = list(_provider(server).iter_issues(IssueFilters(state=IssueState.OPEN)))
+
+        assert [issue.provider_id for issue in issues] == ["1", "2", "4", "5"]
+        pages = [r for r in server.requests if r.url.path.endswith("/issues")]
+        assert len(pages) == 3
+        assert pages[0].url.params["state"] == "open"
+
+    def test_list_issues_stops_at_limit(self):
+        server = FakeGitHub(issues=10)
+
+        issues = _provider(server).list_issues(IssueFilters(limit=3))
+
+        assert len(issues) == 3
+        assert len(server.requests) == 2
+
+    def test_list_issues_defaults_to_open_without_changing_filters(self):
+        server = FakeGitHub()
+        filters = IssueFilters()
+
+        _provider(server).list_issues(filters)
+
+        assert server.requests[0].url.params["state"] == "open"
+        assert filters.state is None
+
+    def test_create_issue_adds_type_labels(self):
+        server = FakeGitHub()
+
+        issue = _provider(server).create_issue(IssueCreateRequest(title="New", labels=["x"]))
+
+        assert issue.title == "New"
+        assert json.loads(server.requests[-1].content)["labels"] == ["x", "task"]
+
+    def test_update_issue_closes_and_assigns_milestone_by_title(self):
+        server = FakeGitHub()
+
+        issue = _provider(server).update_issue(
+            "1", IssueUpdateRequest(state=IssueState.CLOSED, milestone_id="v1.0")
+        )
+
+        assert issue.state == IssueState.CLOSED
+        assert issue.milestone_id == "7"
+        patch_request = server.requests[-1]
+        assert patch_request.method == "PATCH"
+        assert json.loads(patch_request.content) == {"state": "closed", "milestone": 7}
+
+    def test_close_issue_posts_comment_then_closes(self):
+        server = FakeGitHub()
+
+        assert _provider(server).close_issue("1", comment="done")
+        assert [r.method for r in server.requests] == ["POST", "PATCH"]
+        assert server.issues[1]["state"] == "closed"
+
+    def test_existing_milestone_raises_validation_error(self):
+        with pytest.raises(ValidationError, match="already exists"):
+            _provider(FakeGitHub()).create_milestone(MilestoneCreateRequest(title="v1.0"))
+
+    def test_get_issues_uses_one_graphql_query_per_batch(self):
+        server = FakeGitHub(issues=150)
+
+        issues = _provider(server).get_issues([str(n) for n in range(1, 152)])
+
+        assert len(issues) == 150
+        assert issues[0].milestone_id == "7"
+        assert [label.name for label in issues[0].labels] == ["bug"]
+        assert [r.url.path for r in server.requests] == ["/graphql", "/graphql"]
+        variables = json.loads(server.requests[0].content)["variables"]
+        assert variables == {"owner": "owner", "name": "repo"}
+
+    def test_remote_branch_check_uses_the_api(self):
+        provider = _provider(FakeGitHub())
+
+        assert provider._remote_branch_exists("main") is True
+        assert provider._remote_branch_exists("gone") is False
+
+    def test_repo_slug_uses_the_enterprise_host(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("GIT_DIR", raising=False)
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        (tmp_path / ".git" / "config").write_text(
+            '[remote "origin"]\n\turl = git@ghe.example.com:team/app.git\n'
+        )
+        monkeypatch.chdir(tmp_path)
+
+        with patch("subprocess.run") as run:
+            assert GitHubHTTPProvider(token="t", host="ghe.example.com")._get_repo_slug() == (
+                "team/app"
+            )
+            with pytest.raises(ProviderError, match="Not a GitHub repository"):
+                GitHubHTTPProvider(token="t")._get_repo_slug()
+        run.assert_not_called()
+
+    def test_missing_token_raises_authentication_error(self):
+        provider = GitHubHTTPProvider()
+
+        with (
+            patch("doit_cli.services.providers.github_http.get_github_token", return_value=None),
+            pytest.raises(AuthenticationError),
+        ):
+            provider.get_issue("1")
+
+
+class TestBackendSelection:
+    """The factory picks the HTTP backend only when configured and authenticated."""
+
+    def test_http_backend_with_token(self):
+        with patch.object(github_auth, "get_github_token", return_value="t"):
+            provider = ProviderFactory.create_github(GitHubConfig(backend="http"))
+
+        assert isinstance(provider, GitHubHTTPProvider)
+
+    def test_http_backend_without_token_falls_back_to_gh(self):
+        with patch.object(github_auth, "get_github_token", return_value=None):
+            provider = ProviderFactory.create_github(GitHubConfig(backend="http"))
+
+        assert type(provider) is GitHubProvider
+
+    def test_gh_cli_backend_is_the_default(self):
+        assert type(ProviderFactory.create_github()) is GitHubProvider
+
+
+class TestGetGitHubToken:
+    """Tokens come from the environment first, then gh once per host."""
+
+    @pytest.fixture(autouse=True)
+    def _clean(self, monkeypatch):
+        for name in ("GH_TOKEN", "GITHUB_TOKEN", "GH_ENTERPRISE_TOKEN", "GITHUB_ENTERPRISE_TOKEN"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setattr(github_auth, "_gh_tokens", {})
+
+    def test_environment_token_wins(self, monkeypatch):
+        monkeypatch.setenv("GITHUB_TOKEN", "env-token")
+
+        with patch.object(github_auth, "_read_gh_token") as read:
+            assert github_auth.get_github_token() == "env-token"
+        read.assert_not_called()
+
+    def test_gh_token_is_read_once_per_host(self):
+        with patch.object(github_auth, "_read_gh_token", return_value="gh-token") as read:
+            assert github_auth.get_github_token() == "gh-token"
+            assert github_auth.get_github_token() == "gh-token"
+            github_auth.get_github_token("ghe.example.com")
+
+        assert [call.args for call in read.call_args_list] == [(None,), ("ghe.example.com",)]
@@ -0,0 +1,210 @@
+"""Tests for paginated provider iterators.
+
+Covers the shared iter_pages helper, GitLab's X-Next-Page/Link handling
+against a fake server (httpx.MockTransport), and GitHub's ``gh api`` pages.
+"""
+
+import json
+import threading
+import time
+from itertools import islice
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from doit_cli.models.provider_models import IssueFilters, IssueState, PRFilters, PRState
+from doit_cli.services.providers.base import iter_pages
+from doit_cli.services.providers.github import API_PAGE_SIZE, GitHubProvider
+from doit_cli.services.providers.gitlab import GitLabAPIClient, GitLabProvider
+
+
+def _pages(count: int, size: int = 3):
+    """fetch_page over ``count`` pages of ``size`` numbered items."""
+    requested: list[int] = []
+
+    def fetch(page: int):
+        requested.append(page)
+        items = list(range(page * size, page * size + size))
+        return items, page + 1 if page + 1 < count else None
+
+    return fetch, requested
+
+
+class TestIterPages:
+    """iter_pages follows cursors lazily, optionally one page ahead."""
+
+    def test_yields_every_page_in_order(self):
+        fetch, requested = _pages(3)
+
+        assert list(iter_pages(fetch, 0)) == list(range(9))
+        assert requested == [0, 1, 2]
+
+    def test_pages_are_fetched_on_demand(self):
+        fetch, requested = _pages(100)
+
+        assert list(islice(iter_pages(fetch, 0), 4)) == [0, 1, 2, 3]
+        assert requested == [0, 1]
+
+    def test_prefetch_requests_the_next_page_early(self):
+        fetch, requested = _pages(100)
+        pages = iter_pages(fetch, 0, prefetch=True)
+
+        assert next(pages) == 0
+        deadline = time.monotonic() + 5
+        while len(requested) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert requested == [0, 1]
+        pages.close()
+
+    def test_prefetch_yields_the_same_items(self):
+        fetch, _ = _pages(5)
+
+        assert list(iter_pages(fetch, 0, prefetch=True)) == list(range(15))
+
+
+class FakeGitLab:
+    """Serves ``total`` issues in pages, via X-Next-Page or Link headers."""
+
+    def __init__(self, total: int, keyset: bool = False) -> None:
+        self.total = total
+        self.keyset = keyset
+        self.pages: list[int] = []
+        self._lock = threading.Lock()
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        per_page = int(request.url.params.get("per_page", 20))
+        with self._lock:
+            self.pages.append(page)
+        start = (page - 1) * per_page
+        items = [
+            {
+                "iid": i,
+                "title": f"Issue {i}",
+                "state": "opened",
+                "labels": [],
+                "web_url": f"https://gitlab.com/o/r/-/issues/{i}",
+                "created_at": "2026-01-21T10:00:00Z",
+                "updated_at": "2026-01-21T10:00:00Z",
+            }
+            for i in range(start + 1, min(start + per_page, self.total) + 1)
+        ]
+        headers = {}
+        if start + per_page < self.total:
+            if self.keyset:
+                url = request.url.copy_merge_params({"page": page + 1})
+                headers["Link"] = f'<{url}>; rel="next"'
+            else:
+                headers["X-Next-Page"] = str(page + 1)
+        return httpx.Response(200, json=items, headers=headers)
+
+
+def _gitlab(server: FakeGitLab) -> GitLabProvider:
+    provider = GitLabProvider(token="t", project_path="o/r")
+    api = GitLabAPIClient(project_path="o%2Fr", token="t")
+    api._client = httpx.Client(base_url=api.base_url, transport=httpx.MockTransport(server.handle))
+    provider._client = api
+    return provider
+
+
+class TestGitLabPagination:
+    """GitLab list operations follow pagination headers."""
+
+    def test_iter_issues_follows_x_next_page(self):
+        server = FakeGitLab(total=250)
+
+        issues = list(_gitlab(server).iter_issues())
+
+        assert len(issues) == 250
+        assert server.pages == [1, 2, 3]
+
+    def test_iter_issues_follows_link_header(self):
+        server = FakeGitLab(total=150, keyset=True)
+
+        issues = list(_gitlab(server).iter_issues(prefetch=True))
+
+        assert [issue.provider_id for issue in issues] == [str(i) for i in range(1, 151)]
+        assert server.pages == [1, 2]
+
+    def test_list_issues_spans_pages_up_to_limit(self):
+        server = FakeGitLab(total=1000)
+
+        issues = _gitlab(server).list_issues(IssueFilters(limit=250))
+
+        assert len(issues) == 250
+        assert server.pages == [1, 2, 3]
+
+
+def _gh_pages(pages: list[list[dict]]):
+    """Fake ``subprocess.run`` for ``gh auth status``/``gh api``."""
+    calls: list[list[str]] = []
+
+    def run(cmd, **kwargs):
+        if cmd[:2] == ["gh", "api"]:
+            calls.append(cmd)
+            page = int(next(arg for arg in cmd if arg.startswith("page=")).split("=")[1])
+            items = pages[page - 1] if page <= len(pages) else []
+            return MagicMock(returncode=0, stdout=json.dumps(items), stderr="")
+        return MagicMock(returncode=0, stdout="", stderr="")
+
+    return run, calls
+
+
+def _rest_issue(number: int, **extra) -> dict:
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "body": "",
+        "state": "open",
+        "html_url": f"https://github.com/owner/repo/issues/{number}",
+        "created_at": "2026-01-21T10:00:00Z",
+        "updated_at": "2026-01-21T10:00:00Z",
+        "labels": [{"name": "bug"}],
+        **extra,
+    }
+
+
+class TestGitHubPagination:
+    """GitHub iterators page through ``gh api`` until a short page."""
+
+    @pytest.fixture(autouse=True)
+    def _repo_slug(self):
+        with patch.object(GitHubProvider, "_get_repo_slug", return_value="owner/repo"):
+            yield
+
+    def test_iter_issues_reads_every_page_and_skips_pull_requests(self):
+        first = [_rest_issue(n) for n in range(1, API_PAGE_SIZE + 1)]
+        first[0]["pull_request"] = {"url": "..."}
+        run, calls = _gh_pages([first, [_rest_issue(101)]])
+
+        with patch("doit_cli.services.providers.github.subprocess.run", side_effect=run):
+            issues = list(GitHubProvider().iter_issues(IssueFilters(state=IssueState.OPEN)))
+
+        assert len(issues) == API_PAGE_SIZE
+        assert issues[-1].provider_id == "101"
+        assert issues[0].url == "https://github.com/owner/repo/issues/2"
+        assert len(calls) == 2
+        assert "state=open" in calls[0]
+        assert calls[0][2:5] == ["--method", "GET", "repos/owner/repo/issues"]
+
+    def test_iter_pull_requests_filters_merged(self):
+        merged = _rest_issue(1, merged_at="2026-01-22T10:00:00Z", state="closed")
+        closed = _rest_issue(2, merged_at=None, state="closed")
+        run, calls = _gh_pages([[merged, closed]])
+
+        with patch("doit_cli.services.providers.github.subprocess.run", side_effect=run):
+            prs = list(GitHubProvider().iter_pull_requests(PRFilters(state=PRState.MERGED)))
+
+        assert [pr.provider_id for pr in prs] == ["1"]
+        assert "state=closed" in calls[0]
+
+    def test_list_milestones_reads_all_pages(self):
+        milestone = {"number": 1, "title": "v1", "state": "open"}
+        run, calls = _gh_pages([[milestone] * API_PAGE_SIZE, [milestone]])
+
+        with patch("doit_cli.services.providers.github.subprocess.run", side_effect=run):
+            milestones = GitHubProvider().list_milestones()
+
+        assert len(milestones) == API_PAGE_SIZE + 1
+        assert "state=all" in calls[0]
@@ -0,0 +1,142 @@
+"""Unit tests for the content-addressed BackupService."""
+
+import os
+
+import pytest
+
+from doit_cli.services.backup_service import BackupService
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project with a few doit command files."""
+    commands = tmp_path / ".claude" / "commands"
+    commands.mkdir(parents=True)
+    (commands / "doit.plan.md").write_text("plan v1")
+    (commands / "doit.tasks.md").write_text("tasks v1")
+    (commands / "doit.same.md").write_text("plan v1")
+    return tmp_path
+
+
+@pytest.fixture
+def service(project):
+    """Create a BackupService for the project."""
+    return BackupService(project)
+
+
+def _blobs(service: BackupService) -> list:
+    return sorted(p for p in service.objects_folder.glob("*/*"))
+
+
+class TestCreateBackup:
+    """Contents are stored once; backups are manifests."""
+
+    def test_identical_contents_share_one_blob(self, service):
+        backup = service.create_doit_backup()
+
+        assert backup is not None
+        assert [p.name for p in backup.iterdir()] == ["manifest.json"]
+        assert len(_blobs(service)) == 2
+
+    def test_unchanged_files_add_no_blobs(self, service, project):
+        service.create_backup(list(project.glob(".claude/commands/*")), "first")
+        blobs = _blobs(service)
+        (project / ".claude" / "commands" / "doit.tasks.md").write_text("tasks v2")
+
+        service.create_backup(list(project.glob(".claude/commands/*")), "second")
+
+        assert len(_blobs(service)) == len(blobs) + 1
+        assert service.get_store_size() == len("plan v1tasks v1tasks v2")
+
+    def test_same_name_adds_to_backup(self, service, project):
+        commands = project / ".claude" / "commands"
+        service.create_backup([commands / "doit.plan.md"], "snap")
+        backup = service.create_backup([commands / "doit.tasks.md"], "snap")
+
+        assert service.get_backup_size(backup) == len("plan v1tasks v1")
+
+    def test_object_store_is_not_listed(self, service):
+        backup = service.create_doit_backup()
+
+        assert service.list_backups() == [backup]
+
+
+class TestRestoreBackup:
+    """Restores bring back content, mode and mtime."""
+
+    def test_restore_is_exact(self, service, project):
+        plan = project / ".claude" / "commands" / "doit.plan.md"
+        os.chmod(plan, 0o640)
+        os.utime(plan, ns=(1_000_000_000, 1_000_000_000))
+        backup = service.create_doit_backup()
+        plan.write_text("edited")
+        os.chmod(plan, 0o600)
+
+        result = service.restore_backup(backup)
+
+        assert result["errors"] == []
+        assert len(result["restored"]) == 3
+        assert plan.read_text() == "plan v1"
+        assert plan.stat().st_mode & 0o777 == 0o640
+        assert plan.stat().st_mtime_ns == 1_000_000_000
+
+    def test_restore_deleted_file(self, service, project):
+        tasks = project / ".claude" / "commands" / "doit.tasks.md"
+        backup = service.create_doit_backup()
+        tasks.unlink()
+
+        service.restore_backup(backup)
+
+        assert tasks.read_text() == "tasks v1"
+
+    def test_missing_blob_is_reported(self, service):
+        backup = service.create_doit_backup()
+        for blob in _blobs(service):
+            blob.unlink()
+
+        result = service.restore_backup(backup)
+
+        assert len(result["errors"]) == 3
+        assert result["restored"] == []
+
+    def test_missing_backup(self, service, project):
+        result = service.restore_backup(project / "nope")
+
+        assert result["errors"] == [f"Backup not found: {project / 'nope'}"]
+
+    def test_legacy_backup_is_restored(self, service, project):
+        legacy = service.backups_folder / "20250101T000000" / ".claude" / "commands"
+        legacy.mkdir(parents=True)
+        (legacy / "doit.plan.md").write_text("old plan")
+
+        result = service.restore_backup(service.backups_folder / "20250101T000000")
+
+        assert result["errors"] == []
+        assert (project / ".claude" / "commands" / "doit.plan.md").read_text() == "old plan"
+        assert service.get_backup_size(service.backups_folder / "20250101T000000") == 8
+
+
+class TestGarbageCollection:
+    """Blobs live as long as a manifest references them."""
+
+    def test_cleanup_removes_unreferenced_blobs_only(self, service, project):
+        tasks = project / ".claude" / "commands" / "doit.tasks.md"
+        for i, name in enumerate(["a", "b", "c"]):
+            tasks.write_text(f"tasks {i}")
+            service.create_backup(list(project.glob(".claude/commands/*")), name)
+
+        removed = service.cleanup_old_backups(keep_count=1)
+
+        assert [b.name for b in removed] == ["b", "a"]
+        assert len(_blobs(service)) == 2
+        assert service.restore_backup(service.backups_folder / "c")["errors"] == []
+
+    def test_collect_garbage_removes_stale_temp_files(self, service):
+        service.create_doit_backup()
+        stale = service.objects_folder / ".blob.abc.tmp"
+        stale.write_text("partial")
+
+        service.collect_garbage()
+
+        assert not stale.exists()
+        assert len(_blobs(service)) == 2
@@ -0,0 +1,123 @@
+"""Tests for the shared git context read from `.git`."""
+
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from doit_cli.services.git_context import GitContext, get_git_context, parse_repo_slug
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(root: Path, *args: str) -> str:
+    result = subprocess.run(["git", *args], cwd=root, check=True, capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch) -> Path:
+    """A repository with one commit on ``main`` and a GitHub origin."""
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q", "-b", "main")
+    _git(root, "config", "user.email", "dev@example.com")
+    _git(root, "config", "user.name", "Dev")
+    _git(root, "remote", "add", "origin", "git@github.com:owner/repo.git")
+    (root / "README.md").write_text("readme")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "init")
+    return root
+
+
+class TestGitContext:
+    """Values match what git reports, without running git."""
+
+    def test_reads_branch_head_and_remote_without_subprocesses(self, repo):
+        expected_sha = _git(repo, "rev-parse", "HEAD")
+        context = GitContext.discover(repo)
+
+        with patch("subprocess.run", side_effect=AssertionError("git was spawned")):
+            assert context.branch == "main"
+            assert context.head_sha == expected_sha
+            assert context.remote_url() == "git@github.com:owner/repo.git"
+            assert context.repo_slug() == "owner/repo"
+
+    def test_discovers_the_root_from_a_subdirectory(self, repo):
+        (repo / "specs" / "001-a").mkdir(parents=True)
+
+        context = GitContext.discover(repo / "specs" / "001-a")
+
+        assert context.root == repo.resolve()
+
+    def test_checkout_and_commit_are_picked_up(self, repo):
+        context = GitContext.discover(repo)
+        assert context.branch == "main"
+
+        _git(repo, "checkout", "-q", "-b", "042-feature")
+        (repo / "a.txt").write_text("a")
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-q", "-m", "a")
+
+        assert context.branch == "042-feature"
+        assert context.head_sha == _git(repo, "rev-parse", "HEAD")
+
+    def test_detached_head_has_no_branch(self, repo):
+        sha = _git(repo, "rev-parse", "HEAD")
+        _git(repo, "checkout", "-q", "--detach")
+
+        context = GitContext.discover(repo)
+
+        assert context.branch is None
+        assert context.head_sha == sha
+
+    def test_packed_refs_are_resolved(self, repo):
+        sha = _git(repo, "rev-parse", "HEAD")
+        _git(repo, "pack-refs", "--all")
+
+        assert not (repo / ".git" / "refs" / "heads" / "main").exists()
+        assert GitContext.discover(repo).head_sha == sha
+
+    def test_worktree_has_its_own_head_and_shared_config(self, repo, tmp_path):
+        worktree = tmp_path / "wt"
+        _git(repo, "worktree", "add", "-q", "-b", "007-other", str(worktree))
+
+        context = GitContext.discover(worktree)
+
+        assert context.root == worktree.resolve()
+        assert context.branch == "007-other"
+        assert context.common_dir == (repo / ".git").resolve()
+        assert context.repo_slug() == "owner/repo"
+
+    def test_url_rewrites_fall_back_to_git(self, repo):
+        _git(repo, "config", "url.https://github.com/.insteadOf", "gh:")
+        _git(repo, "remote", "set-url", "origin", "gh:owner/other")
+
+        assert GitContext.discover(repo).repo_slug() == "owner/other"
+
+    def test_outside_a_repository_returns_none(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("GIT_DIR", raising=False)
+
+        assert GitContext.discover(tmp_path) is None
+
+    def test_shared_context_per_repository(self, repo):
+        (repo / "docs").mkdir()
+
+        assert get_git_context(repo) is get_git_context(repo / "docs")
+
+
+@pytest.mark.parametrize(
+    ("url", "slug"),
+    [
+        ("git@github.com:owner/repo.git", "owner/repo"),
+        ("https://github.com/owner/repo", "owner/repo"),
+        ("https://token@github.com/owner/repo.git/", "owner/repo"),
+        ("ssh://git@github.com:22/owner/repo.git", "owner/repo"),
+        ("https://gitlab.com/owner/repo.git", None),
+    ],
+)
+def test_parse_repo_slug(url, slug):
+    assert parse_repo_slug(url) == slug
@@ -0,0 +1,118 @@
+"""Tests for the batched git history used by DateInferrer."""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from doit_cli.services.date_inferrer import DateInferrer
+from doit_cli.services.git_metadata import GitMetadataProvider
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(root: Path, *args: str, date: str | None = None) -> None:
+    env = dict(os.environ)
+    if date:
+        env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = f"{date}T12:00:00+00:00"
+    subprocess.run(["git", *args], cwd=root, env=env, check=True, capture_output=True)
+
+
+def _commit(root: Path, date: str, files: dict[str, str | None]) -> None:
+    for name, content in files.items():
+        path = root / name
+        if content is None:
+            path.unlink()
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", date, date=date)
+
+
+def _spec(status: str, body: str = "") -> str:
+    return f"# Spec\n\n**Status**: {status}\n\n{body}\n"
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """A doit project whose specs have a history of edits and renames."""
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "dev@example.com")
+    _git(tmp_path, "config", "user.name", "Dev")
+    (tmp_path / ".doit").mkdir()
+    _commit(tmp_path, "2026-01-01", {"specs/001-a/spec.md": _spec("Draft")})
+    _commit(
+        tmp_path,
+        "2026-01-05",
+        {"specs/002-b/spec.md": _spec("Draft", "b" * 200), "README.md": "readme"},
+    )
+    _commit(tmp_path, "2026-01-10", {"specs/001-a/spec.md": _spec("Complete")})
+    _commit(tmp_path, "2026-01-15", {"specs/001-a/spec.md": _spec("Complete", "more")})
+    # Rename 002-b -> 003-c keeping the content.
+    (tmp_path / "specs" / "003-c").mkdir()
+    _git(tmp_path, "mv", "specs/002-b/spec.md", "specs/003-c/spec.md")
+    _git(tmp_path, "commit", "-q", "-m", "rename", date="2026-01-20")
+    _commit(tmp_path, "2026-01-25", {"specs/003-c/spec.md": _spec("Approved", "b" * 200)})
+    return tmp_path
+
+
+def _all_dates(inferrer: DateInferrer, root: Path) -> dict[str, tuple]:
+    return {
+        name: (
+            inferrer._get_git_first_commit_date(root / name),
+            inferrer._get_git_last_modified_date(root / name),
+            inferrer._get_git_status_change_date(root / name),
+        )
+        for name in (
+            "specs/001-a/spec.md",
+            "specs/002-b/spec.md",
+            "specs/003-c/spec.md",
+            "specs/004-missing/spec.md",
+        )
+    }
+
+
+class TestGitMetadataProvider:
+    """Batched history matches the per-file git queries."""
+
+    def test_matches_per_file_queries(self, repo):
+        expected = _all_dates(DateInferrer(repo), repo)
+        indexed = _all_dates(DateInferrer(repo, git_metadata=GitMetadataProvider(repo)), repo)
+
+        assert indexed == expected
+        assert str(expected["specs/003-c/spec.md"][0]) == "2026-01-05"
+
+    def test_incremental_update_reads_new_commits(self, repo):
+        GitMetadataProvider(repo).history(repo / "specs" / "001-a" / "spec.md")
+        assert (repo / GitMetadataProvider.CACHE_PATH).exists()
+
+        _commit(
+            repo,
+            "2026-02-01",
+            {"specs/001-a/spec.md": _spec("Draft"), "specs/004-missing/spec.md": _spec("Draft")},
+        )
+
+        expected = _all_dates(DateInferrer(repo), repo)
+        indexed = _all_dates(DateInferrer(repo, git_metadata=GitMetadataProvider(repo)), repo)
+        assert indexed == expected
+
+    def test_rewritten_history_rebuilds(self, repo):
+        GitMetadataProvider(repo).history(repo / "specs" / "001-a" / "spec.md")
+        _git(repo, "reset", "-q", "--hard", "HEAD~2")
+        _commit(repo, "2026-03-01", {"specs/002-b/spec.md": _spec("Complete")})
+
+        expected = _all_dates(DateInferrer(repo), repo)
+        indexed = _all_dates(DateInferrer(repo, git_metadata=GitMetadataProvider(repo)), repo)
+        assert indexed == expected
+
+    def test_paths_outside_directory_are_not_covered(self, repo):
+        provider = GitMetadataProvider(repo)
+
+        assert provider.history(repo / "README.md") is None
+        assert provider.history(repo / "specs" / "001-a" / "spec.md") is not None
+
+    def test_not_a_repository(self, tmp_path):
+        assert GitMetadataProvider(tmp_path).history(tmp_path / "specs" / "spec.md") is None
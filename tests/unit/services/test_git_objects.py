@@ -0,0 +1,203 @@
+"""Tests for reading staged paths from the Git index and object database."""
+
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from doit_cli.services.git_context import GitContext
+from doit_cli.services.git_objects import ObjectStore, diff_index_to_head, read_index
+from doit_cli.services.git_utils import GitFormatError, get_staged_files
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(root: Path, *args: str) -> str:
+    result = subprocess.run(["git", *args], cwd=root, check=True, capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+def _expected(root: Path) -> list[str]:
+    output = _git(
+        root, "-c", "core.quotePath=false", "diff", "--cached", "--name-only", "--no-renames"
+    )
+    return output.splitlines()
+
+
+def _write(root: Path, files: dict[str, str]) -> None:
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch) -> Path:
+    """A repository with a few nested directories committed."""
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.delenv("GIT_INDEX_FILE", raising=False)
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q", "-b", "main")
+    _git(root, "config", "user.email", "dev@example.com")
+    _git(root, "config", "user.name", "Dev")
+    _write(
+        root,
+        {
+            "README.md": "readme",
+            "src/app.py": "print('app')\n" * 50,
+            "src/lib/util.py": "def util(): ...\n" * 50,
+            "specs/001-a/spec.md": "# Spec",
+            "specs/002-b/spec.md": "# Spec B",
+        },
+    )
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "init")
+    return root
+
+
+def _staged(root: Path) -> list[str]:
+    context = GitContext.discover(root)
+    assert context is not None
+    return list(context.staged_files())
+
+
+class TestStagedFiles:
+    """The in-process diff matches `git diff --cached --no-renames`."""
+
+    def test_nothing_staged(self, repo):
+        assert _staged(repo) == [] == _expected(repo)
+
+    def test_added_modified_deleted_and_renamed(self, repo):
+        _write(repo, {"src/lib/util.py": "changed", "docs/new.md": "new", "a-b.txt": "x"})
+        (repo / "specs" / "002-b" / "spec.md").unlink()
+        _git(repo, "mv", "README.md", "README.rst")
+        _git(repo, "add", "-A")
+
+        assert _staged(repo) == _expected(repo)
+        assert "specs/002-b/spec.md" in _staged(repo)
+
+    def test_mode_change(self, repo):
+        (repo / "src" / "app.py").chmod(0o755)
+        _git(repo, "add", "-A")
+
+        assert _staged(repo) == ["src/app.py"] == _expected(repo)
+
+    def test_packed_objects_with_deltas(self, repo):
+        for i in range(5):
+            _write(repo, {"src/app.py": "print('app')\n" * 50 + f"# {i}\n"})
+            _git(repo, "commit", "-q", "-am", f"change {i}")
+        _git(repo, "gc", "-q", "--aggressive")
+        assert not any((repo / ".git" / "objects").glob("??/*"))
+        pack = next((repo / ".git" / "objects" / "pack").glob("*.idx"))
+        assert "chain length" in _git(repo, "verify-pack", "-v", str(pack))
+
+        _write(repo, {"src/lib/util.py": "changed", "src/lib/new.py": "new"})
+        _git(repo, "add", "-A")
+
+        assert _staged(repo) == ["src/lib/new.py", "src/lib/util.py"] == _expected(repo)
+
+    def test_unchanged_directories_are_not_read(self, repo):
+        _write(repo, {"specs/001-a/spec.md": "# Changed"})
+        _git(repo, "add", "-A")
+        context = GitContext.discover(repo)
+        read_trees: list[str] = []
+        original = ObjectStore.read_tree
+
+        def spy(store, sha):
+            read_trees.append(sha)
+            return original(store, sha)
+
+        # `git add` leaves the cache tree of the touched directories
+        # invalid; rebuild it the way `git commit` would see it
+        _git(repo, "write-tree")
+        with patch.object(ObjectStore, "read_tree", spy):
+            assert context.staged_files() == ("specs/001-a/spec.md",)
+
+        # root, specs/ and specs/001-a/ only; src/ is skipped via the cache tree
+        assert len(read_trees) == 3
+
+    def test_initial_commit_stages_everything(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("GIT_DIR", raising=False)
+        _git(tmp_path, "init", "-q")
+        _write(tmp_path, {"a.py": "a", "b/c.py": "c"})
+        _git(tmp_path, "add", "-A")
+
+        assert _staged(tmp_path) == ["a.py", "b/c.py"] == _expected(tmp_path)
+
+    def test_git_index_file_is_honoured(self, repo, monkeypatch):
+        _write(repo, {"README.md": "changed"})
+        index = repo / ".git" / "other-index"
+        monkeypatch.setenv("GIT_INDEX_FILE", str(index))
+        _git(repo, "read-tree", "HEAD")
+        _git(repo, "add", "README.md")
+
+        assert _staged(repo) == ["README.md"]
+        monkeypatch.delenv("GIT_INDEX_FILE")
+        assert _staged(repo) == []
+
+    def test_intent_to_add_falls_back_to_git(self, repo):
+        _write(repo, {"later.py": "x"})
+        _git(repo, "add", "-N", "later.py")
+
+        with pytest.raises(GitFormatError):
+            read_index(repo / ".git" / "index")
+        assert list(get_staged_files(repo)) == _expected(repo)
+
+    def test_get_staged_files_runs_no_subprocess(self, repo):
+        _write(repo, {"src/app.py": "changed"})
+        _git(repo, "add", "-A")
+
+        with patch("subprocess.run", side_effect=AssertionError("git was spawned")):
+            assert list(get_staged_files(repo)) == ["src/app.py"]
+
+
+def test_missing_index_means_everything_deleted(repo):
+    (repo / ".git" / "index").unlink()
+    context = GitContext.discover(repo)
+
+    staged = diff_index_to_head(
+        repo / ".git" / "objects", repo / ".git" / "index", context.head_sha
+    )
+
+    assert staged == sorted(
+        ["README.md", "specs/001-a/spec.md", "specs/002-b/spec.md", "src/app.py", "src/lib/util.py"]
+    )
+
+
+class TestConfigValue:
+    """Config values are layered like `git config` reports them."""
+
+    def test_repository_config_overrides_global(self, repo, tmp_path, monkeypatch):
+        global_config = tmp_path / "gitconfig"
+        global_config.write_text(
+            '[user]\n\temail = global@example.com\n\tname = "Global  Name" # c\n'
+        )
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(global_config))
+        monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+        context = GitContext.discover(repo)
+
+        with patch("subprocess.run", side_effect=AssertionError("git was spawned")):
+            assert context.config_value("user.email") == "dev@example.com"
+            assert context.config_value("User.Name") == "Dev"
+
+        _git(repo, "config", "--unset", "user.name")
+        assert (
+            context.config_value("user.name") == "Global  Name" == _git(repo, "config", "user.name")
+        )
+
+    def test_missing_key(self, repo, monkeypatch, tmp_path):
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(tmp_path / "missing"))
+        monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+
+        assert GitContext.discover(repo).config_value("doit.nothing") is None
+
+    def test_includes_fall_back_to_git(self, repo, tmp_path, monkeypatch):
+        included = tmp_path / "included"
+        included.write_text("[doit]\n\tteam = core\n")
+        monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+        _git(repo, "config", "include.path", str(included))
+
+        assert GitContext.discover(repo).config_value("doit.team") == "core"
@@ -0,0 +1,161 @@
+"""Tests for the persistent memory search index."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from doit_cli.models.search_models import QueryType, SourceFilter
+from doit_cli.services.memory_index import IndexedFile, MemoryIndex
+from doit_cli.services.memory_search import MemorySearchService
+
+CONSTITUTION = """# Project Constitution
+
+## Vision
+
+This project aims to build an authentication system.
+
+## Requirements
+
+- FR-001: Users must authenticate
+- FR-002: System must validate credentials (e.g. passwords)
+"""
+
+SPEC = """# Feature Specification: User Authentication
+
+## Summary
+
+Implement user authentication with login and logout functionality.
+
+## Requirements
+
+- FR-001: Users must be able to log in
+- FR-012: Sessions must expire after 24 hours -- see `session.py`
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A doit project with one memory file and one spec."""
+    memory_dir = tmp_path / ".doit" / "memory"
+    memory_dir.mkdir(parents=True)
+    (memory_dir / "constitution.md").write_text(CONSTITUTION)
+    spec_dir = tmp_path / "specs" / "001-user-auth"
+    spec_dir.mkdir(parents=True)
+    (spec_dir / "spec.md").write_text(SPEC)
+    return tmp_path
+
+
+def _search(project: Path, query: str, query_type: QueryType, **kwargs):
+    service = MemorySearchService(project, use_index=kwargs.pop("use_index", True))
+    results, sources, _ = service.search(
+        query_text=query, query_type=query_type, source_filter=SourceFilter.ALL, **kwargs
+    )
+    summary = [
+        (r.source_id, r.line_number, r.matched_text, r.relevance_score, r.context_before)
+        for r in results
+    ]
+    return summary, sorted((s.id, s.line_count, s.token_count) for s in sources), service
+
+
+class TestIndexedSearch:
+    """Indexed searches return exactly what a full scan returns."""
+
+    @pytest.mark.parametrize(
+        ("query", "query_type", "case_sensitive"),
+        [
+            ("auth", QueryType.KEYWORD, False),
+            ("FR-00", QueryType.KEYWORD, False),
+            ("e.g. pass", QueryType.PHRASE, False),
+            ("`session.py`", QueryType.KEYWORD, False),
+            ("--", QueryType.KEYWORD, False),
+            ("Users", QueryType.KEYWORD, True),
+            ("nothing-like-this", QueryType.KEYWORD, False),
+            ("what is the project vision?", QueryType.NATURAL, False),
+            (r"FR-\d+", QueryType.REGEX, False),
+        ],
+    )
+    def test_matches_full_scan(self, project, query, query_type, case_sensitive):
+        expected = _search(
+            project, query, query_type, case_sensitive=case_sensitive, use_index=False
+        )
+        cold = _search(project, query, query_type, case_sensitive=case_sensitive)
+        warm = _search(project, query, query_type, case_sensitive=case_sensitive)
+
+        assert cold[:2] == expected[:2]
+        assert warm[:2] == expected[:2]
+
+    def test_no_cache_does_not_write_index(self, project):
+        _search(project, "auth", QueryType.KEYWORD, use_index=False)
+
+        assert not (project / MemoryIndex.INDEX_PATH).exists()
+
+
+class TestIncrementalUpdates:
+    """Only changed files are re-tokenized."""
+
+    def test_unchanged_files_are_reused(self, project):
+        _search(project, "auth", QueryType.KEYWORD)
+        _, _, service = _search(project, "auth", QueryType.KEYWORD)
+
+        assert service.index.stats.reused == 2
+        assert service.index.stats.indexed == 0
+
+    def test_edited_file_is_reindexed(self, project):
+        _search(project, "auth", QueryType.KEYWORD)
+        spec = project / "specs" / "001-user-auth" / "spec.md"
+        spec.write_text(SPEC + "\n- FR-013: Support passkeys\n")
+
+        results, _, service = _search(project, "passkeys", QueryType.KEYWORD)
+
+        assert service.index.stats.indexed == 1
+        assert service.index.stats.reused == 1
+        assert [r[1] for r in results] == [12]
+
+    def test_touched_file_keeps_postings(self, project):
+        _search(project, "auth", QueryType.KEYWORD)
+        spec = project / "specs" / "001-user-auth" / "spec.md"
+        stat = spec.stat()
+        os.utime(spec, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        _, _, service = _search(project, "auth", QueryType.KEYWORD)
+
+        assert service.index.stats.indexed == 0
+
+    def test_deleted_file_is_dropped(self, project):
+        _search(project, "auth", QueryType.KEYWORD)
+        (project / "specs" / "001-user-auth" / "spec.md").unlink()
+
+        results, sources, service = _search(project, "auth", QueryType.KEYWORD)
+
+        assert service.index.stats.removed == 1
+        assert len(sources) == 1
+        assert results
+
+    def test_corrupt_index_is_ignored(self, project):
+        path = project / MemoryIndex.INDEX_PATH
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+
+        expected = _search(project, "auth", QueryType.KEYWORD, use_index=False)
+        assert _search(project, "auth", QueryType.KEYWORD)[:2] == expected[:2]
+
+
+class TestIndexedFile:
+    """Per-file postings and section table."""
+
+    def test_sections_match_heading_rules(self):
+        entry = IndexedFile.build(Path("spec.md"), SPEC, 0, len(SPEC))
+
+        assert entry.section_for_line(1) == "feature specification: user authentication"
+        assert entry.section_for_line(4) == "summary"
+        assert entry.section_for_line(9) == "requirements"
+
+    def test_candidates_narrow_to_lines(self, project):
+        index = MemoryIndex(project)
+        spec = project / "specs" / "001-user-auth" / "spec.md"
+        entries = index.refresh([spec])
+
+        assert index.candidates(entries, ["log"]) == {spec: {5, 9}}
+        assert index.candidates(entries, ["24 hours", "logout"]) == {spec: {5, 10}}
+        assert index.candidates(entries, ["--"]) is None
@@ -0,0 +1,83 @@
+"""Tests for parallel spec validation (`--jobs`)."""
+
+from pathlib import Path
+
+import pytest
+
+from doit_cli.models.validation_models import ValidationConfig
+from doit_cli.services.spec_scanner import SpecScanner
+from doit_cli.services.validation_service import ValidationService, resolve_jobs
+
+SPEC = """# Feature: Spec {n}
+
+**Status**: {status}
+**Feature Branch**: `{n:03d}-spec`
+
+## User Scenarios
+
+### User Story 1: Basic
+
+- **Given** spec {n} **When** validated **Then** it is reported in order
+
+## Requirements
+
+- **FR-001**: Requirement for spec {n}
+
+## Success Criteria
+
+- **SC-001**: Criterion
+{extra}"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A doit project with a mix of clean, noisy and broken specs."""
+    (tmp_path / ".doit").mkdir()
+    for n in range(1, 9):
+        spec_dir = tmp_path / "specs" / f"{n:03d}-spec"
+        spec_dir.mkdir(parents=True)
+        status = "Complete" if n % 3 == 0 else "Draft"
+        extra = "\nTODO: finish\n" if n % 2 else ""
+        (spec_dir / "spec.md").write_text(SPEC.format(n=n, status=status, extra=extra))
+    # A spec with no readable status exercises the per-spec error path.
+    broken = tmp_path / "specs" / "009-broken"
+    broken.mkdir()
+    (broken / "spec.md").write_text("")
+    return tmp_path
+
+
+def _summary(results):
+    return [
+        (r.spec_path, r.status, r.quality_score, [(i.rule_id, i.line_number) for i in r.issues])
+        for r in results
+    ]
+
+
+class TestResolveJobs:
+    def test_zero_means_every_cpu(self, monkeypatch):
+        monkeypatch.setattr("os.cpu_count", lambda: 6)
+        assert resolve_jobs(0) == 6
+
+    def test_positive_is_kept(self):
+        assert resolve_jobs(3) == 3
+
+
+class TestParallelValidation:
+    """Parallel runs report exactly what serial runs report."""
+
+    def test_validate_all_matches_serial(self, project):
+        serial = ValidationService(project, ValidationConfig.default()).validate_all(jobs=1)
+        parallel = ValidationService(project, ValidationConfig.default()).validate_all(jobs=4)
+
+        assert _summary(parallel) == _summary(serial)
+        assert [Path(r.spec_path).parent.name for r in parallel] == sorted(
+            p.name for p in (project / "specs").iterdir()
+        )
+
+    def test_scanner_matches_serial(self, project):
+        serial = SpecScanner(project, validate=True).scan(jobs=1)
+        parallel = SpecScanner(project, validate=True).scan(jobs=4)
+
+        assert [
+            (s.name, s.status, s.error, s.validation_passed, s.is_blocking) for s in parallel
+        ] == [(s.name, s.status, s.error, s.validation_passed, s.is_blocking) for s in serial]
@@ -0,0 +1,174 @@
+"""Tests for the persistent parsed-spec cache."""
+
+from pathlib import Path
+
+import pytest
+
+from doit_cli.models.status_models import SpecState
+from doit_cli.models.validation_models import ValidationConfig
+from doit_cli.services.requirement_parser import RequirementParser
+from doit_cli.services.spec_cache import SpecCache
+from doit_cli.services.spec_scanner import SpecScanner
+from doit_cli.services.task_parser import TaskParser
+from doit_cli.services.validation_service import ValidationService
+
+SPEC = """# Feature: Cached
+
+**Status**: In Progress
+**Feature Branch**: `001-cached`
+
+## User Scenarios
+
+### User Story 1: Basic
+
+- **Given** a spec **When** validated twice **Then** the second run hits the cache
+
+## Requirements
+
+- **FR-001**: First requirement
+- **FR-002**: Second requirement
+
+## Success Criteria
+
+- **SC-001**: Criterion
+
+TODO: tighten the criterion
+"""
+
+TASKS = """# Tasks
+
+- [ ] T001 Implement first [FR-001]
+- [x] T002 Implement second [FR-002]
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A doit project with one spec and its tasks file."""
+    (tmp_path / ".doit").mkdir()
+    spec_dir = tmp_path / "specs" / "001-cached"
+    spec_dir.mkdir(parents=True)
+    (spec_dir / "spec.md").write_text(SPEC)
+    (spec_dir / "tasks.md").write_text(TASKS)
+    return tmp_path
+
+
+def _spec(project: Path) -> Path:
+    return project / "specs" / "001-cached" / "spec.md"
+
+
+class TestSpecCache:
+    """Low-level cache behavior."""
+
+    def test_roundtrip_persists_across_instances(self, project):
+        cache = SpecCache(project)
+        assert cache.get_status(_spec(project), SPEC) is None
+        cache.put_status(_spec(project), SPEC, "in_progress")
+        cache.save()
+
+        reloaded = SpecCache(project)
+        assert reloaded.get_status(_spec(project), SPEC) == "in_progress"
+        assert reloaded.stats.hits == 1
+        assert (project / SpecCache.CACHE_PATH).exists()
+
+    def test_content_change_is_a_miss(self, project):
+        cache = SpecCache(project)
+        cache.put_status(_spec(project), SPEC, "in_progress")
+
+        assert cache.get_status(_spec(project), SPEC + "\nedited") is None
+        assert cache.stats.misses == 1
+
+    def test_disabled_cache_never_hits_or_writes(self, project):
+        cache = SpecCache(project, enabled=False)
+        cache.put_status(_spec(project), SPEC, "draft")
+        cache.save()
+
+        assert cache.get_status(_spec(project), SPEC) is None
+        assert cache.stats.misses == 1
+        assert not (project / SpecCache.CACHE_PATH).exists()
+
+    def test_save_outside_doit_project_is_noop(self, tmp_path):
+        cache = SpecCache(tmp_path)
+        cache.put_status(tmp_path / "spec.md", SPEC, "draft")
+        cache.save()
+
+        assert not (tmp_path / ".doit").exists()
+
+    def test_corrupt_cache_file_is_ignored(self, project):
+        path = project / SpecCache.CACHE_PATH
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+
+        cache = SpecCache(project)
+        assert cache.get_status(_spec(project), SPEC) is None
+
+
+class TestValidationCaching:
+    """ValidationService serves unchanged specs from the cache."""
+
+    def test_cached_result_matches_fresh_result(self, project):
+        fresh = ValidationService(project, config=ValidationConfig.default()).validate_file(
+            _spec(project)
+        )
+        assert any(i.rule_id == "todo-in-approved-spec" for i in fresh.issues)
+
+        first = SpecCache(project)
+        ValidationService(project, ValidationConfig.default(), cache=first).validate_all()
+        second = SpecCache(project)
+        results = ValidationService(
+            project, ValidationConfig.default(), cache=second
+        ).validate_all()
+
+        assert second.stats.hits >= 1
+        assert results[0].issues == fresh.issues
+        assert results[0].quality_score == fresh.quality_score
+
+    def test_rule_change_invalidates(self, project):
+        ValidationService(
+            project, ValidationConfig.default(), cache=SpecCache(project)
+        ).validate_all()
+
+        config = ValidationConfig(disabled_rules=["todo-in-approved-spec"])
+        results = ValidationService(project, config, cache=SpecCache(project)).validate_all()
+
+        assert not any(i.rule_id == "todo-in-approved-spec" for i in results[0].issues)
+
+    def test_tasks_change_invalidates(self, project):
+        ValidationService(
+            project, ValidationConfig.default(), cache=SpecCache(project)
+        ).validate_all()
+        (_spec(project).parent / "tasks.md").write_text(TASKS + "- [ ] T003 Orphan [FR-009]\n")
+
+        cache = SpecCache(project)
+        results = ValidationService(project, ValidationConfig.default(), cache=cache).validate_all()
+
+        assert any(i.rule_id == "orphaned-task-reference" for i in results[0].issues)
+
+
+class TestParserCaching:
+    """Scanner and cross-reference parsers consult the cache."""
+
+    def test_scanner_status_served_from_cache(self, project):
+        SpecScanner(project, validate=False, cache=SpecCache(project)).scan()
+
+        cache = SpecCache(project)
+        statuses = SpecScanner(project, validate=False, cache=cache).scan()
+
+        assert statuses[0].status == SpecState.IN_PROGRESS
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 0
+
+    def test_requirements_and_tasks_roundtrip(self, project):
+        cache = SpecCache(project)
+        tasks_path = _spec(project).parent / "tasks.md"
+        expected_reqs = RequirementParser().parse(_spec(project))
+        expected_tasks = TaskParser().parse(tasks_path)
+
+        RequirementParser(cache=cache).parse(_spec(project))
+        TaskParser(cache=cache).parse(tasks_path)
+        cache.save()
+
+        reloaded = SpecCache(project)
+        assert RequirementParser(cache=reloaded).parse(_spec(project)) == expected_reqs
+        assert TaskParser(cache=reloaded).parse(tasks_path) == expected_tasks
+        assert reloaded.stats.hits == 2
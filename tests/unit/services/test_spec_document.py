@@ -0,0 +1,113 @@
+"""Tests for the single-pass markdown document model."""
+
+from pathlib import Path
+
+from doit_cli.services import spec_document
+from doit_cli.services.entity_parser import EntityParser
+from doit_cli.services.rule_engine import RuleEngine
+from doit_cli.services.spec_document import SpecDocument
+from doit_cli.services.user_story_parser import UserStoryParser
+
+SPEC = """# Feature: Sample
+
+**Status**: In Progress
+**Feature Branch**: `001-sample`
+
+## User Scenarios
+
+### User Story 1 - Login (Priority: P1)
+
+As a user I log in.
+
+1. **Given** an account, **When** I log in, **Then** I see the dashboard
+
+### Edge Cases
+
+- Expired password
+
+## Requirements
+
+- **FR-001**: Log in
+
+### Key Entities
+
+- **User**: Has many Sessions
+- **Session**: Belongs to User
+
+## Examples
+
+```markdown
+### User Story 9 - Not real (Priority: P3)
+- **FR-999**: Not real either
+```
+
+| Priority | Question | Owner |
+|----------|----------|-------|
+| P1 | Why? | me |
+"""
+
+
+def _doc() -> SpecDocument:
+    return SpecDocument.parse(SPEC)
+
+
+class TestTokenization:
+    def test_headings_and_sections(self):
+        doc = _doc()
+        titles = [(h.level, h.title) for h in doc.headings]
+        assert titles[:4] == [
+            (1, "Feature: Sample"),
+            (2, "User Scenarios"),
+            (3, "User Story 1 - Login (Priority: P1)"),
+            (3, "Edge Cases"),
+        ]
+        scenarios = doc.section("user scenarios", level=2)
+        assert scenarios is not None
+        assert [h.title for h in doc.subheadings(scenarios)] == [
+            "User Story 1 - Login (Priority: P1)",
+            "Edge Cases",
+        ]
+        assert doc.lines[scenarios.end].startswith("## Requirements")
+
+    def test_fenced_code_is_opaque(self):
+        doc = _doc()
+        assert [(b.language, b.content.count("\n")) for b in doc.code_blocks] == [("markdown", 1)]
+        assert not any("Not real" in h.title for h in doc.headings)
+        assert not any("FR-999" in item.text for item in doc.list_items)
+
+    def test_unclosed_fence_is_plain_text(self):
+        doc = SpecDocument.parse("```python\n## Still a heading\n")
+        assert doc.code_blocks == ()
+        assert [h.title for h in doc.headings] == ["Still a heading"]
+
+    def test_tables_and_fields(self):
+        doc = _doc()
+        assert len(doc.tables) == 1
+        assert doc.tables[0].rows[0].startswith("| Priority")
+        assert doc.field("status") == "In Progress"
+        assert doc.field("Feature  Branch") == "`001-sample`"
+
+    def test_matching_lines_equals_per_line_search(self):
+        doc = SpecDocument.parse("a TODO\nb\n[NEEDS\nCLARIFICATION]\nTODO twice TODO")
+        assert doc.matching_lines(r"\bTODO\b") == [1, 5]
+        # A match spanning a line break is not a per-line match.
+        assert doc.matching_lines(r"\[NEEDS\s+CLARIFICATION") == []
+
+    def test_line_number_at(self):
+        doc = SpecDocument.parse("one\ntwo\nthree")
+        assert [doc.line_number_at(i) for i in (0, 3, 4, 8)] == [1, 1, 2, 3]
+
+
+class TestConsumers:
+    def test_parsers_accept_document(self):
+        doc = _doc()
+        stories = UserStoryParser().parse(doc)
+        assert [s.id for s in stories] == ["US1"]
+        assert len(stories[0].scenarios) == 1
+        assert [e.name for e in EntityParser().parse(doc)] == ["User", "Session"]
+        assert UserStoryParser().parse(SPEC) == stories
+
+    def test_rule_engine_tokenizes_once(self):
+        spec_document._parse_cached.cache_clear()
+        RuleEngine().evaluate(SPEC + "\n<!-- unique -->", Path("spec.md"))
+        assert spec_document._parse_cached.cache_info().misses == 1
@@ -0,0 +1,159 @@
+"""Unit tests for the sync-prompts content-hash manifest."""
+
+import json
+import os
+
+import pytest
+
+from doit_cli.models.sync_models import OperationType, SyncStatusEnum
+from doit_cli.services.command_writer import CommandWriter
+from doit_cli.services.drift_detector import DriftDetector
+from doit_cli.services.prompt_writer import PromptWriter
+from doit_cli.services.sync_manifest import SyncManifest
+from doit_cli.services.template_reader import TemplateReader
+
+OLD_NS = 1_000_000_000
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project with two command templates."""
+    templates_dir = tmp_path / ".doit" / "templates" / "commands"
+    templates_dir.mkdir(parents=True)
+    (templates_dir / "doit.one.md").write_text("---\ndescription: One\n---\n## Outline\nStep 1")
+    (templates_dir / "doit.two.md").write_text("# Two")
+    return tmp_path
+
+
+@pytest.fixture
+def templates(project):
+    """Read the project's templates."""
+    return TemplateReader(project_root=project).scan_templates()
+
+
+def _age(paths) -> None:
+    """Give files an mtime older than any template, as after a checkout."""
+    for path in paths:
+        os.utime(path, ns=(OLD_NS, OLD_NS))
+
+
+def _no_transform(*args):
+    raise AssertionError("template was transformed")
+
+
+class TestPromptWriterManifest:
+    """Prompts are rewritten only when their content would change."""
+
+    def test_fresh_checkout_rewrites_nothing(self, project, templates):
+        PromptWriter(project_root=project).write_prompts(templates)
+        prompts = sorted((project / ".github" / "prompts").iterdir())
+        (project / SyncManifest.CACHE_PATH).unlink()
+        _age(prompts)
+
+        result = PromptWriter(project_root=project).write_prompts(templates)
+
+        assert result.skipped == 2
+        assert [p.stat().st_mtime_ns for p in prompts] == [OLD_NS, OLD_NS]
+        assert (project / SyncManifest.CACHE_PATH).exists()
+
+    def test_recorded_prompts_are_not_transformed(self, project, templates):
+        PromptWriter(project_root=project).write_prompts(templates)
+        writer = PromptWriter(project_root=project)
+        writer.transformer.transform = _no_transform
+
+        result = writer.write_prompts(templates)
+
+        assert result.skipped == 2
+
+    def test_touched_prompt_is_checked_by_hash(self, project, templates):
+        PromptWriter(project_root=project).write_prompts(templates)
+        _age((project / ".github" / "prompts").iterdir())
+        writer = PromptWriter(project_root=project)
+        writer.transformer.transform = _no_transform
+
+        assert writer.write_prompts(templates).skipped == 2
+
+    def test_changed_template_is_rewritten(self, project):
+        PromptWriter(project_root=project).write_prompts(
+            TemplateReader(project_root=project).scan_templates()
+        )
+        (project / ".doit" / "templates" / "commands" / "doit.two.md").write_text("# Two v2")
+        templates = TemplateReader(project_root=project).scan_templates()
+
+        result = PromptWriter(project_root=project).write_prompts(templates)
+
+        assert [op.operation_type for op in result.operations] == [
+            OperationType.SKIPPED,
+            OperationType.UPDATED,
+        ]
+        assert "Two v2" in (project / ".github" / "prompts" / "doit.two.prompt.md").read_text()
+
+    def test_edited_prompt_is_rewritten(self, project, templates):
+        writer = PromptWriter(project_root=project)
+        writer.write_prompts(templates)
+        prompt = project / ".github" / "prompts" / "doit.one.prompt.md"
+        expected = prompt.read_text()
+        prompt.write_text("hand edit")
+
+        assert writer.check_prompt(templates[0]) == SyncStatusEnum.OUT_OF_SYNC
+        assert writer.write_prompts(templates).synced == 1
+        assert prompt.read_text() == expected
+
+
+class TestCommandWriterManifest:
+    """Claude commands follow the same rules as prompts."""
+
+    def test_fresh_checkout_rewrites_nothing(self, project, templates):
+        CommandWriter(project_root=project).write_commands(templates)
+        commands = sorted((project / ".claude" / "commands").iterdir())
+        (project / SyncManifest.CACHE_PATH).unlink()
+        _age(commands)
+
+        result = CommandWriter(project_root=project).write_commands(templates)
+
+        assert result.skipped == 2
+        assert [p.stat().st_mtime_ns for p in commands] == [OLD_NS, OLD_NS]
+
+    def test_shared_manifest_keeps_both_outputs(self, project, templates):
+        manifest = SyncManifest(project)
+        PromptWriter(project_root=project, manifest=manifest).write_prompts(templates)
+        CommandWriter(project_root=project, manifest=manifest).write_commands(templates)
+
+        entries = json.loads((project / SyncManifest.CACHE_PATH).read_text())["entries"]
+
+        assert sorted(entries) == [
+            ".claude/commands/doit.one.md",
+            ".claude/commands/doit.two.md",
+            ".github/prompts/doit.one.prompt.md",
+            ".github/prompts/doit.two.prompt.md",
+        ]
+
+
+class TestDriftDetectorManifest:
+    """Drift is content drift, not mtime drift."""
+
+    def test_old_mtimes_are_not_drift(self, project, templates):
+        PromptWriter(project_root=project).write_prompts(templates)
+        _age((project / ".github" / "prompts").iterdir())
+
+        assert DriftDetector(project_root=project).is_all_synced(templates)
+
+    def test_check_all_uses_stats_only(self, project, templates):
+        PromptWriter(project_root=project).write_prompts(templates)
+        detector = DriftDetector(project_root=project)
+        detector.prompt_writer.transformer.transform = _no_transform
+
+        statuses = detector.check_all(templates)
+
+        assert {s.status for s in statuses} == {SyncStatusEnum.SYNCHRONIZED}
+
+
+def test_manifest_is_not_written_outside_a_doit_project(tmp_path):
+    output = tmp_path / "out.md"
+    output.write_text("x")
+    manifest = SyncManifest(tmp_path)
+
+    assert manifest.check(output, "src", lambda: "x") == SyncStatusEnum.SYNCHRONIZED
+    manifest.save()
+
+    assert not (tmp_path / ".doit").exists()
@@ -486,3 +486,78 @@ class TestTaskParserReferencePreservation:
         # With low threshold, should match
         preserved_low = parser.preserve_references(old_tasks, new_tasks, similarity_threshold=0.3)
         assert preserved_low[0].requirement_ids == ["FR-001"]
+
+
+def _brute_force_preserve(
+    parser: TaskParser, old_tasks: list, new_tasks: list, threshold: float
+) -> list[list[str]]:
+    """Pairwise matching as done before the token index, for comparison."""
+    result = []
+    used: set[str] = set()
+    for new_task in new_tasks:
+        best, best_score = None, 0.0
+        for old_task in old_tasks:
+            if old_task.id in used:
+                continue
+            score = parser._calculate_similarity(new_task.description, old_task.description)
+            if score > best_score and score >= threshold:
+                best, best_score = old_task, score
+        if best is not None and best.references:
+            used.add(best.id)
+            result.append(best.requirement_ids)
+        else:
+            result.append([])
+    return result
+
+
+class TestIndexedReferenceMatching:
+    """The token index gives the same matches as comparing every pair."""
+
+    WORDS = ["create", "update", "parser", "model", "service", "tests", "docs", "cli", "cache"]
+
+    def _content(self, count: int, steps: int, with_refs: bool) -> str:
+        lines = []
+        for i in range(count):
+            words = [self.WORDS[(i * k) % len(self.WORDS)] for k in range(1, 2 + i % 4)]
+            ref = f" [FR-{i % 50:03d}]" if with_refs and i % 4 else ""
+            lines.append(f"- [ ] T{i:03d} {' '.join(words)} step{i % steps}{ref}")
+        return "\n".join(lines)
+
+    @pytest.mark.parametrize("threshold", [0.3, 0.5, 0.7])
+    def test_preserve_matches_pairwise_comparison(self, threshold: float) -> None:
+        parser = TaskParser()
+        old_tasks = parser.parse_content(self._content(300, 7, True), "/old/tasks.md")
+        new_tasks = parser.parse_content(self._content(320, 5, False), "/new/tasks.md")
+
+        preserved = parser.preserve_references(old_tasks, new_tasks, threshold)
+
+        assert [t.requirement_ids for t in preserved] == _brute_force_preserve(
+            parser, old_tasks, new_tasks, threshold
+        )
+
+    def test_ties_go_to_the_earliest_old_task(self) -> None:
+        parser = TaskParser()
+        old_tasks = parser.parse_content(
+            "- [ ] Build parser alpha [FR-001]\n- [ ] Build parser beta [FR-002]", "/old.md"
+        )
+        new_tasks = parser.parse_content("- [ ] Build parser\n- [ ] Build parser", "/new.md")
+
+        preserved = parser.preserve_references(old_tasks, new_tasks, similarity_threshold=0.5)
+
+        assert [t.requirement_ids for t in preserved] == [["FR-001"], ["FR-002"]]
+
+    def test_apply_uses_first_matching_key_without_pairwise_scoring(self, monkeypatch) -> None:
+        parser = TaskParser()
+        old_tasks = parser.parse_content(
+            "- [ ] Write the cache layer [FR-001]\n- [ ] Write the cache layer now [FR-002]",
+            "/old.md",
+        )
+        ref_map = parser.build_reference_map(old_tasks)
+        monkeypatch.setattr(
+            parser, "_calculate_similarity", lambda *_: pytest.fail("pairwise scoring")
+        )
+
+        result = parser.apply_references_to_content("- [ ] Write the cache layer now", ref_map)
+
+        # Both keys clear the threshold; the first in map order wins
+        assert result == "- [ ] Write the cache layer now [FR-001]"
@@ -0,0 +1,100 @@
+"""Tests for TraceabilityService."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from doit_cli.models.crossref_models import CoverageStatus
+from doit_cli.services.rule_engine import RuleEngine
+from doit_cli.services.task_parser import TaskParser
+from doit_cli.services.traceability_service import TraceabilityService
+
+
+def _feature(root: Path, name: str, spec: str, tasks: str | None) -> Path:
+    feature_dir = root / "specs" / name
+    feature_dir.mkdir(parents=True)
+    (feature_dir / "spec.md").write_text(spec)
+    if tasks is not None:
+        (feature_dir / "tasks.md").write_text(tasks)
+    return feature_dir / "spec.md"
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A project with two features, one of them without tasks.md."""
+    _feature(
+        tmp_path,
+        "001-alpha",
+        "- **FR-001**: First\n- **FR-002**: Second\n",
+        "- [x] T001 Build [FR-001]\n- [ ] T002 Wire [FR-001, FR-002] [FR-001]\n"
+        "- [ ] T003 Extra [FR-009]\n",
+    )
+    _feature(tmp_path, "002-beta", "- **FR-001**: Only\n", None)
+    (tmp_path / "specs" / "notes").mkdir()
+    return tmp_path
+
+
+class TestTraceabilityService:
+    """The matrix holds one coverage report per feature."""
+
+    def test_build_covers_every_feature(self, project: Path) -> None:
+        matrix = TraceabilityService(project).build()
+
+        assert list(matrix.reports) == ["001-alpha", "002-beta"]
+        assert (matrix.total_count, matrix.covered_count, matrix.orphaned_count) == (3, 2, 1)
+        assert [t.line_number for t in matrix.get_tasks("001-alpha", "FR-001")] == [1, 2]
+        assert matrix.get_tasks("002-beta", "FR-001") == []
+        alpha = matrix.get_report("001-alpha")
+        assert alpha is not None
+        assert [rc.status for rc in alpha.requirements] == [
+            CoverageStatus.PARTIAL,
+            CoverageStatus.PARTIAL,
+        ]
+
+    def test_build_selected_features(self, project: Path) -> None:
+        matrix = TraceabilityService(project).build(["002-beta", "missing"])
+
+        assert list(matrix.reports) == ["002-beta"]
+
+    def test_each_file_is_parsed_once(self, project: Path) -> None:
+        with patch.object(TaskParser, "parse", autospec=True, side_effect=TaskParser.parse) as spy:
+            TraceabilityService(project).build()
+
+        assert spy.call_count == 1
+
+    def test_rows_and_csv(self, project: Path) -> None:
+        matrix = TraceabilityService(project).build()
+
+        assert [(r["feature"], r["requirement"], r["task_line"]) for r in matrix.rows()] == [
+            ("001-alpha", "FR-001", 1),
+            ("001-alpha", "FR-001", 2),
+            ("001-alpha", "FR-002", 2),
+            ("001-alpha", "FR-009", 3),
+            ("002-beta", "FR-001", None),
+        ]
+        csv_lines = matrix.to_csv().splitlines()
+        assert csv_lines[0] == ",".join(matrix.CSV_COLUMNS)
+        assert csv_lines[-1] == "002-beta,FR-001,uncovered,,,"
+
+    def test_empty_project(self, tmp_path: Path) -> None:
+        matrix = TraceabilityService(tmp_path).build()
+
+        assert matrix.reports == {}
+        assert matrix.coverage_percent == 100.0
+
+
+def test_rule_engine_parses_tasks_once_for_all_traceability_rules(project: Path) -> None:
+    spec_path = project / "specs" / "001-alpha" / "spec.md"
+    engine = RuleEngine()
+
+    with patch.object(TaskParser, "parse", autospec=True, side_effect=TaskParser.parse) as spy:
+        issues = engine.evaluate(spec_path.read_text(), spec_path)
+
+    assert spy.call_count == 1
+    traceability = [
+        (i.rule_id, i.line_number)
+        for i in issues
+        if i.rule_id in ("orphaned-task-reference", "uncovered-requirement")
+    ]
+    assert traceability == [("orphaned-task-reference", 3)]
@@ -1,5 +1,6 @@
 """Unit tests for ContextLoader service."""
 
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -125,6 +126,48 @@ Even more details here.
         assert truncated is False
 
 
+def _roadmap(line_count: int) -> str:
+    """Build a roadmap-like document with a heading every 50 lines."""
+    lines = ["# Roadmap", ""]
+    for i in range(line_count):
+        if i % 50 == 0:
+            lines.extend([f"## Section {i // 50}", f"Intro paragraph for section {i // 50}.", ""])
+        lines.append(f"- [ ] Item {i}: deliver capability number {i} for the platform")
+    return "\n".join(lines)
+
+
+class TestTruncationScaling:
+    """Benchmark: truncation cost grows linearly with document size."""
+
+    @staticmethod
+    def _best_time(content: str, tmp_path: Path) -> float:
+        max_tokens = estimate_tokens(content) // 2
+        best = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            truncate_content(content, max_tokens=max_tokens, path=tmp_path / "roadmap.md")
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def test_10k_lines_scales_linearly(self, tmp_path: Path):
+        small = self._best_time(_roadmap(2_500), tmp_path)
+        large = self._best_time(_roadmap(10_000), tmp_path)
+
+        # 4x the input should take ~4x the time; quadratic would be ~16x.
+        assert large < small * 8
+        assert large < 1.0
+
+    def test_fill_respects_budget(self, tmp_path: Path):
+        content = _roadmap(10_000)
+        result, truncated, original = truncate_content(content, max_tokens=2_000, path=tmp_path)
+
+        assert truncated is True
+        assert original > 2_000
+        assert estimate_tokens(result) <= 2_000 + 50
+        assert result.startswith("# Roadmap")
+        assert "## Section 0" in result
+
+
 class TestExtractKeywords:
     """Tests for keyword extraction function."""
 
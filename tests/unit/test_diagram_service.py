@@ -331,3 +331,92 @@ class TestDiagramServiceSectionHandling:
 
         # Should find alternate section name
         assert result.success
+
+
+@pytest.fixture
+def bullet_spec_file(tmp_path, sample_spec_content):
+    """Create a spec file whose entities are listed as bullets."""
+    content = sample_spec_content.replace(
+        "### User\nCentral entity representing a system user.",
+        "- **User**: Central entity representing a system user.",
+    ).replace("### Task\nRepresents a task item.", "- **Task**: Represents a task item.")
+    spec_file = tmp_path / "spec.md"
+    spec_file.write_text(content, encoding="utf-8")
+    return spec_file
+
+
+class TestDiagramServiceSkipUnchanged:
+    """Tests for source hashes and skipping unchanged sections."""
+
+    def test_marker_records_source_hash(self, service, bullet_spec_file):
+        """Test that inserted sections record their source hash."""
+        service.generate(bullet_spec_file)
+
+        content = bullet_spec_file.read_text(encoding="utf-8")
+        journey_hash = service.source_hash(content, DiagramType.USER_JOURNEY)
+        assert f'section="user-journey" source="{journey_hash}"' in content
+
+    def test_second_run_skips_and_does_not_write(self, service, bullet_spec_file):
+        """Test that unchanged sources are not regenerated or rewritten."""
+        service.generate(bullet_spec_file)
+        first = bullet_spec_file.read_text(encoding="utf-8")
+        mtime = bullet_spec_file.stat().st_mtime_ns
+
+        result = service.generate(bullet_spec_file)
+
+        assert result.success
+        assert result.diagrams == []
+        assert sorted(result.sections_unchanged) == ["entity-relationships", "user-journey"]
+        assert bullet_spec_file.read_text(encoding="utf-8") == first
+        assert bullet_spec_file.stat().st_mtime_ns == mtime
+
+    def test_force_regenerates(self, service, bullet_spec_file):
+        """Test that force regenerates unchanged sections."""
+        service.generate(bullet_spec_file)
+
+        result = service.generate(bullet_spec_file, force=True)
+
+        assert result.sections_unchanged == []
+        assert len(result.diagrams) == 2
+
+    def test_edited_source_regenerates_only_its_section(self, service, bullet_spec_file):
+        """Test that editing a story regenerates the user journey only."""
+        service.generate(bullet_spec_file)
+        content = bullet_spec_file.read_text(encoding="utf-8")
+        bullet_spec_file.write_text(content.replace("Login Flow", "Sign In Flow"), encoding="utf-8")
+
+        result = service.generate(bullet_spec_file)
+
+        assert [d.diagram_type for d in result.diagrams] == [DiagramType.USER_JOURNEY]
+        assert result.sections_unchanged == ["entity-relationships"]
+        assert "Sign In Flow" in bullet_spec_file.read_text(encoding="utf-8")
+
+    def test_generated_content_does_not_change_hash(self, service, sample_spec_content):
+        """Test that the hash ignores lines inside AUTO-GENERATED sections."""
+        filled = sample_spec_content.replace(
+            '<!-- BEGIN:AUTO-GENERATED section="user-journey" -->\n',
+            '<!-- BEGIN:AUTO-GENERATED section="user-journey" -->\nflowchart LR\n',
+        )
+
+        assert service.source_hash(filled, DiagramType.USER_JOURNEY) == service.source_hash(
+            sample_spec_content, DiagramType.USER_JOURNEY
+        )
+
+    def test_no_source_has_no_hash(self, service):
+        """Test that content without stories has no user journey hash."""
+        assert service.source_hash("# Empty\n", DiagramType.USER_JOURNEY) is None
+
+    def test_generate_all_keeps_input_order(self, service, tmp_path, sample_spec_content):
+        """Test that concurrent batch generation returns results in order."""
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"{i:03d}" / "spec.md"
+            path.parent.mkdir()
+            path.write_text(sample_spec_content, encoding="utf-8")
+            paths.append(path)
+
+        results = service.generate_all(paths, jobs=3)
+
+        assert [r.file_path for r in results] == paths
+        assert all(r.sections_updated for r in results)
+        assert all(r.sections_unchanged for r in service.generate_all(paths, jobs=3))
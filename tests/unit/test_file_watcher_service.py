@@ -0,0 +1,167 @@
+"""Tests for the coalescing change pipeline in FileWatcherService."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from watchdog.events import FileMovedEvent
+
+from doit_cli.services.file_watcher_service import (
+    ChangeQueue,
+    FileChangeEvent,
+    FileWatcherService,
+    MemoryFileHandler,
+)
+
+
+class Recorder:
+    """Collects dispatched batches and signals each one."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[FileChangeEvent]] = []
+        self.event = threading.Event()
+
+    def __call__(self, batch: list[FileChangeEvent]) -> None:
+        self.batches.append(batch)
+        self.event.set()
+
+    def summary(self) -> list[list[tuple[str, str]]]:
+        return [[(e.path, e.event_type) for e in batch] for batch in self.batches]
+
+
+def _event(path: str, event_type: str) -> FileChangeEvent:
+    return FileChangeEvent(path=path, event_type=event_type)
+
+
+def _queue(recorder: Recorder, quiet: float = 0.05, latency: float = 5.0) -> ChangeQueue:
+    change_queue = ChangeQueue(recorder, quiet_period=quiet, max_latency=latency)
+    change_queue.start()
+    return change_queue
+
+
+class TestChangeQueue:
+    """Events are merged per path and dispatched in batches."""
+
+    def test_burst_becomes_one_batch_with_last_event_per_path(self):
+        recorder = Recorder()
+        change_queue = _queue(recorder)
+
+        for _ in range(50):
+            change_queue.put(_event("a.md", "modified"))
+            change_queue.put(_event("b.md", "modified"))
+        assert recorder.event.wait(2)
+        change_queue.stop()
+
+        assert recorder.summary() == [[("a.md", "modified"), ("b.md", "modified")]]
+        stats = change_queue.stats
+        assert (stats.received, stats.coalesced, stats.dispatched, stats.batches) == (
+            100,
+            98,
+            2,
+            1,
+        )
+
+    def test_merge_rules(self):
+        recorder = Recorder()
+        change_queue = _queue(recorder, quiet=60)
+
+        for path, event_type in [
+            ("temp.md", "created"),
+            ("temp.md", "deleted"),
+            ("new.md", "created"),
+            ("new.md", "modified"),
+            ("replaced.md", "deleted"),
+            ("replaced.md", "created"),
+        ]:
+            change_queue.put(_event(path, event_type))
+        change_queue.stop()
+
+        assert recorder.summary() == [[("new.md", "created"), ("replaced.md", "modified")]]
+        stats = change_queue.stats
+        assert stats.received == stats.coalesced + stats.dispatched
+
+    def test_max_latency_flushes_during_a_continuous_stream(self):
+        recorder = Recorder()
+        change_queue = _queue(recorder, quiet=0.2, latency=0.1)
+
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:
+            change_queue.put(_event("busy.md", "modified"))
+            time.sleep(0.01)
+        change_queue.stop()
+
+        assert len(recorder.batches) >= 3
+
+    def test_stop_dispatches_pending_changes(self):
+        recorder = Recorder()
+        change_queue = _queue(recorder, quiet=60)
+
+        change_queue.put(_event("a.md", "created"))
+        change_queue.stop()
+
+        assert recorder.summary() == [[("a.md", "created")]]
+
+    def test_failing_dispatch_does_not_stop_the_worker(self):
+        calls = []
+
+        def dispatch(batch):
+            calls.append(batch)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+
+        change_queue = ChangeQueue(dispatch, quiet_period=0.01, max_latency=5)
+        change_queue.start()
+        change_queue.put(_event("a.md", "modified"))
+        time.sleep(0.1)
+        change_queue.put(_event("b.md", "modified"))
+        change_queue.stop()
+
+        assert [[e.path for e in batch] for batch in calls] == [["a.md"], ["b.md"]]
+
+
+class TestMemoryFileHandler:
+    """Moves are reported per path."""
+
+    def _handler(self, tmp_path: Path) -> tuple[MemoryFileHandler, list[FileChangeEvent]]:
+        events: list[FileChangeEvent] = []
+        return MemoryFileHandler(tmp_path, events.append), events
+
+    def test_move_is_a_delete_and_a_create(self, tmp_path):
+        handler, events = self._handler(tmp_path)
+
+        handler.on_moved(FileMovedEvent(str(tmp_path / "a.md"), str(tmp_path / "b.md")))
+
+        assert [(e.path, e.event_type) for e in events] == [
+            ("a.md", "deleted"),
+            ("b.md", "created"),
+        ]
+
+    def test_atomic_replace_is_a_modification(self, tmp_path):
+        handler, events = self._handler(tmp_path)
+
+        handler.on_moved(FileMovedEvent(str(tmp_path / ".a.md.x1.tmp"), str(tmp_path / "a.md")))
+
+        assert [(e.path, e.event_type) for e in events] == [("a.md", "modified")]
+
+
+def test_watcher_sends_one_notification_per_batch(tmp_path, monkeypatch):
+    monkeypatch.setattr(FileWatcherService, "DEBOUNCE_SECONDS", 0.2)
+    notifications = MagicMock()
+    recorder = Recorder()
+    watcher = FileWatcherService(tmp_path, notification_service=notifications)
+    watcher.add_change_callback(recorder)
+    assert watcher.start()
+
+    try:
+        for i in range(10):
+            (watcher.memory_dir / f"note-{i}.md").write_text("x")
+            (watcher.memory_dir / f"note-{i}.md").write_text("y")
+        assert recorder.event.wait(5)
+    finally:
+        watcher.stop()
+
+    assert notifications.notify_memory_changed.call_count == 1
+    files = notifications.notify_memory_changed.call_args.kwargs["affected_files"]
+    assert sorted(files) == sorted(f"note-{i}.md" for i in range(10))
+    assert watcher.stats.received > watcher.stats.dispatched
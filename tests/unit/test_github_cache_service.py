@@ -11,6 +11,7 @@ from pathlib import Path
 import pytest
 
 from doit_cli.models.github_epic import GitHubEpic
+from doit_cli.models.github_feature import GitHubFeature
 from doit_cli.models.sync_metadata import SyncMetadata
 from doit_cli.services.github_cache_service import (
     CacheError,
@@ -501,3 +502,75 @@ class TestGetCacheAgeMinutes:
         cache_service.cache_path.write_text("corrupted")
 
         assert cache_service.get_cache_age_minutes() is None
+
+
+class TestPerEntityCache:
+    """Tests for per-entity entries, timestamps and stale reads."""
+
+    @pytest.fixture
+    def epic_with_feature(self, mock_epic):
+        mock_epic.features = [
+            GitHubFeature(
+                number=578,
+                title="[Feature]: Display Epics",
+                state="open",
+                labels=["feature"],
+                epic_number=577,
+                url="https://github.com/owner/repo/issues/578",
+            )
+        ]
+        return mock_epic
+
+    def test_features_round_trip(self, cache_service, epic_with_feature, mock_metadata):
+        """Features are cached as their own entries and reattached to epics."""
+        cache_service.save_cache([epic_with_feature], mock_metadata)
+
+        cache_data = json.loads(cache_service.cache_path.read_text())
+        assert [f["number"] for f in cache_data["features"]] == [578]
+        assert "features" not in cache_data["epics"][0]
+
+        epics = cache_service.get_epics()
+        assert [f.number for f in epics[0].features] == [578]
+        assert epics[0].features[0].labels == ["feature"]
+
+    def test_unchanged_entries_keep_fetched_at(
+        self, cache_service, epic_with_feature, mock_metadata
+    ):
+        """Only entries whose data changed get a new fetchedAt stamp."""
+        cache_service.save_cache([epic_with_feature], mock_metadata)
+        data = json.loads(cache_service.cache_path.read_text())
+        data["epics"][0]["fetchedAt"] = "2026-01-01T00:00:00"
+        data["features"][0]["fetchedAt"] = "2026-01-01T00:00:00"
+        cache_service.cache_path.write_text(json.dumps(data))
+
+        epic_with_feature.features[0].title = "[Feature]: Renamed"
+        cache_service.save_cache([epic_with_feature], mock_metadata)
+
+        data = json.loads(cache_service.cache_path.read_text())
+        assert data["epics"][0]["fetchedAt"] == "2026-01-01T00:00:00"
+        assert data["features"][0]["fetchedAt"] != "2026-01-01T00:00:00"
+
+    def test_stale_epics_are_served_when_allowed(self, cache_service, mock_epic):
+        """Expired entries remain readable for offline mode."""
+        expired = SyncMetadata(
+            repo_url="https://github.com/owner/repo",
+            last_sync=datetime.now() - timedelta(minutes=60),
+            ttl_minutes=30,
+        )
+        cache_service.save_cache([mock_epic], expired)
+
+        assert cache_service.get_epics() is None
+        assert [e.number for e in cache_service.get_epics(allow_stale=True)] == [577]
+
+    def test_synced_at_is_recorded_per_kind(self, cache_service, mock_epic, mock_metadata):
+        """save_cache records the sync start for epics, features and full syncs."""
+        started = datetime(2026, 2, 1, 10, 0)
+
+        cache_service.save_cache([mock_epic], mock_metadata, synced_at=started)
+        assert cache_service.get_synced_at("features") == started
+        assert cache_service.get_synced_at("full") == started
+
+        later = datetime(2026, 2, 1, 11, 0)
+        cache_service.save_cache([mock_epic], mock_metadata, synced_at=later, full_sync=False)
+        assert cache_service.get_synced_at("epics") == later
+        assert cache_service.get_synced_at("full") == started
@@ -265,51 +265,57 @@ Content here.
         assert "## Other Section" in new_body
 
 
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """Make a repository whose origin URL is set by calling the fixture."""
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    monkeypatch.chdir(tmp_path)
+
+    def with_origin(url: str | None) -> Path:
+        config = "[core]\n\tbare = false\n"
+        if url:
+            config += f'[remote "origin"]\n\turl = {url}\n'
+        (tmp_path / ".git" / "config").write_text(config)
+        return tmp_path
+
+    return with_origin
+
+
 class TestGetRepoSlug:
     """Tests for _get_repo_slug method."""
 
-    @patch("subprocess.run")
-    def test_get_repo_slug_ssh(self, mock_run):
+    def test_get_repo_slug_ssh(self, git_repo, mock_github_service):
         """Test getting repo slug from SSH remote URL."""
-        mock_result = Mock()
-        mock_result.stdout = "git@github.com:owner/repo.git\n"
-        mock_run.return_value = mock_result
+        git_repo("git@github.com:owner/repo.git")
 
-        linker = GitHubLinkerService()
+        linker = GitHubLinkerService(github_service=mock_github_service)
         slug = linker._get_repo_slug()
 
         assert slug == "owner/repo"
 
-    @patch("subprocess.run")
-    def test_get_repo_slug_https(self, mock_run):
+    def test_get_repo_slug_https(self, git_repo, mock_github_service):
         """Test getting repo slug from HTTPS remote URL."""
-        mock_result = Mock()
-        mock_result.stdout = "https://github.com/owner/repo.git\n"
-        mock_run.return_value = mock_result
+        git_repo("https://github.com/owner/repo.git")
 
-        linker = GitHubLinkerService()
+        linker = GitHubLinkerService(github_service=mock_github_service)
         slug = linker._get_repo_slug()
 
         assert slug == "owner/repo"
 
-    @patch("subprocess.run")
-    def test_get_repo_slug_not_github(self, mock_run):
+    def test_get_repo_slug_not_github(self, git_repo, mock_github_service):
         """Test error when remote is not GitHub."""
-        mock_result = Mock()
-        mock_result.stdout = "https://gitlab.com/owner/repo.git\n"
-        mock_run.return_value = mock_result
+        git_repo("https://gitlab.com/owner/repo.git")
 
-        linker = GitHubLinkerService()
+        linker = GitHubLinkerService(github_service=mock_github_service)
 
         with pytest.raises(GitHubServiceError, match="Not a GitHub repository"):
             linker._get_repo_slug()
 
-    @patch("subprocess.run")
-    def test_get_repo_slug_no_remote(self, mock_run, mock_github_service):
+    def test_get_repo_slug_no_remote(self, git_repo, mock_github_service):
         """Test error when no git remote found."""
-        import subprocess
-
-        mock_run.side_effect = subprocess.CalledProcessError(1, "git")
+        git_repo(None)
 
         linker = GitHubLinkerService(github_service=mock_github_service)
 
@@ -320,26 +326,20 @@ class TestGetRepoSlug:
 class TestGetRelativePath:
     """Tests for _get_relative_path method."""
 
-    @patch("subprocess.run")
-    def test_get_relative_path_success(self, mock_run):
+    def test_get_relative_path_success(self, git_repo, mock_github_service):
         """Test getting relative path from repo root."""
-        mock_result = Mock()
-        mock_result.stdout = "/home/user/repo\n"
-        mock_run.return_value = mock_result
+        root = git_repo(None)
 
-        linker = GitHubLinkerService()
-        spec_path = Path("/home/user/repo/specs/001-test/spec.md")
+        linker = GitHubLinkerService(github_service=mock_github_service)
+        spec_path = root.resolve() / "specs" / "001-test" / "spec.md"
 
         relative_path = linker._get_relative_path(spec_path)
 
         assert relative_path == "specs/001-test/spec.md"
 
-    @patch("subprocess.run")
-    def test_get_relative_path_fallback(self, mock_run, mock_github_service):
-        """Test fallback when git command fails."""
-        import subprocess
-
-        mock_run.side_effect = subprocess.CalledProcessError(1, "git")
+    def test_get_relative_path_fallback(self, git_repo, mock_github_service):
+        """Test fallback when the spec is outside the repository."""
+        git_repo(None)
 
         linker = GitHubLinkerService(github_service=mock_github_service)
         spec_path = Path("/home/user/repo/specs/001-test/spec.md")
@@ -6,6 +6,8 @@ mocking subprocess calls to test various scenarios for roadmap epic integration.
 
 import json
 import subprocess
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -15,6 +17,7 @@ from doit_cli.models.github_feature import GitHubFeature
 from doit_cli.services.github_service import (
     GitHubAPIError,
     GitHubAuthError,
+    GitHubRateLimitError,
     GitHubService,
 )
 
@@ -400,6 +403,253 @@ class TestFetchFeaturesForEpic:
         assert "#999" in captured.out
 
 
+class TestFetchEpicsWithFeatures:
+    """Tests for the concurrent fetch_epics_with_features pipeline."""
+
+    @staticmethod
+    def _gh(epic_numbers, feature_failures=None):
+        """Fake `gh issue list` answering epic and per-epic feature searches.
+
+        Args:
+            epic_numbers: Epics returned by the label query.
+            feature_failures: Epic number -> list of stderr messages returned
+                (one per attempt) before the search succeeds.
+        """
+        failures = {k: list(v) for k, v in (feature_failures or {}).items()}
+        lock = threading.Lock()
+        active = {"now": 0, "max": 0}
+
+        def run(cmd, **kwargs):
+            if "--label" in cmd:
+                epics = [
+                    {
+                        "number": n,
+                        "title": f"[Epic]: {n}",
+                        "state": "open",
+                        "labels": [{"name": "epic"}],
+                        "body": "",
+                        "url": f"https://github.com/owner/repo/issues/{n}",
+                        "createdAt": "2026-01-21T10:00:00Z",
+                        "updatedAt": "2026-01-21T15:30:00Z",
+                    }
+                    for n in epic_numbers
+                ]
+                return MagicMock(returncode=0, stdout=json.dumps(epics), stderr="")
+
+            epic_number = int(cmd[cmd.index("--search") + 1].rsplit("#", 1)[1])
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+                pending = failures.get(epic_number)
+                stderr = pending.pop(0) if pending else None
+            time.sleep(0.02)
+            with lock:
+                active["now"] -= 1
+            if stderr is not None:
+                return MagicMock(returncode=1, stdout="", stderr=stderr)
+            feature = {
+                "number": epic_number * 10,
+                "title": f"[Feature]: {epic_number}",
+                "labels": [{"name": "feature"}],
+                "state": "open",
+                "url": f"https://github.com/owner/repo/issues/{epic_number * 10}",
+            }
+            return MagicMock(returncode=0, stdout=json.dumps([feature]), stderr="")
+
+        run.active = active
+        return run
+
+    @patch("doit_cli.services.github_service.is_gh_authenticated", return_value=True)
+    @patch("doit_cli.services.github_service.has_gh_cli", return_value=True)
+    def test_fetches_features_for_every_epic_concurrently(
+        self, mock_has_cli, mock_is_auth, github_service
+    ):
+        """Every epic gets its features, with searches running in parallel."""
+        gh = self._gh([1, 2, 3, 4, 5, 6])
+
+        with patch("subprocess.run", side_effect=gh):
+            result = github_service.fetch_epics_with_features(max_workers=4)
+
+        assert [epic.number for epic in result.epics] == [1, 2, 3, 4, 5, 6]
+        assert [[f.number for f in epic.features] for epic in result.epics] == [
+            [10],
+            [20],
+            [30],
+            [40],
+            [50],
+            [60],
+        ]
+        assert result.failures == {}
+        assert 1 < gh.active["max"] <= 4
+        assert set(result.timings) == {"epics", "features"}
+
+    @patch("doit_cli.services.github_service.is_gh_authenticated", return_value=True)
+    @patch("doit_cli.services.github_service.has_gh_cli", return_value=True)
+    def test_rate_limited_search_is_retried(self, mock_has_cli, mock_is_auth, github_service):
+        """A rate-limited search backs off and then succeeds."""
+        gh = self._gh([1, 2], {2: ["API rate limit exceeded"]})
+
+        with patch("subprocess.run", side_effect=gh):
+            result = github_service.fetch_epics_with_features(backoff_seconds=0.01)
+
+        assert result.failures == {}
+        assert [f.number for f in result.epics[1].features] == [20]
+
+    @patch("doit_cli.services.github_service.is_gh_authenticated", return_value=True)
+    @patch("doit_cli.services.github_service.has_gh_cli", return_value=True)
+    def test_failures_are_reported_per_epic(self, mock_has_cli, mock_is_auth, github_service):
+        """Epics whose search keeps failing are reported; others still load."""
+        gh = self._gh(
+            [1, 2, 3],
+            {1: ["API rate limit exceeded"] * 3, 3: ["HTTP 502: Bad Gateway"]},
+        )
+
+        with patch("subprocess.run", side_effect=gh):
+            result = github_service.fetch_epics_with_features(max_retries=2, backoff_seconds=0.01)
+
+        assert isinstance(result.failures[1], GitHubRateLimitError)
+        assert isinstance(result.failures[3], GitHubAPIError)
+        assert set(result.failures) == {1, 3}
+        assert result.epics[0].features == []
+        assert [f.number for f in result.epics[1].features] == [20]
+
+
+class TestFetchEpicChanges:
+    """Tests for the incremental fetch_epic_changes refresh."""
+
+    @staticmethod
+    def _issue(number, state="OPEN", body=""):
+        return {
+            "number": number,
+            "title": f"Issue {number}",
+            "state": state,
+            "labels": [],
+            "body": body,
+            "url": f"https://github.com/owner/repo/issues/{number}",
+            "updatedAt": "2026-02-01T12:00:00Z",
+        }
+
+    @staticmethod
+    def _cached():
+        epic = GitHubEpic(
+            number=1,
+            title="[Epic]: 1",
+            state="open",
+            labels=["epic"],
+            body="",
+            url="https://github.com/owner/repo/issues/1",
+        )
+        epic.features = [
+            GitHubFeature(
+                number=10,
+                title="[Feature]: 10",
+                state="open",
+                labels=[],
+                epic_number=1,
+                url="https://github.com/owner/repo/issues/10",
+            )
+        ]
+        closing = GitHubEpic(
+            number=2,
+            title="[Epic]: 2",
+            state="open",
+            labels=["epic"],
+            body="",
+            url="https://github.com/owner/repo/issues/2",
+        )
+        return [epic, closing]
+
+    @patch("doit_cli.services.github_service.is_gh_authenticated", return_value=True)
+    @patch("doit_cli.services.github_service.has_gh_cli", return_value=True)
+    def test_merges_changes_into_cached_epics(self, mock_has_cli, mock_is_auth, github_service):
+        """Changed epics and features are merged; unchanged ones are kept."""
+        from datetime import UTC, datetime
+
+        calls = []
+
+        def run(cmd, **kwargs):
+            calls.append(cmd)
+            search = cmd[cmd.index("--search") + 1]
+            if "--label" in cmd:
+                assert search == "updated:>=2026-02-01T10:00:00Z"
+                epics = [self._issue(2, state="CLOSED"), self._issue(3)]
+                return MagicMock(returncode=0, stdout=json.dumps(epics), stderr="")
+            if search.endswith("#3"):
+                return MagicMock(returncode=0, stdout=json.dumps([self._issue(30)]), stderr="")
+            features = [
+                self._issue(10, state="CLOSED", body="Part of Epic #1"),
+                self._issue(11, body="Part of Epic #1"),
+                self._issue(12, body="No epic reference"),
+            ]
+            return MagicMock(returncode=0, stdout=json.dumps(features), stderr="")
+
+        since = datetime(2026, 2, 1, 10, 0, tzinfo=UTC)
+        with patch("subprocess.run", side_effect=run):
+            result = github_service.fetch_epic_changes(self._cached(), since)
+
+        assert [epic.number for epic in result.epics] == [3, 1]
+        assert [[f.number for f in epic.features] for epic in result.epics] == [[30], [11]]
+        assert result.failures == {}
+        # One epic query, one feature query, one full search for the new epic
+        assert len(calls) == 3
+
+    @patch("doit_cli.services.github_service.SEARCH_PAGE_SIZE", 2)
+    @patch("doit_cli.services.github_service.is_gh_authenticated", return_value=True)
+    @patch("doit_cli.services.github_service.has_gh_cli", return_value=True)
+    def test_updated_features_are_paged(self, mock_has_cli, mock_is_auth, github_service):
+        """A full page restarts the search from the last updatedAt seen."""
+        from datetime import UTC, datetime
+
+        searches = []
+        pages = {
+            "2026-02-01T10:00:00Z": [
+                dict(self._issue(11, body="Part of Epic #1"), updatedAt="2026-02-01T10:30:00Z"),
+                dict(self._issue(12, body="Part of Epic #1"), updatedAt="2026-02-01T11:00:00Z"),
+            ],
+            "2026-02-01T11:00:00Z": [
+                dict(self._issue(12, body="Part of Epic #1"), updatedAt="2026-02-01T11:00:00Z"),
+                dict(self._issue(13, body="Part of Epic #1"), updatedAt="2026-02-01T11:30:00Z"),
+            ],
+            "2026-02-01T11:30:00Z": [
+                dict(self._issue(13, body="Part of Epic #1"), updatedAt="2026-02-01T11:30:00Z"),
+            ],
+        }
+
+        def run(cmd, **kwargs):
+            search = cmd[cmd.index("--search") + 1]
+            searches.append(search)
+            since = search.split("updated:>=")[1].split()[0]
+            return MagicMock(returncode=0, stdout=json.dumps(pages[since]), stderr="")
+
+        since = datetime(2026, 2, 1, 10, 0, tzinfo=UTC)
+        with patch("subprocess.run", side_effect=run):
+            features = github_service._search_updated_features(since)
+
+        assert [f.number for f in features] == [11, 12, 13]
+        assert len(searches) == 3
+        assert all("sort:updated-asc" in search for search in searches)
+
+    @patch("doit_cli.services.github_service.is_gh_authenticated", return_value=True)
+    @patch("doit_cli.services.github_service.has_gh_cli", return_value=True)
+    def test_feature_of_several_epics(self, mock_has_cli, mock_is_auth, github_service):
+        """Every "Part of Epic #N" reference links the feature to that epic."""
+        from datetime import UTC, datetime
+
+        def run(cmd, **kwargs):
+            if "--label" in cmd:
+                return MagicMock(returncode=0, stdout="[]", stderr="")
+            body = "Part of Epic #1\nAlso part of epic #2\nPart of Epic #1"
+            return MagicMock(
+                returncode=0, stdout=json.dumps([self._issue(20, body=body)]), stderr=""
+            )
+
+        since = datetime(2026, 2, 1, 10, 0, tzinfo=UTC)
+        with patch("subprocess.run", side_effect=run):
+            result = github_service.fetch_epic_changes(self._cached(), since)
+
+        assert [[f.number for f in epic.features] for epic in result.epics] == [[20], [10, 20]]
+
+
 class TestCreateEpic:
     """Tests for create_epic method."""
 
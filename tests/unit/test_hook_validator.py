@@ -1,9 +1,10 @@
 """Unit tests for HookValidator service."""
 
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from doit_cli.models.hook_config import HookConfig, HookRule
+from doit_cli.services.git_utils import StagedFiles
 from doit_cli.services.hook_validator import HookValidator, ValidationResult
 
 
@@ -253,6 +254,36 @@ class TestPreCommitValidation:
                 assert result.success is True
 
 
+class TestStagedFiles:
+    """Tests for reading the Git index."""
+
+    def test_git_index_read_once(self, tmp_path):
+        """Test that repeated lookups share one git subprocess."""
+        validator = HookValidator(project_root=tmp_path)
+        run = Mock(return_value=Mock(returncode=0, stdout="a.py\nspecs/x.md\n", stderr=""))
+
+        with patch("subprocess.run", run):
+            first = validator.get_staged_files()
+            second = validator.get_staged_files()
+
+        assert first == second == ["a.py", "specs/x.md"]
+        assert run.call_count == 1
+
+    def test_uses_provided_snapshot(self, tmp_path):
+        """Test that a shared snapshot is returned without running git."""
+        validator = HookValidator(project_root=tmp_path, staged_files=StagedFiles(("README.md",)))
+
+        with patch("subprocess.run", side_effect=AssertionError("git should not run")):
+            assert validator.get_staged_files() == ["README.md"]
+
+    def test_git_unavailable_returns_empty(self, tmp_path):
+        """Test that a missing git binary yields no staged files."""
+        validator = HookValidator(project_root=tmp_path)
+
+        with patch("subprocess.run", side_effect=FileNotFoundError("git")):
+            assert validator.get_staged_files() == []
+
+
 class TestPrePushValidation:
     """Tests for pre-push validation logic."""
 
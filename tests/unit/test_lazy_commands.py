@@ -0,0 +1,115 @@
+"""Tests for lazy top-level command loading and the CLI cold-start budget."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import time
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from doit_cli.cli.lazy_group import build_click_command
+from doit_cli.main import COMMANDS, app
+
+# Wall-clock budget for a cold `doit` invocation, excluding bare interpreter
+# startup. Eager imports of every command module used to cost ~0.7s.
+COLD_START_BUDGET_SECONDS = 1.0
+
+# Modules that only specific commands need; none may load for `--help` or hooks.
+HEAVY_MODULES = ("httpx", "watchdog", "mcp", "doit_cli.services.analytics_service")
+
+_PROBE = """
+import json, sys
+from doit_cli.main import app
+try:
+    app(sys.argv[1:], prog_name="doit")
+except SystemExit:
+    pass
+print(json.dumps(sorted(sys.modules)), file=sys.stderr)
+"""
+
+
+def _run_cold(*args: str) -> tuple[float, set[str]]:
+    """Run doit in a fresh interpreter; return (elapsed, imported modules)."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE, *args],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    elapsed = time.perf_counter() - start
+    modules = set(json.loads(result.stderr.strip().splitlines()[-1]))
+    return elapsed, modules
+
+
+def _interpreter_startup() -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return time.perf_counter() - start
+
+
+def _summary(text: str | None) -> str:
+    return " ".join((text or "").split("\n\n")[0].split())
+
+
+class TestRegistry:
+    """The lazy registry mirrors the real commands."""
+
+    @pytest.mark.parametrize("name", list(COMMANDS))
+    def test_help_matches_real_command(self, name):
+        command = build_click_command(COMMANDS[name])
+        assert command.name == name
+        assert _summary(command.short_help or command.help) == COMMANDS[name].help
+
+    @pytest.mark.parametrize("name", list(COMMANDS))
+    def test_targets_are_commands_or_apps(self, name):
+        target = COMMANDS[name].load()
+        assert isinstance(target, typer.Typer) or callable(target)
+
+
+class TestLazyGroup:
+    """Command resolution through the top-level app."""
+
+    def test_help_lists_every_command(self):
+        result = CliRunner().invoke(app, ["--help"])
+        assert result.exit_code == 0
+        for name in COMMANDS:
+            assert name in result.output
+
+    def test_subcommand_help_resolves(self):
+        result = CliRunner().invoke(app, ["hooks", "--help"])
+        assert result.exit_code == 0
+        assert "validate" in result.output
+
+    def test_typo_suggests_close_match(self):
+        result = CliRunner().invoke(app, ["statsu"])
+        assert result.exit_code != 0
+        assert "status" in result.output
+
+
+class TestColdStart:
+    """Fresh-interpreter import footprint and timing."""
+
+    def test_help_imports_no_command_modules(self):
+        _, modules = _run_cold("--help")
+        loaded = {m for m in modules if m.startswith("doit_cli.cli.")}
+        assert loaded == {"doit_cli.cli.lazy_group"}
+        assert not modules.intersection(HEAVY_MODULES)
+
+    def test_hooks_validate_imports_only_hooks_tree(self):
+        _, modules = _run_cold("hooks", "validate", "pre-commit")
+        commands = {m for m in modules if m.startswith("doit_cli.cli.")}
+        assert commands == {"doit_cli.cli.lazy_group", "doit_cli.cli.hooks_command"}
+        assert not modules.intersection(HEAVY_MODULES)
+
+    @pytest.mark.parametrize(
+        "args", [("--help",), ("hooks", "validate", "pre-commit")], ids=["help", "hooks"]
+    )
+    def test_cold_start_within_budget(self, args):
+        baseline = _interpreter_startup()
+        elapsed = min(_run_cold(*args)[0] for _ in range(3))
+        assert elapsed - baseline < COLD_START_BUDGET_SECONDS
@@ -0,0 +1,147 @@
+"""Tests for the MCP server's watched project state."""
+
+import json
+import subprocess
+import time
+
+import pytest
+
+from doit_cli.mcp import MCP_AVAILABLE
+from doit_cli.mcp.project_state import ProjectState
+from doit_cli.models.status_models import SpecState
+
+
+def _spec(status: str) -> str:
+    return f"# Feature Specification: Demo\n\n**Status**: {status}\n"
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".doit" / "memory").mkdir(parents=True)
+    (tmp_path / ".doit" / "memory" / "roadmap.md").write_text("# Roadmap\n")
+    spec_dir = tmp_path / "specs" / "001-demo"
+    spec_dir.mkdir(parents=True)
+    (spec_dir / "spec.md").write_text(_spec("Draft"))
+    (spec_dir / "tasks.md").write_text("- [ ] T001 Build it [FR-001]\n")
+    return tmp_path
+
+
+@pytest.fixture
+def state(project):
+    state = ProjectState(project)
+    assert state.start()
+    yield state
+    state.stop()
+
+
+def _wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+class TestProjectState:
+    """Entries are kept between lookups and dropped per changed file."""
+
+    def test_repeated_lookups_are_served_from_memory(self, state, project):
+        first = state.spec_statuses()
+        second = state.spec_statuses()
+
+        assert second == first
+        assert state.stats.misses == 1
+        assert state.stats.hits == 1
+
+    def test_invalidating_a_file_drops_only_its_entries(self, state, project):
+        spec_file = project / "specs" / "001-demo" / "spec.md"
+        roadmap = project / ".doit" / "memory" / "roadmap.md"
+        state.spec_statuses()
+        state.read_text(roadmap)
+
+        spec_file.write_text(_spec("In Progress"))
+        state.invalidate(spec_file)
+
+        assert state.spec_statuses()[0].status == SpecState.IN_PROGRESS
+        state.read_text(roadmap)
+        assert state.stats.hits == 1
+
+    def test_tasks_change_invalidates_spec_validation(self, state, project):
+        spec_file = project / "specs" / "001-demo" / "spec.md"
+        state.validation(spec_file)
+
+        state.invalidate(project / "specs" / "001-demo" / "tasks.md")
+        state.validation(spec_file)
+
+        assert state.stats.misses == 2
+
+    def test_coverage_is_kept_until_tasks_change(self, state, project):
+        spec_file = project / "specs" / "001-demo" / "spec.md"
+        first = state.coverage(spec_file)
+
+        assert state.coverage(spec_file) is first
+        state.invalidate(project / "specs" / "001-demo" / "tasks.md")
+        assert state.coverage(spec_file) is not first
+        assert state.stats.misses == 2
+
+    def test_config_change_drops_everything(self, state, project):
+        state.spec_statuses()
+        state.read_text(project / ".doit" / "memory" / "roadmap.md")
+
+        state.invalidate(project / ".doit" / "validation-rules.yaml")
+
+        assert state.to_dict()["entries"] == 0
+
+    def test_doit_written_files_are_ignored(self, state, project):
+        state.spec_statuses()
+
+        state.invalidate(project / ".doit" / "cache" / "specs.json")
+
+        assert state.to_dict()["entries"] == 1
+
+    def test_watcher_invalidates_on_disk_changes(self, state, project):
+        roadmap = project / ".doit" / "memory" / "roadmap.md"
+        assert state.read_text(roadmap) == "# Roadmap\n"
+
+        roadmap.write_text("# Roadmap v2\n")
+
+        assert _wait_for(lambda: state.read_text(roadmap) == "# Roadmap v2\n")
+        assert state.stats.invalidations >= 1
+
+    def test_unwatched_state_keeps_nothing(self, project):
+        state = ProjectState(project, watch=False)
+
+        state.spec_statuses()
+        state.spec_statuses()
+
+        assert state.is_watching is False
+        assert state.stats.hits == 0
+        assert state.to_dict()["entries"] == 0
+
+    def test_unwatched_state_sees_newly_staged_specs(self, project):
+        subprocess.run(["git", "init", "-q"], cwd=project, check=True)
+        state = ProjectState(project, watch=False)
+        assert state.spec_statuses()[0].is_blocking is False
+
+        subprocess.run(["git", "add", "specs"], cwd=project, check=True)
+
+        assert state.spec_statuses()[0].is_blocking is True
+
+
+@pytest.mark.skipif(not MCP_AVAILABLE, reason="mcp package not installed")
+class TestServerUsesProjectState:
+    """Tools registered by create_server answer from the shared state."""
+
+    def test_cache_stats_tool_reports_hits(self, project):
+        from doit_cli.mcp.server import create_server
+
+        server = create_server(project_root=project)
+        tools = server._tool_manager._tools
+        tools["doit_status"].fn()
+        tools["doit_status"].fn()
+        stats = json.loads(tools["doit_cache_stats"].fn())
+
+        assert stats["watching"] is True
+        assert stats["hits"] >= 1
+        assert stats["entries_by_kind"]["status"] == 1
@@ -53,3 +53,32 @@ class TestTasksTool:
 
         result = json.loads(tasks_fn(feature_name="test-feature"))
         assert result["summary"]["total"] >= 0
+
+    def test_tasks_include_requirement_coverage(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        feature_dir = tmp_path / "specs" / "test-feature"
+        feature_dir.mkdir(parents=True)
+        (feature_dir / "spec.md").write_text(
+            "- **FR-001**: First\n- **FR-002**: Second\n", encoding="utf-8"
+        )
+        (feature_dir / "tasks.md").write_text(
+            "- [ ] T001 First task [FR-001]\n- [ ] T002 Stray task [FR-007]\n",
+            encoding="utf-8",
+        )
+
+        from mcp.server.fastmcp import FastMCP
+
+        from doit_cli.mcp.tools.tasks_tool import register_tasks_tool
+
+        mcp = FastMCP("test")
+        register_tasks_tool(mcp)
+        tasks_fn = mcp._tool_manager._tools["doit_tasks"].fn
+
+        result = json.loads(tasks_fn(feature_name="test-feature"))
+
+        assert [t["requirement_refs"] for t in result["tasks"]] == [["FR-001"], ["FR-007"]]
+        assert result["coverage"]["requirements"] == 2
+        assert result["coverage"]["uncovered"] == ["FR-002"]
+        assert result["coverage"]["orphaned_references"] == [
+            {"task_line": 2, "reference": "FR-007"}
+        ]
@@ -1,6 +1,7 @@
 """Unit tests for memory search service."""
 
 import tempfile
+import time
 from pathlib import Path
 
 import pytest
@@ -248,3 +249,56 @@ class TestSearchHistory:
 
         history = service.get_history()
         assert len(history.entries) == 10
+
+
+class TestSearchScaling:
+    """Per-match work must not re-split the whole file."""
+
+    @staticmethod
+    def _roadmap_project(root: Path, items: int) -> Path:
+        memory_dir = root / ".doit" / "memory"
+        memory_dir.mkdir(parents=True)
+        body = "\n".join(f"- [ ] Roadmap item {i}" for i in range(items))
+        (memory_dir / "roadmap.md").write_text(f"# Roadmap\n\n## Items\n\n{body}\n")
+        return root
+
+    def _time_search(self, root: Path) -> float:
+        timings = []
+        for _ in range(3):
+            service = MemorySearchService(root, use_index=False)
+            start = time.perf_counter()
+            service.search("item", max_results=100)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    def test_search_time_scales_with_matches(self, tmp_path):
+        """4x the matches in one file costs ~4x, not ~16x."""
+        small = self._time_search(self._roadmap_project(tmp_path / "small", 1_000))
+        large = self._time_search(self._roadmap_project(tmp_path / "large", 4_000))
+
+        assert large < max(small, 0.01) * 8
+        assert large < 1.0
+
+    def test_rendered_line_comes_from_search(self, temp_project):
+        """format_result_rich renders the matched line without re-reading."""
+        service = MemorySearchService(temp_project)
+        results, sources, _ = service.search("authentication")
+        source_map = {s.id: s for s in sources}
+        source = source_map[results[0].source_id]
+        line = source.file_path.read_text().splitlines()[results[0].line_number - 1]
+        for path in temp_project.rglob("*.md"):
+            path.unlink()
+
+        panel = service.format_result_rich(results[0], source_map, "authentication")
+
+        assert line in str(panel.renderable)
+
+    def test_line_maps_are_reset_per_search(self, temp_project):
+        """Only files matched by the latest search keep a line map."""
+        service = MemorySearchService(temp_project)
+        service.search("authentication")
+        results, sources, _ = service.search("Role-based")
+
+        assert set(service._line_maps) == {
+            s.file_path for s in sources if s.id in {r.source_id for r in results}
+        }
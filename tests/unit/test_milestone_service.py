@@ -0,0 +1,138 @@
+"""Tests for bulk epic-to-milestone assignment in MilestoneService."""
+
+import threading
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from doit_cli.models.milestone import EpicAssignment, Milestone
+from doit_cli.models.priority import get_priority
+from doit_cli.models.provider_models import Issue, IssueState
+from doit_cli.models.sync_operation import SyncOperation, SyncStatus
+from doit_cli.services.milestone_service import MilestoneService
+from doit_cli.services.providers.exceptions import NetworkError, ProviderError
+
+P1 = get_priority("P1").milestone_title
+P2 = get_priority("P2").milestone_title
+
+
+class FakeProvider:
+    """Records batch lookups and milestone updates."""
+
+    def __init__(self, assigned: dict[int, int], fail: set[int] | None = None) -> None:
+        self.assigned = assigned
+        self.fail = fail or set()
+        self.lookups: list[list[str]] = []
+        self.updates: list[tuple[str, str | None]] = []
+        self._lock = threading.Lock()
+
+    def get_issues(self, issue_ids: list[str]) -> list[Issue]:
+        self.lookups.append(issue_ids)
+        return [self._issue(int(issue_id)) for issue_id in issue_ids]
+
+    def list_milestones(self):
+        return []
+
+    def update_issue(self, issue_id, updates):
+        with self._lock:
+            self.updates.append((issue_id, updates.milestone_id))
+        if int(issue_id) in self.fail:
+            raise NetworkError("boom")
+        return self._issue(int(issue_id))
+
+    def _issue(self, number: int) -> Issue:
+        milestone = self.assigned.get(number)
+        return Issue(
+            id=f"github:issue:{number}",
+            provider_id=str(number),
+            title=f"Epic {number}",
+            state=IssueState.OPEN,
+            url=f"https://github.com/o/r/issues/{number}",
+            created_at=datetime(2026, 1, 1),
+            updated_at=datetime(2026, 1, 1),
+            milestone_id=str(milestone) if milestone else None,
+        )
+
+
+MILESTONES = [
+    Milestone(number=1, title=P1, description="", state="open", url=""),
+    Milestone(number=2, title=P2, description="", state="open", url=""),
+]
+
+
+def _service(provider: FakeProvider, dry_run: bool = False) -> MilestoneService:
+    github_service = MagicMock()
+    github_service.get_provider.return_value = provider
+    return MilestoneService(github_service, dry_run=dry_run)
+
+
+def _sync_op(dry_run: bool = False) -> SyncOperation:
+    return SyncOperation(id="sync", started_at=datetime.now(), dry_run=dry_run)
+
+
+class TestAssignEpicsToMilestones:
+    """One lookup builds the plan; only needed changes are applied."""
+
+    def test_only_changed_epics_are_updated(self):
+        epics = list(range(1, 121))
+        # Even epics already sit in P1; odd ones are unassigned
+        provider = FakeProvider({n: 1 for n in epics if n % 2 == 0})
+        sync_op = _sync_op()
+
+        _service(provider).assign_epics_to_milestones({"P1": epics}, MILESTONES, sync_op)
+
+        assert len(provider.lookups) == 1
+        assert sorted(int(n) for n, _ in provider.updates) == epics[::2]
+        assert {milestone for _, milestone in provider.updates} == {P1}
+        assert sync_op.epics_assigned == 60
+        assert sum(r.status == SyncStatus.SKIPPED for r in sync_op.results) == 60
+
+    def test_dry_run_prints_plan_without_changes(self):
+        provider = FakeProvider({1: 2})
+        sync_op = _sync_op(dry_run=True)
+
+        service = _service(provider, dry_run=True)
+        plan = service.plan_epic_assignments({"P1": [1, 2]}, MILESTONES)
+        service.assign_epics_to_milestones({"P1": [1, 2]}, MILESTONES, sync_op)
+
+        assert [(a.epic_number, a.previous_milestone, a.is_needed) for a in plan] == [
+            (1, P2, True),
+            (2, None, True),
+        ]
+        assert provider.updates == []
+        assert [r.message for r in sync_op.results] == [f"Dry run - would assign to {P1}"] * 2
+
+    def test_failed_updates_are_recorded_as_errors(self):
+        provider = FakeProvider({}, fail={2})
+        sync_op = _sync_op()
+
+        _service(provider).assign_epics_to_milestones({"P1": [1, 2, 3]}, MILESTONES, sync_op)
+
+        assert sync_op.errors == 1
+        assert sync_op.epics_assigned == 2
+        assert [r.target for r in sync_op.results] == ["#1", "#2", "#3"]
+
+    def test_missing_milestone_skips_its_epics(self):
+        provider = FakeProvider({})
+
+        plan = _service(provider).plan_epic_assignments({"P3": [5], "P1": [6]}, MILESTONES)
+
+        assert [a.epic_number for a in plan] == [6]
+
+    def test_failed_lookup_falls_back_to_per_epic_checks(self):
+        provider = FakeProvider({})
+        provider.get_issues = MagicMock(side_effect=ProviderError("down"))
+        service = _service(provider)
+
+        with patch.object(service, "check_existing_assignment", return_value=P1) as check:
+            plan = service.plan_epic_assignments({"P1": [1, 2]}, MILESTONES)
+
+        assert check.call_count == 2
+        assert not any(a.is_needed for a in plan)
+
+
+@pytest.mark.parametrize("previous", [None, P2])
+def test_assignment_is_needed_unless_already_in_target(previous):
+    assert EpicAssignment(1, P1, previous).is_needed
+    assert not EpicAssignment(1, P1, P1).is_needed
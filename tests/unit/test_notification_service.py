@@ -0,0 +1,173 @@
+"""Tests for the append-only notification log in NotificationService."""
+
+import json
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from doit_cli.models.team_models import Notification, NotificationType
+from doit_cli.services.notification_service import NotificationService
+
+
+def _notify(service: NotificationService, title: str = "changed") -> Notification:
+    return service.create_notification(
+        NotificationType.MEMORY_CHANGED, title, "content", "dev@example.com", ["a.md"]
+    )
+
+
+def _log_lines(service: NotificationService) -> list[dict]:
+    return [json.loads(line) for line in service.log_path.read_text().splitlines()]
+
+
+class TestAppendOnlyLog:
+    """Each event appends one line; readers replay the log."""
+
+    def test_create_appends_without_reading_history(self, tmp_path, monkeypatch):
+        service = NotificationService(tmp_path)
+        _notify(service)
+        monkeypatch.setattr(service, "_load_state", MagicMock(side_effect=AssertionError))
+
+        _notify(service, "second")
+
+        assert [r["op"] for r in _log_lines(service)] == ["create", "create"]
+        assert not service.state_path.exists()
+
+    def test_new_service_sees_notifications_and_reads(self, tmp_path):
+        writer = NotificationService(tmp_path)
+        first = _notify(writer, "first")
+        _notify(writer, "second")
+        writer.mark_read(first.id)
+
+        reader = NotificationService(tmp_path)
+
+        assert [n.title for n in reader.get_notifications()] == ["second", "first"]
+        assert [n.title for n in reader.get_notifications(unread_only=True)] == ["second"]
+        assert reader.get_unread_count() == 1
+
+    def test_mark_all_read_moves_the_cursor(self, tmp_path):
+        service = NotificationService(tmp_path)
+        for i in range(3):
+            _notify(service, str(i))
+        log_before = service.log_path.read_bytes()
+
+        assert service.mark_read() == 3
+
+        assert service.log_path.read_bytes() == log_before
+        _notify(service, "new")
+        assert NotificationService(tmp_path).get_unread_count() == 1
+        assert service.mark_read() == 1
+
+    def test_partial_trailing_line_is_ignored(self, tmp_path):
+        service = NotificationService(tmp_path)
+        _notify(service)
+        with open(service.log_path, "a") as f:
+            f.write('{"op": "create", "notif')
+
+        assert len(NotificationService(tmp_path).get_notifications()) == 1
+
+    def test_paging(self, tmp_path):
+        service = NotificationService(tmp_path)
+        for i in range(5):
+            _notify(service, str(i))
+
+        pages = [
+            [n.title for n in service.get_notifications(limit=2, offset=offset)]
+            for offset in (0, 2, 4)
+        ]
+
+        assert [t for page in pages for t in page] == [n.title for n in service.get_notifications()]
+        assert [len(page) for page in pages] == [2, 2, 1]
+
+    def test_concurrent_writers_lose_nothing(self, tmp_path):
+        def write(n: int) -> None:
+            service = NotificationService(tmp_path)
+            for i in range(25):
+                _notify(service, f"{n}-{i}")
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert NotificationService(tmp_path).get_unread_count() == 100
+
+
+class TestCompaction:
+    """The log is rewritten once it has doubled, keeping read state."""
+
+    def test_compaction_drops_excess_and_keeps_read_flags(self, tmp_path):
+        service = NotificationService(tmp_path)
+        service.COMPACT_MIN_BYTES = 0
+        service.MAX_NOTIFICATIONS = 4
+        created = [_notify(service, str(i)) for i in range(3)]
+        service.mark_read(created[1].id)
+        for i in range(3, 5):
+            _notify(service, str(i))
+
+        records = _log_lines(service)
+        assert records[0]["op"] == "header"
+        assert "read" not in [r["op"] for r in records]
+
+        reader = NotificationService(tmp_path)
+        reader.MAX_NOTIFICATIONS = 4
+        notifications = reader.get_state().notifications
+        assert [(n.title, n.read) for n in notifications] == [
+            ("1", True),
+            ("2", False),
+            ("3", False),
+            ("4", False),
+        ]
+
+    def test_cursor_survives_compaction(self, tmp_path):
+        service = NotificationService(tmp_path)
+        service.COMPACT_MIN_BYTES = 0
+        _notify(service)
+        service.mark_read()
+        _notify(service, "unread")
+        for _ in range(3):
+            _notify(service, "more")
+
+        fresh = NotificationService(tmp_path)
+        assert [n.title for n in fresh.get_notifications(unread_only=True)].count("more") == 3
+        assert fresh.get_unread_count() == 4
+
+    def test_expired_notifications_are_dropped(self, tmp_path):
+        service = NotificationService(tmp_path)
+        old = _notify(service, "old")
+        with open(service.log_path, "a") as f:
+            expired = Notification.from_dict(old.to_dict())
+            expired.id = "expired"
+            expired.expires_at = datetime.now() - timedelta(days=1)
+            f.write(json.dumps({"op": "create", "notification": expired.to_dict()}) + "\n")
+
+        assert [n.id for n in NotificationService(tmp_path).get_notifications()] == [old.id]
+
+    def test_clear_all_truncates_the_log(self, tmp_path):
+        service = NotificationService(tmp_path)
+        for _ in range(3):
+            _notify(service)
+
+        assert service.clear_all() == 3
+
+        assert [r["op"] for r in _log_lines(service)] == ["header"]
+        assert NotificationService(tmp_path).get_unread_count() == 0
+
+
+def test_legacy_state_file_is_migrated(tmp_path):
+    legacy = Notification.create(NotificationType.MEMBER_JOINED, "joined", "", "owner@example.com")
+    legacy.read = True
+    state_path = tmp_path / ".doit" / "state" / "notifications.json"
+    state_path.parent.mkdir(parents=True)
+    state_path.write_text(
+        json.dumps({"notifications": [legacy.to_dict()], "settings": {"batch_interval_minutes": 9}})
+    )
+    service = NotificationService(tmp_path)
+
+    _notify(service)
+
+    stored = json.loads(state_path.read_text())
+    assert "notifications" not in stored
+    assert stored["settings"]["batch_interval_minutes"] == 9
+    notifications = NotificationService(tmp_path).get_state().notifications
+    assert [(n.title, n.read) for n in notifications] == [("joined", True), ("changed", False)]
@@ -458,6 +458,49 @@ class TestBlockingLogic:
 
         assert result.is_blocking is True
 
+    def test_staged_draft_in_project_subdirectory_is_blocking(self, tmp_path, monkeypatch):
+        """Test that staged paths are matched from the repository root."""
+        import subprocess
+
+        from doit_cli.models.validation_models import (
+            Severity,
+            ValidationIssue,
+            ValidationResult,
+        )
+
+        monkeypatch.delenv("GIT_DIR", raising=False)
+        project = tmp_path / "proj"
+        spec_path = project / "specs" / "test-spec" / "spec.md"
+        spec_path.parent.mkdir(parents=True)
+        spec_path.write_text("# Spec\n\n**Status**: Draft\n")
+        (project / ".doit").mkdir()
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        subprocess.run(["git", "add", "proj/specs"], cwd=tmp_path, check=True)
+
+        spec_status = SpecStatus(
+            name="test-spec",
+            path=spec_path,
+            status=SpecState.DRAFT,
+            last_modified=datetime.now(),
+            validation_result=ValidationResult(
+                spec_path=str(spec_path),
+                issues=[
+                    ValidationIssue(
+                        rule_id="test-rule",
+                        severity=Severity.ERROR,
+                        line_number=1,
+                        message="Test error",
+                    )
+                ],
+            ),
+            is_blocking=False,
+        )
+        scanner = SpecScanner(project, validate=False)
+
+        result = scanner._compute_blocking(spec_status)
+
+        assert result.is_blocking is True
+
     def test_complete_spec_never_blocking(self, tmp_path):
         """Test that COMPLETE specs never block regardless of validation."""
         from doit_cli.models.validation_models import (
@@ -627,3 +670,51 @@ class TestGitStaged:
         result = scanner._is_git_staged(spec_path)
 
         assert result is False
+
+    def test_staged_match_is_exact_not_substring(self, tmp_path, monkeypatch):
+        """Test that a longer staged path does not mark the spec as staged."""
+        from unittest.mock import Mock
+
+        (tmp_path / ".doit").mkdir()
+        scanner = SpecScanner(tmp_path, validate=False)
+
+        spec_path = tmp_path / "specs" / "001-test" / "spec.md"
+
+        mock_result = Mock(returncode=0, stdout="specs/001-test/spec.md.orig\n", stderr="")
+        monkeypatch.setattr("subprocess.run", lambda *args, **kwargs: mock_result)
+
+        assert scanner._is_git_staged(spec_path) is False
+
+    def test_git_index_read_once_per_scanner(self, tmp_path, monkeypatch):
+        """Test that checking many specs runs git a single time."""
+        from unittest.mock import Mock
+
+        (tmp_path / ".doit").mkdir()
+        scanner = SpecScanner(tmp_path, validate=False)
+
+        run = Mock(return_value=Mock(returncode=0, stdout="specs/002-b/spec.md\n", stderr=""))
+        monkeypatch.setattr("subprocess.run", run)
+
+        staged = [
+            scanner._is_git_staged(tmp_path / "specs" / name / "spec.md")
+            for name in ("001-a", "002-b", "003-c")
+        ]
+
+        assert staged == [False, True, False]
+        assert run.call_count == 1
+
+    def test_shared_snapshot_skips_git(self, tmp_path, monkeypatch):
+        """Test that a provided snapshot is used without running git."""
+        from doit_cli.services.git_utils import StagedFiles
+
+        (tmp_path / ".doit").mkdir()
+        scanner = SpecScanner(
+            tmp_path, validate=False, staged_files=StagedFiles(("specs/001-test/spec.md",))
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("git should not run")
+
+        monkeypatch.setattr("subprocess.run", fail)
+
+        assert scanner._is_git_staged(tmp_path / "specs" / "001-test" / "spec.md") is True
@@ -226,17 +226,13 @@ class TestPromptWriter:
         prompts_dir = temp_dir / ".github/prompts"
         prompts_dir.mkdir(parents=True)
         prompt_path = prompts_dir / "doit.test.prompt.md"
-        prompt_path.write_text("# Already exists")
-
-        # Make prompt newer than template
-        import time
-
-        time.sleep(0.01)
-        prompt_path.touch()
 
         template = CommandTemplate.from_path(template_path)
         writer = PromptWriter(project_root=temp_dir)
 
+        # Prompt already holds the transformed template
+        prompt_path.write_text(writer.transformer.transform(template))
+
         # Execute
         operation = writer.write_prompt(template)
 
@@ -290,17 +286,13 @@ class TestDriftDetector:
         template_path = templates_dir / "doit.test.md"
         template_path.write_text("# Test")
 
-        # Create prompt (newer than template)
+        # Create prompt holding the transformed template
         prompts_dir = temp_dir / ".github/prompts"
         prompts_dir.mkdir(parents=True)
         prompt_path = prompts_dir / "doit.test.prompt.md"
 
-        import time
-
-        time.sleep(0.01)
-        prompt_path.write_text("# Generated")
-
         template = CommandTemplate.from_path(template_path)
+        prompt_path.write_text(PromptTransformer().transform(template))
         detector = DriftDetector(project_root=temp_dir)
 
         status = detector.check_sync_status(template)
@@ -338,16 +330,9 @@ class TestDriftDetector:
         templates_dir.mkdir(parents=True)
         (templates_dir / "doit.test.md").write_text("# Test")
 
-        prompts_dir = temp_dir / ".github/prompts"
-        prompts_dir.mkdir(parents=True)
-
-        import time
-
-        time.sleep(0.01)
-        (prompts_dir / "doit.test.prompt.md").write_text("# Prompt")
-
         reader = TemplateReader(project_root=temp_dir)
         detector = DriftDetector(project_root=temp_dir)
         templates = reader.scan_templates()
+        PromptWriter(project_root=temp_dir).write_prompts(templates)
 
         assert detector.is_all_synced(templates)